@@ -0,0 +1,177 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import threading
+import time
+from ..common.config import (
+    CLIENT_POOL_MAX_SIZE,
+    CLIENT_POOL_TEMPORARY_CREDENTIALS_TTL_SECONDS,
+)
+from botocore.client import BaseClient
+from collections import OrderedDict
+from loguru import logger
+from typing import Any, Callable, NamedTuple
+
+
+# Errors meaning the credentials baked into a client are no longer usable
+EXPIRED_CREDENTIALS_ERROR_CODES = frozenset(
+    [
+        'ExpiredToken',
+        'ExpiredTokenException',
+        'RequestExpired',
+        'InvalidClientTokenId',
+        'UnrecognizedClientException',
+    ]
+)
+
+
+class ClientKey(NamedTuple):
+    """Identity of a pooled client."""
+
+    service_name: str
+    region: str
+    endpoint_url: str | None
+    access_key_id: str
+    credentials_digest: str
+    user_agent_extra: str
+
+
+class _PooledClient(NamedTuple):
+    client: BaseClient
+    expires_at: float | None
+
+
+def make_client_key(
+    service_name: str,
+    region: str,
+    endpoint_url: str | None,
+    access_key_id: str,
+    secret_access_key: str,
+    session_token: str | None,
+    user_agent_extra: str,
+) -> ClientKey:
+    """Build the pool key for a client, without keeping the secret in plain text."""
+    credentials_digest = hashlib.sha256(
+        f'{secret_access_key}\0{session_token or ""}'.encode()
+    ).hexdigest()
+    return ClientKey(
+        service_name=service_name,
+        region=region,
+        endpoint_url=endpoint_url,
+        access_key_id=access_key_id,
+        credentials_digest=credentials_digest,
+        user_agent_extra=user_agent_extra,
+    )
+
+
+class Boto3ClientPool:
+    """Bounded LRU pool of boto3 clients.
+
+    Creating a client loads the service model, endpoint rules and a new connection pool,
+    so clients are reused across calls that share a service, region, endpoint and
+    credential identity. Clients built from temporary credentials are retired after a
+    TTL, and callers can evict a client whose credentials were rejected as expired.
+    """
+
+    def __init__(
+        self,
+        max_size: int = CLIENT_POOL_MAX_SIZE,
+        temporary_credentials_ttl_seconds: float = CLIENT_POOL_TEMPORARY_CREDENTIALS_TTL_SECONDS,
+    ):
+        """Initialize the pool; a max_size of 0 disables pooling."""
+        self.max_size = max_size
+        self.temporary_credentials_ttl_seconds = temporary_credentials_ttl_seconds
+        self._clients: OrderedDict[ClientKey, _PooledClient] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_client(
+        self,
+        key: ClientKey,
+        create_client: Callable[[], BaseClient],
+        has_temporary_credentials: bool,
+    ) -> BaseClient:
+        """Return the pooled client for the key, creating it on a miss."""
+        with self._lock:
+            pooled = self._clients.get(key)
+            if pooled is not None and (
+                pooled.expires_at is None or time.monotonic() < pooled.expires_at
+            ):
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return pooled.client
+
+            if pooled is not None:
+                del self._clients[key]
+                self.evictions += 1
+            self.misses += 1
+
+            # boto3's default session is not thread-safe, so clients are created under the lock
+            client = create_client()
+            if self.max_size <= 0:
+                return client
+
+            expires_at = (
+                time.monotonic() + self.temporary_credentials_ttl_seconds
+                if has_temporary_credentials
+                else None
+            )
+            self._clients[key] = _PooledClient(client, expires_at)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+            return client
+
+    def invalidate(self, key: ClientKey) -> None:
+        """Drop the client for the key, e.g. after its credentials were rejected."""
+        with self._lock:
+            if self._clients.pop(key, None) is not None:
+                self.evictions += 1
+                logger.info(
+                    'Evicted {} client for region {} from pool', key.service_name, key.region
+                )
+
+    def clear(self) -> None:
+        """Drop all pooled clients."""
+        with self._lock:
+            self._clients.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of client lookups served from the pool."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool statistics."""
+        with self._lock:
+            size = len(self._clients)
+        return {
+            'size': size,
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        """Return the number of pooled clients."""
+        return len(self._clients)
+
+
+CLIENT_POOL = Boto3ClientPool()
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-from ..common.helpers import Boto3Encoder
+from ..common.helpers import make_json_compatible
 from .services import PaginationConfig
 from botocore.paginate import PageIterator, Paginator
 from botocore.utils import merge_dicts, set_value_from_jmespath
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from jmespath.parser import ParsedResult
 from loguru import logger
 from typing import Any
@@ -56,18 +57,46 @@ def _merge_page_into_result(
     return result
 
 
+def _prefetch_pages(page_iterator: PageIterator) -> Iterator[Any]:
+    """Yield pages while the next page is requested in the background.
+
+    Only one request is in flight at a time, so the pages and the number of calls are the
+    same as when iterating directly; the caller's per-page work overlaps the next request.
+    """
+    pages = iter(page_iterator)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='pagination-prefetch') as executor:
+        next_page = executor.submit(next, pages, None)
+        while (page := next_page.result()) is not None:
+            next_page = executor.submit(next, pages, None)
+            yield page
+
+
+def _is_result_key_projection(node: Mapping[str, Any], result_keys: list[ParsedResult]) -> bool:
+    """Check whether an expression node projects the elements of a paginated result key."""
+    if node['type'] in ('projection', 'filter_projection', 'flatten'):
+        source = node['children'][0]
+        return any(source == result_key.parsed for result_key in result_keys) or (
+            _is_result_key_projection(source, result_keys)
+        )
+    return False
+
+
+def can_filter_per_page(client_side_filter: ParsedResult, result_keys: list[ParsedResult]) -> bool:
+    """Check whether a client-side filter can be applied page by page.
+
+    This holds for projections, filters and flattens over a result key (for example
+    ``Functions[].FunctionName`` or ``Reservations[].Instances[?State.Name=='running']``),
+    whose result over the merged pages is the concatenation of the per-page results.
+    """
+    return _is_result_key_projection(client_side_filter.parsed, result_keys)
+
+
 def _finalize_result(
     result: dict[str, Any],
     page_iterator: PageIterator,
     response_metadata: dict[str, Any] | None,
-    client_side_filter: ParsedResult | None,
 ) -> dict[str, Any]:
     """Finalize the result by adding non-aggregate parts and processing metadata."""
-    if client_side_filter is not None:
-        # Apply client-side filter
-        json_compatible_result = json.loads(json.dumps(result, cls=Boto3Encoder))
-        result = {'Result': client_side_filter.search(json_compatible_result)}
-
     merge_dicts(result, page_iterator.non_aggregate_part)
 
     result['ResponseMetadata'] = response_metadata
@@ -90,26 +119,47 @@ def build_result(
 
     to take into account token limits, max results and timeouts. The first page is always processed.
 
+    Pages are prefetched while the previous one is merged. When the client-side filter only
+    projects a result key, it is applied to each page as it arrives so that unfiltered pages
+    are never accumulated.
+
     https://github.com/boto/botocore/blob/master/botocore/paginate.py#L481
     """
     result: dict[str, Any] = {}
+    filtered_result: list[Any] | None = None
     response_metadata = None
 
     logger.info(
         f'Building pagination result for {service_name} {operation_name} with config: {pagination_config}'
     )
     page_iterator = paginator.paginate(**operation_parameters, PaginationConfig=pagination_config)
+    filter_per_page = client_side_filter is not None and can_filter_per_page(
+        client_side_filter, page_iterator.result_keys or []
+    )
 
-    for response in page_iterator:
+    for response in _prefetch_pages(page_iterator):
         page = response
 
         # operation object pagination comes in a tuple of two elements: (http_response, parsed_response)
         if isinstance(response, tuple) and len(response) == 2:
             page = response[1]
 
-        # For each page in the response we need to inject the necessary components from the page into the result.
-        _merge_page_into_result(result, page, page_iterator)
+        if filter_per_page and client_side_filter is not None:
+            page_result = _merge_page_into_result({}, page, page_iterator)
+            page_filtered = client_side_filter.search(make_json_compatible(page_result))
+            if page_filtered is not None:
+                if filtered_result is None:
+                    filtered_result = []
+                filtered_result.extend(page_filtered)
+        else:
+            # For each page in the response we need to inject the necessary components from the page into the result.
+            _merge_page_into_result(result, page, page_iterator)
 
         response_metadata = page.get('ResponseMetadata')
 
-    return _finalize_result(result, page_iterator, response_metadata, client_side_filter)
+    if filter_per_page:
+        result = {'Result': filtered_result}
+    elif client_side_filter is not None:
+        result = {'Result': client_side_filter.search(make_json_compatible(result))}
+
+    return _finalize_result(result, page_iterator, response_metadata)
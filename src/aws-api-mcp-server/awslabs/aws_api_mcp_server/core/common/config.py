@@ -193,6 +193,12 @@ ENDPOINT_SUGGEST_AWS_COMMANDS = os.getenv(
 )
 CONNECT_TIMEOUT_SECONDS = 10
 READ_TIMEOUT_SECONDS = 60
+CLIENT_POOL_MAX_SIZE = int(os.getenv('AWS_API_MCP_CLIENT_POOL_SIZE', 32))
+CLIENT_POOL_TEMPORARY_CREDENTIALS_TTL_SECONDS = 300
+PARSED_COMMAND_CACHE_MAX_SIZE = int(os.getenv('AWS_API_MCP_PARSE_CACHE_SIZE', 256))
+CALL_AWS_BATCH_MAX_COMMANDS = 20
+CALL_AWS_BATCH_MAX_WORKERS = int(os.getenv('AWS_API_MCP_BATCH_MAX_WORKERS', 8))
+CALL_AWS_BATCH_DEFAULT_TIMEOUT_SECONDS = 120
 
 # Authentication Configuration
 AUTH_TYPE = os.getenv('AUTH_TYPE')
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import re
-from ..parser.parser import driver
+from ..parser.parser import get_command_table
 from awscli.bcdoc.restdoc import ReSTDocument
 from awscli.clidriver import ServiceCommand
 from awscli.customizations.commands import BasicCommand
@@ -37,7 +37,7 @@ def _clean_description(description: str) -> str:
 
 def generate_help_document(service_name: str, operation_name: str) -> dict[str, Any] | None:
     """Generate a document for a single AWS API operation."""
-    command = driver._get_command_table()[service_name]
+    command = get_command_table()[service_name]
     if isinstance(command, BasicCommand):
         command_table = command.subcommand_table
     elif isinstance(command, ServiceCommand):
@@ -22,24 +22,40 @@ from contextlib import contextmanager
 from datetime import datetime
 from loguru import logger
 from requests.adapters import HTTPAdapter
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib3 import Retry
 
 
+if TYPE_CHECKING:
+    from ..aws.client_pool import Boto3ClientPool
+
+
 @contextmanager
-def operation_timer(service: str, operation: str, region: str):
+def operation_timer(
+    service: str, operation: str, region: str, client_pool: 'Boto3ClientPool | None' = None
+):
     """Context manager for timing interpretation calls.
 
     :param service: The service name.
     :param operation: The operation name.
     :param region: The region where the call is being made
+    :param client_pool: The client pool used for the call, whose hit rate is logged
     """
     start = time.perf_counter()
     logger.info('Interpreting operation {}.{} for region {}', service, operation, region)
     yield
     end = time.perf_counter()
     elapsed_time = end - start
-    logger.info('Operation {}.{} interpreted in {} seconds', service, operation, elapsed_time)
+    if client_pool is None:
+        logger.info('Operation {}.{} interpreted in {} seconds', service, operation, elapsed_time)
+    else:
+        logger.info(
+            'Operation {}.{} interpreted in {} seconds (client pool hit rate: {:.1%})',
+            service,
+            operation,
+            elapsed_time,
+            client_pool.hit_rate,
+        )
 
 
 class Boto3Encoder(json.JSONEncoder):
@@ -55,6 +71,34 @@ class Boto3Encoder(json.JSONEncoder):
         return super().default(o)
 
 
+def make_json_compatible(value: Any) -> Any:
+    """Convert the values Boto3Encoder would encode, in place, without a JSON round trip.
+
+    Dicts and lists are updated in place and returned; a top-level scalar is returned converted.
+    """
+    if not isinstance(value, (dict, list)):
+        return _json_compatible_scalar(value)
+
+    stack: list[dict[Any, Any] | list[Any]] = [value]
+    while stack:
+        container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, item in items:
+            if isinstance(item, (dict, list)):
+                stack.append(item)
+            elif isinstance(item, (datetime, StreamingBody)):
+                container[key] = _json_compatible_scalar(item)
+    return value
+
+
+def _json_compatible_scalar(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, StreamingBody):
+        return value.read().decode('utf-8')
+    return value
+
+
 def as_json(boto_response: dict[str, Any]) -> str:
     """Convert a boto3 response dictionary to a JSON string."""
     return json.dumps(boto_response, cls=Boto3Encoder)
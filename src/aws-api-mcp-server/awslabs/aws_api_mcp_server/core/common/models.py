@@ -118,6 +118,20 @@ class ProgramInterpretationResponse(BaseModel):
     failed_constraints: list[str] | None = Field(default=None)
 
 
+class BatchCommandResult(BaseModel):
+    """Result of one command of a batch, holding either its response or its error."""
+
+    cli_command: str
+    result: ProgramInterpretationResponse | AwsCliAliasResponse | None = Field(default=None)
+    error: str | None = Field(default=None)
+
+
+class BatchInterpretationResponse(BaseModel):
+    """Responses of a batch of commands, in the order the commands were given."""
+
+    results: list[BatchCommandResult]
+
+
 class Consent(BaseModel):
     """Represents the consent of the user for executing a particular command."""
 
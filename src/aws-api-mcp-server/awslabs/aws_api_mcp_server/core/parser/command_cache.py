@@ -0,0 +1,90 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import threading
+from ..common.command import IRCommand
+from ..common.config import PARSED_COMMAND_CACHE_MAX_SIZE
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+
+class CachedCommand(NamedTuple):
+    """A validated command and whether its region was given in the command itself."""
+
+    ir_command: IRCommand
+    region_is_explicit: bool
+
+
+class ParsedCommandCache:
+    """Bounded LRU cache of validated IRCommand templates, keyed by the command's tokens.
+
+    Entries are copied on the way in and out, so callers are free to mutate the returned
+    command (e.g. when popping the pagination config from its parameters).
+    """
+
+    def __init__(self, max_size: int = PARSED_COMMAND_CACHE_MAX_SIZE):
+        """Initialize the cache; a max_size of 0 disables caching."""
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, ...], CachedCommand] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tokens: tuple[str, ...]) -> CachedCommand | None:
+        """Return a copy of the cached command for the tokens, if any."""
+        with self._lock:
+            entry = self._entries.get(tokens)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(tokens)
+            self.hits += 1
+        return CachedCommand(copy.deepcopy(entry.ir_command), entry.region_is_explicit)
+
+    def put(self, tokens: tuple[str, ...], ir_command: IRCommand, region_is_explicit: bool):
+        """Cache a validated command, evicting the least recently used one if full."""
+        if self.max_size <= 0:
+            return
+        entry = CachedCommand(copy.deepcopy(ir_command), region_is_explicit)
+        with self._lock:
+            self._entries[tokens] = entry
+            self._entries.move_to_end(tokens)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached commands."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.hits + self.misses
+        return {
+            'size': size,
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        """Return the number of cached commands."""
+        return len(self._entries)
+
+
+PARSED_COMMAND_CACHE = ParsedCommandCache()
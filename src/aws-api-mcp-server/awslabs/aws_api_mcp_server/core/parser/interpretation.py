@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import boto3
-import json
+from ..aws.client_pool import CLIENT_POOL, EXPIRED_CREDENTIALS_ERROR_CODES, make_client_key
 from ..aws.pagination import build_result
 from ..aws.services import (
     extract_pagination_config,
@@ -21,8 +21,9 @@ from ..aws.services import (
 from ..common.command import IRCommand, OutputFile
 from ..common.config import CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS, get_user_agent_extra
 from ..common.file_system_controls import validate_file_path
-from ..common.helpers import Boto3Encoder, operation_timer
+from ..common.helpers import make_json_compatible, operation_timer
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from jmespath.parser import ParsedResult
 from typing import Any
 
@@ -50,16 +51,26 @@ def interpret(
     parameters = config_result.parameters
     pagination_config = config_result.pagination_config
 
-    config = Config(
-        region_name=region,
-        connect_timeout=CONNECT_TIMEOUT_SECONDS,
-        read_timeout=READ_TIMEOUT_SECONDS,
-        retries={'max_attempts': 3, 'mode': 'adaptive'},
-        user_agent_extra=get_user_agent_extra(),
+    user_agent_extra = get_user_agent_extra()
+    client_key = make_client_key(
+        ir.service_name,
+        region,
+        endpoint_url,
+        access_key_id,
+        secret_access_key,
+        session_token,
+        user_agent_extra,
     )
 
-    with operation_timer(ir.service_name, ir.operation_python_name, region):
-        client = boto3.client(
+    def create_client():
+        config = Config(
+            region_name=region,
+            connect_timeout=CONNECT_TIMEOUT_SECONDS,
+            read_timeout=READ_TIMEOUT_SECONDS,
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            user_agent_extra=user_agent_extra,
+        )
+        return boto3.client(
             ir.service_name,
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key,
@@ -68,21 +79,31 @@ def interpret(
             endpoint_url=endpoint_url,
         )
 
-        if client.can_paginate(ir.operation_python_name):
-            response = build_result(
-                paginator=client.get_paginator(ir.operation_python_name),
-                service_name=ir.service_name,
-                operation_name=ir.operation_name,
-                operation_parameters=ir.parameters,
-                pagination_config=pagination_config,
-                client_side_filter=client_side_filter,
-            )
-        else:
-            operation = getattr(client, ir.operation_python_name)
-            response = operation(**parameters)
-
-            if client_side_filter is not None:
-                response = _apply_filter(response, client_side_filter)
+    with operation_timer(ir.service_name, ir.operation_python_name, region, CLIENT_POOL):
+        client = CLIENT_POOL.get_client(
+            client_key, create_client, has_temporary_credentials=session_token is not None
+        )
+
+        try:
+            if client.can_paginate(ir.operation_python_name):
+                response = build_result(
+                    paginator=client.get_paginator(ir.operation_python_name),
+                    service_name=ir.service_name,
+                    operation_name=ir.operation_name,
+                    operation_parameters=ir.parameters,
+                    pagination_config=pagination_config,
+                    client_side_filter=client_side_filter,
+                )
+            else:
+                operation = getattr(client, ir.operation_python_name)
+                response = operation(**parameters)
+
+                if client_side_filter is not None:
+                    response = _apply_filter(response, client_side_filter)
+        except ClientError as error:
+            if error.response.get('Error', {}).get('Code') in EXPIRED_CREDENTIALS_ERROR_CODES:
+                CLIENT_POOL.invalidate(client_key)
+            raise
 
         if ir.has_streaming_output and ir.output_file and ir.output_file.path != '-':
             response = _handle_streaming_output(response, ir.output_file)
@@ -106,6 +127,5 @@ def _handle_streaming_output(response: dict[str, Any], output_file: OutputFile)
 
 def _apply_filter(response: dict[str, Any], client_side_filter: ParsedResult) -> dict[str, Any]:
     response_metadata = response.get('ResponseMetadata')
-    json_compatible_response = json.loads(json.dumps(response, cls=Boto3Encoder))
-    filtered_result = client_side_filter.search(json_compatible_response)
+    filtered_result = client_side_filter.search(make_json_compatible(response))
     return {'Result': filtered_result, 'ResponseMetadata': response_metadata}
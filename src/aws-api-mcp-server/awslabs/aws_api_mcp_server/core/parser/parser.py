@@ -14,9 +14,12 @@
 
 import argparse
 import botocore.serialize
+import dataclasses
+import functools
 import ipaddress
 import jmespath
 import re
+import threading
 from ..aws.regions import GLOBAL_SERVICE_REGIONS
 from ..aws.services import (
     get_awscli_driver,
@@ -51,6 +54,7 @@ from ..common.errors import (
 )
 from ..common.file_system_controls import extract_file_paths_from_parameters, validate_file_path
 from ..common.helpers import expand_user_home_directory, is_help_operation
+from .command_cache import PARSED_COMMAND_CACHE
 from .custom_validators.botocore_param_validator import BotoCoreParamValidator
 from .custom_validators.ec2_validator import validate_ec2_parameter_values
 from .custom_validators.ssm_validator import perform_ssm_validations
@@ -59,9 +63,11 @@ from argparse import Namespace
 from awscli.argparser import ArgTableArgParser, CommandAction, MainArgParser
 from awscli.argprocess import ParamError
 from awscli.arguments import BaseCLIArgument, CLIArgument
-from awscli.clidriver import ServiceCommand
+from awscli.clidriver import CLIDriver, ServiceCommand
 from botocore.exceptions import ParamValidationError, UndefinedModelAttributeError
 from botocore.model import OperationModel, ServiceModel
+from botocore.serialize import Serializer
+from botocore.validate import ParamValidationDecorator
 from collections.abc import Generator
 from difflib import SequenceMatcher
 from jmespath.exceptions import ParseError
@@ -159,6 +165,9 @@ _excluded_optional_params = frozenset(
     }
 )
 
+# Values read from local files or URLs must be loaded and validated again on every call
+UNCACHEABLE_VALUE_MARKERS = ('file://', 'fileb://', 'http://', 'https://')
+
 NARGS_ONE_ARGUMENT = None
 NARGS_OPTIONAL = '?'
 NARGS_ONE_OR_MORE = '+'
@@ -306,12 +315,12 @@ class GlobalArgParser(MainArgParser):
         self.add_argument('command', action=CommandAction, command_table=command_table)
 
     @staticmethod
-    def get_parser():
+    def get_parser(driver: CLIDriver, command_table: dict[str, Any]):
         """Return a new instance of GlobalArgParser."""
         return GlobalArgParser(
             command_table,
-            session.user_agent(),
-            cli_data.get('description', None),
+            driver.session.user_agent(),
+            driver._get_cli_data().get('description', None),
             driver._get_argument_table(),
             prog='aws',
         )
@@ -323,7 +332,7 @@ class GlobalArgParser(MainArgParser):
 
 def is_custom_operation(service, operation):
     """Returns true if the service operation is cli customization."""
-    service_command = command_table.get(service, None)
+    service_command = get_command_table().get(service, None)
     if not service_command:
         raise InvalidServiceError(service)
 
@@ -363,35 +372,102 @@ def is_denied_custom_operation(service, operation):
     return not (service in allowed_operations and operation in allowed_operations[service])
 
 
-driver = get_awscli_driver()
-session = driver.session
-command_table = driver._get_command_table()
-cli_data = driver._get_cli_data()
-parser = GlobalArgParser.get_parser()
-driver._add_aliases(command_table, parser)
+class _AwsCli(NamedTuple):
+    driver: CLIDriver
+    command_table: dict[str, Any]
+    parser: GlobalArgParser
+
+
+# Operation parsers are shared and keep the command being parsed as state
+_operation_parser_lock = threading.Lock()
+
+
+@functools.cache
+def _get_aws_cli() -> _AwsCli:
+    """Build the awscli driver, its command table and the global parser on first use."""
+    driver = get_awscli_driver()
+    command_table = driver._get_command_table()
+    parser = GlobalArgParser.get_parser(driver, command_table)
+    driver._add_aliases(command_table, parser)
+    return _AwsCli(driver, command_table, parser)
+
+
+def get_command_table() -> dict[str, Any]:
+    """Return the awscli top-level command table."""
+    return _get_aws_cli().command_table
+
+
+@functools.cache
+def _get_service_parser(service_command: ServiceCommand) -> argparse.ArgumentParser:
+    """Return the service-level parser, built once per service."""
+    return service_command._create_parser()
+
+
+@functools.cache
+def _get_operation_parser(operation_command: Any) -> ArgTableParser:
+    """Return the parser for an operation's argument table, built once per operation."""
+    return ArgTableParser(operation_command.arg_table)
+
+
+@functools.cache
+def _get_serializer(protocol: str) -> Serializer | ParamValidationDecorator:
+    return botocore.serialize.create_serializer(protocol, include_validation=False)
 
 
 def parse(cli_command: str, default_region_override: str | None = None) -> IRCommand:
-    """Parse a CLI command string into an IRCommand object."""
+    """Parse a CLI command string into an IRCommand object.
+
+    Validated service commands are cached by their tokens, so a repeated command skips
+    argument parsing and validation and only has its default region resolved again.
+    """
     tokens = split_cli_command(cli_command)
     # Strip `aws` and expand paths beginning with ~
     tokens = expand_user_home_directory(tokens[1:])
-    service_namespace, args = parser.parse_known_args(tokens)
-    service_command = command_table[service_namespace.command]
+
+    cached = PARSED_COMMAND_CACHE.get(tuple(tokens))
+    if cached is not None:
+        if cached.region_is_explicit:
+            return cached.ir_command
+        return dataclasses.replace(
+            cached.ir_command,
+            region=_default_region(cached.ir_command.profile, default_region_override),
+        )
+
+    service_namespace, args = _get_aws_cli().parser.parse_known_args(tokens)
+    service_command = get_command_table()[service_namespace.command]
 
     if service_command.name in DENIED_CUSTOM_SERVICES:
         raise ServiceNotAllowedError(service_command.name)
 
     if isinstance(service_command, ServiceCommand):
-        return _handle_service_command(
+        ir_command = _handle_service_command(
             service_command, service_namespace, args, default_region_override
         )
+        if _is_cacheable(service_command, ir_command, tokens):
+            PARSED_COMMAND_CACHE.put(
+                tuple(tokens), ir_command, region_is_explicit=bool(service_namespace.region)
+            )
+        return ir_command
 
     return _handle_awscli_customization(
         service_namespace, args, tokens[0], default_region_override
     )
 
 
+def _is_cacheable(service_command: ServiceCommand, ir_command: IRCommand, tokens: list[str]):
+    """Check whether a parsed command depends only on its tokens.
+
+    Commands that read or write local files are parsed again on every call, as the files
+    and the file access settings they were validated against may change.
+    """
+    if ir_command.is_awscli_customization or ir_command.has_streaming_output:
+        return False
+    operation_model = service_command.service_model.operation_model(ir_command.operation_name)
+    if operation_model.has_streaming_input:
+        return False
+    return not any(marker in token for token in tokens for marker in UNCACHEABLE_VALUE_MARKERS)
+
+
 def _handle_service_command(
     service_command: ServiceCommand,
     global_args: argparse.Namespace,
@@ -420,10 +496,10 @@ def _handle_service_command(
     _validate_global_args(service, global_args)
     region = getattr(global_args, 'region', None)
 
-    service_parser = service_command._create_parser()
-    service_args, service_remaining = service_parser.parse_known_args(remaining)
-    operation_parser = ArgTableParser(operation_command.arg_table)
-    parsed_args = operation_parser.parse_operation_args(command_metadata, service_remaining)
+    _, service_remaining = _get_service_parser(service_command).parse_known_args(remaining)
+    operation_parser = _get_operation_parser(operation_command)
+    with _operation_parser_lock:
+        parsed_args = operation_parser.parse_operation_args(command_metadata, service_remaining)
     _handle_invalid_parameters(command_metadata, service, operation, parsed_args)
 
     try:
@@ -486,8 +562,7 @@ def _handle_awscli_customization(
 
     operation = remaining[0]
 
-    command_table = driver._get_command_table()
-    service_command = command_table.get(service)
+    service_command = get_command_table().get(service)
 
     if service_command is None:
         raise InvalidServiceError(service)
@@ -718,9 +793,7 @@ def _validate_request_serialization(
     validated_parameters.pop('PaginationConfig', None)
 
     # Parameter validation has been done, just serialize
-    serializer = botocore.serialize.create_serializer(
-        service_model.metadata['protocol'], include_validation=False
-    )
+    serializer = _get_serializer(service_model.metadata['protocol'])
     try:
         serializer.serialize_to_request(validated_parameters, operation_model)
     except ParamValidationError as err:
@@ -874,8 +947,7 @@ def _construct_command(
     region = (
         getattr(global_args, 'region', None)
         or _fetch_region_from_arn(parameters)
-        or default_region_override
-        or get_region(profile or AWS_API_MCP_PROFILE_NAME)
+        or _default_region(profile, default_region_override)
     )
 
     client_side_query = getattr(global_args, 'query', None)
@@ -911,6 +983,10 @@ def _construct_command(
     )
 
 
+def _default_region(profile: str | None, default_region_override: str | None) -> str:
+    return default_region_override or get_region(profile or AWS_API_MCP_PROFILE_NAME)
+
+
 def _service_full_name(service_model: ServiceModel) -> str | None:
     try:
         return service_model._get_metadata_property('serviceFullName')
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
 import os
 import sys
+import threading
 from .core.agent_scripts.manager import AGENT_SCRIPTS_MANAGER
 from .core.aws.driver import translate_cli_to_ir
 from .core.aws.service import (
@@ -25,6 +28,9 @@ from .core.aws.service import (
     validate,
 )
 from .core.common.config import (
+    CALL_AWS_BATCH_DEFAULT_TIMEOUT_SECONDS,
+    CALL_AWS_BATCH_MAX_COMMANDS,
+    CALL_AWS_BATCH_MAX_WORKERS,
     DEFAULT_REGION,
     ENABLE_AGENT_SCRIPTS,
     ENDPOINT_SUGGEST_AWS_COMMANDS,
@@ -45,13 +51,17 @@ from .core.common.errors import AwsApiMcpError, CommandValidationError
 from .core.common.helpers import get_requests_session, validate_aws_region
 from .core.common.models import (
     AwsCliAliasResponse,
+    BatchCommandResult,
+    BatchInterpretationResponse,
     Credentials,
+    IRTranslation,
     ProgramInterpretationResponse,
 )
 from .core.metadata.read_only_operations_list import ReadOnlyOperations, get_read_only_operations
 from .core.security.policy import PolicyDecision
 from .middleware.http_header_validation_middleware import HTTPHeaderValidationMiddleware
 from botocore.exceptions import NoCredentialsError
+from concurrent.futures import ThreadPoolExecutor
 from fastmcp import Context, FastMCP
 from loguru import logger
 from mcp.types import ToolAnnotations
@@ -76,6 +86,20 @@ server = FastMCP(
 )
 READ_OPERATIONS_INDEX: Optional[ReadOnlyOperations] = None
 
+# Commands of a batch run on this pool. A command that times out keeps its worker until
+# the underlying call returns, so the pool bounds the number of calls in flight.
+_batch_executor = ThreadPoolExecutor(
+    max_workers=CALL_AWS_BATCH_MAX_WORKERS, thread_name_prefix='call-aws-batch'
+)
+# awscli customizations capture the process-wide stdout and stderr while they run
+_customization_lock = threading.Lock()
+
+_NO_CREDENTIALS_MESSAGE = (
+    'Error while executing the command: No AWS credentials found. '
+    "Please configure your AWS credentials using 'aws configure' "
+    'or set appropriate environment variables.'
+)
+
 _FILE_ACCESS_MSGS = {
     FileAccessMode.UNRESTRICTED: f"File access is unrestricted so commands can reference files anywhere; use forward slashes (/) regardless of the system (e.g. 'c:/users/name/file.txt' or 'subdir/file.txt'); relative paths resolve from the working directory ({WORKING_DIRECTORY}).",
     FileAccessMode.NO_ACCESS: 'File access is disabled and commands with any local file reference will be rejected. S3 URIs (s3://...) and stdout redirect (-) remain allowed.',
@@ -248,6 +272,171 @@ async def call_aws_helper(
     default_region: str | None = None,
 ) -> ProgramInterpretationResponse | AwsCliAliasResponse:
     """Helper function that actually calls aws."""
+    ir = await _translate_and_validate(cli_command, ctx)
+
+    try:
+        await _check_security_policy(cli_command, ir, ctx)
+
+        if ir.command and ir.command.is_help_operation:
+            return await get_help_document(cli_command, ctx)
+
+        return _execute_command(cli_command, ir, max_results, credentials, default_region)
+    except NoCredentialsError:
+        await ctx.error(_NO_CREDENTIALS_MESSAGE)
+        raise AwsApiMcpError(_NO_CREDENTIALS_MESSAGE)
+    except AwsApiMcpError as e:
+        await ctx.error(e.as_failure().reason)
+        raise
+    except Exception as e:
+        error_message = f'Error while executing the command: {str(e)}'
+        await ctx.error(error_message)
+        raise AwsApiMcpError(error_message)
+
+
+@server.tool(
+    name='call_aws_batch',
+    description=f"""Execute several independent AWS CLI commands concurrently and return all their results in one call. Use this instead of repeated 'call_aws' calls when the commands do not depend on each other's output, e.g. describing the same resources in several regions or accounts.
+    Key points:
+    - Each command MUST start with "aws" and follow the same syntax and restrictions as in 'call_aws'
+    - Up to {CALL_AWS_BATCH_MAX_COMMANDS} commands per call; each is validated and checked against the security policy on its own
+    - Commands run concurrently, so DO NOT batch commands whose order matters or that use each other's results
+    - Each command has its own timeout; a failing or timed out command does not affect the others
+
+    Returns:
+        One result per command, in the same order as the commands, with either the command's response or its error
+    """,
+    annotations=ToolAnnotations(
+        title='Execute AWS CLI commands in batch',
+        readOnlyHint=READ_OPERATIONS_ONLY_MODE,
+        destructiveHint=not READ_OPERATIONS_ONLY_MODE,
+        openWorldHint=True,
+    ),
+)
+async def call_aws_batch(
+    cli_commands: Annotated[
+        list[str],
+        Field(
+            description='The complete AWS CLI commands to execute. Each MUST start with "aws"',
+            min_length=1,
+            max_length=CALL_AWS_BATCH_MAX_COMMANDS,
+        ),
+    ],
+    ctx: Context,
+    max_results: Annotated[
+        int | None,
+        Field(description='Optional limit for number of results of each command'),
+    ] = None,
+    timeout_seconds: Annotated[
+        int,
+        Field(description='Maximum time in seconds to wait for each command', ge=1, le=900),
+    ] = CALL_AWS_BATCH_DEFAULT_TIMEOUT_SECONDS,
+) -> BatchInterpretationResponse:
+    """Call AWS with several CLI commands concurrently and return their results in order."""
+    return await call_aws_batch_helper(
+        cli_commands=cli_commands,
+        ctx=ctx,
+        max_results=max_results,
+        timeout_seconds=timeout_seconds,
+        credentials=None,
+    )
+
+
+async def call_aws_batch_helper(
+    cli_commands: list[str],
+    ctx: Context,
+    max_results: int | None = None,
+    timeout_seconds: float = CALL_AWS_BATCH_DEFAULT_TIMEOUT_SECONDS,
+    credentials: Credentials | None = None,
+    default_region: str | None = None,
+) -> BatchInterpretationResponse:
+    """Validate, authorize and execute commands, running executions on a bounded pool.
+
+    Validation and security checks run one command at a time since they may ask the user
+    for consent, and each command starts executing as soon as it is allowed.
+    """
+    executions = []
+    try:
+        for cli_command in cli_commands:
+            try:
+                ir = await _translate_and_validate(cli_command, ctx)
+                await _check_security_policy(cli_command, ir, ctx)
+            except AwsApiMcpError as e:
+                executions.append(_failed_batch_item(cli_command, e.as_failure().reason))
+                continue
+            except Exception as e:
+                error_message = f'Error while checking the command: {str(e)}'
+                await ctx.error(error_message)
+                executions.append(_failed_batch_item(cli_command, error_message))
+                continue
+
+            executions.append(
+                asyncio.create_task(
+                    _execute_batch_item(
+                        cli_command,
+                        ir,
+                        ctx,
+                        max_results,
+                        timeout_seconds,
+                        credentials,
+                        default_region,
+                    )
+                )
+            )
+    except BaseException:
+        # Do not leave already started commands running unobserved when the batch is aborted
+        started = [execution for execution in executions if isinstance(execution, asyncio.Task)]
+        for execution in executions:
+            if isinstance(execution, asyncio.Task):
+                execution.cancel()
+            else:
+                execution.close()
+        await asyncio.gather(*started, return_exceptions=True)
+        raise
+
+    return BatchInterpretationResponse(results=list(await asyncio.gather(*executions)))
+
+
+async def _failed_batch_item(cli_command: str, error: str) -> BatchCommandResult:
+    return BatchCommandResult(cli_command=cli_command, error=error)
+
+
+async def _execute_batch_item(
+    cli_command: str,
+    ir: IRTranslation,
+    ctx: Context,
+    max_results: int | None,
+    timeout_seconds: float,
+    credentials: Credentials | None,
+    default_region: str | None,
+) -> BatchCommandResult:
+    try:
+        if ir.command and ir.command.is_help_operation:
+            execution = get_help_document(cli_command, ctx)
+        else:
+            execution = asyncio.get_running_loop().run_in_executor(
+                _batch_executor,
+                functools.partial(
+                    _execute_command, cli_command, ir, max_results, credentials, default_region
+                ),
+            )
+        result = await asyncio.wait_for(execution, timeout=timeout_seconds)
+        return BatchCommandResult(cli_command=cli_command, result=result)
+    except TimeoutError:
+        error_message = (
+            f'Error while executing the command: timed out after {timeout_seconds} seconds'
+        )
+    except NoCredentialsError:
+        error_message = _NO_CREDENTIALS_MESSAGE
+    except AwsApiMcpError as e:
+        error_message = e.as_failure().reason
+    except Exception as e:
+        error_message = f'Error while executing the command: {str(e)}'
+
+    await ctx.error(error_message)
+    return BatchCommandResult(cli_command=cli_command, error=error_message)
+
+
+async def _translate_and_validate(cli_command: str, ctx: Context) -> IRTranslation:
     try:
         ir = translate_cli_to_ir(cli_command)
         ir_validation = validate(ir)
@@ -271,33 +460,40 @@ async def call_aws_helper(
         ir.command.service_name,
         ir.command.operation_cli_name,
     )
+    return ir
 
-    try:
-        # Check security policy
-        if READ_OPERATIONS_INDEX is not None:
-            policy_decision = check_security_policy(ir, READ_OPERATIONS_INDEX, ctx)
 
-            if policy_decision == PolicyDecision.DENY:
-                error_message = 'Execution of this operation is denied by security policy.'
-                await ctx.error(error_message)
-                raise AwsApiMcpError(error_message)
-            elif policy_decision == PolicyDecision.ELICIT:
-                await request_consent(cli_command, ctx)
-        else:
-            if READ_OPERATIONS_ONLY_MODE:
-                error_message = (
-                    'Execution of this operation is not allowed because read only mode is enabled. '
-                    f'It can be disabled by setting the {READ_ONLY_KEY} environment variable to False.'
-                )
-                await ctx.error(error_message)
-                raise AwsApiMcpError(error_message)
-            elif REQUIRE_MUTATION_CONSENT:
-                await request_consent(cli_command, ctx)
+async def _check_security_policy(cli_command: str, ir: IRTranslation, ctx: Context):
+    if READ_OPERATIONS_INDEX is not None:
+        policy_decision = check_security_policy(ir, READ_OPERATIONS_INDEX, ctx)
 
-        if ir.command and ir.command.is_help_operation:
-            return await get_help_document(cli_command, ctx)
+        if policy_decision == PolicyDecision.DENY:
+            error_message = 'Execution of this operation is denied by security policy.'
+            await ctx.error(error_message)
+            raise AwsApiMcpError(error_message)
+        elif policy_decision == PolicyDecision.ELICIT:
+            await request_consent(cli_command, ctx)
+    else:
+        if READ_OPERATIONS_ONLY_MODE:
+            error_message = (
+                'Execution of this operation is not allowed because read only mode is enabled. '
+                f'It can be disabled by setting the {READ_ONLY_KEY} environment variable to False.'
+            )
+            await ctx.error(error_message)
+            raise AwsApiMcpError(error_message)
+        elif REQUIRE_MUTATION_CONSENT:
+            await request_consent(cli_command, ctx)
 
-        if ir.command and ir.command.is_awscli_customization:
+
+def _execute_command(
+    cli_command: str,
+    ir: IRTranslation,
+    max_results: int | None,
+    credentials: Credentials | None,
+    default_region: str | None,
+) -> ProgramInterpretationResponse | AwsCliAliasResponse:
+    if ir.command and ir.command.is_awscli_customization:
+        with _customization_lock:
             return execute_awscli_customization(
                 cli_command,
                 ir.command,
@@ -305,27 +501,12 @@ async def call_aws_helper(
                 default_region_override=default_region,
             )
 
-        return interpret_command(
-            cli_command=cli_command,
-            max_results=max_results,
-            credentials=credentials,
-            default_region_override=default_region,
-        )
-    except NoCredentialsError:
-        error_message = (
-            'Error while executing the command: No AWS credentials found. '
-            "Please configure your AWS credentials using 'aws configure' "
-            'or set appropriate environment variables.'
-        )
-        await ctx.error(error_message)
-        raise AwsApiMcpError(error_message)
-    except AwsApiMcpError as e:
-        await ctx.error(e.as_failure().reason)
-        raise
-    except Exception as e:
-        error_message = f'Error while executing the command: {str(e)}'
-        await ctx.error(error_message)
-        raise AwsApiMcpError(error_message)
+    return interpret_command(
+        cli_command=cli_command,
+        max_results=max_results,
+        credentials=credentials,
+        default_region_override=default_region,
+    )
 
 
 # EXPERIMENTAL: Agent scripts tool - only registered if ENABLE_AGENT_SCRIPTS is True
@@ -0,0 +1,153 @@
+import pytest
+from awslabs.aws_api_mcp_server.core.aws.client_pool import (
+    CLIENT_POOL,
+    Boto3ClientPool,
+    make_client_key,
+)
+from awslabs.aws_api_mcp_server.core.aws.driver import translate_cli_to_ir
+from awslabs.aws_api_mcp_server.core.parser.interpretation import interpret
+from botocore.exceptions import ClientError
+from tests.fixtures import TEST_CREDENTIALS, patch_botocore
+from unittest.mock import MagicMock, patch
+
+
+def _key(service='ec2', region='us-east-1', access_key_id='AKID', secret='secret', token=None):
+    return make_client_key(service, region, None, access_key_id, secret, token, 'ua')
+
+
+def test_client_reused_for_same_key():
+    """Test that a second lookup with the same key is served from the pool."""
+    pool = Boto3ClientPool(max_size=2)
+    create_client = MagicMock(side_effect=lambda: MagicMock())
+
+    first = pool.get_client(_key(), create_client, has_temporary_credentials=False)
+    second = pool.get_client(_key(), create_client, has_temporary_credentials=False)
+
+    assert first is second
+    assert create_client.call_count == 1
+    assert pool.stats() == {
+        'size': 1,
+        'max_size': 2,
+        'hits': 1,
+        'misses': 1,
+        'evictions': 0,
+        'hit_rate': 0.5,
+    }
+
+
+@pytest.mark.parametrize(
+    'other_key',
+    [
+        _key(service='s3'),
+        _key(region='eu-west-1'),
+        _key(access_key_id='OTHER'),
+        _key(secret='other-secret'),
+        _key(token='token'),
+        make_client_key('ec2', 'us-east-1', 'http://localhost:4566', 'AKID', 'secret', None, 'ua'),
+    ],
+)
+def test_client_not_shared_across_identities(other_key):
+    """Test that service, region, endpoint and credentials all separate clients."""
+    pool = Boto3ClientPool(max_size=10)
+    create_client = MagicMock(side_effect=lambda: MagicMock())
+
+    first = pool.get_client(_key(), create_client, has_temporary_credentials=False)
+    second = pool.get_client(other_key, create_client, has_temporary_credentials=False)
+
+    assert first is not second
+
+
+def test_key_does_not_contain_secret():
+    """Test that the secret key and session token are only kept as a digest."""
+    key = _key(secret='my-secret', token='my-token')
+
+    assert 'my-secret' not in repr(key)
+    assert 'my-token' not in repr(key)
+
+
+def test_least_recently_used_client_evicted():
+    """Test LRU eviction when the pool is full."""
+    pool = Boto3ClientPool(max_size=2)
+    create_client = MagicMock(side_effect=lambda: MagicMock())
+    pool.get_client(_key('ec2'), create_client, False)
+    pool.get_client(_key('s3'), create_client, False)
+    pool.get_client(_key('ec2'), create_client, False)
+
+    pool.get_client(_key('sts'), create_client, False)
+    pool.get_client(_key('ec2'), create_client, False)
+
+    assert len(pool) == 2
+    assert create_client.call_count == 3
+    assert pool.evictions == 1
+
+
+def test_temporary_credentials_client_expires():
+    """Test that clients built from temporary credentials are retired after the TTL."""
+    pool = Boto3ClientPool(max_size=2, temporary_credentials_ttl_seconds=60)
+    create_client = MagicMock(side_effect=lambda: MagicMock())
+
+    with patch(
+        'awslabs.aws_api_mcp_server.core.aws.client_pool.time.monotonic', side_effect=[0, 61, 61]
+    ):
+        first = pool.get_client(_key(token='t'), create_client, has_temporary_credentials=True)
+        second = pool.get_client(_key(token='t'), create_client, has_temporary_credentials=True)
+
+    assert first is not second
+    assert pool.evictions == 1
+
+
+def test_zero_size_disables_pooling():
+    """Test that a pool of size zero never keeps clients."""
+    pool = Boto3ClientPool(max_size=0)
+    create_client = MagicMock(side_effect=lambda: MagicMock())
+
+    pool.get_client(_key(), create_client, False)
+    pool.get_client(_key(), create_client, False)
+
+    assert create_client.call_count == 2
+    assert len(pool) == 0
+
+
+def test_interpret_reuses_client():
+    """Test that repeated interpret calls reuse the same boto3 client."""
+    ir = translate_cli_to_ir('aws sts get-caller-identity').command
+    assert ir is not None
+    CLIENT_POOL.clear()
+
+    with patch_botocore():
+        with patch(
+            'awslabs.aws_api_mcp_server.core.parser.interpretation.boto3.client',
+            wraps=__import__('boto3').client,
+        ) as mock_client:
+            for _ in range(3):
+                interpret(
+                    ir,
+                    access_key_id=TEST_CREDENTIALS['access_key_id'],
+                    secret_access_key=TEST_CREDENTIALS['secret_access_key'],
+                    session_token=TEST_CREDENTIALS['session_token'],
+                    region='us-east-1',
+                )
+
+    assert mock_client.call_count == 1
+
+
+def test_interpret_evicts_client_on_expired_token():
+    """Test that a client whose credentials expired is dropped from the pool."""
+    ir = translate_cli_to_ir('aws sts get-caller-identity').command
+    assert ir is not None
+    CLIENT_POOL.clear()
+    expired = ClientError(
+        {'Error': {'Code': 'ExpiredToken', 'Message': 'expired'}}, 'GetCallerIdentity'
+    )
+
+    with patch('botocore.client.BaseClient._make_api_call', side_effect=expired):
+        with pytest.raises(ClientError):
+            interpret(
+                ir,
+                access_key_id=TEST_CREDENTIALS['access_key_id'],
+                secret_access_key=TEST_CREDENTIALS['secret_access_key'],
+                session_token=TEST_CREDENTIALS['session_token'],
+                region='us-east-1',
+            )
+
+    assert len(CLIENT_POOL) == 0
@@ -1,5 +1,8 @@
 import jmespath
-from awslabs.aws_api_mcp_server.core.aws.pagination import build_result
+import pytest
+import threading
+from awslabs.aws_api_mcp_server.core.aws.pagination import build_result, can_filter_per_page
+from datetime import datetime
 from unittest.mock import MagicMock, Mock
 
 
@@ -123,3 +126,139 @@ def test_build_result_with_max_results():
     assert functions[1].get('FunctionName') == 'my-function-2'
     assert (result.get('ResponseMetadata') or {}).get('HTTPStatusCode') == 200
     assert result.get('pagination_token') is None
+
+
+def _mock_paginator(pages):
+    mock_paginator = Mock()
+    mock_page_iter = MagicMock()
+
+    mock_page_iter.__iter__.return_value = pages
+    mock_page_iter.result_keys = [jmespath.compile('Functions')]
+    mock_page_iter.resume_token = None
+    mock_page_iter.non_aggregate_part = {}
+    mock_paginator.paginate.return_value = mock_page_iter
+    return mock_paginator
+
+
+@pytest.mark.parametrize(
+    'expression,expected',
+    [
+        ('Functions[].FunctionName', True),
+        ('Functions[*].{Name: FunctionName}', True),
+        ("Functions[?Runtime=='nodejs20.x']", True),
+        ('Functions[]', True),
+        ('Functions[].Layers[].Arn', True),
+        ('Functions', False),
+        ('Functions[0]', False),
+        ('Functions[:1]', False),
+        ('length(Functions)', False),
+        ('Functions[].FunctionName | [0]', False),
+        ('sort_by(Functions, &FunctionName)[].FunctionName', False),
+        ('Other[].FunctionName', False),
+    ],
+)
+def test_can_filter_per_page(expression, expected):
+    """Test which client-side filters can be applied to each page separately."""
+    result_keys = [jmespath.compile('Functions')]
+
+    assert can_filter_per_page(jmespath.compile(expression), result_keys) is expected
+
+
+@pytest.mark.parametrize(
+    'expression',
+    [
+        'Functions[].FunctionName',
+        "Functions[?FunctionName=='my-function-2'].FunctionArn",
+        'Functions[].Missing',
+        'Functions[0].FunctionName',
+        'length(Functions)',
+        'Functions[].FunctionName | sort(@)',
+    ],
+)
+def test_build_result_filter_matches_filter_on_merged_pages(expression):
+    """Test that per-page filtering gives the same result as filtering the merged result."""
+    client_side_filter = jmespath.compile(expression)
+    expected = client_side_filter.search(
+        {'Functions': [function for page in get_pages() for function in page['Functions']]}
+    )
+
+    result = build_result(
+        paginator=_mock_paginator(get_pages()),
+        service_name='lambda',
+        operation_name='ListFunctions',
+        operation_parameters={},
+        pagination_config={},
+        client_side_filter=client_side_filter,
+    )
+
+    assert result['Result'] == expected
+
+
+def test_build_result_filter_without_result_key():
+    """Test that a filter over pages without the result key returns None."""
+    pages = [{'ResponseMetadata': {'HTTPStatusCode': 200}}]
+
+    result = build_result(
+        paginator=_mock_paginator(pages),
+        service_name='lambda',
+        operation_name='ListFunctions',
+        operation_parameters={},
+        pagination_config={},
+        client_side_filter=jmespath.compile('Functions[].FunctionName'),
+    )
+
+    assert result['Result'] is None
+
+
+def test_build_result_filter_on_datetimes():
+    """Test that datetimes are compared as ISO strings, like in the CLI output."""
+    pages = get_pages()
+    pages[0]['Functions'][0]['LastModified'] = datetime(2025, 2, 3, 20, 55)
+    pages[1]['Functions'][0]['LastModified'] = datetime(2025, 3, 3, 20, 55)
+
+    result = build_result(
+        paginator=_mock_paginator(pages),
+        service_name='lambda',
+        operation_name='ListFunctions',
+        operation_parameters={},
+        pagination_config={},
+        client_side_filter=jmespath.compile(
+            "Functions[?starts_with(LastModified, '2025-03')].LastModified"
+        ),
+    )
+
+    assert result['Result'] == ['2025-03-03T20:55:00']
+
+
+def test_build_result_prefetches_next_page():
+    """Test that the next page is requested while the current one is merged."""
+    second_page_requested = threading.Event()
+
+    class WaitingPage(dict):
+        def get(self, key, default=None):
+            # Only returns once the second page was requested in the background
+            if key == 'ResponseMetadata':
+                assert second_page_requested.wait(timeout=5)
+            return super().get(key, default)
+
+    def pages():
+        first_page, second_page = get_pages()
+        yield WaitingPage(first_page)
+        second_page_requested.set()
+        yield second_page
+
+    mock_paginator = _mock_paginator([])
+    mock_paginator.paginate.return_value.__iter__.return_value = pages()
+
+    result = build_result(
+        paginator=mock_paginator,
+        service_name='lambda',
+        operation_name='ListFunctions',
+        operation_parameters={},
+        pagination_config={},
+    )
+
+    assert [function['FunctionName'] for function in result['Functions']] == [
+        'my-function-1',
+        'my-function-2',
+    ]
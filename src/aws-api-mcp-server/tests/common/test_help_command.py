@@ -34,14 +34,14 @@ def test_clean_description():
     assert _clean_description(desc) == 'This is a description.'
 
 
-@patch('awslabs.aws_api_mcp_server.core.common.help_command.driver')
-def test_generate_help_document_unknown_command(mock_driver):
+@patch('awslabs.aws_api_mcp_server.core.common.help_command.get_command_table')
+def test_generate_help_document_unknown_command(mock_get_command_table):
     """Test generating help document for unknown command."""
     service_name = 'unknown'
     operation_name = 'op'
 
     mock_command_table = MagicMock()
-    mock_driver._get_command_table.return_value = mock_command_table
+    mock_get_command_table.return_value = mock_command_table
 
     mock_command_table.__getitem__.return_value = (
         MagicMock()
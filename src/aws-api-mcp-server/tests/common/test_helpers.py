@@ -1,9 +1,13 @@
+import io
 import pytest
 from awslabs.aws_api_mcp_server.core.common.helpers import (
     get_requests_session,
     is_help_operation,
+    make_json_compatible,
     validate_aws_region,
 )
+from botocore.response import StreamingBody
+from datetime import datetime
 from requests.adapters import HTTPAdapter
 from unittest.mock import MagicMock, patch
 
@@ -141,3 +145,23 @@ def test_get_requests_session():
 def test_is_help_operation(args, expected):
     """Test is_help_operation identifies help commands correctly."""
     assert is_help_operation(args) == expected
+
+
+def test_make_json_compatible_matches_boto3_encoder():
+    """Test that in-place conversion gives the same result as a JSON round trip."""
+    body = StreamingBody(io.BytesIO(b'content'), len(b'content'))
+    response = {
+        'Items': [{'Created': datetime(2025, 1, 2, 3, 4, 5), 'Tags': [{'Key': 'k'}]}],
+        'Body': body,
+        'Count': 1,
+    }
+
+    converted = make_json_compatible(response)
+
+    assert converted is response
+    assert converted == {
+        'Items': [{'Created': '2025-01-02T03:04:05', 'Tags': [{'Key': 'k'}]}],
+        'Body': 'content',
+        'Count': 1,
+    }
+    assert make_json_compatible(datetime(2025, 1, 2)) == '2025-01-02T00:00:00'
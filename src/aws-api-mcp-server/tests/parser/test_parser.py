@@ -17,6 +17,10 @@ from awslabs.aws_api_mcp_server.core.common.errors import (
     ServiceNotAllowedError,
     ShortHandParserError,
 )
+from awslabs.aws_api_mcp_server.core.parser.command_cache import (
+    PARSED_COMMAND_CACHE,
+    ParsedCommandCache,
+)
 from awslabs.aws_api_mcp_server.core.parser.parser import (
     _validate_endpoint,
     parse,
@@ -693,3 +697,74 @@ def test_allowed_custom_operations_when_file_access_disabled_is_subset():
         + 'The following operations are in ALLOWED_CUSTOM_OPERATIONS_WHEN_FILE_ACCESS_DISABLED but not in ALLOWED_CUSTOM_OPERATIONS:\n'
         + '\n'.join(extra_operations)
     )
+
+
+def test_repeated_command_served_from_cache():
+    """Test that a repeated command skips argument parsing and validation."""
+    command = 'aws ec2 describe-instances --instance-ids i-0123456789abcdef0 --region eu-west-1'
+    PARSED_COMMAND_CACHE.clear()
+    first = parse(command)
+
+    with patch(
+        'awslabs.aws_api_mcp_server.core.parser.parser._handle_service_command'
+    ) as mock_handle_service_command:
+        second = parse(command)
+
+    mock_handle_service_command.assert_not_called()
+    assert second == first
+    assert second is not first
+    assert second.parameters is not first.parameters
+
+
+def test_cached_command_is_not_shared_with_callers():
+    """Test that mutating a returned command does not affect later parses."""
+    command = 'aws ec2 describe-instances --max-items 5 --region eu-west-1'
+    PARSED_COMMAND_CACHE.clear()
+    parse(command).parameters.pop('PaginationConfig')
+
+    assert parse(command).parameters['PaginationConfig'] == {'MaxItems': 5}
+
+
+def test_cached_command_resolves_default_region_again():
+    """Test that the default region of a cached command follows the current override."""
+    command = 'aws ec2 describe-instances'
+    PARSED_COMMAND_CACHE.clear()
+
+    assert parse(command, default_region_override='eu-west-1').region == 'eu-west-1'
+    assert parse(command, default_region_override='ap-south-1').region == 'ap-south-1'
+    assert len(PARSED_COMMAND_CACHE) == 1
+
+
+@pytest.mark.parametrize(
+    'command',
+    [
+        'aws s3 ls',
+        'aws s3api get-object --bucket b --key k -',
+        'aws s3api put-object --bucket b --key k --body -',
+        'aws ec2 describe-instances --filters file://filters.json',
+    ],
+)
+def test_commands_using_local_files_not_cached(command):
+    """Test that customizations and commands reading or writing files are not cached."""
+    PARSED_COMMAND_CACHE.clear()
+
+    try:
+        parse(command)
+    except Exception:
+        pass
+
+    assert len(PARSED_COMMAND_CACHE) == 0
+
+
+def test_parsed_command_cache_evicts_least_recently_used():
+    """Test LRU eviction in the parsed command cache."""
+    cache = ParsedCommandCache(max_size=2)
+    first = parse('aws ec2 describe-instances --region eu-west-1')
+    cache.put(('a',), first, True)
+    cache.put(('b',), first, True)
+    cache.get(('a',))
+    cache.put(('c',), first, True)
+
+    assert cache.get(('b',)) is None
+    assert cache.get(('a',)) is not None
+    assert cache.stats()['hits'] == 2
@@ -1,5 +1,7 @@
 import pytest
 import requests
+import threading
+import time
 from awslabs.aws_api_mcp_server.core.common.config import get_server_auth
 from awslabs.aws_api_mcp_server.core.common.errors import AwsApiMcpError, CommandValidationError
 from awslabs.aws_api_mcp_server.core.common.help_command import generate_help_document
@@ -13,6 +15,8 @@ from awslabs.aws_api_mcp_server.core.common.models import (
 )
 from awslabs.aws_api_mcp_server.server import (
     call_aws,
+    call_aws_batch,
+    call_aws_batch_helper,
     call_aws_helper,
     main,
     suggest_aws_commands,
@@ -20,6 +24,8 @@ from awslabs.aws_api_mcp_server.server import (
 from botocore.exceptions import NoCredentialsError
 from fastmcp.server.auth import JWTVerifier
 from fastmcp.server.elicitation import AcceptedElicitation
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, ErrorData
 from tests.fixtures import TEST_CREDENTIALS, DummyCtx
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -1181,3 +1187,162 @@ def test_get_server_auth_oauth_valid():
     # Verify the JWTVerifier is configured correctly
     assert auth_provider.issuer == 'https://issuer.example.com'
     assert auth_provider.jwks_uri == 'https://example.com/jwks'
+
+
+def _mock_batch_ir(cli_command: str):
+    mock_command = MagicMock()
+    mock_command.is_awscli_customization = False
+    mock_command.is_help_operation = False
+    mock_command.service_name = 'ec2'
+    mock_command.operation_cli_name = cli_command.split()[2]
+    mock_ir = MagicMock()
+    mock_ir.command = mock_command
+    return mock_ir
+
+
+def _interpretation_response(json: str) -> ProgramInterpretationResponse:
+    return ProgramInterpretationResponse(
+        response=InterpretationResponse(error=None, json=json, status_code=200)
+    )
+
+
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_INDEX', None)
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_ONLY_MODE', False)
+@patch('awslabs.aws_api_mcp_server.server.REQUIRE_MUTATION_CONSENT', False)
+@patch('awslabs.aws_api_mcp_server.server.interpret_command')
+@patch('awslabs.aws_api_mcp_server.server.validate')
+@patch('awslabs.aws_api_mcp_server.server.translate_cli_to_ir')
+async def test_call_aws_batch_runs_commands_concurrently_in_order(
+    mock_translate_cli_to_ir, mock_validate, mock_interpret
+):
+    """Test that batch commands run concurrently and results keep the input order."""
+    commands = [f'aws ec2 describe-instances --region {region}' for region in ('a', 'b', 'c')]
+    all_started = threading.Barrier(len(commands), timeout=5)
+
+    def interpret(cli_command, **kwargs):
+        all_started.wait()
+        # Finish in reverse order
+        time.sleep(0.05 * (len(commands) - commands.index(cli_command)))
+        return _interpretation_response(cli_command)
+
+    mock_translate_cli_to_ir.side_effect = _mock_batch_ir
+    mock_validate.return_value = MagicMock(validation_failed=False)
+    mock_interpret.side_effect = interpret
+
+    result = await call_aws_batch.fn(commands, DummyCtx())
+
+    assert [item.cli_command for item in result.results] == commands
+    assert [item.result.response.as_json for item in result.results] == commands
+    assert all(item.error is None for item in result.results)
+
+
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_INDEX', None)
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_ONLY_MODE', False)
+@patch('awslabs.aws_api_mcp_server.server.REQUIRE_MUTATION_CONSENT', False)
+@patch('awslabs.aws_api_mcp_server.server.interpret_command')
+@patch('awslabs.aws_api_mcp_server.server.validate')
+@patch('awslabs.aws_api_mcp_server.server.translate_cli_to_ir')
+async def test_call_aws_batch_reports_errors_per_command(
+    mock_translate_cli_to_ir, mock_validate, mock_interpret
+):
+    """Test that validation, execution and timeout errors only affect their own command."""
+
+    def translate(cli_command):
+        if 'invalid' in cli_command:
+            raise AwsApiMcpError('Invalid command')
+        return _mock_batch_ir(cli_command)
+
+    def interpret(cli_command, **kwargs):
+        if 'no-credentials' in cli_command:
+            raise NoCredentialsError()
+        if 'slow' in cli_command:
+            time.sleep(2)
+        return _interpretation_response('{}')
+
+    mock_translate_cli_to_ir.side_effect = translate
+    mock_validate.return_value = MagicMock(validation_failed=False)
+    mock_interpret.side_effect = interpret
+
+    result = await call_aws_batch_helper(
+        [
+            'aws ec2 invalid',
+            'aws ec2 no-credentials',
+            'aws ec2 slow',
+            'aws ec2 describe-instances',
+        ],
+        DummyCtx(),  # type: ignore[arg-type]
+        timeout_seconds=0.5,
+    )
+
+    errors = [item.error for item in result.results]
+    assert errors[0] == 'Invalid command'
+    assert errors[1] is not None and 'No AWS credentials found' in errors[1]
+    assert errors[2] == 'Error while executing the command: timed out after 0.5 seconds'
+    assert errors[3] is None
+    assert result.results[3].result == _interpretation_response('{}')
+    assert all(item.result is None for item in result.results[:3])
+
+
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_INDEX', None)
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_ONLY_MODE', True)
+@patch('awslabs.aws_api_mcp_server.server.interpret_command')
+@patch('awslabs.aws_api_mcp_server.server.validate')
+@patch('awslabs.aws_api_mcp_server.server.translate_cli_to_ir')
+async def test_call_aws_batch_applies_security_policy_per_command(
+    mock_translate_cli_to_ir, mock_validate, mock_interpret
+):
+    """Test that commands denied by the security policy are not executed."""
+    mock_translate_cli_to_ir.side_effect = _mock_batch_ir
+    mock_validate.return_value = MagicMock(validation_failed=False)
+
+    result = await call_aws_batch_helper(
+        ['aws ec2 terminate-instances', 'aws ec2 run-instances'],
+        DummyCtx(),  # type: ignore[arg-type]
+    )
+
+    assert all('read only mode is enabled' in (item.error or '') for item in result.results)
+    mock_interpret.assert_not_called()
+
+
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_INDEX', None)
+@patch('awslabs.aws_api_mcp_server.server.READ_OPERATIONS_ONLY_MODE', False)
+@patch('awslabs.aws_api_mcp_server.server.REQUIRE_MUTATION_CONSENT', True)
+@patch('awslabs.aws_api_mcp_server.server.interpret_command')
+@patch('awslabs.aws_api_mcp_server.server.validate')
+@patch('awslabs.aws_api_mcp_server.server.translate_cli_to_ir')
+async def test_call_aws_batch_reports_consent_errors_per_command(
+    mock_translate_cli_to_ir, mock_validate, mock_interpret
+):
+    """Test that an unexpected consent error only fails its own command."""
+
+    async def elicit(message, response_type):
+        if 'run-instances' in message:
+            raise McpError(ErrorData(code=INTERNAL_ERROR, message='Elicitation failed'))
+        return AcceptedElicitation(data=response_type(answer=True))
+
+    mock_translate_cli_to_ir.side_effect = _mock_batch_ir
+    mock_validate.return_value = MagicMock(validation_failed=False)
+    mock_interpret.return_value = _interpretation_response('{}')
+    ctx = DummyCtx()
+    ctx.elicit = elicit  # type: ignore[attr-defined]
+
+    result = await call_aws_batch_helper(
+        [
+            'aws ec2 describe-instances',
+            'aws ec2 run-instances',
+            'aws ec2 describe-volumes',
+        ],
+        ctx,  # type: ignore[arg-type]
+    )
+
+    assert [item.cli_command for item in result.results] == [
+        'aws ec2 describe-instances',
+        'aws ec2 run-instances',
+        'aws ec2 describe-volumes',
+    ]
+    assert result.results[1].error == 'Error while checking the command: Elicitation failed'
+    assert result.results[1].result is None
+    assert [result.results[0].result, result.results[2].result] == [
+        _interpretation_response('{}')
+    ] * 2
+    assert mock_interpret.call_count == 2
@@ -0,0 +1,196 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of documentation pages converted to markdown."""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from loguru import logger
+from pathlib import Path
+from typing import Dict, Optional
+
+
+# Maximum number of converted pages kept in memory
+PAGE_CACHE_SIZE = int(os.getenv('AWS_DOCUMENTATION_CACHE_SIZE', '50'))
+# Pages younger than this are served without asking the server whether they changed
+PAGE_CACHE_TTL_SECONDS = int(os.getenv('AWS_DOCUMENTATION_CACHE_TTL_SECONDS', '600'))
+# Optional directory keeping converted pages across restarts
+PAGE_CACHE_DIR = os.getenv('AWS_DOCUMENTATION_CACHE_DIR')
+# Maximum number of converted pages kept on disk
+PAGE_CACHE_DISK_SIZE = int(os.getenv('AWS_DOCUMENTATION_CACHE_DISK_SIZE', '1000'))
+
+
+@dataclass
+class CachedPage:
+    """A documentation page converted to markdown, with its HTTP validators."""
+
+    url: str
+    content: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get the headers asking the server to only send the page if it changed.
+
+        Returns:
+            If-None-Match/If-Modified-Since headers, empty if the page had no validators
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Bounded LRU cache of converted pages keyed by URL, with an optional on-disk tier.
+
+    Pages evicted from memory stay on disk when a cache directory is configured and are
+    promoted back to memory on their next read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = PAGE_CACHE_SIZE,
+        ttl_seconds: int = PAGE_CACHE_TTL_SECONDS,
+        cache_dir: Optional[str] = PAGE_CACHE_DIR,
+        max_disk_entries: int = PAGE_CACHE_DISK_SIZE,
+    ):
+        """Initialize the page cache.
+
+        Args:
+            max_entries: Maximum number of pages kept in memory (0 disables caching)
+            ttl_seconds: Age after which a page is revalidated before being served
+            cache_dir: Directory for the on-disk tier, or None to only cache in memory
+            max_disk_entries: Maximum number of pages kept in the on-disk tier
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_entries = max_disk_entries
+        self._pages: 'OrderedDict[str, CachedPage]' = OrderedDict()
+
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f'Disabling on-disk page cache in {self.cache_dir}: {e}')
+                self.cache_dir = None
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Get a cached page, looking in memory first and then on disk.
+
+        Args:
+            url: Documentation URL
+
+        Returns:
+            The cached page, or None if it is not cached
+        """
+        page = self._pages.get(url)
+        if page is not None:
+            self._pages.move_to_end(url)
+            return page
+
+        page = self._read_from_disk(url)
+        if page is not None:
+            self._put_in_memory(page)
+        return page
+
+    def put(self, page: CachedPage) -> None:
+        """Cache a page in memory and, if configured, on disk.
+
+        Args:
+            page: Converted page to cache
+        """
+        if self.max_entries <= 0:
+            return
+        self._put_in_memory(page)
+        self._write_to_disk(page)
+
+    def refresh(self, page: CachedPage) -> None:
+        """Mark a page as just validated after the server reported it unchanged.
+
+        Args:
+            page: Cached page that was revalidated
+        """
+        page.fetched_at = time.time()
+        self.put(page)
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """Check whether a page can be served without revalidation.
+
+        Args:
+            page: Cached page
+
+        Returns:
+            True if the page is younger than the TTL
+        """
+        return time.time() - page.fetched_at < self.ttl_seconds
+
+    def clear(self) -> None:
+        """Remove all pages from memory (the on-disk tier is kept)."""
+        self._pages.clear()
+
+    def __len__(self) -> int:
+        """Get the number of pages cached in memory."""
+        return len(self._pages)
+
+    def _put_in_memory(self, page: CachedPage) -> None:
+        self._pages[page.url] = page
+        self._pages.move_to_end(page.url)
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+
+    def _disk_path(self, url: str) -> Path:
+        return self.cache_dir / f'{hashlib.sha256(url.encode()).hexdigest()}.json'  # type: ignore[operator]
+
+    def _read_from_disk(self, url: str) -> Optional[CachedPage]:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(url)
+        try:
+            with open(path, encoding='utf-8') as f:
+                page = CachedPage(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable cached page {path}: {e}')
+            return None
+        return page if page.url == url else None
+
+    def _write_to_disk(self, page: CachedPage) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._disk_path(page.url)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(page), f)
+            os.replace(tmp_path, path)
+            self._prune_disk()
+        except OSError as e:
+            logger.debug(f'Could not write cached page {path}: {e}')
+
+    def _prune_disk(self) -> None:
+        files = list(self.cache_dir.glob('*.json'))  # type: ignore[union-attr]
+        if len(files) <= self.max_disk_entries:
+            return
+        files.sort(key=lambda file: file.stat().st_mtime)
+        for file in files[: len(files) - self.max_disk_entries]:
+            file.unlink(missing_ok=True)
@@ -27,6 +27,9 @@ from awslabs.aws_documentation_mcp_server.models import (
 from awslabs.aws_documentation_mcp_server.server_utils import (
     DEFAULT_USER_AGENT,
     add_search_result_cache_item,
+    get_http_client,
+    http_client_lifespan,
+    read_documentation_batch_impl,
     read_documentation_impl,
 )
 
@@ -44,6 +47,7 @@ from typing import List, Optional
 SEARCH_API_URL = 'https://proxy.search.docs.aws.amazon.com/search'
 RECOMMENDATIONS_API_URL = 'https://contentrecs-api.docs.aws.amazon.com/v1/recommendations'
 SESSION_UUID = str(uuid.uuid4())
+READ_DOCUMENTATION_BATCH_MAX_URLS = 10
 
 
 # Dict for domain modifiers for search if search terms contain any of the terms
@@ -77,6 +81,7 @@ mcp = FastMCP(
 
     - Use `search_documentation` when: You need to find documentation about a specific AWS service or feature
     - Use `read_documentation` when: You have a specific documentation URL and need its content
+    - Use `read_documentation_batch` when: You have several documentation URLs and need all of their content
     - Use `recommend` when: You want to find related content to a documentation page you're already viewing or need to find newly released information
     - Use `recommend` as a fallback when: Multiple searches have not yielded the specific information needed
     """,
@@ -85,6 +90,7 @@ mcp = FastMCP(
         'httpx',
         'beautifulsoup4',
     ],
+    lifespan=http_client_lifespan,
 )
 
 
@@ -145,9 +151,61 @@ async def read_documentation(
     Returns:
         Markdown content of the AWS documentation
     """
-    # Validate that URL is from docs.aws.amazon.com and ends with .html
     url_str = str(url)
+    await _validate_documentation_url(ctx, url_str)
 
+    return await read_documentation_impl(ctx, url_str, max_length, start_index, SESSION_UUID)
+
+
+@mcp.tool()
+async def read_documentation_batch(
+    ctx: Context,
+    urls: List[str] = Field(
+        description='URLs of the AWS documentation pages to read',
+        min_length=1,
+        max_length=READ_DOCUMENTATION_BATCH_MAX_URLS,
+    ),
+    max_length: int = Field(
+        default=5000,
+        description='Maximum number of characters to return for each page.',
+        gt=0,
+        lt=1000000,
+    ),
+) -> List[str]:
+    """Fetch several AWS documentation pages concurrently and convert them to markdown.
+
+    ## Usage
+
+    This tool reads up to 10 documentation pages in one call, for example the most relevant
+    results of a search. Pages are fetched concurrently, so this is faster than calling
+    `read_documentation` once per URL. The URL requirements are the same as for
+    `read_documentation`.
+
+    ## Output Format
+
+    One markdown document per URL, in the same order as the requested URLs. A page that
+    could not be fetched is replaced by its error message; the other pages are still returned.
+    To read past the truncation point of a page, call `read_documentation` with a start_index.
+
+    Args:
+        ctx: MCP context for logging and error handling
+        urls: URLs of the AWS documentation pages to read
+        max_length: Maximum number of characters to return for each page
+
+    Returns:
+        Markdown content of each AWS documentation page
+    """
+    url_strs = [str(url) for url in urls]
+    for url_str in url_strs:
+        await _validate_documentation_url(ctx, url_str)
+
+    return await read_documentation_batch_impl(
+        ctx, url_strs, max_length, READ_DOCUMENTATION_BATCH_MAX_URLS, SESSION_UUID
+    )
+
+
+async def _validate_documentation_url(ctx: Context, url_str: str) -> None:
+    """Validate that a URL is from a supported documentation domain and ends with .html."""
     supported_domains_regex = [r'^https?://docs\.aws\.amazon\.com/']
     for modifier in SEARCH_TERM_DOMAIN_MODIFIERS:
         supported_domains_regex.append(modifier['regex'])
@@ -159,8 +217,6 @@ async def read_documentation(
         await ctx.error(f'Invalid URL: {url_str}. URL must end with .html')
         raise ValueError('URL must end with .html')
 
-    return await read_documentation_impl(ctx, url_str, max_length, start_index, SESSION_UUID)
-
 
 @mcp.tool()
 async def search_documentation(
@@ -259,61 +315,61 @@ async def search_documentation(
         search_url_with_session, search_intent
     )
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                search_url_with_session,
-                json=request_body,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': DEFAULT_USER_AGENT,
-                    'X-MCP-Session-Id': SESSION_UUID,
-                },
-                timeout=30,
-            )
-        except httpx.HTTPError as e:
-            error_msg = f'Error searching AWS docs: {str(e)}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return SearchResponse(
-                search_results=[SearchResult(rank_order=1, url='', title=error_msg, context=None)],
-                facets=None,
-                query_id='',
-            )
-
-        if response.status_code >= 400:
-            error_msg = f'Error searching AWS docs - status code {response.status_code}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return SearchResponse(
-                search_results=[SearchResult(rank_order=1, url='', title=error_msg, context=None)],
-                facets=None,
-                query_id='',
-            )
-
-        try:
-            data = response.json()
-            query_id = data.get('queryId', '')
-            raw_facets = data.get('facets', {})
-
-            # Parse facets to rename keys
-            facets = {}
-            if raw_facets:
-                for key, value in raw_facets.items():
-                    if key == 'aws-docs-search-product':
-                        facets['product_types'] = value
-                    elif key == 'aws-docs-search-guide':
-                        facets['guide_types'] = value
-
-        except json.JSONDecodeError as e:
-            error_msg = f'Error parsing search results: {str(e)}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return SearchResponse(
-                search_results=[SearchResult(rank_order=1, url='', title=error_msg, context=None)],
-                facets=None,
-                query_id='',
-            )
+    client = get_http_client()
+    try:
+        response = await client.post(
+            search_url_with_session,
+            json=request_body,
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': DEFAULT_USER_AGENT,
+                'X-MCP-Session-Id': SESSION_UUID,
+            },
+            timeout=30,
+        )
+    except httpx.HTTPError as e:
+        error_msg = f'Error searching AWS docs: {str(e)}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return SearchResponse(
+            search_results=[SearchResult(rank_order=1, url='', title=error_msg, context=None)],
+            facets=None,
+            query_id='',
+        )
+
+    if response.status_code >= 400:
+        error_msg = f'Error searching AWS docs - status code {response.status_code}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return SearchResponse(
+            search_results=[SearchResult(rank_order=1, url='', title=error_msg, context=None)],
+            facets=None,
+            query_id='',
+        )
+
+    try:
+        data = response.json()
+        query_id = data.get('queryId', '')
+        raw_facets = data.get('facets', {})
+
+        # Parse facets to rename keys
+        facets = {}
+        if raw_facets:
+            for key, value in raw_facets.items():
+                if key == 'aws-docs-search-product':
+                    facets['product_types'] = value
+                elif key == 'aws-docs-search-guide':
+                    facets['guide_types'] = value
+
+    except json.JSONDecodeError as e:
+        error_msg = f'Error parsing search results: {str(e)}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return SearchResponse(
+            search_results=[SearchResult(rank_order=1, url='', title=error_msg, context=None)],
+            facets=None,
+            query_id='',
+        )
 
     results = []
     if 'suggestions' in data:
@@ -407,38 +463,38 @@ async def recommend(
 
     recommendation_url = f'{RECOMMENDATIONS_API_URL}?path={url_str}&session={SESSION_UUID}'
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                recommendation_url,
-                headers={'User-Agent': DEFAULT_USER_AGENT},
-                timeout=30,
+    client = get_http_client()
+    try:
+        response = await client.get(
+            recommendation_url,
+            headers={'User-Agent': DEFAULT_USER_AGENT},
+            timeout=30,
+        )
+    except httpx.HTTPError as e:
+        error_msg = f'Error getting recommendations: {str(e)}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return [RecommendationResult(url='', title=error_msg, context=None)]
+
+    if response.status_code >= 400:
+        error_msg = f'Error getting recommendations - status code {response.status_code}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return [
+            RecommendationResult(
+                url='',
+                title=error_msg,
+                context=None,
             )
-        except httpx.HTTPError as e:
-            error_msg = f'Error getting recommendations: {str(e)}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return [RecommendationResult(url='', title=error_msg, context=None)]
-
-        if response.status_code >= 400:
-            error_msg = f'Error getting recommendations - status code {response.status_code}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return [
-                RecommendationResult(
-                    url='',
-                    title=error_msg,
-                    context=None,
-                )
-            ]
-
-        try:
-            data = response.json()
-        except json.JSONDecodeError as e:
-            error_msg = f'Error parsing recommendations: {str(e)}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return [RecommendationResult(url='', title=error_msg, context=None)]
+        ]
+
+    try:
+        data = response.json()
+    except json.JSONDecodeError as e:
+        error_msg = f'Error parsing recommendations: {str(e)}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return [RecommendationResult(url='', title=error_msg, context=None)]
 
     results = parse_recommendation_results(data)
     logger.debug(f'Found {len(results)} recommendations for: {url_str}')
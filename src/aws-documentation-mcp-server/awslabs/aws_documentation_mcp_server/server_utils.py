@@ -11,19 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import httpx
+import importlib.util
 import os
+import time
 from awslabs.aws_documentation_mcp_server.models import SearchResponse
+from awslabs.aws_documentation_mcp_server.page_cache import CachedPage, PageCache
 from awslabs.aws_documentation_mcp_server.util import (
     extract_content_from_html,
     format_documentation_result,
     is_html_content,
 )
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from importlib.metadata import version
 from loguru import logger
 from mcp.server.fastmcp import Context
-from typing import Optional
+from typing import AsyncIterator, Optional
 from urllib.parse import quote
 
 
@@ -42,6 +48,75 @@ DEFAULT_USER_AGENT = (
     f'{BASE_USER_AGENT} ModelContextProtocol/{__version__} (AWS Documentation Server)'
 )
 
+# Connection limits of the shared HTTP client
+HTTP_MAX_CONNECTIONS = int(os.getenv('AWS_DOCUMENTATION_HTTP_MAX_CONNECTIONS', '20'))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv('AWS_DOCUMENTATION_HTTP_MAX_KEEPALIVE_CONNECTIONS', '10')
+)
+# HTTP/2 needs the optional h2 package (pip install 'httpx[http2]')
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+# Number of threads converting HTML pages to markdown
+CONVERSION_WORKERS = int(os.getenv('AWS_DOCUMENTATION_CONVERSION_WORKERS', '4'))
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_conversion_executor = ThreadPoolExecutor(
+    max_workers=CONVERSION_WORKERS, thread_name_prefix='html-to-markdown'
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all tool calls.
+
+    Reusing one client keeps connections alive between calls, so a page read or search
+    does not pay for a new TLS handshake. The client is bound to the running event loop
+    and is recreated if called from a different one.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its connections."""
+    global _http_client, _http_client_loop
+
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def http_client_lifespan(server) -> AsyncIterator[None]:
+    """Server lifespan closing the shared HTTP client on shutdown.
+
+    Args:
+        server: The FastMCP server
+
+    Yields:
+        None
+    """
+    try:
+        yield
+    finally:
+        await close_http_client()
+
+
+PAGE_CACHE = PageCache()
+
 
 async def read_documentation_impl(
     ctx: Context,
@@ -50,7 +125,17 @@ async def read_documentation_impl(
     start_index: int,
     session_uuid: str,
 ) -> str:
-    """The implementation of the read_documentation tool."""
+    """The implementation of the read_documentation tool.
+
+    Converted pages are cached by URL. Continuation reads (start_index > 0) and reads of
+    recently fetched pages are served from the cache; older pages are revalidated with a
+    conditional request and only downloaded and converted again if they changed.
+    """
+    cached_page = PAGE_CACHE.get(url_str)
+    if cached_page is not None and (start_index > 0 or PAGE_CACHE.is_fresh(cached_page)):
+        logger.debug(f'Serving {url_str} from page cache')
+        return _format_page(url_str, cached_page.content, start_index, max_length)
+
     logger.debug(f'Fetching documentation from {url_str}')
 
     url_with_session = f'{url_str}?session={session_uuid}'
@@ -60,37 +145,91 @@ async def read_documentation_impl(
         url_with_session += f'&query_id={query_id}'
         logger.debug(f'Using query_id {query_id}')
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                url_with_session,
-                follow_redirects=True,
-                headers={
-                    'User-Agent': DEFAULT_USER_AGENT,
-                    'X-MCP-Session-Id': session_uuid,
-                },
-                timeout=30,
-            )
-        except httpx.HTTPError as e:
-            error_msg = f'Failed to fetch {url_str}: {str(e)}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return error_msg
-
-        if response.status_code >= 400:
-            error_msg = f'Failed to fetch {url_str} - status code {response.status_code}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return error_msg
-
-        page_raw = response.text
-        content_type = response.headers.get('content-type', '')
+    headers = {
+        'User-Agent': DEFAULT_USER_AGENT,
+        'X-MCP-Session-Id': session_uuid,
+    }
+    if cached_page is not None:
+        headers.update(cached_page.conditional_headers())
+
+    client = get_http_client()
+    try:
+        response = await client.get(
+            url_with_session,
+            follow_redirects=True,
+            headers=headers,
+            timeout=30,
+        )
+    except httpx.HTTPError as e:
+        error_msg = f'Failed to fetch {url_str}: {str(e)}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return error_msg
+
+    if response.status_code == 304 and cached_page is not None:
+        logger.debug(f'{url_str} not modified, serving from page cache')
+        PAGE_CACHE.refresh(cached_page)
+        return _format_page(url_str, cached_page.content, start_index, max_length)
+
+    if response.status_code >= 400:
+        error_msg = f'Failed to fetch {url_str} - status code {response.status_code}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return error_msg
+
+    page_raw = response.text
+    content_type = response.headers.get('content-type', '')
 
     if is_html_content(page_raw, content_type):
-        content = extract_content_from_html(page_raw)
+        # Conversion is CPU-bound, keep it off the event loop so other reads can proceed
+        content = await asyncio.get_running_loop().run_in_executor(
+            _conversion_executor, extract_content_from_html, page_raw
+        )
     else:
         content = page_raw
 
+    PAGE_CACHE.put(
+        CachedPage(
+            url=url_str,
+            content=content,
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified'),
+            fetched_at=time.time(),
+        )
+    )
+
+    return _format_page(url_str, content, start_index, max_length)
+
+
+async def read_documentation_batch_impl(
+    ctx: Context,
+    url_strs: list[str],
+    max_length: int,
+    max_concurrency: int,
+    session_uuid: str,
+) -> list[str]:
+    """The implementation of the read_documentation_batch tool.
+
+    Args:
+        ctx: MCP context for logging and error handling
+        url_strs: Documentation URLs to read
+        max_length: Maximum number of characters to return per page
+        max_concurrency: Maximum number of pages fetched at the same time
+        session_uuid: Session identifier sent with each request
+
+    Returns:
+        The content of each page, or its error message, in the order of url_strs
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read_one(url_str: str) -> str:
+        async with semaphore:
+            return await read_documentation_impl(ctx, url_str, max_length, 0, session_uuid)
+
+    return list(await asyncio.gather(*(read_one(url_str) for url_str in url_strs)))
+
+
+def _format_page(url_str: str, content: str, start_index: int, max_length: int) -> str:
     result = format_documentation_result(url_str, content, start_index, max_length)
 
     # Log if content was truncated
@@ -38,3 +38,25 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if 'live' in item.keywords:
                 item.add_marker(skip_live)
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    """Start every test with an empty page cache."""
+    from awslabs.aws_documentation_mcp_server.server_utils import PAGE_CACHE
+
+    PAGE_CACHE.clear()
+    yield
+    PAGE_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_http_client():
+    """Start every test without a shared HTTP client, so patched clients are picked up."""
+    from awslabs.aws_documentation_mcp_server import server_utils
+
+    server_utils._http_client = None
+    server_utils._http_client_loop = None
+    yield
+    server_utils._http_client = None
+    server_utils._http_client_loop = None
@@ -0,0 +1,213 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the page cache and its use by read_documentation."""
+
+import pytest
+import time
+from awslabs.aws_documentation_mcp_server.page_cache import CachedPage, PageCache
+from awslabs.aws_documentation_mcp_server.server_utils import (
+    DEFAULT_USER_AGENT,
+    PAGE_CACHE,
+    read_documentation_impl,
+)
+from mcp.server.fastmcp.server import Context
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+URL = 'https://docs.aws.amazon.com/cached.html'
+
+
+def _page(
+    url: str = URL,
+    content: str = '# Cached',
+    fetched_at: Optional[float] = None,
+    etag: Optional[str] = '"v1"',
+    last_modified: Optional[str] = None,
+) -> CachedPage:
+    return CachedPage(
+        url=url,
+        content=content,
+        etag=etag,
+        last_modified=last_modified,
+        fetched_at=time.time() if fetched_at is None else fetched_at,
+    )
+
+
+def _mock_client(response):
+    mock_client = MagicMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mock_client.get = AsyncMock(return_value=response)
+    return mock_client
+
+
+def _response(status_code=200, text='Plain text content', headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = {'content-type': 'text/plain', **(headers or {})}
+    return response
+
+
+class TestPageCache:
+    """Tests for the PageCache class."""
+
+    def test_least_recently_used_page_evicted(self):
+        """Test LRU eviction when the cache is full."""
+        cache = PageCache(max_entries=2, cache_dir=None)
+        cache.put(_page(url='a'))
+        cache.put(_page(url='b'))
+        cache.get('a')
+        cache.put(_page(url='c'))
+
+        assert len(cache) == 2
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+
+    def test_zero_size_disables_caching(self):
+        """Test that a cache of size zero never keeps pages."""
+        cache = PageCache(max_entries=0, cache_dir=None)
+        cache.put(_page())
+
+        assert cache.get(URL) is None
+
+    def test_freshness(self):
+        """Test that pages older than the TTL are no longer fresh."""
+        cache = PageCache(ttl_seconds=60, cache_dir=None)
+
+        assert cache.is_fresh(_page())
+        assert not cache.is_fresh(_page(fetched_at=time.time() - 61))
+
+    def test_conditional_headers(self):
+        """Test that stored validators become conditional request headers."""
+        page = _page(etag='"abc"', last_modified='Wed, 01 Jan 2025 00:00:00 GMT')
+
+        assert page.conditional_headers() == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT',
+        }
+        assert _page(etag=None).conditional_headers() == {}
+
+    def test_disk_tier_survives_memory_eviction(self, tmp_path):
+        """Test that pages are read back from disk and promoted to memory."""
+        cache = PageCache(max_entries=1, cache_dir=str(tmp_path))
+        cache.put(_page(url='a', content='first'))
+        cache.put(_page(url='b', content='second'))
+
+        page = cache.get('a')
+
+        assert page is not None and page.content == 'first'
+        reloaded = PageCache(cache_dir=str(tmp_path)).get('b')
+        assert reloaded is not None and reloaded.content == 'second'
+
+    def test_disk_tier_is_bounded(self, tmp_path):
+        """Test that the oldest files are removed when the disk tier is full."""
+        cache = PageCache(cache_dir=str(tmp_path), max_disk_entries=2)
+        for url in ('a', 'b', 'c'):
+            cache.put(_page(url=url))
+
+        assert len(list(tmp_path.glob('*.json'))) == 2
+
+    def test_corrupt_disk_entry_ignored(self, tmp_path):
+        """Test that an unreadable file is treated as a cache miss."""
+        cache = PageCache(cache_dir=str(tmp_path))
+        cache._disk_path(URL).write_text('not json')
+
+        assert cache.get(URL) is None
+
+
+class TestReadDocumentationCaching:
+    """Tests for page caching in read_documentation_impl."""
+
+    @pytest.mark.asyncio
+    async def test_second_read_served_from_cache(self):
+        """Test that a fresh cached page is served without a request."""
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+        mock_client = _mock_client(_response(text='Page content'))
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            first = await read_documentation_impl(ctx, URL, 1000, 0, 'test-uuid')
+            second = await read_documentation_impl(ctx, URL, 1000, 0, 'test-uuid')
+
+        assert first == second
+        assert 'Page content' in second
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_continuation_served_from_stale_cache(self):
+        """Test that reads with a start_index never refetch the page."""
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+        PAGE_CACHE.put(_page(content='0123456789', fetched_at=0))
+
+        with patch('httpx.AsyncClient') as mock_client_class:
+            result = await read_documentation_impl(ctx, URL, 3, 5, 'test-uuid')
+
+        mock_client_class.assert_not_called()
+        assert '567' in result
+
+    @pytest.mark.asyncio
+    async def test_stale_page_revalidated_not_modified(self):
+        """Test that a stale page is revalidated and reused on 304."""
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+        page = _page(content='Old content', fetched_at=0)
+        PAGE_CACHE.put(page)
+        mock_client = _mock_client(_response(status_code=304, text=''))
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            result = await read_documentation_impl(ctx, URL, 1000, 0, 'test-uuid')
+
+        assert 'Old content' in result
+        assert PAGE_CACHE.is_fresh(page)
+        mock_client.get.assert_called_once_with(
+            f'{URL}?session=test-uuid',
+            follow_redirects=True,
+            headers={
+                'User-Agent': DEFAULT_USER_AGENT,
+                'X-MCP-Session-Id': 'test-uuid',
+                'If-None-Match': '"v1"',
+            },
+            timeout=30,
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_page_replaced_when_modified(self):
+        """Test that a changed page replaces the cached copy."""
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+        PAGE_CACHE.put(_page(content='Old content', fetched_at=0))
+        response = _response(text='New content', headers={'etag': '"v2"'})
+
+        with patch('httpx.AsyncClient', return_value=_mock_client(response)):
+            result = await read_documentation_impl(ctx, URL, 1000, 0, 'test-uuid')
+
+        assert 'New content' in result
+        cached = PAGE_CACHE.get(URL)
+        assert cached is not None
+        assert cached.content == 'New content'
+        assert cached.etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        """Test that failed fetches are not cached."""
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+
+        with patch('httpx.AsyncClient', return_value=_mock_client(_response(status_code=404))):
+            await read_documentation_impl(ctx, URL, 1000, 0, 'test-uuid')
+
+        assert PAGE_CACHE.get(URL) is None
@@ -19,6 +19,7 @@ import pytest
 from awslabs.aws_documentation_mcp_server.server_aws import (
     main,
     read_documentation,
+    read_documentation_batch,
     recommend,
     search_documentation,
 )
@@ -128,6 +129,53 @@ class TestReadDocumentation:
             await read_documentation(ctx, url=url, max_length=10000, start_index=0)
 
 
+class TestReadDocumentationBatch:
+    """Tests for the read_documentation_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_read_documentation_batch(self):
+        """Test that pages are returned in request order with per-page errors."""
+        urls = [
+            'https://docs.aws.amazon.com/first.html',
+            'https://docs.aws.amazon.com/missing.html',
+            'https://docs.aws.amazon.com/second.html',
+        ]
+        ctx = MockContext()
+
+        def get_page(url, **kwargs):
+            response = MagicMock()
+            response.status_code = 404 if 'missing' in url else 200
+            response.text = f'Content of {url.split("?")[0]}'
+            response.headers = {'content-type': 'text/plain'}
+            return response
+
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            result = await read_documentation_batch(ctx, urls=urls, max_length=10000)
+
+        assert len(result) == 3
+        assert f'Content of {urls[0]}' in result[0]
+        assert 'status code 404' in result[1]
+        assert f'Content of {urls[2]}' in result[2]
+        assert mock_get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_read_documentation_batch_invalid_url(self):
+        """Test that an invalid URL fails the batch before anything is fetched."""
+        ctx = MockContext()
+
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            with pytest.raises(ValueError, match='must end with .html'):
+                await read_documentation_batch(
+                    ctx,
+                    urls=['https://docs.aws.amazon.com/ok.html', 'https://docs.aws.amazon.com/x'],
+                    max_length=10000,
+                )
+
+        mock_get.assert_not_called()
+
+
 class TestSearchDocumentation:
     """Tests for the search_documentation function."""
 
@@ -13,14 +13,20 @@
 # limitations under the License.
 """Tests for server utility functions in the AWS Documentation MCP Server."""
 
+import asyncio
 import httpx
 import pytest
+import threading
 from awslabs.aws_documentation_mcp_server.models import SearchResponse, SearchResult
 from awslabs.aws_documentation_mcp_server.server_utils import (
     DEFAULT_USER_AGENT,
     SEARCH_RESULT_CACHE,
     add_search_result_cache_item,
+    close_http_client,
+    get_http_client,
     get_query_id_from_cache,
+    http_client_lifespan,
+    read_documentation_batch_impl,
     read_documentation_impl,
 )
 from mcp.server.fastmcp.server import Context
@@ -378,6 +384,105 @@ class TestReadDocumentationImpl:
                 )
 
 
+class TestSharedHttpClient:
+    """Tests for the shared HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self):
+        """Test that the same client and connection pool serve every call."""
+        client = get_http_client()
+
+        try:
+            assert get_http_client() is client
+        finally:
+            await close_http_client()
+
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_recreated_after_close(self):
+        """Test that a new client is created once the shared one was closed."""
+        client = get_http_client()
+        await client.aclose()
+
+        new_client = get_http_client()
+        try:
+            assert new_client is not client
+        finally:
+            await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_client(self):
+        """Test that the server lifespan closes the shared client on shutdown."""
+        async with http_client_lifespan(MagicMock()):
+            client = get_http_client()
+
+        assert client.is_closed
+
+
+class TestReadDocumentationBatchImpl:
+    """Tests for the read_documentation_batch_impl function."""
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_concurrently_in_order(self):
+        """Test that pages are fetched concurrently, bounded, and returned in order."""
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+        urls = [f'https://docs.aws.amazon.com/page{i}.html' for i in range(5)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_page(url, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later pages answer first
+            await asyncio.sleep(0.01 * (5 - int(url.split('page')[1][0])))
+            in_flight -= 1
+            response = MagicMock()
+            response.status_code = 200
+            response.text = url.split('?')[0]
+            response.headers = {'content-type': 'text/plain'}
+            return response
+
+        with patch('httpx.AsyncClient.get', side_effect=get_page):
+            result = await read_documentation_batch_impl(ctx, urls, 1000, 3, 'test-uuid')
+
+        assert [url in page for url, page in zip(urls, result)] == [True] * 5
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_html_converted_in_worker_thread(self):
+        """Test that HTML to markdown conversion does not run on the event loop thread."""
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+        loop_thread = threading.get_ident()
+        conversion_threads = []
+
+        def extract(page_raw):
+            conversion_threads.append(threading.get_ident())
+            return '# Converted'
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = '<html><body><h1>Converted</h1></body></html>'
+        mock_response.headers = {'content-type': 'text/html'}
+
+        with (
+            patch('httpx.AsyncClient.get', new_callable=AsyncMock, return_value=mock_response),
+            patch(
+                'awslabs.aws_documentation_mcp_server.server_utils.extract_content_from_html',
+                side_effect=extract,
+            ),
+        ):
+            result = await read_documentation_batch_impl(
+                ctx, ['https://docs.aws.amazon.com/test.html'], 1000, 1, 'test-uuid'
+            )
+
+        assert '# Converted' in result[0]
+        assert conversion_threads and conversion_threads[0] != loop_thread
+
+
 class TestUserAgentCustomization:
     """Test custom User-Agent functionality."""
 
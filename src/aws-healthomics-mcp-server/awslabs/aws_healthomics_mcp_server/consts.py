@@ -82,6 +82,13 @@ GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH_ENV = 'GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH
 GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE_ENV = 'GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE'
 GENOMICS_SEARCH_RESULT_CACHE_TTL_ENV = 'GENOMICS_SEARCH_RESULT_CACHE_TTL'
 GENOMICS_SEARCH_TAG_CACHE_TTL_ENV = 'GENOMICS_SEARCH_TAG_CACHE_TTL'
+GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE_ENV = 'GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE'
+GENOMICS_SEARCH_TAG_FETCH_WORKERS_ENV = 'GENOMICS_SEARCH_TAG_FETCH_WORKERS'
+GENOMICS_SEARCH_INVENTORY_INDEX_DIR_ENV = 'GENOMICS_SEARCH_INVENTORY_INDEX_DIR'
+GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL_ENV = 'GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL'
+GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL_ENV = (
+    'GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL'
+)
 
 # Default values for genomics search
 DEFAULT_GENOMICS_SEARCH_MAX_CONCURRENT = 10
@@ -91,6 +98,9 @@ DEFAULT_GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH = True
 DEFAULT_GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE = 100
 DEFAULT_GENOMICS_SEARCH_RESULT_CACHE_TTL = 600
 DEFAULT_GENOMICS_SEARCH_TAG_CACHE_TTL = 300
+DEFAULT_GENOMICS_SEARCH_TAG_FETCH_WORKERS = 32
+DEFAULT_GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL = 300  # Append-only top-up every 5 minutes
+DEFAULT_GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL = 86400  # Full re-list once a day
 
 # Cache size limits - Maximum number of entries in the cache
 DEFAULT_GENOMICS_SEARCH_MAX_FILE_CACHE_SIZE = 10000
@@ -105,9 +115,26 @@ DEFAULT_CACHE_CLEANUP_KEEP_RATIO = 0.8  # Keep at most 80% of entries when clean
 MAX_SEARCH_RESULTS_LIMIT = 10000  # Maximum allowed results per search
 DEFAULT_HEALTHOMICS_PAGE_SIZE = 100  # Default pagination size for HealthOmics APIs
 DEFAULT_S3_PAGE_SIZE = 1000  # Default pagination size for S3 operations
+S3_INVENTORY_INDEX_FILENAME = 's3_inventory.sqlite3'  # On-disk S3 inventory index file name
+S3_INVENTORY_TOKEN_PREFIX = 'inventory:'  # nosec B105 - continuation token marker, not a secret
 DEFAULT_RESULT_RANKER_FALLBACK_SIZE = 100  # Fallback size when max_results is invalid
 
 # Rate limiting and performance
+S3_TAG_FETCH_INITIAL_CONCURRENCY = 10  # Starting in-flight GetObjectTagging requests
+S3_TAG_FETCH_MAX_THROTTLE_RETRIES = 5  # Retries per object after S3 throttles tag retrieval
+S3_TAG_FETCH_MAX_ERROR_RETRIES = 2  # Retries per object after server or connection errors
+S3_TAG_FETCH_THROTTLE_BACKOFF_SECONDS = 0.2  # Base backoff, doubled on each throttled retry
+S3_THROTTLING_ERROR_CODES = frozenset(
+    {
+        'SlowDown',
+        'Throttling',
+        'ThrottlingException',
+        'RequestLimitExceeded',
+        'TooManyRequestsException',
+        'ServiceUnavailable',
+        '503',
+    }
+)
 HEALTHOMICS_RATE_LIMIT_DELAY = 0.1  # Sleep delay between HealthOmics Storage API calls (10 TPS)
 
 # Cache cleanup sweep probabilities for entries with expired TTLs (as percentages for clarity)
@@ -193,6 +193,7 @@ class SearchConfig:
     max_tag_retrieval_batch_size: int = 100  # Maximum objects to retrieve tags for in batch
     result_cache_ttl_seconds: int = 600  # Result cache TTL (10 minutes)
     tag_cache_ttl_seconds: int = 300  # Tag cache TTL (5 minutes)
+    max_tag_fetch_workers: int = 32  # Thread pool and connection pool size for tag retrieval
 
     # Cache size limits
     max_tag_cache_size: int = 1000  # Maximum number of tag cache entries
@@ -212,6 +213,11 @@ class SearchConfig:
         0.001  # Score threshold tolerance for pagination consistency
     )
 
+    # Persistent S3 inventory index settings
+    inventory_index_dir: Optional[str] = None  # Directory for the on-disk index (None disables)
+    inventory_refresh_interval_seconds: int = 300  # Append-only refresh interval
+    inventory_full_refresh_interval_seconds: int = 86400  # Full re-list interval
+
 
 class GenomicsFileSearchRequest(BaseModel):
     """Request model for genomics file search."""
@@ -19,6 +19,8 @@ from .scoring_engine import ScoringEngine
 from .file_association_engine import FileAssociationEngine
 from .file_type_detector import FileTypeDetector
 from .s3_search_engine import S3SearchEngine
+from .s3_inventory_index import S3InventoryIndex
+from .s3_tag_fetcher import S3TagFetcher, TagCache
 
 __all__ = [
     'PatternMatcher',
@@ -26,4 +28,7 @@ __all__ = [
     'FileAssociationEngine',
     'FileTypeDetector',
     'S3SearchEngine',
+    'S3InventoryIndex',
+    'S3TagFetcher',
+    'TagCache',
 ]
@@ -0,0 +1,290 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batched pattern matching over large path and tag corpora."""
+
+import bisect
+from awslabs.aws_healthomics_mcp_server.consts import (
+    FUZZY_MATCH_MAX_MULTIPLIER,
+    FUZZY_MATCH_THRESHOLD,
+    MULTIPLE_MATCH_BONUS_MULTIPLIER,
+    SUBSTRING_MATCH_MAX_MULTIPLIER,
+    TAG_MATCH_PENALTY_MULTIPLIER,
+)
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+MatchResult = Tuple[float, List[str]]
+
+# Slack for the float arithmetic of the length window, so boundary lengths are never pruned
+_LENGTH_WINDOW_EPSILON = 1e-9
+
+
+class _CompiledPattern:
+    """A search pattern with the state needed to score many texts against it."""
+
+    def __init__(self, pattern: str, fuzzy_threshold: float):
+        self.pattern = pattern
+        self.lower = pattern.lower()
+        self.length = len(self.lower)
+        self.char_counts = list(Counter(self.lower).items())
+
+        # SequenceMatcher caches its analysis of the second sequence, so the pattern is
+        # indexed once and each candidate text only pays for set_seq1()
+        self.matcher = SequenceMatcher(None, '', self.lower)
+
+        # ratio() = 2 * matches / (len(text) + len(pattern)) and matches <= min(len(text),
+        # len(pattern)), so texts outside this length window can never reach the threshold
+        self.min_text_length = fuzzy_threshold * self.length / (2 - fuzzy_threshold)
+        self.max_text_length = (
+            (2 - fuzzy_threshold) * self.length / fuzzy_threshold
+            if fuzzy_threshold > 0
+            else float('inf')
+        )
+
+
+class BatchPatternMatcher:
+    """Scores a whole corpus of texts against a fixed set of search patterns.
+
+    Produces exactly the scores and match reasons of
+    ``PatternMatcher.calculate_match_score``, ``match_file_path`` and ``match_tags``, but
+    deduplicates the corpus and prunes fuzzy-match candidates before running
+    ``SequenceMatcher``:
+
+    1. Texts are bucketed by length; only texts inside a pattern's length window can reach
+       the fuzzy threshold.
+    2. Survivors are checked against a character-count bound (the multiset overlap used by
+       ``SequenceMatcher.quick_ratio``), which is an upper bound on the real ratio.
+    3. Only the remaining candidates are scored with ``SequenceMatcher.ratio``.
+
+    Exact matches are resolved with a dictionary lookup and substring matches with a single
+    scan per pattern.
+    """
+
+    def __init__(self, patterns: List[str], fuzzy_threshold: float = FUZZY_MATCH_THRESHOLD):
+        """Initialize the batch matcher.
+
+        Args:
+            patterns: List of search patterns to match
+            fuzzy_threshold: Minimum similarity for fuzzy matches
+        """
+        self.patterns = patterns
+        self.fuzzy_threshold = fuzzy_threshold
+        self._compiled = [
+            _CompiledPattern(pattern, fuzzy_threshold) for pattern in patterns if pattern.strip()
+        ]
+
+    def score_texts(self, texts: Iterable[str]) -> Dict[str, MatchResult]:
+        """Score every distinct text against the patterns.
+
+        Args:
+            texts: Texts to score (duplicates are scored once)
+
+        Returns:
+            Dictionary mapping each text to the (score, match_reasons) that
+            ``PatternMatcher.calculate_match_score`` would return for it
+        """
+        corpus = list(dict.fromkeys(text for text in texts if text))
+        if not corpus or not self._compiled:
+            return {text: (0.0, []) for text in corpus}
+
+        lowered = [text.lower() for text in corpus]
+
+        # Index: lowered text -> corpus ids, and corpus ids sorted by lowered length
+        ids_by_lower: Dict[str, List[int]] = {}
+        for text_id, lower in enumerate(lowered):
+            ids_by_lower.setdefault(lower, []).append(text_id)
+        ids_by_length = sorted(range(len(lowered)), key=lambda text_id: len(lowered[text_id]))
+        sorted_lengths = [len(lowered[text_id]) for text_id in ids_by_length]
+
+        # Per-pattern (exact, substring, fuzzy) scores, only for texts that matched
+        pattern_scores: List[Dict[int, Tuple[float, float, float]]] = []
+        for compiled in self._compiled:
+            pattern_scores.append(
+                self._score_pattern(compiled, lowered, ids_by_lower, ids_by_length, sorted_lengths)
+            )
+
+        results: Dict[str, MatchResult] = {text: (0.0, []) for text in corpus}
+        matched_ids = set().union(*(scores.keys() for scores in pattern_scores))
+        for text_id in matched_ids:
+            results[corpus[text_id]] = self._combine_pattern_scores(text_id, pattern_scores)
+        return results
+
+    def match_file_paths(self, file_paths: List[str]) -> List[MatchResult]:
+        """Match the patterns against many file paths.
+
+        Args:
+            file_paths: Full file paths to match against
+
+        Returns:
+            List of (score, match_reasons) in input order, as ``PatternMatcher.match_file_path``
+        """
+        components_per_path = [
+            self._path_components(file_path) if file_path else [] for file_path in file_paths
+        ]
+        scores = self.score_texts(
+            component for components in components_per_path for component in components
+        )
+
+        results: List[MatchResult] = []
+        for components in components_per_path:
+            max_score = 0.0
+            all_reasons: List[str] = []
+            for component in components:
+                score, reasons = scores.get(component, (0.0, []))
+                if score > max_score:
+                    max_score = score
+                    all_reasons = reasons
+            results.append((max_score, all_reasons))
+        return results
+
+    def match_tags(self, tag_sets: List[Dict[str, str]]) -> List[MatchResult]:
+        """Match the patterns against many tag dictionaries.
+
+        Args:
+            tag_sets: Tag key-value dictionaries to match against
+
+        Returns:
+            List of (score, match_reasons) in input order, as ``PatternMatcher.match_tags``
+        """
+        texts_per_tag_set = [self._tag_texts(tags) for tags in tag_sets]
+        scores = self.score_texts(text for texts in texts_per_tag_set for text in texts)
+
+        results: List[MatchResult] = []
+        for texts in texts_per_tag_set:
+            if not texts or not self.patterns:
+                results.append((0.0, []))
+                continue
+            max_score = 0.0
+            match_reasons: List[str] = []
+            for text in texts:
+                score, reasons = scores.get(text, (0.0, []))
+                if score > max_score:
+                    max_score = score
+                    match_reasons = [f'Tag {reason}' for reason in reasons]
+            results.append((max_score * TAG_MATCH_PENALTY_MULTIPLIER, match_reasons))
+        return results
+
+    def _score_pattern(
+        self,
+        compiled: _CompiledPattern,
+        lowered: List[str],
+        ids_by_lower: Dict[str, List[int]],
+        ids_by_length: List[int],
+        sorted_lengths: List[int],
+    ) -> Dict[int, Tuple[float, float, float]]:
+        """Compute exact, substring and fuzzy scores of one pattern over the corpus."""
+        exact: Dict[int, float] = dict.fromkeys(ids_by_lower.get(compiled.lower, []), 1.0)
+
+        pattern_lower = compiled.lower
+        substring: Dict[int, float] = {
+            text_id: SUBSTRING_MATCH_MAX_MULTIPLIER * (compiled.length / len(lower))
+            for text_id, lower in enumerate(lowered)
+            if pattern_lower in lower
+        }
+
+        fuzzy = self._fuzzy_scores(compiled, lowered, ids_by_length, sorted_lengths)
+
+        scores: Dict[int, Tuple[float, float, float]] = {}
+        for text_id in exact.keys() | substring.keys() | fuzzy.keys():
+            scores[text_id] = (
+                exact.get(text_id, 0.0),
+                substring.get(text_id, 0.0),
+                fuzzy.get(text_id, 0.0),
+            )
+        return scores
+
+    def _fuzzy_scores(
+        self,
+        compiled: _CompiledPattern,
+        lowered: List[str],
+        ids_by_length: List[int],
+        sorted_lengths: List[int],
+    ) -> Dict[int, float]:
+        """Compute fuzzy scores for the texts that can reach the fuzzy threshold."""
+        threshold = self.fuzzy_threshold
+        pattern_length = compiled.length
+        char_counts = compiled.char_counts
+        matcher = compiled.matcher
+
+        start = bisect.bisect_left(
+            sorted_lengths, compiled.min_text_length - _LENGTH_WINDOW_EPSILON
+        )
+        end = bisect.bisect_right(
+            sorted_lengths, compiled.max_text_length + _LENGTH_WINDOW_EPSILON
+        )
+
+        fuzzy: Dict[int, float] = {}
+        for text_id in ids_by_length[start:end]:
+            lower = lowered[text_id]
+            total_length = len(lower) + pattern_length
+
+            # Character multiset overlap bounds the number of matching characters
+            overlap = 0
+            for char, count in char_counts:
+                overlap += min(lower.count(char), count)
+            if 2.0 * overlap / total_length < threshold:
+                continue
+
+            matcher.set_seq1(lower)
+            similarity = matcher.ratio()
+            if similarity >= threshold:
+                fuzzy[text_id] = FUZZY_MATCH_MAX_MULTIPLIER * similarity
+        return fuzzy
+
+    def _combine_pattern_scores(
+        self, text_id: int, pattern_scores: List[Dict[int, Tuple[float, float, float]]]
+    ) -> MatchResult:
+        """Combine per-pattern scores into a single result, as calculate_match_score does."""
+        max_score = 0.0
+        match_reasons: List[str] = []
+
+        for compiled, scores in zip(self._compiled, pattern_scores):
+            entry = scores.get(text_id)
+            if entry is None:
+                continue
+            exact_score, substring_score, fuzzy_score = entry
+            pattern_score = max(exact_score, substring_score, fuzzy_score)
+            if pattern_score > 0:
+                if exact_score == pattern_score:
+                    match_reasons.append(f"Exact match for '{compiled.pattern}'")
+                elif substring_score == pattern_score:
+                    match_reasons.append(f"Substring match for '{compiled.pattern}'")
+                elif fuzzy_score == pattern_score:
+                    match_reasons.append(f"Fuzzy match for '{compiled.pattern}'")
+
+                max_score = max(max_score, pattern_score)
+
+        if len([r for r in match_reasons if 'match' in r]) > 1:
+            max_score = min(1.0, max_score * MULTIPLE_MATCH_BONUS_MULTIPLIER)
+
+        return max_score, match_reasons
+
+    @staticmethod
+    def _path_components(file_path: str) -> List[str]:
+        """Get the path components matched by PatternMatcher.match_file_path."""
+        filename = file_path.split('/')[-1]
+        return [file_path, filename, filename.split('.')[0]]
+
+    @staticmethod
+    def _tag_texts(tags: Optional[Dict[str, str]]) -> List[str]:
+        """Get the tag texts matched by PatternMatcher.match_tags."""
+        tag_texts: List[str] = []
+        if not tags:
+            return tag_texts
+        for key, value in tags.items():
+            tag_texts.extend([key, value, f'{key}:{value}'])
+        return tag_texts
@@ -47,14 +47,14 @@ from awslabs.aws_healthomics_mcp_server.search.healthomics_search_engine import
     HealthOmicsSearchEngine,
 )
 from awslabs.aws_healthomics_mcp_server.search.json_response_builder import JsonResponseBuilder
-from awslabs.aws_healthomics_mcp_server.search.result_ranker import ResultRanker
+from awslabs.aws_healthomics_mcp_server.search.result_ranker import ResultRanker, TopKResults
 from awslabs.aws_healthomics_mcp_server.search.s3_search_engine import S3SearchEngine
 from awslabs.aws_healthomics_mcp_server.search.scoring_engine import ScoringEngine
 from awslabs.aws_healthomics_mcp_server.utils.search_config import get_genomics_search_config
 from loguru import logger
 
 # Import here to avoid circular imports
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, Coroutine, Dict, List, Optional, Set, Tuple
 
 
 if TYPE_CHECKING:
@@ -163,49 +163,179 @@ class GenomicsSearchOrchestrator:
             # Get ranking statistics
             ranking_stats = self.result_ranker.get_ranking_statistics(ranked_results)
 
-            # Build comprehensive JSON response
+            return self._build_search_response(
+                request,
+                limited_results,
+                total_found=len(scored_results),
+                total_ranked=len(ranked_results),
+                ranking_stats=ranking_stats,
+                start_time=start_time,
+            )
+
+        except Exception as e:
             search_duration_ms = int((time.time() - start_time) * 1000)
-            storage_systems_searched = self._get_searched_storage_systems()
+            logger.error(f'Search failed after {search_duration_ms}ms: {e}')
+            raise
 
-            pagination_info = {
-                'offset': request.offset,
-                'limit': request.max_results,
-                'total_available': len(ranked_results),
-                'has_more': (request.offset + len(limited_results)) < len(ranked_results),
-                'next_offset': request.offset + len(limited_results)
-                if (request.offset + len(limited_results)) < len(ranked_results)
-                else None,
-                'continuation_token': request.continuation_token,  # Pass through for now
-            }
+    async def search_stream(
+        self, request: GenomicsFileSearchRequest
+    ) -> AsyncIterator[List[GenomicsFileResult]]:
+        """Yield scored results as each storage system finishes searching.
 
-            response_dict = self.json_builder.build_search_response(
-                results=limited_results,
-                total_found=len(scored_results),
-                search_duration_ms=search_duration_ms,
-                storage_systems_searched=storage_systems_searched,
-                search_statistics=ranking_stats,
-                pagination_info=pagination_info,
-            )
+        Each batch holds the deduplicated, association-grouped and scored results of one
+        storage system, sorted by relevance score. Files already yielded in an earlier batch
+        are dropped, and file associations are resolved within each batch. Closing the
+        generator early cancels the searches that are still running.
 
-            # Create GenomicsFileSearchResponse object for compatibility
-            response = GenomicsFileSearchResponse(
-                results=response_dict['results'],
-                total_found=response_dict['total_found'],
-                search_duration_ms=response_dict['search_duration_ms'],
-                storage_systems_searched=response_dict['storage_systems_searched'],
-                enhanced_response=response_dict,
-            )
+        Args:
+            request: Search request containing search parameters
 
-            logger.info(
-                f'Search completed in {search_duration_ms}ms, returning {len(limited_results)} results'
+        Yields:
+            Lists of GenomicsFileResult objects, one per storage system with results
+
+        Raises:
+            ValueError: If search parameters are invalid
+        """
+        self._validate_search_request(request)
+
+        search_tasks = await self._create_search_tasks(request)
+        if not search_tasks:
+            logger.warning('No storage systems configured for search')
+            return
+
+        logger.info(f'Streaming results from {len(search_tasks)} parallel search tasks')
+        tasks = {
+            asyncio.ensure_future(search_task): storage_system
+            for storage_system, search_task in search_tasks
+        }
+        pending: Set[asyncio.Task] = set(tasks)
+        seen_paths: Set[str] = set()
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    storage_system = tasks[task]
+                    try:
+                        files = task.result()
+                    except Exception as e:
+                        logger.error(f'Error in {storage_system} search: {e}')
+                        continue
+
+                    logger.info(f'{storage_system} search returned {len(files)} files')
+                    batch = await self._score_file_batch(files, seen_paths, request)
+                    if batch:
+                        yield batch
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self._cleanup_s3_cache_periodically()
+
+    async def search_streaming(
+        self, request: GenomicsFileSearchRequest
+    ) -> GenomicsFileSearchResponse:
+        """Search all storage systems, ranking streamed results with a bounded top-k heap.
+
+        Returns the same response as search(), but only the top offset + max_results
+        results are kept in memory while the storage systems are still returning.
+
+        Args:
+            request: Search request containing search parameters
+
+        Returns:
+            GenomicsFileSearchResponse with ranked results and metadata
+
+        Raises:
+            ValueError: If search parameters are invalid
+        """
+        start_time = time.time()
+        logger.info(f'Starting streaming genomics file search with parameters: {request}')
+
+        try:
+            top_results = TopKResults(request.offset + request.max_results)
+            async for batch in self.search_stream(request):
+                top_results.extend(batch)
+
+            ranked_results = top_results.ranked()
+            limited_results = self.result_ranker.apply_pagination(
+                ranked_results, request.max_results, request.offset
+            )
+            ranking_stats = self.result_ranker.get_score_statistics(top_results.scores)
+
+            return self._build_search_response(
+                request,
+                limited_results,
+                total_found=top_results.total_seen,
+                total_ranked=top_results.total_seen,
+                ranking_stats=ranking_stats,
+                start_time=start_time,
             )
-            return response
 
         except Exception as e:
             search_duration_ms = int((time.time() - start_time) * 1000)
-            logger.error(f'Search failed after {search_duration_ms}ms: {e}')
+            logger.error(f'Streaming search failed after {search_duration_ms}ms: {e}')
             raise
 
+    def _build_search_response(
+        self,
+        request: GenomicsFileSearchRequest,
+        limited_results: List[GenomicsFileResult],
+        total_found: int,
+        total_ranked: int,
+        ranking_stats: Dict[str, Any],
+        start_time: float,
+    ) -> GenomicsFileSearchResponse:
+        """Build the search response for a page of ranked results.
+
+        Args:
+            request: Search request containing pagination parameters
+            limited_results: Ranked results of the requested page
+            total_found: Total number of scored results
+            total_ranked: Total number of ranked results available for pagination
+            ranking_stats: Ranking statistics over all ranked results
+            start_time: Search start time used for the duration
+
+        Returns:
+            GenomicsFileSearchResponse with ranked results and metadata
+        """
+        # Build comprehensive JSON response
+        search_duration_ms = int((time.time() - start_time) * 1000)
+        storage_systems_searched = self._get_searched_storage_systems()
+
+        next_offset = request.offset + len(limited_results)
+        pagination_info = {
+            'offset': request.offset,
+            'limit': request.max_results,
+            'total_available': total_ranked,
+            'has_more': next_offset < total_ranked,
+            'next_offset': next_offset if next_offset < total_ranked else None,
+            'continuation_token': request.continuation_token,  # Pass through for now
+        }
+
+        response_dict = self.json_builder.build_search_response(
+            results=limited_results,
+            total_found=total_found,
+            search_duration_ms=search_duration_ms,
+            storage_systems_searched=storage_systems_searched,
+            search_statistics=ranking_stats,
+            pagination_info=pagination_info,
+        )
+
+        # Create GenomicsFileSearchResponse object for compatibility
+        response = GenomicsFileSearchResponse(
+            results=response_dict['results'],
+            total_found=response_dict['total_found'],
+            search_duration_ms=response_dict['search_duration_ms'],
+            storage_systems_searched=response_dict['storage_systems_searched'],
+            enhanced_response=response_dict,
+        )
+
+        logger.info(
+            f'Search completed in {search_duration_ms}ms, returning {len(limited_results)} results'
+        )
+        return response
+
     async def search_paginated(
         self, request: GenomicsFileSearchRequest
     ) -> GenomicsFileSearchResponse:
@@ -467,24 +597,7 @@ class GenomicsSearchOrchestrator:
         Returns:
             Combined list of GenomicsFile objects from all storage systems
         """
-        search_tasks = []
-
-        # Combine configured buckets with validated adhoc buckets
-        all_bucket_paths = await self._get_all_s3_bucket_paths(request)
-
-        # Add S3 search task if bucket paths are available and S3 engine is available
-        if all_bucket_paths and self.s3_engine is not None:
-            logger.info(f'Adding S3 search task for {len(all_bucket_paths)} buckets')
-            s3_task = self._search_s3_with_timeout_for_buckets(request, all_bucket_paths)
-            search_tasks.append(('s3', s3_task))
-
-        # Add HealthOmics search tasks if enabled
-        if self.config.enable_healthomics_search:
-            logger.info('Adding HealthOmics search tasks')
-            sequence_task = self._search_healthomics_sequences_with_timeout(request)
-            reference_task = self._search_healthomics_references_with_timeout(request)
-            search_tasks.append(('healthomics_sequences', sequence_task))
-            search_tasks.append(('healthomics_references', reference_task))
+        search_tasks = await self._create_search_tasks(request)
 
         if not search_tasks:
             logger.warning('No storage systems configured for search')
@@ -507,6 +620,44 @@ class GenomicsSearchOrchestrator:
             else:
                 logger.warning(f'Unexpected result type from {storage_system}: {type(result)}')
 
+        self._cleanup_s3_cache_periodically()
+
+        return all_files
+
+    async def _create_search_tasks(
+        self, request: GenomicsFileSearchRequest
+    ) -> List[Tuple[str, Coroutine[Any, Any, List[GenomicsFile]]]]:
+        """Create the search coroutines for all configured storage systems.
+
+        Args:
+            request: Search request containing search parameters
+
+        Returns:
+            List of (storage_system, search coroutine) tuples
+        """
+        search_tasks = []
+
+        # Combine configured buckets with validated adhoc buckets
+        all_bucket_paths = await self._get_all_s3_bucket_paths(request)
+
+        # Add S3 search task if bucket paths are available and S3 engine is available
+        if all_bucket_paths and self.s3_engine is not None:
+            logger.info(f'Adding S3 search task for {len(all_bucket_paths)} buckets')
+            s3_task = self._search_s3_with_timeout_for_buckets(request, all_bucket_paths)
+            search_tasks.append(('s3', s3_task))
+
+        # Add HealthOmics search tasks if enabled
+        if self.config.enable_healthomics_search:
+            logger.info('Adding HealthOmics search tasks')
+            sequence_task = self._search_healthomics_sequences_with_timeout(request)
+            reference_task = self._search_healthomics_references_with_timeout(request)
+            search_tasks.append(('healthomics_sequences', sequence_task))
+            search_tasks.append(('healthomics_references', reference_task))
+
+        return search_tasks
+
+    def _cleanup_s3_cache_periodically(self) -> None:
+        """Occasionally clean up expired S3 cache entries after a search."""
         # Periodically clean up expired cache entries (reduced frequency due to size-based cleanup)
         if (
             secrets.randbelow(100 // S3_CACHE_CLEANUP_PROBABILITY) == 0
@@ -517,7 +668,38 @@ class GenomicsSearchOrchestrator:
             except Exception as e:
                 logger.debug(f'Cache cleanup failed: {e}')
 
-        return all_files
+    async def _score_file_batch(
+        self,
+        files: List[GenomicsFile],
+        seen_paths: Set[str],
+        request: GenomicsFileSearchRequest,
+    ) -> List[GenomicsFileResult]:
+        """Deduplicate, group and score the files returned by one storage system.
+
+        Args:
+            files: Files returned by a storage system search
+            seen_paths: Paths already yielded by earlier batches, updated in place
+            request: Search request containing scoring parameters
+
+        Returns:
+            Scored GenomicsFileResult objects sorted by relevance score
+        """
+        new_files = [
+            file for file in self._deduplicate_files(files) if file.path not in seen_paths
+        ]
+        seen_paths.update(file.path for file in new_files)
+        if not new_files:
+            return []
+
+        files_with_associations = self._extract_healthomics_associations(new_files)
+        file_groups = self.association_engine.find_associations(files_with_associations)
+        scored_results = await self._score_results(
+            file_groups,
+            request.file_type,
+            request.search_terms,
+            request.include_associated_files,
+        )
+        return self.result_ranker.rank_results(scored_results)
 
     async def _execute_parallel_paginated_searches(
         self,
@@ -978,15 +1160,14 @@ class GenomicsSearchOrchestrator:
         """
         scored_results = []
 
-        for file_group in file_groups:
-            # Calculate score for the primary file considering its associations
-            score, reasons = self.scoring_engine.calculate_score(
-                file_group.primary_file,
-                search_terms,
-                file_type_filter,
-                file_group.associated_files,
-            )
+        # Score every primary file, considering its associations, in one batch
+        scores = self.scoring_engine.calculate_scores(
+            [(file_group.primary_file, file_group.associated_files) for file_group in file_groups],
+            search_terms,
+            file_type_filter,
+        )
 
+        for file_group, (score, reasons) in zip(file_groups, scores):
             # Create GenomicsFileResult
             result = GenomicsFileResult(
                 primary_file=file_group.primary_file,
@@ -21,6 +21,7 @@ from awslabs.aws_healthomics_mcp_server.consts import (
     SUBSTRING_MATCH_MAX_MULTIPLIER,
     TAG_MATCH_PENALTY_MULTIPLIER,
 )
+from awslabs.aws_healthomics_mcp_server.search.batch_pattern_matcher import BatchPatternMatcher
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
 
@@ -140,6 +141,44 @@ class PatternMatcher:
         # Tag matches get a slight penalty compared to path matches
         return max_score * TAG_MATCH_PENALTY_MULTIPLIER, match_reasons
 
+    def match_file_paths(
+        self, file_paths: List[str], patterns: List[str]
+    ) -> List[Tuple[float, List[str]]]:
+        """Match patterns against many file paths at once.
+
+        Equivalent to calling match_file_path for each path, but scores the whole
+        corpus in bulk with candidate pruning. Prefer this for large result sets.
+
+        Args:
+            file_paths: Full file paths to match against
+            patterns: List of search patterns
+
+        Returns:
+            List of (score, match_reasons) tuples in the same order as file_paths
+        """
+        if not patterns:
+            return [(0.0, []) for _ in file_paths]
+        return BatchPatternMatcher(patterns, self.fuzzy_threshold).match_file_paths(file_paths)
+
+    def match_tag_sets(
+        self, tag_sets: List[Dict[str, str]], patterns: List[str]
+    ) -> List[Tuple[float, List[str]]]:
+        """Match patterns against many tag dictionaries at once.
+
+        Equivalent to calling match_tags for each tag dictionary, but scores the
+        whole corpus in bulk with candidate pruning.
+
+        Args:
+            tag_sets: Tag key-value dictionaries to match against
+            patterns: List of search patterns
+
+        Returns:
+            List of (score, match_reasons) tuples in the same order as tag_sets
+        """
+        if not patterns:
+            return [(0.0, []) for _ in tag_sets]
+        return BatchPatternMatcher(patterns, self.fuzzy_threshold).match_tags(tag_sets)
+
     def _exact_match_score(self, text: str, pattern: str) -> float:
         """Calculate score for exact matches (case-insensitive)."""
         if text.lower() == pattern.lower():
@@ -162,8 +201,15 @@ class PatternMatcher:
         text_lower = text.lower()
         pattern_lower = pattern.lower()
 
-        # Use SequenceMatcher for fuzzy matching
-        similarity = SequenceMatcher(None, text_lower, pattern_lower).ratio()
+        # Use SequenceMatcher for fuzzy matching; its cheap upper bounds reject most
+        # non-matches (e.g. a short pattern against a full path) before ratio() runs
+        matcher = SequenceMatcher(None, text_lower, pattern_lower)
+        if (
+            matcher.real_quick_ratio() < self.fuzzy_threshold
+            or matcher.quick_ratio() < self.fuzzy_threshold
+        ):
+            return 0.0
+        similarity = matcher.ratio()
 
         if similarity >= self.fuzzy_threshold:
             return FUZZY_MATCH_MAX_MULTIPLIER * similarity  # Max score for fuzzy matches
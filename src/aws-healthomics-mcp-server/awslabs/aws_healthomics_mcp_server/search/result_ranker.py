@@ -14,10 +14,72 @@
 
 """Result ranking system for genomics file search results."""
 
+import heapq
+from array import array
 from awslabs.aws_healthomics_mcp_server.consts import DEFAULT_RESULT_RANKER_FALLBACK_SIZE
 from awslabs.aws_healthomics_mcp_server.models import GenomicsFileResult
 from loguru import logger
-from typing import List
+from typing import Iterable, List, Sequence, Tuple
+
+
+class TopKResults:
+    """Keeps the k highest-scoring results seen so far in a bounded min-heap.
+
+    Only k results are held in memory, plus one float per result for ranking statistics.
+    Ties keep the earliest result, matching the stable sort of ResultRanker.rank_results.
+    """
+
+    def __init__(self, k: int):
+        """Initialize the collector.
+
+        Args:
+            k: Number of top results to keep
+        """
+        self.k = max(0, k)
+        self.scores = array('d')
+        self._heap: List[Tuple[float, int, GenomicsFileResult]] = []
+
+    def push(self, result: GenomicsFileResult) -> None:
+        """Offer a result to the collector.
+
+        Args:
+            result: Scored result
+        """
+        # The negated sequence number makes later results lose ties and keeps the
+        # comparison from ever reaching the result object
+        entry = (result.relevance_score, -len(self.scores), result)
+        self.scores.append(result.relevance_score)
+
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self.k and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, results: Iterable[GenomicsFileResult]) -> None:
+        """Offer many results to the collector.
+
+        Args:
+            results: Scored results
+        """
+        for result in results:
+            self.push(result)
+
+    @property
+    def total_seen(self) -> int:
+        """Get the number of results offered so far."""
+        return len(self.scores)
+
+    def ranked(self) -> List[GenomicsFileResult]:
+        """Get the kept results sorted by relevance score in descending order.
+
+        Returns:
+            Up to k results, highest score first
+        """
+        return [entry[2] for entry in sorted(self._heap, key=lambda e: (-e[0], -e[1]))]
+
+    def __len__(self) -> int:
+        """Get the number of kept results."""
+        return len(self._heap)
 
 
 class ResultRanker:
@@ -120,13 +182,22 @@ class ResultRanker:
         Returns:
             Dictionary containing ranking statistics
         """
-        if not results:
-            return {'total_results': 0, 'score_statistics': {}}
+        return self.get_score_statistics([result.relevance_score for result in results])
 
-        scores = [result.relevance_score for result in results]
+    def get_score_statistics(self, scores: Sequence[float]) -> dict:
+        """Get statistics about the distribution of relevance scores.
+
+        Args:
+            scores: Relevance scores of all ranked results
+
+        Returns:
+            Dictionary containing ranking statistics
+        """
+        if not scores:
+            return {'total_results': 0, 'score_statistics': {}}
 
         statistics = {
-            'total_results': len(results),
+            'total_results': len(scores),
             'score_statistics': {
                 'min_score': min(scores),
                 'max_score': max(scores),
@@ -152,6 +223,6 @@ class ResultRanker:
 
             statistics['score_distribution'] = buckets
         else:
-            statistics['score_distribution'] = {'high': len(results), 'medium': 0, 'low': 0}
+            statistics['score_distribution'] = {'high': len(scores), 'medium': 0, 'low': 0}
 
         return statistics
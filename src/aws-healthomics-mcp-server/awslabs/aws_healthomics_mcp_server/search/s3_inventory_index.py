@@ -0,0 +1,450 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent on-disk inventory index of S3 objects for genomics file search."""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from awslabs.aws_healthomics_mcp_server.consts import (
+    DEFAULT_S3_PAGE_SIZE,
+    S3_INVENTORY_INDEX_FILENAME,
+)
+from datetime import datetime
+from loguru import logger
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# Highest code point, used as an exclusive upper bound for prefix range scans
+_PREFIX_UPPER_BOUND_SUFFIX = '\U0010ffff'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER,
+    last_modified TEXT,
+    etag TEXT,
+    storage_class TEXT,
+    PRIMARY KEY (bucket, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    bucket TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    last_seen_key TEXT,
+    last_full_sync REAL NOT NULL DEFAULT 0,
+    last_refresh REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, prefix)
+);
+"""
+
+_UPSERT_OBJECT_SQL = """
+INSERT INTO objects (bucket, key, size, last_modified, etag, storage_class)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (bucket, key) DO UPDATE SET
+    size = excluded.size,
+    last_modified = excluded.last_modified,
+    etag = excluded.etag,
+    storage_class = excluded.storage_class
+WHERE objects.etag IS NOT excluded.etag
+    OR objects.last_modified IS NOT excluded.last_modified
+    OR objects.storage_class IS NOT excluded.storage_class
+"""
+
+# Key ranges are bounded on both sides so prefix scans use the primary key index
+_SELECT_OBJECTS_PAGE_SQL = """
+SELECT key, size, last_modified, etag, storage_class FROM objects
+WHERE bucket = ? AND key >= ? AND key < ? AND key > ?
+ORDER BY key
+LIMIT ?
+"""
+
+_SELECT_KEYS_SQL = 'SELECT key FROM objects WHERE bucket = ? AND key >= ? AND key < ?'
+
+
+class S3InventoryIndex:
+    """SQLite-backed inventory of S3 object listings, refreshed incrementally.
+
+    Each configured bucket/prefix is tracked independently. A prefix is fully
+    re-listed when it has never been indexed or when the full refresh interval
+    has elapsed; the full pass only rewrites rows whose ETag, LastModified or
+    storage class changed and removes keys that disappeared. Between full passes
+    the prefix is topped up with ``StartAfter`` set to the last-seen key, which
+    picks up newly written objects (the common case for sequencing output) at
+    the cost of a single request when nothing changed.
+    """
+
+    def __init__(
+        self,
+        index_dir: str,
+        refresh_interval_seconds: int,
+        full_refresh_interval_seconds: int,
+    ):
+        """Initialize the inventory index.
+
+        Args:
+            index_dir: Directory holding the SQLite index file (created if missing)
+            refresh_interval_seconds: Minimum age before an append-only top-up is run
+            full_refresh_interval_seconds: Minimum age before a prefix is fully re-listed
+        """
+        os.makedirs(index_dir, exist_ok=True)
+        self.index_path = os.path.join(index_dir, S3_INVENTORY_INDEX_FILENAME)
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.full_refresh_interval_seconds = full_refresh_interval_seconds
+
+        # The connection is shared by executor threads, so every access is serialized
+        self._conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._db_lock = threading.Lock()
+
+        # One refresh at a time per bucket/prefix; concurrent searches wait and reuse it.
+        # This holds across tool calls because they share the index of a directory,
+        # see get_shared_inventory_index.
+        self._refresh_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._refresh_locks_guard = threading.Lock()
+
+        self._stats = {'full_refreshes': 0, 'incremental_refreshes': 0, 'index_reads': 0}
+
+        logger.info(f'S3 inventory index opened at {self.index_path}')
+
+    def refresh(self, s3_client: Any, bucket: str, prefix: str) -> Dict[str, Any]:
+        """Bring the index for a bucket/prefix up to date if it is stale.
+
+        This method performs blocking S3 and SQLite calls and should be run in an executor.
+
+        Args:
+            s3_client: boto3 S3 client used for listing
+            bucket: Name of the S3 bucket
+            prefix: Object key prefix
+
+        Returns:
+            Dictionary describing the refresh (mode, listed, upserted, deleted)
+        """
+        with self._get_refresh_lock(bucket, prefix):
+            # Re-read the state under the lock; another search may have just refreshed
+            state = self._get_sync_state(bucket, prefix)
+            now = time.time()
+
+            if (
+                state is None
+                or now - state['last_full_sync'] >= self.full_refresh_interval_seconds
+            ):
+                return self._full_refresh(s3_client, bucket, prefix, now)
+
+            if now - state['last_refresh'] >= self.refresh_interval_seconds:
+                return self._incremental_refresh(
+                    s3_client, bucket, prefix, state['last_seen_key'], now
+                )
+
+            return {'mode': 'none', 'listed': 0, 'upserted': 0, 'deleted': 0}
+
+    def list_objects(self, bucket: str, prefix: str) -> List[Dict[str, Any]]:
+        """Return all indexed objects under a bucket/prefix in key order.
+
+        Args:
+            bucket: Name of the S3 bucket
+            prefix: Object key prefix
+
+        Returns:
+            List of S3 object dictionaries shaped like list_objects_v2 ``Contents`` entries
+        """
+        objects, _ = self.list_objects_page(bucket, prefix, start_after=None, limit=None)
+        return objects
+
+    def list_objects_page(
+        self,
+        bucket: str,
+        prefix: str,
+        start_after: Optional[str],
+        limit: Optional[int],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Return a page of indexed objects under a bucket/prefix in key order.
+
+        Args:
+            bucket: Name of the S3 bucket
+            prefix: Object key prefix
+            start_after: Only return keys strictly greater than this key
+            limit: Maximum number of objects to return (None for all)
+
+        Returns:
+            Tuple of (objects, last_key) where last_key is set only if more objects remain
+        """
+        lower, upper = self._prefix_range(prefix)
+        # SQLite treats a negative LIMIT as unbounded; one extra row reveals another page
+        sql_limit = -1 if limit is None else limit + 1
+
+        with self._db_lock:
+            rows = self._conn.execute(
+                _SELECT_OBJECTS_PAGE_SQL,
+                (bucket, lower, upper, start_after or '', sql_limit),
+            ).fetchall()
+            self._stats['index_reads'] += 1
+
+        next_key = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_key = rows[-1][0]
+
+        return [self._row_to_object(row) for row in rows], next_key
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics for monitoring.
+
+        Returns:
+            Dictionary with index statistics
+        """
+        with self._db_lock:
+            object_count = self._conn.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+            prefix_count = self._conn.execute('SELECT COUNT(*) FROM sync_state').fetchone()[0]
+
+        return {
+            'index_path': self.index_path,
+            'indexed_objects': object_count,
+            'indexed_prefixes': prefix_count,
+            'refresh_interval_seconds': self.refresh_interval_seconds,
+            'full_refresh_interval_seconds': self.full_refresh_interval_seconds,
+            **self._stats,
+        }
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._db_lock:
+            self._conn.close()
+
+    def _full_refresh(
+        self, s3_client: Any, bucket: str, prefix: str, now: float
+    ) -> Dict[str, Any]:
+        """Re-list a bucket/prefix, writing only changed rows and removing deleted keys."""
+        seen_keys: Set[str] = set()
+        upserted = 0
+        last_seen_key = None
+
+        for page in self._iter_list_pages(s3_client, bucket, prefix, start_after=None):
+            upserted += self._upsert_objects(bucket, page)
+            seen_keys.update(obj['Key'] for obj in page)
+            last_seen_key = page[-1]['Key']
+
+        deleted = self._delete_unseen_keys(bucket, prefix, seen_keys)
+        self._set_sync_state(bucket, prefix, last_seen_key, last_full_sync=now, last_refresh=now)
+        self._stats['full_refreshes'] += 1
+
+        logger.info(
+            f'Inventory full refresh of s3://{bucket}/{prefix}: {len(seen_keys)} listed, '
+            f'{upserted} new or changed, {deleted} removed'
+        )
+        return {'mode': 'full', 'listed': len(seen_keys), 'upserted': upserted, 'deleted': deleted}
+
+    def _incremental_refresh(
+        self,
+        s3_client: Any,
+        bucket: str,
+        prefix: str,
+        last_seen_key: Optional[str],
+        now: float,
+    ) -> Dict[str, Any]:
+        """List only keys after the last-seen key and add them to the index."""
+        listed = 0
+        upserted = 0
+
+        for page in self._iter_list_pages(s3_client, bucket, prefix, start_after=last_seen_key):
+            upserted += self._upsert_objects(bucket, page)
+            listed += len(page)
+            last_seen_key = page[-1]['Key']
+
+        self._set_sync_state(bucket, prefix, last_seen_key, last_full_sync=None, last_refresh=now)
+        self._stats['incremental_refreshes'] += 1
+
+        logger.debug(
+            f'Inventory incremental refresh of s3://{bucket}/{prefix}: {listed} new keys listed'
+        )
+        return {'mode': 'incremental', 'listed': listed, 'upserted': upserted, 'deleted': 0}
+
+    def _iter_list_pages(
+        self, s3_client: Any, bucket: str, prefix: str, start_after: Optional[str]
+    ):
+        """Yield non-empty pages of list_objects_v2 results."""
+        continuation_token = None
+        while True:
+            params: Dict[str, Any] = {
+                'Bucket': bucket,
+                'Prefix': prefix,
+                'MaxKeys': DEFAULT_S3_PAGE_SIZE,
+            }
+            if continuation_token:
+                params['ContinuationToken'] = continuation_token
+            elif start_after:
+                params['StartAfter'] = start_after
+
+            response = s3_client.list_objects_v2(**params)
+            contents = response.get('Contents', [])
+            if contents:
+                yield contents
+
+            if not response.get('IsTruncated', False):
+                break
+            continuation_token = response.get('NextContinuationToken')
+
+    def _upsert_objects(self, bucket: str, objects: List[Dict[str, Any]]) -> int:
+        """Insert or update a page of objects, returning the number of rows written."""
+        rows = [
+            (
+                bucket,
+                obj['Key'],
+                obj.get('Size'),
+                self._format_last_modified(obj.get('LastModified')),
+                obj.get('ETag'),
+                obj.get('StorageClass'),
+            )
+            for obj in objects
+        ]
+        with self._db_lock:
+            before = self._conn.total_changes
+            self._conn.executemany(_UPSERT_OBJECT_SQL, rows)
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def _delete_unseen_keys(self, bucket: str, prefix: str, seen_keys: Set[str]) -> int:
+        """Delete indexed keys under a prefix that were not seen in the latest listing."""
+        lower, upper = self._prefix_range(prefix)
+        with self._db_lock:
+            stale_keys = [
+                row[0]
+                for row in self._conn.execute(_SELECT_KEYS_SQL, (bucket, lower, upper))
+                if row[0] not in seen_keys
+            ]
+            self._conn.executemany(
+                'DELETE FROM objects WHERE bucket = ? AND key = ?',
+                [(bucket, key) for key in stale_keys],
+            )
+            self._conn.commit()
+        return len(stale_keys)
+
+    def _get_sync_state(self, bucket: str, prefix: str) -> Optional[Dict[str, Any]]:
+        """Read the sync state for a bucket/prefix."""
+        with self._db_lock:
+            row = self._conn.execute(
+                'SELECT last_seen_key, last_full_sync, last_refresh FROM sync_state '
+                'WHERE bucket = ? AND prefix = ?',
+                (bucket, prefix),
+            ).fetchone()
+        if row is None:
+            return None
+        return {'last_seen_key': row[0], 'last_full_sync': row[1], 'last_refresh': row[2]}
+
+    def _set_sync_state(
+        self,
+        bucket: str,
+        prefix: str,
+        last_seen_key: Optional[str],
+        last_full_sync: Optional[float],
+        last_refresh: float,
+    ) -> None:
+        """Persist the sync state for a bucket/prefix."""
+        with self._db_lock:
+            self._conn.execute(
+                'INSERT INTO sync_state (bucket, prefix, last_seen_key, last_full_sync, last_refresh) '
+                'VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (bucket, prefix) DO UPDATE SET '
+                'last_seen_key = excluded.last_seen_key, '
+                'last_full_sync = COALESCE(?, sync_state.last_full_sync), '
+                'last_refresh = excluded.last_refresh',
+                (bucket, prefix, last_seen_key, last_full_sync or 0, last_refresh, last_full_sync),
+            )
+            self._conn.commit()
+
+    def _get_refresh_lock(self, bucket: str, prefix: str) -> threading.Lock:
+        """Get the lock serializing refreshes of a bucket/prefix."""
+        with self._refresh_locks_guard:
+            return self._refresh_locks.setdefault((bucket, prefix), threading.Lock())
+
+    @staticmethod
+    def _prefix_range(prefix: str) -> Tuple[str, str]:
+        """Get the [lower, upper) key range covering every key under a prefix."""
+        return prefix, prefix + _PREFIX_UPPER_BOUND_SUFFIX
+
+    @staticmethod
+    def _format_last_modified(value: Any) -> Optional[str]:
+        """Serialize a LastModified value for storage."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value) if value is not None else None
+
+    @staticmethod
+    def _row_to_object(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Convert an index row into a list_objects_v2-style object dictionary."""
+        key, size, last_modified, etag, storage_class = row
+        obj: Dict[str, Any] = {'Key': key, 'Size': size}
+        if last_modified:
+            obj['LastModified'] = datetime.fromisoformat(last_modified)
+        if etag is not None:
+            obj['ETag'] = etag
+        if storage_class is not None:
+            obj['StorageClass'] = storage_class
+        return obj
+
+
+# Indexes shared by all search engines of the process, keyed by their index directory
+_shared_indexes: Dict[str, S3InventoryIndex] = {}
+_shared_indexes_lock = threading.Lock()
+
+
+def get_shared_inventory_index(
+    index_dir: str,
+    refresh_interval_seconds: int,
+    full_refresh_interval_seconds: int,
+) -> S3InventoryIndex:
+    """Get the process-wide inventory index of a directory, opening it on first use.
+
+    Search engines are created per tool call, so sharing the index keeps a single SQLite
+    connection and a single set of refresh locks per index file.
+
+    Args:
+        index_dir: Directory holding the SQLite index file (created if missing)
+        refresh_interval_seconds: Minimum age before an append-only top-up is run
+        full_refresh_interval_seconds: Minimum age before a prefix is fully re-listed
+
+    Returns:
+        The shared S3InventoryIndex of the directory
+    """
+    key = os.path.realpath(index_dir)
+    with _shared_indexes_lock:
+        index = _shared_indexes.get(key)
+        if index is None:
+            index = S3InventoryIndex(
+                index_dir, refresh_interval_seconds, full_refresh_interval_seconds
+            )
+            _shared_indexes[key] = index
+        else:
+            # Pick up configuration changes without reopening the database
+            index.refresh_interval_seconds = refresh_interval_seconds
+            index.full_refresh_interval_seconds = full_refresh_interval_seconds
+        return index
+
+
+def close_shared_inventory_indexes() -> None:
+    """Close all shared inventory indexes; they are reopened on next use."""
+    with _shared_indexes_lock:
+        indexes = list(_shared_indexes.values())
+        _shared_indexes.clear()
+    for index in indexes:
+        index.close()
+
+
+atexit.register(close_shared_inventory_indexes)
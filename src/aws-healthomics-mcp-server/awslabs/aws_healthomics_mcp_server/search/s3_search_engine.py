@@ -17,7 +17,10 @@
 import asyncio
 import hashlib
 import time
-from awslabs.aws_healthomics_mcp_server.consts import DEFAULT_S3_PAGE_SIZE
+from awslabs.aws_healthomics_mcp_server.consts import (
+    DEFAULT_S3_PAGE_SIZE,
+    S3_INVENTORY_TOKEN_PREFIX,
+)
 from awslabs.aws_healthomics_mcp_server.models import (
     GenomicsFile,
     GenomicsFileType,
@@ -29,6 +32,11 @@ from awslabs.aws_healthomics_mcp_server.models import (
 )
 from awslabs.aws_healthomics_mcp_server.search.file_type_detector import FileTypeDetector
 from awslabs.aws_healthomics_mcp_server.search.pattern_matcher import PatternMatcher
+from awslabs.aws_healthomics_mcp_server.search.s3_inventory_index import (
+    S3InventoryIndex,
+    get_shared_inventory_index,
+)
+from awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher import get_shared_tag_fetcher
 from awslabs.aws_healthomics_mcp_server.utils.aws_utils import get_aws_session
 from awslabs.aws_healthomics_mcp_server.utils.s3_utils import parse_s3_path
 from awslabs.aws_healthomics_mcp_server.utils.search_config import (
@@ -67,14 +75,34 @@ class S3SearchEngine:
         self.pattern_matcher = PatternMatcher()
 
         # Caching for optimization
-        self._tag_cache = {}  # Cache for object tags
         self._result_cache = {}  # Cache for search results
 
+        # Tag retrieval runs on a thread pool and S3 client shared by the search engines of
+        # all tool calls, with an LRU+TTL tag cache
+        self._tag_fetcher = get_shared_tag_fetcher(self.session, config)
+
+        # Optional persistent inventory index that replaces repeated full listings,
+        # shared with the search engines of other tool calls
+        self._inventory_index: Optional[S3InventoryIndex] = None
+        if config.inventory_index_dir:
+            try:
+                self._inventory_index = get_shared_inventory_index(
+                    config.inventory_index_dir,
+                    config.inventory_refresh_interval_seconds,
+                    config.inventory_full_refresh_interval_seconds,
+                )
+            except Exception as e:
+                logger.warning(
+                    f'Could not open S3 inventory index in {config.inventory_index_dir}: {e}. '
+                    'Falling back to direct S3 listing.'
+                )
+
         logger.info(
             f'S3SearchEngine initialized with tag search: {config.enable_s3_tag_search}, '
             f'tag batch size: {config.max_tag_retrieval_batch_size}, '
             f'result cache TTL: {config.result_cache_ttl_seconds}s, '
-            f'tag cache TTL: {config.tag_cache_ttl_seconds}s'
+            f'tag cache TTL: {config.tag_cache_ttl_seconds}s, '
+            f'inventory index: {self._inventory_index is not None}'
         )
 
     @classmethod
@@ -339,36 +367,9 @@ class S3SearchEngine:
             logger.debug(f'Listed {len(objects)} objects in {bucket_path}')
 
             # Phase 2: Filter by file type and path patterns (no S3 calls)
-            path_matched_objects = []
-            objects_needing_tags = []
-
-            for obj in objects:
-                key = obj['Key']
-
-                # File type filtering
-                detected_file_type = self.file_type_detector.detect_file_type(key)
-                if not detected_file_type:
-                    continue
-
-                if not self._matches_file_type_filter(detected_file_type, file_type):
-                    continue
-
-                # Path-based search term matching
-                if search_terms:
-                    # Use centralized URI construction for pattern matching
-                    s3_path = build_s3_uri(bucket_name, key)
-                    path_score, _ = self.pattern_matcher.match_file_path(s3_path, search_terms)
-                    if path_score > 0:
-                        # Path matched, no need for tags
-                        path_matched_objects.append((obj, {}, detected_file_type))
-                        continue
-                    elif self.config.enable_s3_tag_search:
-                        # Need to check tags
-                        objects_needing_tags.append((obj, detected_file_type))
-                    # If path doesn't match and tag search is disabled, skip
-                else:
-                    # No search terms, include all type-matched files
-                    path_matched_objects.append((obj, {}, detected_file_type))
+            path_matched_objects, objects_needing_tags = self._filter_objects_by_path(
+                objects, bucket_name, file_type, search_terms
+            )
 
             logger.debug(
                 f'After path filtering: {len(path_matched_objects)} path matches, '
@@ -381,13 +382,13 @@ class S3SearchEngine:
                 object_keys = [obj[0]['Key'] for obj in objects_needing_tags]
                 tag_map = await self._get_tags_for_objects_batch(bucket_name, object_keys)
 
-                for obj, detected_file_type in objects_needing_tags:
-                    key = obj['Key']
-                    tags = tag_map.get(key, {})
-
-                    # Check tag-based matching
-                    if search_terms:
-                        tag_score, _ = self.pattern_matcher.match_tags(tags, search_terms)
+                # Check tag-based matching for all candidates in one batch
+                if search_terms:
+                    tag_sets = [tag_map.get(obj['Key'], {}) for obj, _ in objects_needing_tags]
+                    tag_matches = self.pattern_matcher.match_tag_sets(tag_sets, search_terms)
+                    for (obj, detected_file_type), tags, (tag_score, _) in zip(
+                        objects_needing_tags, tag_sets, tag_matches
+                    ):
                         if tag_score > 0:
                             tag_matched_objects.append((obj, tags, detected_file_type))
 
@@ -452,36 +453,9 @@ class S3SearchEngine:
             )
 
             # Phase 2: Filter by file type and path patterns (no S3 calls)
-            path_matched_objects = []
-            objects_needing_tags = []
-
-            for obj in objects:
-                key = obj['Key']
-
-                # File type filtering
-                detected_file_type = self.file_type_detector.detect_file_type(key)
-                if not detected_file_type:
-                    continue
-
-                if not self._matches_file_type_filter(detected_file_type, file_type):
-                    continue
-
-                # Path-based search term matching
-                if search_terms:
-                    # Use centralized URI construction for pattern matching
-                    s3_path = build_s3_uri(bucket_name, key)
-                    path_score, _ = self.pattern_matcher.match_file_path(s3_path, search_terms)
-                    if path_score > 0:
-                        # Path matched, no need for tags
-                        path_matched_objects.append((obj, {}, detected_file_type))
-                        continue
-                    elif self.config.enable_s3_tag_search:
-                        # Need to check tags
-                        objects_needing_tags.append((obj, detected_file_type))
-                    # If path doesn't match and tag search is disabled, skip
-                else:
-                    # No search terms, include all type-matched files
-                    path_matched_objects.append((obj, {}, detected_file_type))
+            path_matched_objects, objects_needing_tags = self._filter_objects_by_path(
+                objects, bucket_name, file_type, search_terms
+            )
 
             logger.debug(
                 f'After path filtering: {len(path_matched_objects)} path matches, '
@@ -494,13 +468,13 @@ class S3SearchEngine:
                 object_keys = [obj[0]['Key'] for obj in objects_needing_tags]
                 tag_map = await self._get_tags_for_objects_batch(bucket_name, object_keys)
 
-                for obj, detected_file_type in objects_needing_tags:
-                    key = obj['Key']
-                    tags = tag_map.get(key, {})
-
-                    # Check tag-based matching
-                    if search_terms:
-                        tag_score, _ = self.pattern_matcher.match_tags(tags, search_terms)
+                # Check tag-based matching for all candidates in one batch
+                if search_terms:
+                    tag_sets = [tag_map.get(obj['Key'], {}) for obj, _ in objects_needing_tags]
+                    tag_matches = self.pattern_matcher.match_tag_sets(tag_sets, search_terms)
+                    for (obj, detected_file_type), tags, (tag_score, _) in zip(
+                        objects_needing_tags, tag_sets, tag_matches
+                    ):
                         if tag_score > 0:
                             tag_matched_objects.append((obj, tags, detected_file_type))
 
@@ -526,6 +500,64 @@ class S3SearchEngine:
             logger.error(f'Error in paginated search of bucket path {bucket_path}: {e}')
             raise
 
+    def _filter_objects_by_path(
+        self,
+        objects: List[Dict[str, Any]],
+        bucket_name: str,
+        file_type: Optional[str],
+        search_terms: List[str],
+    ) -> Tuple[
+        List[Tuple[Dict[str, Any], Dict[str, str], GenomicsFileType]],
+        List[Tuple[Dict[str, Any], GenomicsFileType]],
+    ]:
+        """Filter listed objects by file type and match search terms against their paths.
+
+        Path matching for all type-matched objects runs as a single batch so the
+        pattern matcher can prune fuzzy-match candidates across the whole listing.
+
+        Args:
+            objects: S3 object dictionaries from list_objects_v2
+            bucket_name: Name of the S3 bucket
+            file_type: Optional file type filter
+            search_terms: List of search terms to match against
+
+        Returns:
+            Tuple of (path_matched_objects, objects_needing_tags) where path matches are
+            (object, tags, file_type) tuples and tag candidates are (object, file_type) tuples
+        """
+        type_matched_objects = []
+        for obj in objects:
+            # File type filtering
+            detected_file_type = self.file_type_detector.detect_file_type(obj['Key'])
+            if not detected_file_type:
+                continue
+
+            if not self._matches_file_type_filter(detected_file_type, file_type):
+                continue
+
+            type_matched_objects.append((obj, detected_file_type))
+
+        if not search_terms:
+            # No search terms, include all type-matched files
+            return [(obj, {}, file_type) for obj, file_type in type_matched_objects], []
+
+        # Path-based search term matching, using centralized URI construction
+        s3_paths = [build_s3_uri(bucket_name, obj['Key']) for obj, _ in type_matched_objects]
+        path_matches = self.pattern_matcher.match_file_paths(s3_paths, search_terms)
+
+        path_matched_objects = []
+        objects_needing_tags = []
+        for (obj, detected_file_type), (path_score, _) in zip(type_matched_objects, path_matches):
+            if path_score > 0:
+                # Path matched, no need for tags
+                path_matched_objects.append((obj, {}, detected_file_type))
+            elif self.config.enable_s3_tag_search:
+                # Need to check tags
+                objects_needing_tags.append((obj, detected_file_type))
+            # If path doesn't match and tag search is disabled, skip
+
+        return path_matched_objects, objects_needing_tags
+
     async def _validate_bucket_access(self, bucket_name: str) -> None:
         """Validate that we have access to the specified S3 bucket.
 
@@ -577,6 +609,11 @@ class S3SearchEngine:
         Returns:
             List of S3 object dictionaries
         """
+        if self._inventory_index is not None:
+            return await self._list_s3_objects_from_index(
+                self._inventory_index, bucket_name, prefix
+            )
+
         objects = []
         continuation_token = None
 
@@ -635,6 +672,14 @@ class S3SearchEngine:
         Returns:
             Tuple of (objects, next_continuation_token, total_objects_scanned)
         """
+        # Native S3 tokens issued before the index was enabled keep paging against S3
+        if self._inventory_index is not None and (
+            not continuation_token or continuation_token.startswith(S3_INVENTORY_TOKEN_PREFIX)
+        ):
+            return await self._list_s3_objects_paginated_from_index(
+                self._inventory_index, bucket_name, prefix, continuation_token, max_results
+            )
+
         objects = []
         total_scanned = 0
         current_token = continuation_token
@@ -695,6 +740,95 @@ class S3SearchEngine:
 
         return objects, current_token, total_scanned
 
+    async def _refresh_inventory_index(
+        self, index: S3InventoryIndex, bucket_name: str, prefix: str
+    ) -> None:
+        """Bring the persistent inventory index for a bucket/prefix up to date.
+
+        Args:
+            index: Inventory index to refresh
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix
+
+        Raises:
+            ClientError: If listing the bucket fails
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(
+                None, lambda: index.refresh(self.s3_client, bucket_name, prefix)
+            )
+        except ClientError as e:
+            logger.error(
+                f'Error refreshing inventory index for bucket {bucket_name} with prefix {prefix}: {e}'
+            )
+            raise
+
+    async def _list_s3_objects_from_index(
+        self, index: S3InventoryIndex, bucket_name: str, prefix: str
+    ) -> List[Dict[str, Any]]:
+        """List objects under a bucket/prefix from the persistent inventory index.
+
+        Args:
+            index: Inventory index to read from
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+
+        Returns:
+            List of S3 object dictionaries
+        """
+        await self._refresh_inventory_index(index, bucket_name, prefix)
+
+        loop = asyncio.get_event_loop()
+        objects = await loop.run_in_executor(None, lambda: index.list_objects(bucket_name, prefix))
+        logger.debug(
+            f'Listed {len(objects)} objects in s3://{bucket_name}/{prefix} from inventory index'
+        )
+        return objects
+
+    async def _list_s3_objects_paginated_from_index(
+        self,
+        index: S3InventoryIndex,
+        bucket_name: str,
+        prefix: str,
+        continuation_token: Optional[str],
+        max_results: int,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+        """List a page of objects from the persistent inventory index.
+
+        Continuation tokens carry the last returned key, prefixed with
+        S3_INVENTORY_TOKEN_PREFIX so they are never sent to S3.
+
+        Args:
+            index: Inventory index to read from
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+            continuation_token: Inventory continuation token from previous request
+            max_results: Maximum number of objects to return
+
+        Returns:
+            Tuple of (objects, next_continuation_token, total_objects_scanned)
+        """
+        # Only refresh at the start of a pagination session so pages stay consistent
+        start_after = None
+        if continuation_token:
+            start_after = continuation_token[len(S3_INVENTORY_TOKEN_PREFIX) :]
+        else:
+            await self._refresh_inventory_index(index, bucket_name, prefix)
+
+        loop = asyncio.get_event_loop()
+        objects, last_key = await loop.run_in_executor(
+            None,
+            lambda: index.list_objects_page(bucket_name, prefix, start_after, max_results),
+        )
+        next_token = f'{S3_INVENTORY_TOKEN_PREFIX}{last_key}' if last_key else None
+
+        logger.debug(
+            f'Listed {len(objects)} objects in s3://{bucket_name}/{prefix} from inventory index '
+            f'(next_token: {bool(next_token)})'
+        )
+        return objects, next_token, len(objects)
+
     def _create_genomics_file_from_object(
         self,
         s3_object: Dict[str, Any],
@@ -725,74 +859,10 @@ class S3SearchEngine:
             },
         )
 
-    async def _get_object_tags_cached(self, bucket_name: str, key: str) -> Dict[str, str]:
-        """Get tags for an S3 object with caching.
-
-        Args:
-            bucket_name: Name of the S3 bucket
-            key: Object key
-
-        Returns:
-            Dictionary of object tags
-        """
-        cache_key = f'{bucket_name}/{key}'
-
-        # Check cache first
-        if cache_key in self._tag_cache:
-            cached_entry = self._tag_cache[cache_key]
-            if time.time() - cached_entry['timestamp'] < self.config.tag_cache_ttl_seconds:
-                return cached_entry['tags']
-            else:
-                # Remove expired entry
-                del self._tag_cache[cache_key]
-
-        # Retrieve from S3 and cache
-        tags = await self._get_object_tags(bucket_name, key)
-
-        # Check if we need to clean up before adding
-        if len(self._tag_cache) >= self.config.max_tag_cache_size:
-            self._cleanup_cache_by_size(
-                self._tag_cache,
-                self.config.max_tag_cache_size,
-                self.config.cache_cleanup_keep_ratio,
-            )
-
-        self._tag_cache[cache_key] = {'tags': tags, 'timestamp': time.time()}
-
-        return tags
-
-    async def _get_object_tags(self, bucket_name: str, key: str) -> Dict[str, str]:
-        """Get tags for an S3 object.
-
-        Args:
-            bucket_name: Name of the S3 bucket
-            key: Object key
-
-        Returns:
-            Dictionary of object tags
-        """
-        try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, lambda: self.s3_client.get_object_tagging(Bucket=bucket_name, Key=key)
-            )
-
-            # Convert tag list to dictionary
-            tags = {}
-            for tag in response.get('TagSet', []):
-                tags[tag['Key']] = tag['Value']
-
-            return tags
-
-        except ClientError as e:
-            # If we can't get tags (e.g., no permission), return empty dict
-            logger.debug(f'Could not get tags for s3://{bucket_name}/{key}: {e}')
-            return {}
-
     async def _get_tags_for_objects_batch(
         self, bucket_name: str, object_keys: List[str]
     ) -> Dict[str, Dict[str, str]]:
-        """Retrieve tags for multiple objects efficiently using batching and caching.
+        """Retrieve tags for multiple objects through the tag fetcher and its cache.
 
         Args:
             bucket_name: Name of the S3 bucket
@@ -804,60 +874,7 @@ class S3SearchEngine:
         if not object_keys:
             return {}
 
-        # Check cache for existing entries
-        tag_map = {}
-        keys_to_fetch = []
-
-        for key in object_keys:
-            cache_key = f'{bucket_name}/{key}'
-            if cache_key in self._tag_cache:
-                cached_entry = self._tag_cache[cache_key]
-                if time.time() - cached_entry['timestamp'] < self.config.tag_cache_ttl_seconds:
-                    tag_map[key] = cached_entry['tags']
-                    continue
-                else:
-                    # Remove expired entry
-                    del self._tag_cache[cache_key]
-
-            keys_to_fetch.append(key)
-
-        if not keys_to_fetch:
-            logger.debug(f'All {len(object_keys)} object tags found in cache')
-            return tag_map
-
-        logger.debug(
-            f'Fetching tags for {len(keys_to_fetch)} objects (batch size limit: {self.config.max_tag_retrieval_batch_size})'
-        )
-
-        # Process in batches to avoid overwhelming the API
-        batch_size = min(self.config.max_tag_retrieval_batch_size, len(keys_to_fetch))
-        semaphore = asyncio.Semaphore(10)  # Limit concurrent tag retrievals
-
-        async def get_single_tag(key: str) -> Tuple[str, Dict[str, str]]:
-            async with semaphore:
-                tags = await self._get_object_tags_cached(bucket_name, key)
-                return key, tags
-
-        # Process keys in batches
-        for i in range(0, len(keys_to_fetch), batch_size):
-            batch_keys = keys_to_fetch[i : i + batch_size]
-
-            # Execute batch in parallel
-            tasks = [get_single_tag(key) for key in batch_keys]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process batch results
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.warning(f'Failed to get tags in batch: {result}')
-                elif isinstance(result, tuple) and len(result) == 2:
-                    key, tags = result
-                    tag_map[key] = tags
-                else:
-                    logger.warning(f'Unexpected result type in tag batch: {type(result)}')
-
-        logger.debug(f'Retrieved tags for {len(tag_map)} objects total')
-        return tag_map
+        return await self._tag_fetcher.fetch_tags(bucket_name, object_keys)
 
     def _matches_file_type_filter(
         self, detected_file_type: GenomicsFileType, file_type_filter: Optional[str]
@@ -1081,13 +1098,7 @@ class S3SearchEngine:
         current_time = time.time()
 
         # Clean up tag cache
-        expired_tag_keys = []
-        for cache_key, cached_entry in self._tag_cache.items():
-            if current_time - cached_entry['timestamp'] >= self.config.tag_cache_ttl_seconds:
-                expired_tag_keys.append(cache_key)
-
-        for key in expired_tag_keys:
-            del self._tag_cache[key]
+        expired_tag_count = self._tag_fetcher.cleanup_expired_cache_entries()
 
         # Clean up result cache
         expired_result_keys = []
@@ -1098,9 +1109,9 @@ class S3SearchEngine:
         for key in expired_result_keys:
             del self._result_cache[key]
 
-        if expired_tag_keys or expired_result_keys:
+        if expired_tag_count or expired_result_keys:
             logger.debug(
-                f'Cleaned up {len(expired_tag_keys)} expired tag cache entries and '
+                f'Cleaned up {expired_tag_count} expired tag cache entries and '
                 f'{len(expired_result_keys)} expired result cache entries'
             )
 
@@ -1112,13 +1123,6 @@ class S3SearchEngine:
         """
         current_time = time.time()
 
-        # Count valid entries
-        valid_tag_entries = sum(
-            1
-            for entry in self._tag_cache.values()
-            if current_time - entry['timestamp'] < self.config.tag_cache_ttl_seconds
-        )
-
         valid_result_entries = sum(
             1
             for entry in self._result_cache.values()
@@ -1126,13 +1130,8 @@ class S3SearchEngine:
         )
 
         return {
-            'tag_cache': {
-                'total_entries': len(self._tag_cache),
-                'valid_entries': valid_tag_entries,
-                'ttl_seconds': self.config.tag_cache_ttl_seconds,
-                'max_cache_size': self.config.max_tag_cache_size,
-                'cache_utilization': len(self._tag_cache) / self.config.max_tag_cache_size,
-            },
+            'tag_cache': self._tag_fetcher.cache.get_stats(),
+            'tag_fetch': self._tag_fetcher.get_stats(),
             'result_cache': {
                 'total_entries': len(self._result_cache),
                 'valid_entries': valid_result_entries,
@@ -1140,6 +1139,9 @@ class S3SearchEngine:
                 'max_cache_size': self.config.max_result_cache_size,
                 'cache_utilization': len(self._result_cache) / self.config.max_result_cache_size,
             },
+            'inventory_index': (
+                self._inventory_index.get_stats() if self._inventory_index else None
+            ),
             'config': {
                 'enable_s3_tag_search': self.config.enable_s3_tag_search,
                 'max_tag_batch_size': self.config.max_tag_retrieval_batch_size,
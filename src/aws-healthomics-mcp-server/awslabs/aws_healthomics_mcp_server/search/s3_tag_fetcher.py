@@ -0,0 +1,424 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent S3 object tag retrieval with adaptive concurrency and an LRU+TTL cache."""
+
+import asyncio
+import atexit
+import threading
+import time
+from awslabs.aws_healthomics_mcp_server.consts import (
+    S3_TAG_FETCH_INITIAL_CONCURRENCY,
+    S3_TAG_FETCH_MAX_ERROR_RETRIES,
+    S3_TAG_FETCH_MAX_THROTTLE_RETRIES,
+    S3_TAG_FETCH_THROTTLE_BACKOFF_SECONDS,
+    S3_THROTTLING_ERROR_CODES,
+)
+from awslabs.aws_healthomics_mcp_server.models import SearchConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class TagCache:
+    """LRU cache of S3 object tags with a per-entry TTL and hit/miss counters.
+
+    The cache is accessed from the event loop thread only and is not thread-safe.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        """Initialize the tag cache.
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted
+            ttl_seconds: Entry time-to-live in seconds (0 disables caching)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, Tuple[Dict[str, str], float]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Get cached tags, refreshing the entry's recency.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached tags, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        tags, timestamp = entry
+        if time.time() - timestamp >= self.ttl_seconds:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return tags
+
+    def put(self, key: str, tags: Dict[str, str]) -> None:
+        """Cache tags, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key: Cache key
+            tags: Object tags
+        """
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[key] = (tags, time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def cleanup_expired(self) -> int:
+        """Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        current_time = time.time()
+        expired_keys = [
+            key
+            for key, (_, timestamp) in self._entries.items()
+            if current_time - timestamp >= self.ttl_seconds
+        ]
+        for key in expired_keys:
+            del self._entries[key]
+        self.expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached entries, including not yet removed expired ones."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is cached, regardless of expiry."""
+        return key in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        current_time = time.time()
+        valid_entries = sum(
+            1
+            for _, timestamp in self._entries.values()
+            if current_time - timestamp < self.ttl_seconds
+        )
+        lookups = self.hits + self.misses
+        return {
+            'total_entries': len(self._entries),
+            'valid_entries': valid_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'max_cache_size': self.max_size,
+            'cache_utilization': len(self._entries) / self.max_size if self.max_size else 0.0,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+
+class S3TagFetcher:
+    """Retrieves S3 object tags through a dedicated thread pool and pooled S3 client.
+
+    The number of in-flight GetObjectTagging requests follows an additive-increase,
+    multiplicative-decrease policy: it grows by one for every window of successful
+    requests and is halved whenever S3 throttles, with throttled keys retried after
+    a backoff. Server and connection errors are retried without changing the limit.
+    Results are stored in a TagCache; tags of failed requests are never cached.
+    """
+
+    def __init__(self, session: Any, config: SearchConfig):
+        """Initialize the tag fetcher.
+
+        Args:
+            session: boto3 session used to create the dedicated S3 client
+            config: Search configuration with tag cache and concurrency settings
+        """
+        self.max_workers = max(1, config.max_tag_fetch_workers)
+        self.max_concurrency = max(1, min(self.max_workers, config.max_tag_retrieval_batch_size))
+        self.min_concurrency = 1
+        self._concurrency = min(S3_TAG_FETCH_INITIAL_CONCURRENCY, self.max_concurrency)
+        self._successes_in_window = 0
+
+        # Throttling and transient errors are retried here, so botocore must surface them
+        # instead of retrying silently
+        self.s3_client = session.client(
+            's3',
+            config=Config(
+                max_pool_connections=self.max_workers,
+                retries={'max_attempts': 1, 'mode': 'standard'},
+            ),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='s3-tag-fetch'
+        )
+        self.cache = TagCache(config.max_tag_cache_size, config.tag_cache_ttl_seconds)
+
+        self.requests = 0
+        self.throttle_events = 0
+        self.failed_keys = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Get the current number of requests allowed in flight."""
+        return self._concurrency
+
+    async def fetch_tags(
+        self, bucket_name: str, object_keys: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """Retrieve tags for many objects, serving cached entries first.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            object_keys: List of object keys to get tags for
+
+        Returns:
+            Dictionary mapping object keys to their tags. Keys whose tags could not be
+            retrieved because of repeated throttling, server or connection errors are
+            omitted. Keys the caller may not read tags of (e.g., no permission) map to
+            empty tags.
+        """
+        tag_map: Dict[str, Dict[str, str]] = {}
+        keys_to_fetch: Deque[str] = deque()
+
+        for key in dict.fromkeys(object_keys):
+            tags = self.cache.get(self._cache_key(bucket_name, key))
+            if tags is not None:
+                tag_map[key] = tags
+            else:
+                keys_to_fetch.append(key)
+
+        if not keys_to_fetch:
+            logger.debug(f'All {len(object_keys)} object tags found in cache')
+            return tag_map
+
+        logger.debug(
+            f'Fetching tags for {len(keys_to_fetch)} objects '
+            f'(concurrency limit: {self._concurrency}, workers: {self.max_workers})'
+        )
+
+        loop = asyncio.get_running_loop()
+        in_flight: Dict[asyncio.Future, str] = {}
+        throttle_retries: Dict[str, int] = {}
+        error_retries: Dict[str, int] = {}
+        resume_at = 0.0
+
+        def retry_later(key: str, retries: Dict[str, int], max_retries: int, reason: str) -> float:
+            # Returns the time to resume launching requests at, or 0 when giving up on the key
+            attempts = retries.get(key, 0) + 1
+            retries[key] = attempts
+            if attempts > max_retries:
+                self.failed_keys += 1
+                logger.warning(
+                    f'Giving up on tags for s3://{bucket_name}/{key} after {attempts} '
+                    f'attempts failed with {reason}'
+                )
+                return 0.0
+            keys_to_fetch.append(key)
+            return loop.time() + S3_TAG_FETCH_THROTTLE_BACKOFF_SECONDS * 2 ** (attempts - 1)
+
+        while keys_to_fetch or in_flight:
+            # Launch requests up to the current limit unless backing off after throttling
+            if loop.time() >= resume_at:
+                while keys_to_fetch and len(in_flight) < self._concurrency:
+                    key = keys_to_fetch.popleft()
+                    future = loop.run_in_executor(
+                        self._executor, self._get_object_tags, bucket_name, key
+                    )
+                    in_flight[future] = key
+                    self.requests += 1
+
+            if not in_flight:
+                await asyncio.sleep(max(0.0, resume_at - loop.time()))
+                continue
+
+            timeout = max(0.0, resume_at - loop.time()) if keys_to_fetch else None
+            done, _ = await asyncio.wait(
+                in_flight, timeout=timeout or None, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for future in done:
+                key = in_flight.pop(future)
+                try:
+                    tags = future.result()
+                except ClientError as e:
+                    if e.response.get('Error', {}).get('Code') in S3_THROTTLING_ERROR_CODES:
+                        self._on_throttle()
+                        resume_at = max(
+                            resume_at,
+                            retry_later(
+                                key,
+                                throttle_retries,
+                                S3_TAG_FETCH_MAX_THROTTLE_RETRIES,
+                                'throttling',
+                            ),
+                        )
+                        continue
+                    if e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500:
+                        resume_at = max(
+                            resume_at,
+                            retry_later(
+                                key, error_retries, S3_TAG_FETCH_MAX_ERROR_RETRIES, str(e)
+                            ),
+                        )
+                        continue
+                    # If we can't get tags (e.g., no permission), treat them as empty
+                    logger.debug(f'Could not get tags for s3://{bucket_name}/{key}: {e}')
+                    tags = {}
+                except BotoCoreError as e:
+                    # Connection errors and timeouts
+                    resume_at = max(
+                        resume_at,
+                        retry_later(key, error_retries, S3_TAG_FETCH_MAX_ERROR_RETRIES, str(e)),
+                    )
+                    continue
+                except Exception as e:
+                    self.failed_keys += 1
+                    logger.warning(f'Failed to get tags in batch: {e}')
+                    continue
+
+                self._on_success()
+                tag_map[key] = tags
+                self.cache.put(self._cache_key(bucket_name, key), tags)
+
+        logger.debug(f'Retrieved tags for {len(tag_map)} objects total')
+        return tag_map
+
+    def cleanup_expired_cache_entries(self) -> int:
+        """Remove expired entries from the tag cache.
+
+        Returns:
+            Number of entries removed
+        """
+        return self.cache.cleanup_expired()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tag fetch statistics for monitoring.
+
+        Returns:
+            Dictionary with tag fetch statistics
+        """
+        return {
+            'max_workers': self.max_workers,
+            'concurrency_limit': self._concurrency,
+            'max_concurrency': self.max_concurrency,
+            'requests': self.requests,
+            'throttle_events': self.throttle_events,
+            'failed_keys': self.failed_keys,
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the dedicated thread pool."""
+        self._executor.shutdown(wait=False)
+
+    def _get_object_tags(self, bucket_name: str, key: str) -> Dict[str, str]:
+        """Get tags for an S3 object (blocking, runs on the dedicated thread pool)."""
+        response = self.s3_client.get_object_tagging(Bucket=bucket_name, Key=key)
+        return {tag['Key']: tag['Value'] for tag in response.get('TagSet', [])}
+
+    def _on_success(self) -> None:
+        """Additively increase concurrency after a full window of successful requests."""
+        self._successes_in_window += 1
+        if self._successes_in_window >= self._concurrency:
+            self._successes_in_window = 0
+            self._concurrency = min(self.max_concurrency, self._concurrency + 1)
+
+    def _on_throttle(self) -> None:
+        """Multiplicatively decrease concurrency when S3 throttles a request."""
+        self.throttle_events += 1
+        self._successes_in_window = 0
+        self._concurrency = max(self.min_concurrency, self._concurrency // 2)
+        logger.debug(f'S3 tag retrieval throttled, concurrency limit now {self._concurrency}')
+
+    @staticmethod
+    def _cache_key(bucket_name: str, key: str) -> str:
+        """Build the tag cache key for an object."""
+        return f'{bucket_name}/{key}'
+
+
+# Fetcher shared by all search engines of the process, with the settings it was created for
+_shared_fetcher: Optional[S3TagFetcher] = None
+_shared_fetcher_key: Optional[Tuple[Any, ...]] = None
+_shared_fetcher_lock = threading.Lock()
+
+
+def get_shared_tag_fetcher(session: Any, config: SearchConfig) -> S3TagFetcher:
+    """Get the process-wide tag fetcher, creating it on first use.
+
+    Search engines are created per tool call, so sharing the fetcher keeps a single thread
+    pool and S3 client, and lets the tag cache and concurrency limit persist between calls.
+    The fetcher is replaced when the region or the tag retrieval settings change.
+
+    Args:
+        session: boto3 session used to create the dedicated S3 client
+        config: Search configuration with tag cache and concurrency settings
+
+    Returns:
+        The shared S3TagFetcher
+    """
+    global _shared_fetcher, _shared_fetcher_key
+
+    key = (
+        session.region_name,
+        config.max_tag_fetch_workers,
+        config.max_tag_retrieval_batch_size,
+        config.max_tag_cache_size,
+        config.tag_cache_ttl_seconds,
+    )
+    with _shared_fetcher_lock:
+        if _shared_fetcher is None or _shared_fetcher_key != key:
+            if _shared_fetcher is not None:
+                _shared_fetcher.shutdown()
+            _shared_fetcher = S3TagFetcher(session, config)
+            _shared_fetcher_key = key
+        return _shared_fetcher
+
+
+def shutdown_shared_tag_fetcher() -> None:
+    """Shut down the shared tag fetcher; a new one is created on next use."""
+    global _shared_fetcher, _shared_fetcher_key
+
+    with _shared_fetcher_lock:
+        fetcher = _shared_fetcher
+        _shared_fetcher = None
+        _shared_fetcher_key = None
+    if fetcher is not None:
+        fetcher.shutdown()
+
+
+atexit.register(shutdown_shared_tag_fetcher)
@@ -98,13 +98,67 @@ class ScoringEngine:
         Returns:
             Tuple of (final_score, scoring_reasons)
         """
+        return self._calculate_score_with_matches(
+            file, search_terms, file_type_filter, associated_files
+        )
+
+    def calculate_scores(
+        self,
+        files: List[Tuple[GenomicsFile, List[GenomicsFile]]],
+        search_terms: List[str],
+        file_type_filter: Optional[str] = None,
+    ) -> List[Tuple[float, List[str]]]:
+        """Calculate relevance scores for many genomics files at once.
+
+        Produces the same results as calling calculate_score for each file, but matches
+        the search terms against all paths and tags in one batch.
+
+        Args:
+            files: List of (file, associated_files) tuples to score
+            search_terms: List of search terms to match against
+            file_type_filter: Optional file type filter from search request
+
+        Returns:
+            List of (final_score, scoring_reasons) tuples in the same order as files
+        """
+        if search_terms:
+            path_matches = self.pattern_matcher.match_file_paths(
+                [file.path for file, _ in files], search_terms
+            )
+            tag_matches = self.pattern_matcher.match_tag_sets(
+                [file.tags for file, _ in files], search_terms
+            )
+        else:
+            path_matches = tag_matches = [None] * len(files)
+
+        return [
+            self._calculate_score_with_matches(
+                file, search_terms, file_type_filter, associated_files, path_match, tag_match
+            )
+            for (file, associated_files), path_match, tag_match in zip(
+                files, path_matches, tag_matches
+            )
+        ]
+
+    def _calculate_score_with_matches(
+        self,
+        file: GenomicsFile,
+        search_terms: List[str],
+        file_type_filter: Optional[str],
+        associated_files: Optional[List[GenomicsFile]],
+        path_match: Optional[Tuple[float, List[str]]] = None,
+        tag_match: Optional[Tuple[float, List[str]]] = None,
+    ) -> Tuple[float, List[str]]:
+        """Calculate the relevance score, reusing precomputed path and tag matches if given."""
         if associated_files is None:
             associated_files = []
 
         scoring_reasons = []
 
         # 1. Pattern Match Score (40% weight)
-        pattern_score, pattern_reasons = self._calculate_pattern_score(file, search_terms)
+        pattern_score, pattern_reasons = self._calculate_pattern_score(
+            file, search_terms, path_match, tag_match
+        )
         scoring_reasons.extend(pattern_reasons)
 
         # 2. File Type Relevance Score (30% weight)
@@ -138,17 +192,25 @@ class ScoringEngine:
         return final_score, scoring_reasons
 
     def _calculate_pattern_score(
-        self, file: GenomicsFile, search_terms: List[str]
+        self,
+        file: GenomicsFile,
+        search_terms: List[str],
+        path_match: Optional[Tuple[float, List[str]]] = None,
+        tag_match: Optional[Tuple[float, List[str]]] = None,
     ) -> Tuple[float, List[str]]:
         """Calculate score based on pattern matching against file path, tags, and metadata."""
         if not search_terms:
             return 0.5, ['No search terms provided - neutral pattern score']
 
         # Match against file path
-        path_score, path_reasons = self.pattern_matcher.match_file_path(file.path, search_terms)
+        if path_match is None:
+            path_match = self.pattern_matcher.match_file_path(file.path, search_terms)
+        path_score, path_reasons = path_match
 
         # Match against tags
-        tag_score, tag_reasons = self.pattern_matcher.match_tags(file.tags, search_terms)
+        if tag_match is None:
+            tag_match = self.pattern_matcher.match_tags(file.tags, search_terms)
+        tag_score, tag_reasons = tag_match
 
         # Match against metadata (especially important for HealthOmics files)
         metadata_score, metadata_reasons = self._match_metadata(file.metadata, search_terms)
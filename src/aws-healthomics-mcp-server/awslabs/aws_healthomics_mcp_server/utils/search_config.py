@@ -19,6 +19,8 @@ from awslabs.aws_healthomics_mcp_server.consts import (
     DEFAULT_CACHE_CLEANUP_KEEP_RATIO,
     DEFAULT_GENOMICS_SEARCH_ENABLE_HEALTHOMICS,
     DEFAULT_GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH,
+    DEFAULT_GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL,
+    DEFAULT_GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL,
     DEFAULT_GENOMICS_SEARCH_MAX_CONCURRENT,
     DEFAULT_GENOMICS_SEARCH_MAX_PAGINATION_CACHE_SIZE,
     DEFAULT_GENOMICS_SEARCH_MAX_RESULT_CACHE_SIZE,
@@ -26,16 +28,22 @@ from awslabs.aws_healthomics_mcp_server.consts import (
     DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE,
     DEFAULT_GENOMICS_SEARCH_RESULT_CACHE_TTL,
     DEFAULT_GENOMICS_SEARCH_TAG_CACHE_TTL,
+    DEFAULT_GENOMICS_SEARCH_TAG_FETCH_WORKERS,
     DEFAULT_GENOMICS_SEARCH_TIMEOUT,
     ERROR_INVALID_S3_BUCKET_PATH,
     ERROR_NO_S3_BUCKETS_CONFIGURED,
     GENOMICS_SEARCH_ENABLE_HEALTHOMICS_ENV,
     GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH_ENV,
+    GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL_ENV,
+    GENOMICS_SEARCH_INVENTORY_INDEX_DIR_ENV,
+    GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL_ENV,
     GENOMICS_SEARCH_MAX_CONCURRENT_ENV,
     GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE_ENV,
+    GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE_ENV,
     GENOMICS_SEARCH_RESULT_CACHE_TTL_ENV,
     GENOMICS_SEARCH_S3_BUCKETS_ENV,
     GENOMICS_SEARCH_TAG_CACHE_TTL_ENV,
+    GENOMICS_SEARCH_TAG_FETCH_WORKERS_ENV,
     GENOMICS_SEARCH_TIMEOUT_ENV,
 )
 from awslabs.aws_healthomics_mcp_server.models import SearchConfig
@@ -44,7 +52,7 @@ from awslabs.aws_healthomics_mcp_server.utils.s3_utils import (
     validate_bucket_access,
 )
 from loguru import logger
-from typing import List
+from typing import List, Optional
 
 
 def get_genomics_search_config() -> SearchConfig:
@@ -77,6 +85,15 @@ def get_genomics_search_config() -> SearchConfig:
     # Get cache TTL configurations
     result_cache_ttl = get_result_cache_ttl()
     tag_cache_ttl = get_tag_cache_ttl()
+    max_tag_cache_size = get_max_tag_cache_size()
+
+    # Get tag retrieval thread pool size
+    tag_fetch_workers = get_tag_fetch_workers()
+
+    # Get persistent inventory index configuration
+    inventory_index_dir = get_inventory_index_dir()
+    inventory_refresh_interval = get_inventory_refresh_interval()
+    inventory_full_refresh_interval = get_inventory_full_refresh_interval()
 
     return SearchConfig(
         s3_bucket_paths=s3_bucket_paths,
@@ -87,10 +104,14 @@ def get_genomics_search_config() -> SearchConfig:
         max_tag_retrieval_batch_size=max_tag_batch_size,
         result_cache_ttl_seconds=result_cache_ttl,
         tag_cache_ttl_seconds=tag_cache_ttl,
-        max_tag_cache_size=DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE,
+        max_tag_fetch_workers=tag_fetch_workers,
+        max_tag_cache_size=max_tag_cache_size,
         max_result_cache_size=DEFAULT_GENOMICS_SEARCH_MAX_RESULT_CACHE_SIZE,
         max_pagination_cache_size=DEFAULT_GENOMICS_SEARCH_MAX_PAGINATION_CACHE_SIZE,
         cache_cleanup_keep_ratio=DEFAULT_CACHE_CLEANUP_KEEP_RATIO,
+        inventory_index_dir=inventory_index_dir,
+        inventory_refresh_interval_seconds=inventory_refresh_interval,
+        inventory_full_refresh_interval_seconds=inventory_full_refresh_interval,
     )
 
 
@@ -302,6 +323,120 @@ def get_tag_cache_ttl() -> int:
         return DEFAULT_GENOMICS_SEARCH_TAG_CACHE_TTL
 
 
+def get_max_tag_cache_size() -> int:
+    """Get the maximum number of tag cache entries from environment variables.
+
+    Returns:
+        Maximum number of tag cache entries
+    """
+    try:
+        cache_size = int(
+            os.environ.get(
+                GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE_ENV,
+                str(DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE),
+            )
+        )
+        if cache_size <= 0:
+            logger.warning(
+                f'Invalid max tag cache size value: {cache_size}. Using default: {DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE}'
+            )
+            return DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE
+        return cache_size
+    except ValueError:
+        logger.warning(
+            f'Invalid max tag cache size value in environment. Using default: {DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE}'
+        )
+        return DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE
+
+
+def get_tag_fetch_workers() -> int:
+    """Get the number of tag retrieval worker threads from environment variables.
+
+    Returns:
+        Number of tag retrieval worker threads
+    """
+    try:
+        workers = int(
+            os.environ.get(
+                GENOMICS_SEARCH_TAG_FETCH_WORKERS_ENV,
+                str(DEFAULT_GENOMICS_SEARCH_TAG_FETCH_WORKERS),
+            )
+        )
+        if workers <= 0:
+            logger.warning(
+                f'Invalid tag fetch workers value: {workers}. Using default: {DEFAULT_GENOMICS_SEARCH_TAG_FETCH_WORKERS}'
+            )
+            return DEFAULT_GENOMICS_SEARCH_TAG_FETCH_WORKERS
+        return workers
+    except ValueError:
+        logger.warning(
+            f'Invalid tag fetch workers value in environment. Using default: {DEFAULT_GENOMICS_SEARCH_TAG_FETCH_WORKERS}'
+        )
+        return DEFAULT_GENOMICS_SEARCH_TAG_FETCH_WORKERS
+
+
+def get_inventory_index_dir() -> Optional[str]:
+    """Get the directory of the persistent S3 inventory index from environment variables.
+
+    Returns:
+        Index directory path, or None if the persistent index is disabled
+    """
+    index_dir = os.environ.get(GENOMICS_SEARCH_INVENTORY_INDEX_DIR_ENV, '').strip()
+    return os.path.expanduser(index_dir) if index_dir else None
+
+
+def get_inventory_refresh_interval() -> int:
+    """Get the append-only inventory refresh interval in seconds from environment variables.
+
+    Returns:
+        Inventory refresh interval in seconds
+    """
+    try:
+        interval = int(
+            os.environ.get(
+                GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL_ENV,
+                str(DEFAULT_GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL),
+            )
+        )
+        if interval < 0:
+            logger.warning(
+                f'Invalid inventory refresh interval value: {interval}. Using default: {DEFAULT_GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL}'
+            )
+            return DEFAULT_GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL
+        return interval
+    except ValueError:
+        logger.warning(
+            f'Invalid inventory refresh interval value in environment. Using default: {DEFAULT_GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL}'
+        )
+        return DEFAULT_GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL
+
+
+def get_inventory_full_refresh_interval() -> int:
+    """Get the full inventory re-list interval in seconds from environment variables.
+
+    Returns:
+        Full inventory refresh interval in seconds
+    """
+    try:
+        interval = int(
+            os.environ.get(
+                GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL_ENV,
+                str(DEFAULT_GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL),
+            )
+        )
+        if interval < 0:
+            logger.warning(
+                f'Invalid inventory full refresh interval value: {interval}. Using default: {DEFAULT_GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL}'
+            )
+            return DEFAULT_GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL
+        return interval
+    except ValueError:
+        logger.warning(
+            f'Invalid inventory full refresh interval value in environment. Using default: {DEFAULT_GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL}'
+        )
+        return DEFAULT_GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL
+
+
 def validate_bucket_access_permissions() -> List[str]:
     """Validate that we have access to all configured S3 buckets.
 
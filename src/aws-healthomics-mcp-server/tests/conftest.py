@@ -16,10 +16,18 @@
 
 import os
 import pytest
+from awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher import shutdown_shared_tag_fetcher
 from mcp.server.fastmcp import Context
 from unittest.mock import AsyncMock, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_tag_fetcher():
+    """Give each test a fresh process-wide tag fetcher."""
+    yield
+    shutdown_shared_tag_fetcher()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock MCP context for testing."""
@@ -0,0 +1,165 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for batched pattern matching, including a synthetic-corpus benchmark.
+
+The benchmark corpus size defaults to a CI-friendly value. Run it against a 1M-path
+corpus with:
+
+    HEALTHOMICS_PATTERN_BENCHMARK_SIZE=1000000 pytest -s tests/test_batch_pattern_matcher.py
+"""
+
+import os
+import random
+import time
+from awslabs.aws_healthomics_mcp_server.models import GenomicsFile, GenomicsFileType
+from awslabs.aws_healthomics_mcp_server.search.batch_pattern_matcher import BatchPatternMatcher
+from awslabs.aws_healthomics_mcp_server.search.pattern_matcher import PatternMatcher
+from awslabs.aws_healthomics_mcp_server.search.scoring_engine import ScoringEngine
+from datetime import datetime
+
+
+def _synthetic_paths(count, seed=42):
+    """Generate a reproducible corpus of genomics-like S3 paths."""
+    rng = random.Random(seed)
+    projects = ['oncology', 'cardio', 'rare-disease', 'pop-gen', 'tumor-normal']
+    extensions = ['fastq.gz', 'bam', 'bam.bai', 'cram', 'vcf.gz', 'vcf.gz.tbi', 'fasta']
+    paths = []
+    for i in range(count):
+        project = rng.choice(projects)
+        sample = f'{rng.choice(["NA", "HG", "SAMP"])}{rng.randint(0, 99999):05d}'
+        lane = rng.randint(1, 4)
+        read = rng.choice(['R1', 'R2'])
+        extension = rng.choice(extensions)
+        paths.append(
+            f's3://genomics-{project}/runs/run{i % 997}/{sample}_L00{lane}_{read}.{extension}'
+        )
+    return paths
+
+
+class TestBatchPatternMatcher:
+    """Test cases for BatchPatternMatcher."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pattern_matcher = PatternMatcher()
+
+    def test_score_texts_matches_calculate_match_score(self):
+        """Test that bulk scoring reproduces per-text scoring exactly."""
+        texts = [
+            'sample',
+            'SAMPLE',
+            'sampel',
+            'sample_R1.fastq.gz',
+            'tumor',
+            'tumour',
+            'normal',
+            'unrelated',
+            'abc',
+            'a',
+        ]
+        patterns = ['sample', 'tumor', 'ab', '  ']
+
+        results = BatchPatternMatcher(patterns).score_texts(texts)
+
+        for text in texts:
+            assert results[text] == self.pattern_matcher.calculate_match_score(text, patterns)
+
+    def test_match_file_paths_matches_match_file_path(self):
+        """Test that batch path matching reproduces match_file_path exactly."""
+        paths = _synthetic_paths(2000) + ['', 's3://bucket/dir/', 's3://bucket/NA00001.bam']
+        patterns = ['NA00001', 'tumor', 'cardoi', 'R2']
+
+        results = self.pattern_matcher.match_file_paths(paths, patterns)
+
+        assert results == [self.pattern_matcher.match_file_path(p, patterns) for p in paths]
+
+    def test_match_tag_sets_matches_match_tags(self):
+        """Test that batch tag matching reproduces match_tags exactly."""
+        tag_sets = [
+            {'project': 'oncology', 'sample_id': 'NA12878'},
+            {'patient': 'patient123'},
+            {},
+            {'study': 'cardiology', 'empty': ''},
+        ]
+        patterns = ['na12878', 'patient', 'cardio']
+
+        results = self.pattern_matcher.match_tag_sets(tag_sets, patterns)
+
+        assert results == [self.pattern_matcher.match_tags(tags, patterns) for tags in tag_sets]
+
+    def test_empty_patterns(self):
+        """Test batch matching without patterns."""
+        assert self.pattern_matcher.match_file_paths(['s3://b/a.bam'], []) == [(0.0, [])]
+        assert self.pattern_matcher.match_tag_sets([{'a': 'b'}], []) == [(0.0, [])]
+        assert BatchPatternMatcher(['   ']).score_texts(['abc']) == {'abc': (0.0, [])}
+
+    def test_length_window_boundary_is_not_pruned(self):
+        """Test that texts exactly at the fuzzy length bound are still scored."""
+        # 2 * 3 / (3 + 7) == 0.6, the default threshold
+        results = BatchPatternMatcher(['abcdefg']).score_texts(['abc'])
+
+        assert results['abc'] == self.pattern_matcher.calculate_match_score('abc', ['abcdefg'])
+        assert results['abc'][0] > 0
+
+    def test_scoring_engine_calculate_scores_matches_calculate_score(self):
+        """Test that batch scoring reproduces calculate_score exactly."""
+        engine = ScoringEngine()
+        files = [
+            GenomicsFile(
+                path=path,
+                file_type=GenomicsFileType.BAM,
+                size_bytes=1000,
+                storage_class='STANDARD',
+                last_modified=datetime(2023, 1, 1),
+                tags={'project': 'oncology'} if i % 2 else {},
+                source_system='s3',
+                metadata={},
+            )
+            for i, path in enumerate(_synthetic_paths(200))
+        ]
+        search_terms = ['oncology', 'NA0']
+
+        results = engine.calculate_scores([(f, []) for f in files], search_terms, 'bam')
+
+        assert results == [engine.calculate_score(f, search_terms, 'bam', []) for f in files]
+
+
+def test_batch_pattern_matching_benchmark():
+    """Benchmark batch path matching against per-path matching on a synthetic corpus.
+
+    The per-path baseline is measured on a sample and extrapolated, since running it
+    over a 1M-path corpus takes minutes. Timings are reported but not asserted, as
+    wall-clock comparisons are unreliable on loaded machines.
+    """
+    corpus_size = int(os.environ.get('HEALTHOMICS_PATTERN_BENCHMARK_SIZE', '20000'))
+    baseline_sample_size = min(corpus_size, 5000)
+    paths = _synthetic_paths(corpus_size)
+    patterns = ['NA12878', 'tumor-normal', 'R1']
+    matcher = PatternMatcher()
+
+    start_time = time.time()
+    batch_results = matcher.match_file_paths(paths, patterns)
+    batch_elapsed = time.time() - start_time
+
+    start_time = time.time()
+    baseline_results = [matcher.match_file_path(p, patterns) for p in paths[:baseline_sample_size]]
+    baseline_elapsed = (time.time() - start_time) * corpus_size / baseline_sample_size
+
+    assert batch_results[:baseline_sample_size] == baseline_results
+
+    print(
+        f'\n✓ Batch pattern matching: {batch_elapsed:.2f}s for {corpus_size} paths '
+        f'(per-path baseline ~{baseline_elapsed:.2f}s)'
+    )
@@ -1100,6 +1100,167 @@ class TestGenomicsSearchOrchestrator:
 
         assert result == []
 
+    @pytest.fixture
+    def healthomics_file(self):
+        """Create a HealthOmics sequence store file for streaming tests."""
+        return GenomicsFile(
+            path='omics://sequence-store/sample3',
+            file_type=GenomicsFileType.FASTQ,
+            size_bytes=500000,
+            storage_class='STANDARD',
+            last_modified=datetime.now(),
+            tags={},
+            source_system='sequence_store',
+            metadata={},
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_stream_yields_batches_as_backends_finish(
+        self, orchestrator, sample_search_request, sample_genomics_files, healthomics_file
+    ):
+        """Test that each storage system's results are yielded as soon as it returns."""
+
+        async def slow_s3_search(request, bucket_paths):
+            await asyncio.sleep(0.05)
+            return sample_genomics_files
+
+        with (
+            patch.object(
+                orchestrator, '_search_s3_with_timeout_for_buckets', side_effect=slow_s3_search
+            ),
+            patch.object(
+                orchestrator,
+                '_search_healthomics_sequences_with_timeout',
+                new_callable=AsyncMock,
+                return_value=[healthomics_file],
+            ),
+            patch.object(
+                orchestrator,
+                '_search_healthomics_references_with_timeout',
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+        ):
+            batches = [batch async for batch in orchestrator.search_stream(sample_search_request)]
+
+        assert len(batches) == 2
+        assert [r.primary_file.path for r in batches[0]] == [healthomics_file.path]
+        assert {r.primary_file.path for r in batches[1]} == {f.path for f in sample_genomics_files}
+        scores = [r.relevance_score for r in batches[1]]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_search_stream_deduplicates_and_skips_failures(
+        self, orchestrator, sample_search_request, sample_genomics_files
+    ):
+        """Test that later batches drop already-yielded paths and failed backends are skipped."""
+
+        async def delayed_duplicates(request):
+            await asyncio.sleep(0.01)
+            return sample_genomics_files[:1]
+
+        with (
+            patch.object(
+                orchestrator,
+                '_search_s3_with_timeout_for_buckets',
+                new_callable=AsyncMock,
+                return_value=sample_genomics_files,
+            ),
+            patch.object(
+                orchestrator,
+                '_search_healthomics_sequences_with_timeout',
+                side_effect=delayed_duplicates,
+            ),
+            patch.object(
+                orchestrator,
+                '_search_healthomics_references_with_timeout',
+                new_callable=AsyncMock,
+                side_effect=Exception('Reference search failed'),
+            ),
+        ):
+            batches = [batch async for batch in orchestrator.search_stream(sample_search_request)]
+
+        assert len(batches) == 1
+        assert len(batches[0]) == len(sample_genomics_files)
+
+    @pytest.mark.asyncio
+    async def test_search_stream_close_cancels_pending_searches(
+        self, orchestrator, sample_search_request, sample_genomics_files
+    ):
+        """Test that closing the stream early cancels searches still running."""
+        orchestrator.config.enable_healthomics_search = False
+        cancelled = asyncio.Event()
+
+        async def never_finishes(request):
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with (
+            patch.object(
+                orchestrator,
+                '_search_s3_with_timeout_for_buckets',
+                new_callable=AsyncMock,
+                return_value=sample_genomics_files,
+            ),
+            patch.object(
+                orchestrator,
+                '_create_search_tasks',
+                new_callable=AsyncMock,
+            ) as mock_create_tasks,
+        ):
+            mock_create_tasks.return_value = [
+                (
+                    's3',
+                    orchestrator._search_s3_with_timeout_for_buckets(sample_search_request, []),
+                ),
+                ('healthomics_sequences', never_finishes(sample_search_request)),
+            ]
+            stream = orchestrator.search_stream(sample_search_request)
+            first_batch = await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0)
+
+        assert len(first_batch) == len(sample_genomics_files)
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_search_streaming_matches_search(
+        self, orchestrator, sample_genomics_files, healthomics_file
+    ):
+        """Test that top-k streaming search returns the same page as the full search."""
+        request = GenomicsFileSearchRequest(search_terms=['sample2'], max_results=1)
+
+        with (
+            patch.object(
+                orchestrator,
+                '_search_s3_with_timeout_for_buckets',
+                new_callable=AsyncMock,
+                return_value=sample_genomics_files,
+            ),
+            patch.object(
+                orchestrator,
+                '_search_healthomics_sequences_with_timeout',
+                new_callable=AsyncMock,
+                return_value=[healthomics_file],
+            ),
+            patch.object(
+                orchestrator,
+                '_search_healthomics_references_with_timeout',
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+        ):
+            full = await orchestrator.search(request)
+            streamed = await orchestrator.search_streaming(request)
+
+        assert streamed.total_found == full.total_found == 3
+        assert streamed.results == full.results
+        assert streamed.results[0]['primary_file']['path'] == 's3://test-bucket/sample2.bam'
+        assert streamed.enhanced_response['pagination'] == full.enhanced_response['pagination']
+
     @pytest.mark.asyncio
     async def test_score_results(self, orchestrator, sample_genomics_files):
         """Test scoring results."""
@@ -1110,8 +1271,8 @@ class TestGenomicsSearchOrchestrator:
 
         file_groups = [mock_file_group]
 
-        with patch.object(orchestrator.scoring_engine, 'calculate_score') as mock_score:
-            mock_score.return_value = (0.8, ['file_type_match'])
+        with patch.object(orchestrator.scoring_engine, 'calculate_scores') as mock_score:
+            mock_score.return_value = [(0.8, ['file_type_match'])]
 
             result = await orchestrator._score_results(file_groups, 'fastq', ['sample'], True)
 
@@ -1121,7 +1282,9 @@ class TestGenomicsSearchOrchestrator:
             assert result[0].relevance_score == 0.8
             assert result[0].match_reasons == ['file_type_match']
 
-            mock_score.assert_called_once_with(sample_genomics_files[0], ['sample'], 'fastq', [])
+            mock_score.assert_called_once_with(
+                [(sample_genomics_files[0], [])], ['sample'], 'fastq'
+            )
 
     @pytest.mark.asyncio
     async def test_execute_parallel_paginated_searches_success(
@@ -20,7 +20,7 @@ from awslabs.aws_healthomics_mcp_server.models import (
     GenomicsFileResult,
     GenomicsFileType,
 )
-from awslabs.aws_healthomics_mcp_server.search.result_ranker import ResultRanker
+from awslabs.aws_healthomics_mcp_server.search.result_ranker import ResultRanker, TopKResults
 from datetime import datetime, timezone
 
 
@@ -351,3 +351,65 @@ class TestResultRanker:
         assert stats['score_statistics']['max_score'] == 1.0
         assert stats['score_statistics']['score_range'] == 1.0
         assert stats['score_statistics']['mean_score'] == 0.5
+
+    def test_get_score_statistics_matches_ranking_statistics(self, ranker, sample_results):
+        """Test that score statistics equal ranking statistics over the same results."""
+        scores = [result.relevance_score for result in sample_results]
+
+        assert ranker.get_score_statistics(scores) == ranker.get_ranking_statistics(sample_results)
+
+
+class TestTopKResults:
+    """Test cases for the bounded top-k result collector."""
+
+    @staticmethod
+    def _make_results(scores):
+        """Create results with the given relevance scores."""
+        return [
+            GenomicsFileResult(
+                primary_file=GenomicsFile(
+                    path=f's3://bucket/file{i}.fastq',
+                    file_type=GenomicsFileType.FASTQ,
+                    size_bytes=1000,
+                    storage_class='STANDARD',
+                    last_modified=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                    tags={},
+                    source_system='s3',
+                    metadata={},
+                ),
+                associated_files=[],
+                relevance_score=score,
+                match_reasons=[],
+            )
+            for i, score in enumerate(scores)
+        ]
+
+    def test_matches_full_ranking(self):
+        """Test that the kept results equal the head of a full stable ranking."""
+        results = self._make_results([0.5, 0.9, 0.5, 0.1, 0.9, 0.7, 0.5, 0.3])
+        top_results = TopKResults(4)
+
+        top_results.extend(results)
+
+        assert top_results.ranked() == ResultRanker().rank_results(results)[:4]
+        assert len(top_results) == 4
+        assert top_results.total_seen == 8
+        assert list(top_results.scores) == [r.relevance_score for r in results]
+
+    def test_fewer_results_than_k(self):
+        """Test collecting fewer results than k."""
+        results = self._make_results([0.2, 0.8])
+        top_results = TopKResults(10)
+
+        top_results.extend(results)
+
+        assert top_results.ranked() == [results[1], results[0]]
+
+    def test_zero_k(self):
+        """Test that k of zero keeps nothing but still counts results."""
+        top_results = TopKResults(0)
+
+        top_results.extend(self._make_results([0.5]))
+
+        assert top_results.ranked() == []
+        assert top_results.total_seen == 1
@@ -0,0 +1,275 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the persistent S3 inventory index."""
+
+import pytest
+from awslabs.aws_healthomics_mcp_server.consts import S3_INVENTORY_TOKEN_PREFIX
+from awslabs.aws_healthomics_mcp_server.models import SearchConfig
+from awslabs.aws_healthomics_mcp_server.search.s3_inventory_index import (
+    S3InventoryIndex,
+    close_shared_inventory_indexes,
+    get_shared_inventory_index,
+)
+from awslabs.aws_healthomics_mcp_server.search.s3_search_engine import S3SearchEngine
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+
+def _make_object(key, etag='"abc"', day=1):
+    """Create a list_objects_v2 style object dictionary."""
+    return {
+        'Key': key,
+        'Size': 100,
+        'LastModified': datetime(2023, 1, day, tzinfo=timezone.utc),
+        'ETag': etag,
+        'StorageClass': 'STANDARD',
+    }
+
+
+class FakeS3Lister:
+    """Minimal list_objects_v2 implementation over an in-memory key set."""
+
+    def __init__(self, objects, page_size=2):
+        """Initialize with a list of object dictionaries."""
+        self.objects = {obj['Key']: obj for obj in objects}
+        self.page_size = page_size
+        self.calls = []
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys, ContinuationToken=None, StartAfter=None):
+        """Return a page of objects in key order."""
+        self.calls.append({'ContinuationToken': ContinuationToken, 'StartAfter': StartAfter})
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        start = ContinuationToken or StartAfter
+        if start:
+            keys = [k for k in keys if k > start]
+        page = keys[: self.page_size]
+        response = {'Contents': [self.objects[k] for k in page], 'IsTruncated': False}
+        if len(keys) > self.page_size:
+            response['IsTruncated'] = True
+            response['NextContinuationToken'] = page[-1]
+        return response
+
+
+class TestS3InventoryIndex:
+    """Test cases for S3InventoryIndex."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Create an index that full-refreshes only once and tops up on every call."""
+        index = S3InventoryIndex(
+            str(tmp_path), refresh_interval_seconds=0, full_refresh_interval_seconds=3600
+        )
+        yield index
+        index.close()
+
+    def test_full_refresh_populates_index(self, index):
+        """Test that the first refresh lists the whole prefix."""
+        lister = FakeS3Lister(
+            [
+                _make_object('data/a.bam'),
+                _make_object('data/b.bam'),
+                _make_object('data/c.fastq.gz'),
+                _make_object('other/d.bam'),
+            ]
+        )
+
+        result = index.refresh(lister, 'bucket', 'data/')
+
+        assert result == {'mode': 'full', 'listed': 3, 'upserted': 3, 'deleted': 0}
+        objects = index.list_objects('bucket', 'data/')
+        assert [obj['Key'] for obj in objects] == ['data/a.bam', 'data/b.bam', 'data/c.fastq.gz']
+        assert objects[0]['LastModified'] == datetime(2023, 1, 1, tzinfo=timezone.utc)
+        assert objects[0]['ETag'] == '"abc"'
+        assert objects[0]['StorageClass'] == 'STANDARD'
+
+    def test_incremental_refresh_starts_after_last_seen_key(self, index):
+        """Test that later refreshes only list keys after the last-seen key."""
+        lister = FakeS3Lister([_make_object('data/a.bam'), _make_object('data/b.bam')])
+        index.refresh(lister, 'bucket', 'data/')
+
+        lister.objects['data/c.bam'] = _make_object('data/c.bam')
+        lister.calls.clear()
+        result = index.refresh(lister, 'bucket', 'data/')
+
+        assert result['mode'] == 'incremental'
+        assert result['listed'] == 1
+        assert lister.calls[0]['StartAfter'] == 'data/b.bam'
+        assert len(index.list_objects('bucket', 'data/')) == 3
+
+    def test_refresh_skipped_while_fresh(self, tmp_path):
+        """Test that no listing happens within the refresh interval."""
+        index = S3InventoryIndex(
+            str(tmp_path), refresh_interval_seconds=3600, full_refresh_interval_seconds=3600
+        )
+        lister = FakeS3Lister([_make_object('a.bam')])
+        index.refresh(lister, 'bucket', '')
+        lister.calls.clear()
+
+        result = index.refresh(lister, 'bucket', '')
+
+        assert result['mode'] == 'none'
+        assert lister.calls == []
+        index.close()
+
+    def test_full_refresh_writes_only_changes_and_removes_deleted(self, tmp_path):
+        """Test that a full re-list rewrites changed rows and drops deleted keys."""
+        index = S3InventoryIndex(
+            str(tmp_path), refresh_interval_seconds=0, full_refresh_interval_seconds=0
+        )
+        lister = FakeS3Lister(
+            [_make_object('data/a.bam'), _make_object('data/b.bam'), _make_object('data/c.bam')]
+        )
+        index.refresh(lister, 'bucket', 'data/')
+
+        del lister.objects['data/b.bam']
+        lister.objects['data/c.bam'] = _make_object('data/c.bam', etag='"changed"', day=2)
+        result = index.refresh(lister, 'bucket', 'data/')
+
+        assert result == {'mode': 'full', 'listed': 2, 'upserted': 1, 'deleted': 1}
+        objects = index.list_objects('bucket', 'data/')
+        assert [obj['Key'] for obj in objects] == ['data/a.bam', 'data/c.bam']
+        assert objects[1]['ETag'] == '"changed"'
+        index.close()
+
+    def test_index_persists_across_instances(self, tmp_path):
+        """Test that a new index instance reuses the on-disk state."""
+        first = S3InventoryIndex(
+            str(tmp_path), refresh_interval_seconds=3600, full_refresh_interval_seconds=3600
+        )
+        first.refresh(FakeS3Lister([_make_object('a.bam')]), 'bucket', '')
+        first.close()
+
+        second = S3InventoryIndex(
+            str(tmp_path), refresh_interval_seconds=3600, full_refresh_interval_seconds=3600
+        )
+        lister = FakeS3Lister([_make_object('a.bam')])
+
+        assert second.refresh(lister, 'bucket', '')['mode'] == 'none'
+        assert [obj['Key'] for obj in second.list_objects('bucket', '')] == ['a.bam']
+        assert lister.calls == []
+        second.close()
+
+    def test_list_objects_page(self, index):
+        """Test key-ordered paging over the index."""
+        index.refresh(
+            FakeS3Lister([_make_object(f'data/{i}.bam') for i in range(5)]), 'bucket', 'data/'
+        )
+
+        page, last_key = index.list_objects_page('bucket', 'data/', None, 2)
+        assert [obj['Key'] for obj in page] == ['data/0.bam', 'data/1.bam']
+        assert last_key == 'data/1.bam'
+
+        page, last_key = index.list_objects_page('bucket', 'data/', 'data/3.bam', 2)
+        assert [obj['Key'] for obj in page] == ['data/4.bam']
+        assert last_key is None
+
+    def test_get_stats(self, index):
+        """Test index statistics."""
+        index.refresh(FakeS3Lister([_make_object('a.bam')]), 'bucket', '')
+
+        stats = index.get_stats()
+
+        assert stats['indexed_objects'] == 1
+        assert stats['indexed_prefixes'] == 1
+        assert stats['full_refreshes'] == 1
+
+
+class TestS3SearchEngineInventoryIndex:
+    """Test cases for S3SearchEngine listing through the inventory index."""
+
+    @pytest.fixture
+    def search_engine(self, tmp_path):
+        """Create an S3 search engine with the inventory index enabled."""
+        config = SearchConfig(
+            s3_bucket_paths=['s3://bucket/data/'],
+            enable_s3_tag_search=False,
+            inventory_index_dir=str(tmp_path),
+            inventory_refresh_interval_seconds=3600,
+            inventory_full_refresh_interval_seconds=3600,
+        )
+        lister = FakeS3Lister(
+            [_make_object('data/sample1.fastq.gz'), _make_object('data/sample2.bam')]
+        )
+        s3_client = MagicMock()
+        s3_client.list_objects_v2.side_effect = lister.list_objects_v2
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.s3_search_engine.get_aws_session'
+        ) as mock_session:
+            mock_session.return_value.client.return_value = s3_client
+            engine = S3SearchEngine._create_for_testing(config)
+        yield engine
+        close_shared_inventory_indexes()
+
+    @pytest.mark.asyncio
+    async def test_search_buckets_served_from_index(self, search_engine):
+        """Test that repeated searches list S3 only once."""
+        first = await search_engine.search_buckets(['s3://bucket/data/'], None, [])
+        search_engine._result_cache.clear()
+        second = await search_engine.search_buckets(['s3://bucket/data/'], None, [])
+
+        assert len(first) == len(second) == 2
+        assert search_engine.s3_client.list_objects_v2.call_count == 1
+        assert search_engine.get_cache_stats()['inventory_index']['indexed_objects'] == 2
+
+    @pytest.mark.asyncio
+    async def test_paginated_listing_uses_inventory_tokens(self, search_engine):
+        """Test that paginated listing issues and consumes inventory tokens."""
+        objects, token, scanned = await search_engine._list_s3_objects_paginated(
+            'bucket', 'data/', None, 1
+        )
+
+        assert [obj['Key'] for obj in objects] == ['data/sample1.fastq.gz']
+        assert token == f'{S3_INVENTORY_TOKEN_PREFIX}data/sample1.fastq.gz'
+        assert scanned == 1
+
+        objects, token, _ = await search_engine._list_s3_objects_paginated(
+            'bucket', 'data/', token, 1
+        )
+
+        assert [obj['Key'] for obj in objects] == ['data/sample2.bam']
+        assert token is None
+        assert search_engine.s3_client.list_objects_v2.call_count == 1
+
+    def test_index_shared_between_engines(self, search_engine):
+        """Test that engines created per tool call share the index of a directory."""
+        config = search_engine.config
+        with patch('awslabs.aws_healthomics_mcp_server.search.s3_search_engine.get_aws_session'):
+            other = S3SearchEngine._create_for_testing(config)
+
+        assert other._inventory_index is search_engine._inventory_index
+
+    def test_shared_index_reopened_after_close(self, tmp_path):
+        """Test that closing the shared indexes reopens them on next use."""
+        first = get_shared_inventory_index(str(tmp_path), 3600, 3600)
+        assert get_shared_inventory_index(str(tmp_path), 60, 3600) is first
+        assert first.refresh_interval_seconds == 60
+
+        close_shared_inventory_indexes()
+        second = get_shared_inventory_index(str(tmp_path), 60, 3600)
+
+        assert second is not first
+        assert second.get_stats()['indexed_objects'] == 0
+        close_shared_inventory_indexes()
+
+    def test_invalid_index_dir_falls_back_to_s3(self, tmp_path):
+        """Test that an unusable index directory disables the index."""
+        blocker = tmp_path / 'not-a-directory'
+        blocker.write_text('')
+        config = SearchConfig(inventory_index_dir=str(blocker / 'index'))
+        with patch('awslabs.aws_healthomics_mcp_server.search.s3_search_engine.get_aws_session'):
+            engine = S3SearchEngine._create_for_testing(config)
+
+        assert engine._inventory_index is None
+        assert engine.get_cache_stats()['inventory_index'] is None
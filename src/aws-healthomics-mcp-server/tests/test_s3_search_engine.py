@@ -100,7 +100,7 @@ class TestS3SearchEngine:
             assert engine.s3_client == mock_s3_client
             assert engine.file_type_detector is not None
             assert engine.pattern_matcher is not None
-            assert engine._tag_cache == {}
+            assert len(engine._tag_fetcher.cache) == 0
             assert engine._result_cache == {}
 
     def test_direct_constructor_prevented(self, search_config):
@@ -468,15 +468,18 @@ class TestS3SearchEngine:
             'TagSet': [{'Key': 'sample_id', 'Value': 'test'}]
         }
 
-        tags1 = await search_engine._get_object_tags_cached('test-bucket', 'data/file.fastq')
-        assert tags1 == {'sample_id': 'test'}
+        tags1 = await search_engine._get_tags_for_objects_batch('test-bucket', ['data/file.fastq'])
+        assert tags1 == {'data/file.fastq': {'sample_id': 'test'}}
 
         # Second call should use cache
-        tags2 = await search_engine._get_object_tags_cached('test-bucket', 'data/file.fastq')
-        assert tags2 == {'sample_id': 'test'}
+        tags2 = await search_engine._get_tags_for_objects_batch('test-bucket', ['data/file.fastq'])
+        assert tags2 == {'data/file.fastq': {'sample_id': 'test'}}
 
         # S3 should only be called once due to caching
         search_engine.s3_client.get_object_tagging.assert_called_once()
+        stats = search_engine.get_cache_stats()['tag_cache']
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
 
     @pytest.mark.asyncio
     async def test_get_object_tags_error(self, search_engine):
@@ -485,8 +488,10 @@ class TestS3SearchEngine:
             {'Error': {'Code': 'NoSuchKey', 'Message': 'Key not found'}}, 'GetObjectTagging'
         )
 
-        tags = await search_engine._get_object_tags('test-bucket', 'nonexistent.fastq')
-        assert tags == {}
+        tags = await search_engine._get_tags_for_objects_batch(
+            'test-bucket', ['nonexistent.fastq']
+        )
+        assert tags == {'nonexistent.fastq': {}}
 
     def test_matches_file_type_filter(self, search_engine):
         """Test file type filter matching."""
@@ -581,7 +586,7 @@ class TestS3SearchEngine:
     def test_get_cache_stats(self, search_engine):
         """Test cache statistics."""
         # Add some entries to cache to test utilization calculation
-        search_engine._tag_cache['key1'] = {'tags': {}, 'timestamp': time.time()}
+        search_engine._tag_fetcher.cache.put('key1', {})
         search_engine._result_cache['key2'] = {'results': [], 'timestamp': time.time()}
 
         stats = search_engine.get_cache_stats()
@@ -594,6 +599,8 @@ class TestS3SearchEngine:
         assert 'ttl_seconds' in stats['tag_cache']
         assert 'max_cache_size' in stats['tag_cache']
         assert 'cache_utilization' in stats['tag_cache']
+        assert 'hit_rate' in stats['tag_cache']
+        assert 'concurrency_limit' in stats['tag_fetch']
         assert 'max_cache_size' in stats['result_cache']
         assert 'cache_utilization' in stats['result_cache']
         assert 'cache_cleanup_keep_ratio' in stats['config']
@@ -604,7 +611,7 @@ class TestS3SearchEngine:
 
         # Test utilization calculation
         expected_tag_utilization = (
-            len(search_engine._tag_cache) / search_engine.config.max_tag_cache_size
+            len(search_engine._tag_fetcher.cache) / search_engine.config.max_tag_cache_size
         )
         expected_result_utilization = (
             len(search_engine._result_cache) / search_engine.config.max_result_cache_size
@@ -615,36 +622,37 @@ class TestS3SearchEngine:
     def test_cleanup_expired_cache_entries(self, search_engine):
         """Test cache cleanup."""
         # Add some entries to cache
-        search_engine._tag_cache['key1'] = {'tags': {}, 'timestamp': time.time() - 1000}
+        search_engine._tag_fetcher.cache.put('key1', {})
+        search_engine._tag_fetcher.cache._entries['key1'] = ({}, time.time() - 1000)
         search_engine._result_cache['key2'] = {'results': [], 'timestamp': time.time() - 1000}
 
-        initial_tag_size = len(search_engine._tag_cache)
         initial_result_size = len(search_engine._result_cache)
 
         search_engine.cleanup_expired_cache_entries()
 
         # Cache should be cleaned up (expired entries removed)
-        assert len(search_engine._tag_cache) <= initial_tag_size
+        assert len(search_engine._tag_fetcher.cache) == 0
         assert len(search_engine._result_cache) <= initial_result_size
 
     def test_cleanup_cache_by_size_tag_cache(self, search_engine):
         """Test size-based cache cleanup for tag cache."""
+        tag_cache = {}
         # Set small cache size for testing
         search_engine.config.max_tag_cache_size = 3
         search_engine.config.cache_cleanup_keep_ratio = 0.6  # Keep 60%
 
         # Add more entries than the limit
         for i in range(5):
-            search_engine._tag_cache[f'key{i}'] = {
+            tag_cache[f'key{i}'] = {
                 'tags': {'test': f'value{i}'},
                 'timestamp': time.time() + i,
             }
 
-        assert len(search_engine._tag_cache) == 5
+        assert len(tag_cache) == 5
 
         # Trigger size-based cleanup
         search_engine._cleanup_cache_by_size(
-            search_engine._tag_cache,
+            tag_cache,
             search_engine.config.max_tag_cache_size,
             search_engine.config.cache_cleanup_keep_ratio,
         )
@@ -653,10 +661,10 @@ class TestS3SearchEngine:
         expected_size = int(
             search_engine.config.max_tag_cache_size * search_engine.config.cache_cleanup_keep_ratio
         )
-        assert len(search_engine._tag_cache) == expected_size
+        assert len(tag_cache) == expected_size
 
         # Should keep the most recent entries (highest timestamps)
-        remaining_keys = list(search_engine._tag_cache.keys())
+        remaining_keys = list(tag_cache.keys())
         assert 'key4' in remaining_keys  # Most recent entry
 
     def test_cleanup_cache_by_size_result_cache(self, search_engine):
@@ -695,27 +703,28 @@ class TestS3SearchEngine:
 
     def test_cleanup_cache_by_size_no_cleanup_needed(self, search_engine):
         """Test that size-based cleanup does nothing when cache is under limit."""
+        tag_cache = {}
         # Set cache size larger than current entries
         search_engine.config.max_tag_cache_size = 10
 
         # Add fewer entries than the limit
         for i in range(3):
-            search_engine._tag_cache[f'key{i}'] = {
+            tag_cache[f'key{i}'] = {
                 'tags': {'test': f'value{i}'},
                 'timestamp': time.time(),
             }
 
-        initial_size = len(search_engine._tag_cache)
+        initial_size = len(tag_cache)
 
         # Trigger size-based cleanup
         search_engine._cleanup_cache_by_size(
-            search_engine._tag_cache,
+            tag_cache,
             search_engine.config.max_tag_cache_size,
             search_engine.config.cache_cleanup_keep_ratio,
         )
 
         # Should not remove any entries
-        assert len(search_engine._tag_cache) == initial_size
+        assert len(tag_cache) == initial_size
 
     @pytest.mark.asyncio
     async def test_automatic_tag_cache_size_cleanup(self, search_engine):
@@ -729,12 +738,18 @@ class TestS3SearchEngine:
             'TagSet': [{'Key': 'test', 'Value': 'value'}]
         }
 
+        search_engine._tag_fetcher.cache.max_size = 2
+
         # Add entries that will trigger automatic cleanup
         for i in range(4):
-            await search_engine._get_object_tags_cached('test-bucket', f'key{i}')
+            await search_engine._get_tags_for_objects_batch('test-bucket', [f'key{i}'])
 
             # Cache should never exceed the maximum size
-            assert len(search_engine._tag_cache) <= search_engine.config.max_tag_cache_size
+            assert len(search_engine._tag_fetcher.cache) <= 2
+
+        # Least recently used entries are evicted first
+        assert 'test-bucket/key3' in search_engine._tag_fetcher.cache
+        assert 'test-bucket/key0' not in search_engine._tag_fetcher.cache
 
     def test_automatic_result_cache_size_cleanup(self, search_engine):
         """Test that result cache automatically cleans up when size limit is reached."""
@@ -751,6 +766,7 @@ class TestS3SearchEngine:
 
     def test_smart_cache_cleanup_prioritizes_expired_entries(self, search_engine):
         """Test that smart cache cleanup removes expired entries first."""
+        tag_cache = {}
         # Set small cache size and short TTL for testing
         search_engine.config.max_tag_cache_size = 3
         search_engine.config.cache_cleanup_keep_ratio = 0.6  # Keep 60% = 1 entry
@@ -759,28 +775,28 @@ class TestS3SearchEngine:
         current_time = time.time()
 
         # Add mix of expired and valid entries
-        search_engine._tag_cache['expired1'] = {
+        tag_cache['expired1'] = {
             'tags': {'test': 'expired1'},
             'timestamp': current_time - 20,
         }  # Expired
-        search_engine._tag_cache['expired2'] = {
+        tag_cache['expired2'] = {
             'tags': {'test': 'expired2'},
             'timestamp': current_time - 15,
         }  # Expired
-        search_engine._tag_cache['valid1'] = {
+        tag_cache['valid1'] = {
             'tags': {'test': 'valid1'},
             'timestamp': current_time - 5,
         }  # Valid
-        search_engine._tag_cache['valid2'] = {
+        tag_cache['valid2'] = {
             'tags': {'test': 'valid2'},
             'timestamp': current_time - 2,
         }  # Valid (newest)
 
-        assert len(search_engine._tag_cache) == 4
+        assert len(tag_cache) == 4
 
         # Trigger smart cleanup
         search_engine._cleanup_cache_by_size(
-            search_engine._tag_cache,
+            tag_cache,
             search_engine.config.max_tag_cache_size,
             search_engine.config.cache_cleanup_keep_ratio,
         )
@@ -788,14 +804,15 @@ class TestS3SearchEngine:
         # Should keep only 1 entry (60% of 3 = 1.8 -> 1)
         # Should prioritize removing expired entries first, then oldest valid
         # Expected: expired1, expired2, and valid1 removed; valid2 kept (newest valid)
-        assert len(search_engine._tag_cache) == 1
-        assert 'valid2' in search_engine._tag_cache  # Newest valid entry should remain
-        assert 'expired1' not in search_engine._tag_cache
-        assert 'expired2' not in search_engine._tag_cache
-        assert 'valid1' not in search_engine._tag_cache
+        assert len(tag_cache) == 1
+        assert 'valid2' in tag_cache  # Newest valid entry should remain
+        assert 'expired1' not in tag_cache
+        assert 'expired2' not in tag_cache
+        assert 'valid1' not in tag_cache
 
     def test_smart_cache_cleanup_only_expired_entries(self, search_engine):
         """Test smart cleanup when only expired entries need to be removed."""
+        tag_cache = {}
         # Set cache size larger than valid entries
         search_engine.config.max_tag_cache_size = 5
         search_engine.config.cache_cleanup_keep_ratio = 0.8  # Keep 80% = 4 entries
@@ -804,43 +821,43 @@ class TestS3SearchEngine:
         current_time = time.time()
 
         # Add mix where removing expired entries is sufficient
-        search_engine._tag_cache['expired1'] = {
+        tag_cache['expired1'] = {
             'tags': {'test': 'expired1'},
             'timestamp': current_time - 20,
         }  # Expired
-        search_engine._tag_cache['expired2'] = {
+        tag_cache['expired2'] = {
             'tags': {'test': 'expired2'},
             'timestamp': current_time - 15,
         }  # Expired
-        search_engine._tag_cache['valid1'] = {
+        tag_cache['valid1'] = {
             'tags': {'test': 'valid1'},
             'timestamp': current_time - 5,
         }  # Valid
-        search_engine._tag_cache['valid2'] = {
+        tag_cache['valid2'] = {
             'tags': {'test': 'valid2'},
             'timestamp': current_time - 2,
         }  # Valid
-        search_engine._tag_cache['valid3'] = {
+        tag_cache['valid3'] = {
             'tags': {'test': 'valid3'},
             'timestamp': current_time - 1,
         }  # Valid
 
-        assert len(search_engine._tag_cache) == 5
+        assert len(tag_cache) == 5
 
         # Trigger smart cleanup
         search_engine._cleanup_cache_by_size(
-            search_engine._tag_cache,
+            tag_cache,
             search_engine.config.max_tag_cache_size,
             search_engine.config.cache_cleanup_keep_ratio,
         )
 
         # Should remove only expired entries (2), leaving 3 valid entries (under target of 4)
-        assert len(search_engine._tag_cache) == 3
-        assert 'expired1' not in search_engine._tag_cache
-        assert 'expired2' not in search_engine._tag_cache
-        assert 'valid1' in search_engine._tag_cache
-        assert 'valid2' in search_engine._tag_cache
-        assert 'valid3' in search_engine._tag_cache
+        assert len(tag_cache) == 3
+        assert 'expired1' not in tag_cache
+        assert 'expired2' not in tag_cache
+        assert 'valid1' in tag_cache
+        assert 'valid2' in tag_cache
+        assert 'valid3' in tag_cache
 
     @pytest.mark.asyncio
     async def test_search_single_bucket_path_optimized_success(self, search_engine):
@@ -864,14 +881,18 @@ class TestS3SearchEngine:
             ]
         )
         search_engine.file_type_detector.detect_file_type = MagicMock(
-            side_effect=lambda x: GenomicsFileType.FASTQ
-            if x.endswith('.fastq')
-            else GenomicsFileType.BAM
-            if x.endswith('.bam')
-            else None
+            side_effect=lambda x: (
+                GenomicsFileType.FASTQ
+                if x.endswith('.fastq')
+                else GenomicsFileType.BAM
+                if x.endswith('.bam')
+                else None
+            )
         )
         search_engine._matches_file_type_filter = MagicMock(return_value=True)
-        search_engine.pattern_matcher.match_file_path = MagicMock(return_value=(0.8, ['sample']))
+        search_engine.pattern_matcher.match_file_paths = MagicMock(
+            side_effect=lambda paths, terms: [(0.8, ['sample']) for _ in paths]
+        )
         search_engine._create_genomics_file_from_object = MagicMock(
             side_effect=lambda obj, bucket, tags, file_type: GenomicsFile(
                 path=f's3://{bucket}/{obj["Key"]}',
@@ -917,8 +938,12 @@ class TestS3SearchEngine:
         )
         search_engine._matches_file_type_filter = MagicMock(return_value=True)
         # Path doesn't match, need to check tags
-        search_engine.pattern_matcher.match_file_path = MagicMock(return_value=(0.0, []))
-        search_engine.pattern_matcher.match_tags = MagicMock(return_value=(0.9, ['patient']))
+        search_engine.pattern_matcher.match_file_paths = MagicMock(
+            side_effect=lambda paths, terms: [(0.0, []) for _ in paths]
+        )
+        search_engine.pattern_matcher.match_tag_sets = MagicMock(
+            side_effect=lambda tag_sets, terms: [(0.9, ['patient']) for _ in tag_sets]
+        )
         search_engine._get_tags_for_objects_batch = AsyncMock(
             return_value={'data/file1.fastq': {'patient_id': 'patient123', 'study': 'cancer'}}
         )
@@ -988,17 +1013,19 @@ class TestS3SearchEngine:
             ]
         )
         search_engine.file_type_detector.detect_file_type = MagicMock(
-            side_effect=lambda x: GenomicsFileType.FASTQ
-            if x.endswith('.fastq')
-            else GenomicsFileType.BAM
-            if x.endswith('.bam')
-            else None
+            side_effect=lambda x: (
+                GenomicsFileType.FASTQ
+                if x.endswith('.fastq')
+                else GenomicsFileType.BAM
+                if x.endswith('.bam')
+                else None
+            )
         )
         # Only FASTQ files should match
         search_engine._matches_file_type_filter = MagicMock(
-            side_effect=lambda detected, filter_type: detected == GenomicsFileType.FASTQ
-            if filter_type == 'fastq'
-            else True
+            side_effect=lambda detected, filter_type: (
+                detected == GenomicsFileType.FASTQ if filter_type == 'fastq' else True
+            )
         )
         search_engine._create_genomics_file_from_object = MagicMock(
             return_value=MagicMock(spec=GenomicsFile)
@@ -1046,7 +1073,9 @@ class TestS3SearchEngine:
             return_value=GenomicsFileType.FASTQ
         )
         search_engine._matches_file_type_filter = MagicMock(return_value=True)
-        search_engine.pattern_matcher.match_file_path = MagicMock(return_value=(0.8, ['sample']))
+        search_engine.pattern_matcher.match_file_paths = MagicMock(
+            side_effect=lambda paths, terms: [(0.8, ['sample']) for _ in paths]
+        )
         search_engine._create_genomics_file_from_object = MagicMock(
             return_value=MagicMock(spec=GenomicsFile)
         )
@@ -1085,10 +1114,12 @@ class TestS3SearchEngine:
             return_value=GenomicsFileType.FASTQ
         )
         search_engine._matches_file_type_filter = MagicMock(return_value=True)
-        search_engine.pattern_matcher.match_file_path = MagicMock(
-            return_value=(0.0, [])
+        search_engine.pattern_matcher.match_file_paths = MagicMock(
+            side_effect=lambda paths, terms: [(0.0, []) for _ in paths]
         )  # No path match
-        search_engine.pattern_matcher.match_tags = MagicMock(return_value=(0.9, ['patient']))
+        search_engine.pattern_matcher.match_tag_sets = MagicMock(
+            side_effect=lambda tag_sets, terms: [(0.9, ['patient']) for _ in tag_sets]
+        )
         search_engine._get_tags_for_objects_batch = AsyncMock(
             return_value={'file1.fastq': {'patient_id': 'patient123'}}
         )
@@ -1127,16 +1158,11 @@ class TestS3SearchEngine:
     async def test_get_tags_for_objects_batch_all_cached(self, search_engine):
         """Test batch tag retrieval when all tags are cached."""
         # Pre-populate cache
-        search_engine._tag_cache = {
-            'test-bucket/file1.fastq': {
-                'tags': {'patient_id': 'patient123'},
-                'timestamp': time.time(),
-            },
-            'test-bucket/file2.fastq': {
-                'tags': {'sample_id': 'sample456'},
-                'timestamp': time.time(),
-            },
-        }
+        search_engine._tag_fetcher.cache.put(
+            'test-bucket/file1.fastq', {'patient_id': 'patient123'}
+        )
+        search_engine._tag_fetcher.cache.put('test-bucket/file2.fastq', {'sample_id': 'sample456'})
+        search_engine.s3_client.get_object_tagging.reset_mock()
 
         result = await search_engine._get_tags_for_objects_batch(
             'test-bucket', ['file1.fastq', 'file2.fastq']
@@ -1146,26 +1172,27 @@ class TestS3SearchEngine:
             'file1.fastq': {'patient_id': 'patient123'},
             'file2.fastq': {'sample_id': 'sample456'},
         }
+        search_engine.s3_client.get_object_tagging.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_tags_for_objects_batch_expired_cache(self, search_engine):
         """Test batch tag retrieval with expired cache entries."""
         # Pre-populate cache with expired entries
-        search_engine._tag_cache = {
-            'test-bucket/file1.fastq': {
-                'tags': {'old': 'data'},
-                'timestamp': time.time() - 1000,  # Expired
-            }
-        }
-        search_engine._get_object_tags_cached = AsyncMock(
-            return_value={'patient_id': 'patient123'}
+        search_engine._tag_fetcher.cache._entries['test-bucket/file1.fastq'] = (
+            {'old': 'data'},
+            time.time() - 1000,  # Expired
         )
+        search_engine.s3_client.get_object_tagging.return_value = {
+            'TagSet': [{'Key': 'patient_id', 'Value': 'patient123'}]
+        }
 
         result = await search_engine._get_tags_for_objects_batch('test-bucket', ['file1.fastq'])
 
         assert result == {'file1.fastq': {'patient_id': 'patient123'}}
-        # Expired entry should be removed
-        assert 'test-bucket/file1.fastq' not in search_engine._tag_cache
+        # Expired entry should be replaced with the fresh tags
+        assert search_engine._tag_fetcher.cache.get('test-bucket/file1.fastq') == {
+            'patient_id': 'patient123'
+        }
 
     @pytest.mark.asyncio
     async def test_get_tags_for_objects_batch_with_batching(self, search_engine):
@@ -1173,9 +1200,9 @@ class TestS3SearchEngine:
         # Set small batch size to test batching
         search_engine.config.max_tag_retrieval_batch_size = 2
 
-        search_engine._get_object_tags_cached = AsyncMock(
-            side_effect=[{'tag1': 'value1'}, {'tag2': 'value2'}, {'tag3': 'value3'}]
-        )
+        search_engine.s3_client.get_object_tagging.side_effect = lambda Bucket, Key: {
+            'TagSet': [{'Key': f'tag{Key[4]}', 'Value': f'value{Key[4]}'}]
+        }
 
         result = await search_engine._get_tags_for_objects_batch(
             'test-bucket', ['file1.fastq', 'file2.fastq', 'file3.fastq']
@@ -1189,9 +1216,13 @@ class TestS3SearchEngine:
     @pytest.mark.asyncio
     async def test_get_tags_for_objects_batch_with_exceptions(self, search_engine):
         """Test batch tag retrieval with some exceptions."""
-        search_engine._get_object_tags_cached = AsyncMock(
-            side_effect=[{'tag1': 'value1'}, Exception('Failed to get tags'), {'tag3': 'value3'}]
-        )
+
+        def get_object_tagging(Bucket, Key):
+            if Key == 'file2.fastq':
+                raise Exception('Failed to get tags')
+            return {'TagSet': [{'Key': f'tag{Key[4]}', 'Value': f'value{Key[4]}'}]}
+
+        search_engine.s3_client.get_object_tagging.side_effect = get_object_tagging
 
         result = await search_engine._get_tags_for_objects_batch(
             'test-bucket', ['file1.fastq', 'file2.fastq', 'file3.fastq']
@@ -0,0 +1,289 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for S3 tag retrieval with adaptive concurrency and the LRU+TTL tag cache."""
+
+import pytest
+import threading
+import time
+from awslabs.aws_healthomics_mcp_server.models import SearchConfig
+from awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher import (
+    S3TagFetcher,
+    TagCache,
+    get_shared_tag_fetcher,
+    shutdown_shared_tag_fetcher,
+)
+from botocore.exceptions import ClientError, EndpointConnectionError
+from unittest.mock import MagicMock, patch
+
+
+def _throttle_error():
+    """Create an S3 SlowDown error."""
+    return ClientError({'Error': {'Code': 'SlowDown', 'Message': 'Slow down'}}, 'GetObjectTagging')
+
+
+class TestTagCache:
+    """Test cases for TagCache."""
+
+    def test_get_and_put(self):
+        """Test cache hits and misses."""
+        cache = TagCache(max_size=10, ttl_seconds=60)
+
+        assert cache.get('bucket/a') is None
+        cache.put('bucket/a', {'k': 'v'})
+
+        assert cache.get('bucket/a') == {'k': 'v'}
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TagCache(max_size=2, ttl_seconds=60)
+        cache.put('a', {})
+        cache.put('b', {})
+        cache.get('a')
+
+        cache.put('c', {})
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_expired_entries(self):
+        """Test that expired entries are misses and are removed by cleanup."""
+        cache = TagCache(max_size=10, ttl_seconds=10)
+        cache.put('a', {})
+        cache.put('b', {})
+        cache._entries['a'] = ({}, time.time() - 20)
+        cache._entries['b'] = ({}, time.time() - 20)
+
+        assert cache.get('a') is None
+        assert cache.cleanup_expired() == 1
+        assert len(cache) == 0
+        assert cache.get_stats()['expirations'] == 2
+
+    def test_zero_ttl_disables_caching(self):
+        """Test that a zero TTL stores nothing."""
+        cache = TagCache(max_size=10, ttl_seconds=0)
+        cache.put('a', {})
+
+        assert len(cache) == 0
+
+
+class TestS3TagFetcher:
+    """Test cases for S3TagFetcher."""
+
+    @pytest.fixture
+    def s3_client(self):
+        """Create a mock S3 client that tags every object with its key."""
+        client = MagicMock()
+        client.get_object_tagging.side_effect = lambda Bucket, Key: {
+            'TagSet': [{'Key': 'name', 'Value': Key}]
+        }
+        return client
+
+    def _create_fetcher(self, s3_client, **config_overrides):
+        """Create a fetcher whose session returns the given client."""
+        session = MagicMock()
+        session.client.return_value = s3_client
+        return S3TagFetcher(session, SearchConfig(**config_overrides))
+
+    def test_dedicated_client_sized_to_workers(self, s3_client):
+        """Test that the fetcher creates its own client with a matching connection pool."""
+        session = MagicMock()
+        session.client.return_value = s3_client
+
+        fetcher = S3TagFetcher(session, SearchConfig(max_tag_fetch_workers=16))
+
+        client_config = session.client.call_args.kwargs['config']
+        assert client_config.max_pool_connections == 16
+        assert fetcher.max_workers == 16
+        fetcher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_fetch_tags_uses_cache(self, s3_client):
+        """Test that cached tags are not fetched again."""
+        fetcher = self._create_fetcher(s3_client)
+
+        first = await fetcher.fetch_tags('bucket', ['a', 'b', 'a'])
+        second = await fetcher.fetch_tags('bucket', ['a', 'b'])
+
+        assert first == second == {'a': {'name': 'a'}, 'b': {'name': 'b'}}
+        assert s3_client.get_object_tagging.call_count == 2
+        assert fetcher.cache.get_stats()['hits'] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_and_grows_on_success(self, s3_client):
+        """Test that in-flight requests never exceed the limit and the limit grows."""
+        lock = threading.Lock()
+        state = {'in_flight': 0, 'peak': 0}
+
+        def get_object_tagging(Bucket, Key):
+            with lock:
+                state['in_flight'] += 1
+                state['peak'] = max(state['peak'], state['in_flight'])
+            time.sleep(0.001)
+            with lock:
+                state['in_flight'] -= 1
+            return {'TagSet': []}
+
+        s3_client.get_object_tagging.side_effect = get_object_tagging
+        fetcher = self._create_fetcher(s3_client, max_tag_fetch_workers=16)
+
+        result = await fetcher.fetch_tags('bucket', [f'key{i}' for i in range(200)])
+
+        assert len(result) == 200
+        assert state['peak'] <= fetcher.max_concurrency
+        assert fetcher.concurrency_limit > 10
+        fetcher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_throttling_halves_concurrency_and_retries(self, s3_client):
+        """Test that throttled keys are retried and the limit is cut."""
+        throttled = {'key1'}
+
+        def get_object_tagging(Bucket, Key):
+            if Key in throttled:
+                throttled.discard(Key)
+                raise _throttle_error()
+            return {'TagSet': [{'Key': 'name', 'Value': Key}]}
+
+        s3_client.get_object_tagging.side_effect = get_object_tagging
+        fetcher = self._create_fetcher(s3_client)
+
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher.S3_TAG_FETCH_THROTTLE_BACKOFF_SECONDS',
+            0,
+        ):
+            result = await fetcher.fetch_tags('bucket', ['key0', 'key1'])
+
+        assert result == {'key0': {'name': 'key0'}, 'key1': {'name': 'key1'}}
+        stats = fetcher.get_stats()
+        assert stats['throttle_events'] == 1
+        assert stats['concurrency_limit'] == 5
+
+    @pytest.mark.asyncio
+    async def test_persistent_throttling_gives_up(self, s3_client):
+        """Test that keys throttled on every attempt are omitted and not cached."""
+        s3_client.get_object_tagging.side_effect = _throttle_error()
+        fetcher = self._create_fetcher(s3_client)
+
+        with (
+            patch(
+                'awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher.S3_TAG_FETCH_THROTTLE_BACKOFF_SECONDS',
+                0,
+            ),
+            patch(
+                'awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher.S3_TAG_FETCH_MAX_THROTTLE_RETRIES',
+                2,
+            ),
+        ):
+            result = await fetcher.fetch_tags('bucket', ['key0'])
+
+        assert result == {}
+        assert s3_client.get_object_tagging.call_count == 3
+        assert fetcher.concurrency_limit == 1
+        assert len(fetcher.cache) == 0
+        assert fetcher.get_stats()['failed_keys'] == 1
+
+    @pytest.mark.asyncio
+    async def test_access_denied_cached_as_empty(self, s3_client):
+        """Test that non-throttling client errors yield empty tags."""
+        s3_client.get_object_tagging.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Denied'}}, 'GetObjectTagging'
+        )
+        fetcher = self._create_fetcher(s3_client)
+
+        result = await fetcher.fetch_tags('bucket', ['key0'])
+
+        assert result == {'key0': {}}
+        assert fetcher.cache.get('bucket/key0') == {}
+        assert fetcher.get_stats()['throttle_events'] == 0
+
+    @pytest.mark.asyncio
+    async def test_server_error_retried_and_not_cached(self, s3_client):
+        """Test that server errors are retried without cutting the limit or caching."""
+        failures = {'key0': 1, 'key1': 5}
+
+        def get_object_tagging(Bucket, Key):
+            if failures.get(Key, 0) > 0:
+                failures[Key] -= 1
+                raise ClientError(
+                    {
+                        'Error': {'Code': 'InternalError', 'Message': 'Internal error'},
+                        'ResponseMetadata': {'HTTPStatusCode': 500},
+                    },
+                    'GetObjectTagging',
+                )
+            return {'TagSet': [{'Key': 'name', 'Value': Key}]}
+
+        s3_client.get_object_tagging.side_effect = get_object_tagging
+        fetcher = self._create_fetcher(s3_client)
+
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher.S3_TAG_FETCH_THROTTLE_BACKOFF_SECONDS',
+            0,
+        ):
+            result = await fetcher.fetch_tags('bucket', ['key0', 'key1'])
+
+        assert result == {'key0': {'name': 'key0'}}
+        assert 'bucket/key1' not in fetcher.cache
+        stats = fetcher.get_stats()
+        assert stats['failed_keys'] == 1
+        assert stats['throttle_events'] == 0
+        assert stats['concurrency_limit'] == 10
+
+    @pytest.mark.asyncio
+    async def test_connection_error_not_cached(self, s3_client):
+        """Test that keys failing with connection errors are omitted and not cached."""
+        s3_client.get_object_tagging.side_effect = EndpointConnectionError(
+            endpoint_url='https://s3.amazonaws.com'
+        )
+        fetcher = self._create_fetcher(s3_client)
+
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.s3_tag_fetcher.S3_TAG_FETCH_THROTTLE_BACKOFF_SECONDS',
+            0,
+        ):
+            result = await fetcher.fetch_tags('bucket', ['key0'])
+
+        assert result == {}
+        assert s3_client.get_object_tagging.call_count == 3
+        assert len(fetcher.cache) == 0
+
+
+class TestSharedTagFetcher:
+    """Test cases for the process-wide tag fetcher."""
+
+    def test_fetcher_shared_until_settings_change(self):
+        """Test that the fetcher is reused and replaced when its settings change."""
+        session = MagicMock()
+        session.region_name = 'us-east-1'
+
+        first = get_shared_tag_fetcher(session, SearchConfig())
+        assert get_shared_tag_fetcher(MagicMock(region_name='us-east-1'), SearchConfig()) is first
+
+        with patch.object(first, 'shutdown', wraps=first.shutdown) as mock_shutdown:
+            second = get_shared_tag_fetcher(session, SearchConfig(max_tag_fetch_workers=4))
+            mock_shutdown.assert_called_once()
+
+        assert second is not first
+        assert session.client.call_count == 2
+
+        with patch.object(second, 'shutdown') as mock_shutdown:
+            shutdown_shared_tag_fetcher()
+            mock_shutdown.assert_called_once()
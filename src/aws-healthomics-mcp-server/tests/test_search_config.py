@@ -21,12 +21,17 @@ from awslabs.aws_healthomics_mcp_server.utils.search_config import (
     get_enable_healthomics_search,
     get_enable_s3_tag_search,
     get_genomics_search_config,
+    get_inventory_full_refresh_interval,
+    get_inventory_index_dir,
+    get_inventory_refresh_interval,
     get_max_concurrent_searches,
     get_max_tag_batch_size,
+    get_max_tag_cache_size,
     get_result_cache_ttl,
     get_s3_bucket_paths,
     get_search_timeout_seconds,
     get_tag_cache_ttl,
+    get_tag_fetch_workers,
     validate_bucket_access_permissions,
 )
 from unittest.mock import patch
@@ -47,6 +52,11 @@ class TestSearchConfig:
             'GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE',
             'GENOMICS_SEARCH_RESULT_CACHE_TTL',
             'GENOMICS_SEARCH_TAG_CACHE_TTL',
+            'GENOMICS_SEARCH_INVENTORY_INDEX_DIR',
+            'GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL',
+            'GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL',
+            'GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE',
+            'GENOMICS_SEARCH_TAG_FETCH_WORKERS',
         ]
         for var in env_vars_to_clear:
             if var in os.environ:
@@ -376,6 +386,68 @@ class TestSearchConfig:
 
         assert result == 300  # Should return default for invalid value
 
+    def test_get_inventory_index_dir_unset(self):
+        """Test that the inventory index is disabled by default."""
+        assert get_inventory_index_dir() is None
+
+    def test_get_inventory_index_dir_set(self):
+        """Test getting the inventory index directory."""
+        os.environ['GENOMICS_SEARCH_INVENTORY_INDEX_DIR'] = ' /var/cache/genomics '
+
+        assert get_inventory_index_dir() == '/var/cache/genomics'
+
+    def test_get_inventory_refresh_interval_values(self):
+        """Test getting the inventory refresh interval with valid and invalid values."""
+        assert get_inventory_refresh_interval() == 300
+
+        os.environ['GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL'] = '60'
+        assert get_inventory_refresh_interval() == 60
+
+        os.environ['GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL'] = '-1'
+        assert get_inventory_refresh_interval() == 300
+
+        os.environ['GENOMICS_SEARCH_INVENTORY_REFRESH_INTERVAL'] = 'invalid'
+        assert get_inventory_refresh_interval() == 300
+
+    def test_get_inventory_full_refresh_interval_values(self):
+        """Test getting the full inventory refresh interval with valid and invalid values."""
+        assert get_inventory_full_refresh_interval() == 86400
+
+        os.environ['GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL'] = '3600'
+        assert get_inventory_full_refresh_interval() == 3600
+
+        os.environ['GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL'] = '-1'
+        assert get_inventory_full_refresh_interval() == 86400
+
+        os.environ['GENOMICS_SEARCH_INVENTORY_FULL_REFRESH_INTERVAL'] = 'invalid'
+        assert get_inventory_full_refresh_interval() == 86400
+
+    def test_get_max_tag_cache_size_values(self):
+        """Test getting the tag cache size with valid and invalid values."""
+        assert get_max_tag_cache_size() == 1000
+
+        os.environ['GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE'] = '50000'
+        assert get_max_tag_cache_size() == 50000
+
+        os.environ['GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE'] = '0'
+        assert get_max_tag_cache_size() == 1000
+
+        os.environ['GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE'] = 'invalid'
+        assert get_max_tag_cache_size() == 1000
+
+    def test_get_tag_fetch_workers_values(self):
+        """Test getting the tag fetch worker count with valid and invalid values."""
+        assert get_tag_fetch_workers() == 32
+
+        os.environ['GENOMICS_SEARCH_TAG_FETCH_WORKERS'] = '64'
+        assert get_tag_fetch_workers() == 64
+
+        os.environ['GENOMICS_SEARCH_TAG_FETCH_WORKERS'] = '-1'
+        assert get_tag_fetch_workers() == 32
+
+        os.environ['GENOMICS_SEARCH_TAG_FETCH_WORKERS'] = 'invalid'
+        assert get_tag_fetch_workers() == 32
+
     def test_get_tag_cache_ttl_zero_value(self):
         """Test getting tag cache TTL with zero value (valid)."""
         os.environ['GENOMICS_SEARCH_TAG_CACHE_TTL'] = '0'
@@ -33,3 +33,16 @@ PRICING_API_REGIONS = {
     'classic': ['us-east-1', 'eu-central-1', 'ap-southeast-1'],
     'china': ['cn-northwest-1'],
 }
+
+# Local store of bulk price list files, used instead of the Price List Query API when present
+PRICING_STORE_DIR = os.environ.get(
+    'PRICING_STORE_DIR',
+    os.path.join(os.path.expanduser('~'), '.aws-pricing-mcp-server', 'price-lists'),
+)
+PRICING_STORE_MAX_AGE_DAYS = int(os.environ.get('PRICING_STORE_MAX_AGE_DAYS', '7'))
+# Directory of bulk price list files that may be loaded from disk (unset: downloads only)
+PRICING_SOURCE_DIR = os.environ.get('PRICING_SOURCE_DIR')
+
+# Cache of the service catalog discovery tools (0 disables the cache)
+PRICING_CACHE_TTL_SECONDS = int(os.environ.get('PRICING_CACHE_TTL_SECONDS', '3600'))
+PRICING_CACHE_STALE_SECONDS = int(os.environ.get('PRICING_CACHE_STALE_SECONDS', '86400'))
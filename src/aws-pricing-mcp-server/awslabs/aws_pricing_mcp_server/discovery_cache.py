@@ -0,0 +1,223 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""awslabs MCP AWS Pricing mcp server discovery cache.
+
+This module caches the near-static responses of the service catalog discovery tools
+(service codes, service attributes and attribute values), and indexes the discovered
+attribute values so values can be traced back to the services and attributes they
+belong to.
+"""
+
+import asyncio
+import threading
+import time
+from awslabs.aws_pricing_mcp_server import consts
+from loguru import logger
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+class DiscoveryCache:
+    """Time-to-live cache that serves stale entries while refreshing them in the background.
+
+    Entries younger than the TTL are fresh. Entries older than the TTL, but younger than
+    the TTL plus the stale period, are returned as they are while a background task loads
+    the current value. Older entries are discarded.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = consts.PRICING_CACHE_TTL_SECONDS,
+        stale_seconds: float = consts.PRICING_CACHE_STALE_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Number of seconds an entry is fresh (0 disables the cache)
+            stale_seconds: Number of seconds a stale entry is served after its TTL
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, Tuple[float, List[str]]] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, refresh: Optional[Callable[[], Optional[List[str]]]] = None
+    ) -> Optional[List[str]]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+            refresh: Function loading the current value, called in a worker thread when
+                the entry is stale (optional). An empty or None result keeps the entry.
+
+        Returns:
+            Copy of the cached value, or None if it is missing or expired
+        """
+        if self.ttl_seconds <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry[0] if entry is not None else 0.0
+            if entry is None or age > self.ttl_seconds + self.stale_seconds:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            start_refresh = (
+                age > self.ttl_seconds and refresh is not None and key not in self._refreshing
+            )
+            if start_refresh:
+                self._refreshing.add(key)
+
+        if start_refresh and refresh is not None:
+            self._start_refresh(key, refresh)
+        return list(entry[1])
+
+    def set(self, key: Hashable, value: Iterable[str]) -> None:
+        """Cache a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), list(value))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._refreshing.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+    def _start_refresh(self, key: Hashable, refresh: Callable[[], Optional[List[str]]]) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(self._refresh(key, refresh))
+        except RuntimeError:
+            # Outside of an event loop the stale entry is refreshed on a later call
+            with self._lock:
+                self._refreshing.discard(key)
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: Hashable, refresh: Callable[[], Optional[List[str]]]) -> None:
+        try:
+            value = await asyncio.to_thread(refresh)
+            if value:
+                self.set(key, value)
+                logger.debug(f'Refreshed stale discovery cache entry {key}')
+        except Exception as e:
+            logger.warning(f'Failed to refresh discovery cache entry {key}, keeping it: {e}')
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+class CatalogIndex:
+    """Inverted index of the service attributes and attribute values discovered so far."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._services_by_attribute: Dict[str, Set[str]] = {}
+        self._locations_by_value: Dict[str, Set[Tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def add_service_attributes(self, service_code: str, attribute_names: Iterable[str]) -> None:
+        """Index the attributes of a service.
+
+        Args:
+            service_code: AWS service code
+            attribute_names: Filterable attribute names of the service
+        """
+        with self._lock:
+            for attribute_name in attribute_names:
+                self._services_by_attribute.setdefault(attribute_name, set()).add(service_code)
+
+    def add_attribute_values(
+        self, service_code: str, attribute_name: str, values: Iterable[str]
+    ) -> None:
+        """Index the values of an attribute of a service.
+
+        Args:
+            service_code: AWS service code
+            attribute_name: Attribute name
+            values: Values of the attribute
+        """
+        values = list(values)
+        if not values:
+            return
+        with self._lock:
+            self._services_by_attribute.setdefault(attribute_name, set()).add(service_code)
+            for value in values:
+                self._locations_by_value.setdefault(value.lower(), set()).add(
+                    (service_code, attribute_name)
+                )
+
+    def services_with_attribute(self, attribute_name: str) -> List[str]:
+        """Get the services known to have an attribute.
+
+        Args:
+            attribute_name: Attribute name
+
+        Returns:
+            Sorted service codes
+        """
+        with self._lock:
+            return sorted(self._services_by_attribute.get(attribute_name, ()))
+
+    def find_value(self, value: str) -> List[Dict[str, str]]:
+        """Get the services and attributes a value is known for (case-insensitive).
+
+        Args:
+            value: Attribute value (e.g., 't3.medium')
+
+        Returns:
+            Sorted list of {'service_code': ..., 'attribute_name': ...} dictionaries
+        """
+        with self._lock:
+            locations = sorted(self._locations_by_value.get(value.lower(), ()))
+        return [
+            {'service_code': service_code, 'attribute_name': attribute_name}
+            for service_code, attribute_name in locations
+        ]
+
+    def clear(self) -> None:
+        """Remove all indexed attributes and values."""
+        with self._lock:
+            self._services_by_attribute.clear()
+            self._locations_by_value.clear()
+
+
+DISCOVERY_CACHE = DiscoveryCache()
+CATALOG_INDEX = CatalogIndex()
+
+
+def clear_discovery_cache() -> None:
+    """Clear the discovery cache and the catalog index."""
+    DISCOVERY_CACHE.clear()
+    CATALOG_INDEX.clear()
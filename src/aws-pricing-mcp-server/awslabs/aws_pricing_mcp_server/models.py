@@ -99,6 +99,11 @@ EFFECTIVE_DATE_FIELD = Field(
     description='Effective date for pricing in format "YYYY-MM-DD HH:MM" (default: current timestamp)',
 )
 
+PRICE_LIST_SOURCE_FIELD = Field(
+    None,
+    description='Optional URL from get_price_list_urls, or path of a JSON bulk price list file under PRICING_SOURCE_DIR (default: the current price list from get_price_list_urls)',
+)
+
 OUTPUT_OPTIONS_FIELD = Field(
     None,
     description='Optional output filtering options to reduce response size. Use {"pricing_terms": ["OnDemand", "FlatRate"]} to significantly reduce response size for large services like EC2.',
@@ -128,3 +133,8 @@ ATTRIBUTE_VALUES_FILTERS_FIELD = Field(
     None,
     description='Optional dictionary mapping attribute names to regex patterns for filtering their values (e.g., {"instanceType": "t3", "operatingSystem": "Linux"})',
 )
+
+ATTRIBUTE_VALUES_REGION_FIELD = Field(
+    None,
+    description='Optional AWS region(s) (e.g., "us-east-1" or ["us-east-1", "eu-west-1"]) to get values of from price lists loaded with load_price_list. If omitted, or if the price list of any of the regions is not stored, the values of all regions are returned from the AWS Pricing API.',
+)
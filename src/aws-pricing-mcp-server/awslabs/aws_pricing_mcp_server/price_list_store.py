@@ -0,0 +1,524 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""awslabs MCP AWS Pricing mcp server local price list store.
+
+This module loads AWS bulk price list files into one SQLite database per service and
+region, with the attributes of every product indexed, so pricing queries can be answered
+locally instead of through the AWS Price List Query API.
+"""
+
+import io
+import json
+import os
+import re
+import sqlite3
+import time
+import urllib.parse
+import urllib.request
+from awslabs.aws_pricing_mcp_server import consts
+from awslabs.aws_pricing_mcp_server.models import PricingFilter
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from loguru import logger
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+
+# Prefix of pagination tokens of results read from the local store
+LOCAL_NEXT_TOKEN_PREFIX = 'local:'
+
+_READ_CHUNK_SIZE = 1 << 20
+_INSERT_BATCH_SIZE = 1000
+# Stay below the default maximum number of SQLite query parameters
+_MAX_QUERY_PARAMETERS = 900
+_NAME_PATTERN = re.compile(r'[A-Za-z0-9][A-Za-z0-9_-]*')
+# Hosts serving the bulk price list files returned by the Price List API
+_SOURCE_HOST_PATTERN = re.compile(r'pricing\.[a-z0-9-]+\.amazonaws\.com(\.cn)?')
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE products (sku TEXT PRIMARY KEY, product TEXT NOT NULL);
+CREATE TABLE attributes (sku TEXT NOT NULL, name TEXT NOT NULL, value TEXT COLLATE NOCASE);
+CREATE TABLE terms (sku TEXT NOT NULL, term_type TEXT NOT NULL, offers TEXT NOT NULL);
+"""
+
+_INDEXES = """
+CREATE INDEX attributes_by_value ON attributes (name, value, sku);
+CREATE INDEX terms_by_sku ON terms (sku);
+"""
+
+
+class _JsonObjectStream:
+    """Incremental reader of the nested objects of a large JSON document.
+
+    Bulk price list files of large services are several gigabytes, so they are read one
+    product or term at a time instead of being parsed as a whole.
+    """
+
+    def __init__(self, file: TextIO):
+        """Initialize the stream.
+
+        Args:
+            file: Text file containing the JSON document
+        """
+        self._file = file
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the next object.
+
+        The value of each key must be consumed with read_value or iter_object before the
+        next key is requested.
+
+        Yields:
+            Keys of the object
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self._expect(':')
+            yield key
+            char = self._peek()
+            self._pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f'Invalid price list file: unexpected "{char}" after value')
+
+    def read_value(self) -> Any:
+        """Read the next JSON value.
+
+        Returns:
+            The decoded value
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError('Invalid price list file: unexpected end of file')
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f'Invalid price list file: expected "{char}", found "{found}"')
+        self._pos += 1
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        # Read at least as much as is buffered, so large values are decoded in few attempts
+        chunk = self._file.read(max(_READ_CHUNK_SIZE, len(self._buffer) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+
+def get_store_path(service_code: str, region: str, store_dir: Optional[str] = None) -> str:
+    """Get the path of the database holding the price list of a service in a region.
+
+    Args:
+        service_code: AWS service code (e.g., 'AmazonEC2')
+        region: AWS region code (e.g., 'us-east-1')
+        store_dir: Directory of the store (default: PRICING_STORE_DIR)
+
+    Returns:
+        Path of the SQLite database
+
+    Raises:
+        ValueError: If the service code or region cannot be used in a file name
+    """
+    for name in (service_code, region):
+        if not _NAME_PATTERN.fullmatch(name):
+            raise ValueError(f'Invalid service code or region: "{name}"')
+    return os.path.join(store_dir or consts.PRICING_STORE_DIR, service_code, f'{region}.db')
+
+
+def find_price_list(
+    service_code: str, region: str, store_dir: Optional[str] = None
+) -> Optional[str]:
+    """Find the stored price list of a service in a region.
+
+    Args:
+        service_code: AWS service code
+        region: AWS region code
+        store_dir: Directory of the store (default: PRICING_STORE_DIR)
+
+    Returns:
+        Path of the SQLite database, or None if it is missing or older than
+        PRICING_STORE_MAX_AGE_DAYS
+    """
+    try:
+        path = get_store_path(service_code, region, store_dir)
+    except ValueError:
+        return None
+    if not os.path.exists(path):
+        return None
+
+    age_days = (time.time() - os.path.getmtime(path)) / 86400
+    if age_days > consts.PRICING_STORE_MAX_AGE_DAYS:
+        logger.info(
+            f'Ignoring price list of {service_code} in {region} stored {age_days:.0f} days ago'
+        )
+        return None
+    return path
+
+
+def _is_pricing_url(url: str) -> bool:
+    parsed = urllib.parse.urlsplit(url)
+    return parsed.scheme == 'https' and bool(
+        parsed.hostname and _SOURCE_HOST_PATTERN.fullmatch(parsed.hostname)
+    )
+
+
+def resolve_price_list_source(source: str, source_dir: Optional[str] = None) -> str:
+    """Check that a bulk price list file may be loaded from a source.
+
+    Only files served by the AWS Price List API over HTTPS, as returned by
+    get_price_list_urls, and files under the configured source directory are accepted.
+
+    Args:
+        source: URL or local path of the JSON bulk price list file
+        source_dir: Directory of local price list files (default: PRICING_SOURCE_DIR)
+
+    Returns:
+        The URL, or the resolved path of the local file
+
+    Raises:
+        ValueError: If the source is neither a price list URL nor under the source directory
+    """
+    if '://' in source:
+        if not _is_pricing_url(source):
+            raise ValueError(f'Not an AWS price list file URL: "{source}"')
+        return source
+
+    source_dir = source_dir or consts.PRICING_SOURCE_DIR
+    if not source_dir:
+        raise ValueError(
+            'Loading price list files from disk is disabled. Set PRICING_SOURCE_DIR to the '
+            'directory of the files to allow it.'
+        )
+    root = os.path.realpath(source_dir)
+    path = os.path.realpath(os.path.join(root, source))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f'Price list file "{source}" is not under {source_dir}')
+    return path
+
+
+class _PricingRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Redirect handler that does not follow redirects off the price list hosts."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        if not _is_pricing_url(newurl):
+            raise ValueError(f'Refusing redirect of price list download to "{newurl}"')
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+@contextmanager
+def _open_source(source: str) -> Iterator[TextIO]:
+    if _is_pricing_url(source):
+        opener = urllib.request.build_opener(_PricingRedirectHandler)
+        with opener.open(source, timeout=60) as response:
+            yield io.TextIOWrapper(response, encoding='utf-8')
+    else:
+        with open(source, encoding='utf-8') as f:
+            yield f
+
+
+def build_price_list_store(
+    service_code: str, region: str, source: str, store_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """Load a JSON bulk price list file into the local store.
+
+    The database is written to a temporary file and then moved into place, so queries
+    running during the load keep using the previous price list.
+
+    Args:
+        service_code: AWS service code
+        region: AWS region code
+        source: URL or local path of the JSON bulk price list file, see
+            resolve_price_list_source
+        store_dir: Directory of the store (default: PRICING_STORE_DIR)
+
+    Returns:
+        Dictionary describing the stored price list
+
+    Raises:
+        ValueError: If the source is not accepted or is not a valid price list file
+    """
+    source = resolve_price_list_source(source)
+    path = get_store_path(service_code, region, store_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    logger.info(f'Loading price list of {service_code} in {region} from {source}')
+    start_time = time.time()
+    try:
+        with closing(sqlite3.connect(tmp_path)) as conn:
+            conn.executescript(_SCHEMA)
+            with _open_source(source) as f:
+                meta = _load_offer_file(conn, _JsonObjectStream(f))
+            meta.update(
+                {
+                    'serviceCode': service_code,
+                    'regionCode': region,
+                    'loadedAt': datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            conn.executemany('INSERT INTO meta VALUES (?, ?)', meta.items())
+            conn.executescript(_INDEXES)
+            conn.commit()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logger.info(
+        f'Stored {meta["productCount"]} products of {service_code} in {region} '
+        f'in {time.time() - start_time:.1f}s'
+    )
+    return {
+        'service_code': service_code,
+        'region': region,
+        'product_count': int(meta['productCount']),
+        'version': meta.get('version'),
+        'publication_date': meta.get('publicationDate'),
+        'path': path,
+    }
+
+
+def _load_offer_file(conn: sqlite3.Connection, stream: _JsonObjectStream) -> Dict[str, str]:
+    meta: Dict[str, str] = {}
+    product_count = 0
+    products, attributes, terms = [], [], []
+
+    def flush():
+        conn.executemany('INSERT OR REPLACE INTO products VALUES (?, ?)', products)
+        conn.executemany('INSERT INTO attributes VALUES (?, ?, ?)', attributes)
+        conn.executemany('INSERT INTO terms VALUES (?, ?, ?)', terms)
+        products.clear()
+        attributes.clear()
+        terms.clear()
+
+    for key in stream.iter_object():
+        if key == 'products':
+            for sku in stream.iter_object():
+                product = stream.read_value()
+                products.append((sku, json.dumps(product)))
+                product_attributes = dict(product.get('attributes', {}))
+                if 'productFamily' in product:
+                    product_attributes.setdefault('productFamily', product['productFamily'])
+                attributes.extend(
+                    (sku, name, str(value)) for name, value in product_attributes.items()
+                )
+                product_count += 1
+                if len(products) >= _INSERT_BATCH_SIZE:
+                    flush()
+        elif key == 'terms':
+            for term_type in stream.iter_object():
+                for sku in stream.iter_object():
+                    terms.append((sku, term_type, json.dumps(stream.read_value())))
+                    if len(terms) >= _INSERT_BATCH_SIZE:
+                        flush()
+        else:
+            value = stream.read_value()
+            if isinstance(value, str):
+                meta[key] = value
+    flush()
+
+    meta['productCount'] = str(product_count)
+    return meta
+
+
+def _build_conditions(filters: List[PricingFilter]) -> Tuple[List[str], List[Any]]:
+    conditions: List[str] = []
+    params: List[Any] = []
+    for pricing_filter in filters:
+        filter_type = pricing_filter.type.upper()
+        value = pricing_filter.value
+        text = value if isinstance(value, str) else ','.join(value)
+        subquery = 'SELECT sku FROM attributes WHERE name = ? AND '
+
+        if filter_type in ('EQUALS', 'TERM_MATCH'):
+            conditions.append(f'sku IN ({subquery}value = ?)')
+            params.extend([pricing_filter.field, text])
+        elif filter_type in ('ANY_OF', 'NONE_OF'):
+            # Values of ANY_OF and NONE_OF filters may be given as a comma-separated string
+            values = value if isinstance(value, list) else value.split(',')
+            operator = 'IN' if filter_type == 'ANY_OF' else 'NOT IN'
+            placeholders = ', '.join('?' * len(values))
+            conditions.append(f'sku {operator} ({subquery}value IN ({placeholders}))')
+            params.extend([pricing_filter.field, *values])
+        elif filter_type == 'CONTAINS':
+            pattern = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            conditions.append(f"sku IN ({subquery}value LIKE ? ESCAPE '\\')")
+            params.extend([pricing_filter.field, f'%{pattern}%'])
+        else:
+            raise ValueError(f'Unsupported filter type: {pricing_filter.type}')
+    return conditions, params
+
+
+def query_price_list(
+    service_code: str,
+    regions: List[str],
+    filters: Optional[List[PricingFilter]] = None,
+    max_results: int = 100,
+    next_token: Optional[str] = None,
+    store_dir: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Get products matching filters from the stored price lists of a service.
+
+    Args:
+        service_code: AWS service code
+        regions: AWS region codes to get products of
+        filters: Filters on product attributes (optional)
+        max_results: Maximum number of products to return
+        next_token: Pagination token of a previous local query (optional)
+        store_dir: Directory of the store (default: PRICING_STORE_DIR)
+
+    Returns:
+        Response shaped like the GetProducts API response, with parsed PriceList items,
+        or None if the price list of any region is not stored
+
+    Raises:
+        ValueError: If a filter type is not supported
+    """
+    if next_token and not next_token.startswith(LOCAL_NEXT_TOKEN_PREFIX):
+        return None
+    paths = [find_price_list(service_code, region, store_dir) for region in regions]
+    if not regions or any(path is None for path in paths):
+        return None
+
+    offset = int(next_token[len(LOCAL_NEXT_TOKEN_PREFIX) :]) if next_token else 0
+    skip = offset
+    items: List[Dict[str, Any]] = []
+
+    for region, path in zip(regions, paths):
+        if len(items) > max_results:
+            break
+        conditions, params = _build_conditions(
+            [PricingFilter(Field='regionCode', Type='EQUALS', Value=region), *(filters or [])]
+        )
+        where = ' AND '.join(conditions)
+
+        with closing(sqlite3.connect(f'file:{path}?mode=ro', uri=True)) as conn:
+            if skip:
+                (count,) = conn.execute(
+                    f'SELECT COUNT(*) FROM products WHERE {where}',  # nosec B608
+                    params,
+                ).fetchone()
+                if skip >= count:
+                    skip -= count
+                    continue
+
+            rows = conn.execute(
+                f'SELECT sku, product FROM products WHERE {where} '  # nosec B608
+                'ORDER BY sku LIMIT ? OFFSET ?',
+                [*params, max_results + 1 - len(items), skip],
+            ).fetchall()
+            skip = 0
+            meta = dict(conn.execute('SELECT key, value FROM meta'))
+            items.extend(_with_terms(conn, rows, meta))
+
+    response: Dict[str, Any] = {'PriceList': items[:max_results]}
+    if len(items) > max_results:
+        response['NextToken'] = f'{LOCAL_NEXT_TOKEN_PREFIX}{offset + max_results}'
+    return response
+
+
+def _with_terms(
+    conn: sqlite3.Connection, rows: List[tuple], meta: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    terms: Dict[str, Dict[str, Any]] = {sku: {} for sku, _ in rows}
+    skus = list(terms)
+    for i in range(0, len(skus), _MAX_QUERY_PARAMETERS):
+        batch = skus[i : i + _MAX_QUERY_PARAMETERS]
+        placeholders = ', '.join('?' * len(batch))
+        for sku, term_type, offers in conn.execute(
+            f'SELECT sku, term_type, offers FROM terms WHERE sku IN ({placeholders})',  # nosec B608
+            batch,
+        ):
+            terms[sku][term_type] = json.loads(offers)
+
+    return [
+        {
+            'product': json.loads(product),
+            'terms': terms[sku],
+            'version': meta.get('version'),
+            'publicationDate': meta.get('publicationDate'),
+        }
+        for sku, product in rows
+    ]
+
+
+def get_stored_attribute_values(
+    service_code: str,
+    attribute_name: str,
+    regions: List[str],
+    store_dir: Optional[str] = None,
+) -> Optional[List[str]]:
+    """Get the values of a product attribute from the stored price lists of regions.
+
+    Args:
+        service_code: AWS service code
+        attribute_name: Product attribute name (e.g., 'instanceType')
+        regions: AWS region codes to get values of
+        store_dir: Directory of the store (default: PRICING_STORE_DIR)
+
+    Returns:
+        Sorted distinct values across the regions, or None if the price list of any region
+        is not stored or none of them has the attribute
+    """
+    paths = [find_price_list(service_code, region, store_dir) for region in regions]
+    if not regions or any(path is None for path in paths):
+        return None
+
+    values = set()
+    for path in paths:
+        with closing(sqlite3.connect(f'file:{path}?mode=ro', uri=True)) as conn:
+            values.update(
+                value
+                for (value,) in conn.execute(
+                    'SELECT DISTINCT value FROM attributes WHERE name = ?', (attribute_name,)
+                )
+            )
+    return sorted(values) if values else None
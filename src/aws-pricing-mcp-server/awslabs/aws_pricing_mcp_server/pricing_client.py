@@ -19,16 +19,21 @@ This module provides utilities for creating boto3 pricing clients.
 
 import boto3
 import sys
+import threading
 from awslabs.aws_pricing_mcp_server import __version__, consts
 from botocore.config import Config
 from loguru import logger
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 # Set up logging
 logger.remove()
 logger.add(sys.stderr, level=consts.LOG_LEVEL)
 
+# Pricing clients by profile, pricing region and endpoint, shared by all tool calls
+_clients: Dict[Tuple[Optional[str], str, Optional[str]], Any] = {}
+_clients_lock = threading.Lock()
+
 
 def get_pricing_region(requested_region: Optional[str] = None) -> str:
     """Determine the appropriate AWS Pricing API region.
@@ -83,6 +88,9 @@ def get_pricing_region(requested_region: Optional[str] = None) -> str:
 def create_pricing_client(profile: Optional[str] = None, region: Optional[str] = None) -> Any:
     """Create an AWS Pricing API client.
 
+    Clients are created once per profile and pricing region and reused by later calls,
+    since boto3 clients are thread-safe and refresh their credentials themselves.
+
     Args:
         profile: AWS profile name to use (default: None, uses AWS_PROFILE or default profile)
         region: AWS region name (default: None, uses AWS_REGION env var or nearest pricing region)
@@ -91,11 +99,28 @@ def create_pricing_client(profile: Optional[str] = None, region: Optional[str] =
         boto3 pricing client
     """
     profile_name = profile if profile else consts.AWS_PROFILE
-    session = boto3.Session(profile_name=profile_name)
 
     # Determine the appropriate pricing region
     pricing_region = get_pricing_region(region)
 
+    key = (profile_name, pricing_region, consts.PRICING_ENDPOINT)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _create_client(profile_name, pricing_region)
+            _clients[key] = client
+    return client
+
+
+def clear_pricing_clients() -> None:
+    """Discard the shared pricing clients, so the next call creates new ones."""
+    with _clients_lock:
+        _clients.clear()
+
+
+def _create_client(profile_name: Optional[str], pricing_region: str) -> Any:
+    session = boto3.Session(profile_name=profile_name)
+
     config = Config(
         region_name=pricing_region,
         user_agent_extra=f'awslabs/mcp/{consts.MCP_SERVER_NAME}/{__version__}',
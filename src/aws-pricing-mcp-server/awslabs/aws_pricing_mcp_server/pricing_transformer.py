@@ -17,7 +17,7 @@
 import json
 import logging
 from .models import OutputOptions
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 
 logger = logging.getLogger(__name__)
@@ -56,12 +56,14 @@ def _is_free_product(pricing_item: Dict[str, Any]) -> bool:
 
 
 def transform_pricing_data(
-    pricing_json_list: List[str], output_options: Optional[OutputOptions]
+    pricing_json_list: Sequence[Union[str, Dict[str, Any]]],
+    output_options: Optional[OutputOptions],
 ) -> List[Dict[str, Any]]:
     """Filter and optimize AWS pricing data for reduced response size.
 
     Args:
-        pricing_json_list: List of JSON strings from AWS Pricing API
+        pricing_json_list: List of JSON strings from AWS Pricing API, or of already parsed
+            records from the local price list store
         output_options: Optional filtering options for pricing terms and product attributes
 
     Returns:
@@ -77,7 +79,7 @@ def transform_pricing_data(
     parsed_data = []
     for i, json_str in enumerate(pricing_json_list):
         try:
-            parsed_item = json.loads(json_str)
+            parsed_item = json.loads(json_str) if isinstance(json_str, str) else dict(json_str)
             # Remove redundant serviceCode field (optimization)
             parsed_item.pop('serviceCode', None)
             parsed_data.append(parsed_item)
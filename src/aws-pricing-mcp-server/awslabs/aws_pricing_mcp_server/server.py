@@ -17,20 +17,25 @@
 This server provides tools for analyzing AWS service costs across different user tiers.
 """
 
+import asyncio
 import re
+import sqlite3
 import sys
 from awslabs.aws_pricing_mcp_server import consts
 from awslabs.aws_pricing_mcp_server.alternative_pricing import get_pricing_alternatives
 from awslabs.aws_pricing_mcp_server.cdk_analyzer import analyze_cdk_project
+from awslabs.aws_pricing_mcp_server.discovery_cache import CATALOG_INDEX, DISCOVERY_CACHE
 from awslabs.aws_pricing_mcp_server.models import (
     ATTRIBUTE_NAMES_FIELD,
     ATTRIBUTE_VALUES_FILTERS_FIELD,
+    ATTRIBUTE_VALUES_REGION_FIELD,
     EFFECTIVE_DATE_FIELD,
     FILTERS_FIELD,
     GET_PRICING_MAX_ALLOWED_CHARACTERS_FIELD,
     MAX_RESULTS_FIELD,
     NEXT_TOKEN_FIELD,
     OUTPUT_OPTIONS_FIELD,
+    PRICE_LIST_SOURCE_FIELD,
     REGION_FIELD,
     SERVICE_ATTRIBUTES_FILTER_FIELD,
     SERVICE_CODE_FIELD,
@@ -39,6 +44,12 @@ from awslabs.aws_pricing_mcp_server.models import (
     OutputOptions,
     PricingFilter,
 )
+from awslabs.aws_pricing_mcp_server.price_list_store import (
+    build_price_list_store,
+    get_stored_attribute_values,
+    query_price_list,
+    resolve_price_list_source,
+)
 from awslabs.aws_pricing_mcp_server.pricing_client import (
     create_pricing_client,
     get_currency_for_region,
@@ -91,6 +102,7 @@ mcp = FastMCP(
        - get_pricing_attribute_values: Get possible values for a specific attribute
        - get_pricing: Get actual pricing data with optional filters
        - get_price_list_urls: Get bulk pricing data files in multiple formats (CSV, JSON) for historical pricing analysis
+       - load_price_list: Load a bulk price list into the local store so get_pricing answers from local data
 
     2. Example Discovery Flow:
        ```
@@ -420,65 +432,73 @@ async def get_pricing(
 
     logger.info(f'Getting pricing for {service_code} in {region}')
 
-    # Create pricing client with error handling
-    try:
-        pricing_client = create_pricing_client()
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='client_creation_failed',
-            message=f'Failed to create AWS Pricing client: {str(e)}',
-            service_code=service_code,
-            region=region,
-        )
-
-    # Build filters
-    try:
-        # Build region filter based on parameter type (only if region is provided)
-        api_filters = []
-        if region is not None:
-            api_filters.append(
-                {
-                    'Field': 'regionCode',
-                    'Type': 'ANY_OF' if isinstance(region, list) else 'EQUALS',
-                    'Value': ','.join(region) if isinstance(region, list) else region,
-                }
+    # Answer from the local price list store when the price lists of all regions are stored
+    response = await _query_local_price_list(
+        service_code, region, filters, max_results, next_token
+    )
+    source = 'local price list store' if response is not None else 'AWS Pricing API'
+    if response is None:
+        # Create pricing client with error handling
+        try:
+            pricing_client = create_pricing_client()
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='client_creation_failed',
+                message=f'Failed to create AWS Pricing client: {str(e)}',
+                service_code=service_code,
+                region=region,
             )
 
-        # Add any additional filters if provided
-        if filters:
-            api_filters.extend([f.model_dump(by_alias=True) for f in filters])
+        # Build filters
+        try:
+            # Build region filter based on parameter type (only if region is provided)
+            api_filters = []
+            if region is not None:
+                api_filters.append(
+                    {
+                        'Field': 'regionCode',
+                        'Type': 'ANY_OF' if isinstance(region, list) else 'EQUALS',
+                        'Value': ','.join(region) if isinstance(region, list) else region,
+                    }
+                )
 
-        # Make the API request
-        api_params = {
-            'ServiceCode': service_code,
-            'Filters': api_filters,
-            'MaxResults': max_results,
-        }
+            # Add any additional filters if provided
+            if filters:
+                api_filters.extend([f.model_dump(by_alias=True) for f in filters])
 
-        # Only include NextToken if it's provided
-        if next_token:
-            api_params['NextToken'] = next_token
+            # Make the API request
+            api_params = {
+                'ServiceCode': service_code,
+                'Filters': api_filters,
+                'MaxResults': max_results,
+            }
 
-        response = pricing_client.get_products(**api_params)
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='api_error',
-            message=f'Failed to retrieve pricing data for service "{service_code}" in region "{region}": {str(e)}',
-            service_code=service_code,
-            region=region,
-            suggestion='Verify that the service code and region combination is valid. Use get_service_codes() to get valid service codes.',
-        )
+            # Only include NextToken if it's provided
+            if next_token:
+                api_params['NextToken'] = next_token
+
+            response = pricing_client.get_products(**api_params)
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='api_error',
+                message=f'Failed to retrieve pricing data for service "{service_code}" in region "{region}": {str(e)}',
+                service_code=service_code,
+                region=region,
+                suggestion='Verify that the service code and region combination is valid. Use get_service_codes() to get valid service codes.',
+            )
 
     # Check if results are empty
     if not response.get('PriceList'):
+        known_values = _find_known_filter_values(filters)
         return await create_error_response(
             ctx=ctx,
             error_type='empty_results',
             message=f'No results found for given filters [{filters}], service: "{service_code}", region "{region}"',
             service_code=service_code,
             region=region,
+            **({'known_filter_values': known_values} if known_values else {}),
             suggestion='Try these approaches: (1) Verify that the service code is valid. Use get_service_codes() to get valid service codes. (2) Validate region and filter values using get_pricing_attribute_values(). (3) Test with fewer filters to isolate the issue.',
             examples={
                 'Example service codes': [
@@ -544,7 +564,7 @@ async def get_pricing(
         'status': 'success',
         'service_name': service_code,
         'data': price_list,
-        'message': f'Retrieved pricing for {service_code} {region_text} from AWS Pricing API{alternatives_text}',
+        'message': f'Retrieved pricing for {service_code} {region_text} from {source}{alternatives_text}',
     }
 
     if alt_pricing:
@@ -557,6 +577,62 @@ async def get_pricing(
     return result
 
 
+def _find_known_filter_values(
+    filters: Optional[List[PricingFilter]],
+) -> Dict[str, List[Dict[str, str]]]:
+    """Get the services and attributes discovered so far for each filter value."""
+    known_values = {}
+    for pricing_filter in filters or []:
+        values = pricing_filter.value
+        for value in [values] if isinstance(values, str) else values:
+            locations = CATALOG_INDEX.find_value(value)
+            if locations:
+                known_values[value] = locations
+    return known_values
+
+
+async def _query_local_price_list(
+    service_code: str,
+    region: Optional[Union[str, List[str]]],
+    filters: Optional[List[PricingFilter]],
+    max_results: int,
+    next_token: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Get products from the local price list store, or None if the API must be used."""
+    if region is None:
+        return None
+    try:
+        return await asyncio.to_thread(
+            query_price_list,
+            service_code,
+            region if isinstance(region, list) else [region],
+            filters,
+            max_results,
+            next_token,
+        )
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning(f'Falling back to the AWS Pricing API: {str(e)}')
+        return None
+
+
+async def _get_local_attribute_values(
+    service_code: str, attribute_name: str, region: Optional[Union[str, List[str]]]
+) -> Optional[List[str]]:
+    """Get attribute values from the local price list store, or None if the API must be used."""
+    if region is None:
+        return None
+    try:
+        return await asyncio.to_thread(
+            get_stored_attribute_values,
+            service_code,
+            attribute_name,
+            region if isinstance(region, list) else [region],
+        )
+    except sqlite3.Error as e:
+        logger.warning(f'Falling back to the AWS Pricing API: {str(e)}')
+        return None
+
+
 @mcp.tool(
     name='get_bedrock_patterns',
     description='Get architecture patterns for Amazon Bedrock applications, including component relationships and cost considerations',
@@ -865,39 +941,34 @@ async def get_pricing_service_codes(
     """
     logger.info('Retrieving AWS service codes from Price List API')
 
-    # Create pricing client with error handling
-    try:
-        pricing_client = create_pricing_client()
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='client_creation_failed',
-            message=f'Failed to create AWS Pricing client: {str(e)}',
-        )
-
-    # Retrieve service codes with error handling
-    try:
-        service_codes = []
-        next_token = None
-
-        # Retrieve all service codes with pagination handling
-        while True:
-            response = pricing_client.describe_services(
-                **({'NextToken': next_token} if next_token else {})
+    cache_key = ('service_codes',)
+    service_codes = DISCOVERY_CACHE.get(
+        cache_key, lambda: _fetch_service_codes(create_pricing_client())
+    )
+    if service_codes is None:
+        # Create pricing client with error handling
+        try:
+            pricing_client = create_pricing_client()
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='client_creation_failed',
+                message=f'Failed to create AWS Pricing client: {str(e)}',
             )
-            service_codes.extend([service['ServiceCode'] for service in response['Services']])
 
-            if 'NextToken' not in response:
-                break
-            next_token = response['NextToken']
+        # Retrieve service codes with error handling
+        try:
+            service_codes = _fetch_service_codes(pricing_client)
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='api_error',
+                message=f'Failed to retrieve service codes from AWS API: {str(e)}',
+                suggestion='Verify AWS credentials and permissions for pricing:DescribeServices action.',
+            )
 
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='api_error',
-            message=f'Failed to retrieve service codes from AWS API: {str(e)}',
-            suggestion='Verify AWS credentials and permissions for pricing:DescribeServices action.',
-        )
+        if service_codes:
+            DISCOVERY_CACHE.set(cache_key, service_codes)
 
     # Check for empty results
     if not service_codes:
@@ -946,6 +1017,24 @@ async def get_pricing_service_codes(
     return sorted_codes
 
 
+def _fetch_service_codes(pricing_client) -> List[str]:
+    """Retrieve all service codes with pagination handling."""
+    service_codes = []
+    next_token = None
+
+    while True:
+        response = pricing_client.describe_services(
+            **({'NextToken': next_token} if next_token else {})
+        )
+        service_codes.extend([service['ServiceCode'] for service in response['Services']])
+
+        if 'NextToken' not in response:
+            break
+        next_token = response['NextToken']
+
+    return service_codes
+
+
 @mcp.tool(
     name='get_pricing_service_attributes',
     description="""Get filterable attributes available for an AWS service in the Pricing API.
@@ -988,31 +1077,39 @@ async def get_pricing_service_attributes(
 
     logger.info(f'Retrieving attributes for AWS service: {service_code}')
 
-    # Create pricing client with error handling
-    try:
-        pricing_client = create_pricing_client()
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='client_creation_failed',
-            message=f'Failed to create AWS Pricing client: {str(e)}',
-            service_code=service_code,
-        )
+    cache_key = ('service_attributes', service_code)
+    attributes = DISCOVERY_CACHE.get(
+        cache_key, lambda: _fetch_service_attributes(create_pricing_client(), service_code)
+    )
+    if attributes is None:
+        # Create pricing client with error handling
+        try:
+            pricing_client = create_pricing_client()
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='client_creation_failed',
+                message=f'Failed to create AWS Pricing client: {str(e)}',
+                service_code=service_code,
+            )
 
-    # Get service attributes with error handling
-    try:
-        response = pricing_client.describe_services(ServiceCode=service_code)
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='api_error',
-            message=f'Failed to retrieve attributes for service "{service_code}": {str(e)}',
-            service_code=service_code,
-            suggestion='Verify that the service code is valid and AWS credentials have the required pricing:DescribeServices permissions. Use get_service_codes() to get valid service codes.',
-        )
+        # Get service attributes with error handling
+        try:
+            attributes = _fetch_service_attributes(pricing_client, service_code)
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='api_error',
+                message=f'Failed to retrieve attributes for service "{service_code}": {str(e)}',
+                service_code=service_code,
+                suggestion='Verify that the service code is valid and AWS credentials have the required pricing:DescribeServices permissions. Use get_service_codes() to get valid service codes.',
+            )
+
+        if attributes:
+            DISCOVERY_CACHE.set(cache_key, attributes)
 
     # Check if service was found
-    if not response.get('Services'):
+    if attributes is None:
         return await create_error_response(
             ctx=ctx,
             error_type='service_not_found',
@@ -1028,11 +1125,6 @@ async def get_pricing_service_attributes(
             },
         )
 
-    # Extract attribute names
-    attributes = []
-    for attr in response['Services'][0].get('AttributeNames', []):
-        attributes.append(attr)
-
     # Check for empty results
     if not attributes:
         return await create_error_response(
@@ -1088,6 +1180,17 @@ async def get_pricing_service_attributes(
     return sorted_attributes
 
 
+def _fetch_service_attributes(pricing_client, service_code: str) -> Optional[List[str]]:
+    """Retrieve the attribute names of a service, or None if the service was not found."""
+    response = pricing_client.describe_services(ServiceCode=service_code)
+    if not response.get('Services'):
+        return None
+
+    attributes = list(response['Services'][0].get('AttributeNames', []))
+    CATALOG_INDEX.add_service_attributes(service_code, attributes)
+    return attributes
+
+
 class AttributeValuesError(Exception):
     """Custom exception for attribute values retrieval errors."""
 
@@ -1122,32 +1225,7 @@ async def _get_single_attribute_values(
         AttributeValuesError: When API calls fail or no values are found
     """
     try:
-        # Get attribute values with pagination handling
-        values = []
-        next_token = None
-
-        while True:
-            if next_token:
-                response = pricing_client.get_attribute_values(
-                    ServiceCode=service_code,
-                    AttributeName=attribute_name,
-                    MaxResults=10000,
-                    NextToken=next_token,
-                )
-            else:
-                response = pricing_client.get_attribute_values(
-                    ServiceCode=service_code, AttributeName=attribute_name, MaxResults=10000
-                )
-
-            for attr_value in response.get('AttributeValues', []):
-                if 'Value' in attr_value:
-                    values.append(attr_value['Value'])
-
-            if 'NextToken' in response:
-                next_token = response['NextToken']
-            else:
-                break
-
+        values = _fetch_attribute_values(pricing_client, service_code, attribute_name)
     except Exception as e:
         raise AttributeValuesError(
             error_type='api_error',
@@ -1159,6 +1237,8 @@ async def _get_single_attribute_values(
 
     # Check if no values were found
     if not values:
+        # Point to services known to have the attribute, if any were discovered before
+        known_services = CATALOG_INDEX.services_with_attribute(attribute_name)
         raise AttributeValuesError(
             error_type='no_attribute_values_found',
             message=f'No values found for attribute "{attribute_name}" of service "{service_code}". This could be due to an invalid service code or an invalid attribute name for this service.',
@@ -1174,11 +1254,52 @@ async def _get_single_attribute_values(
                     'engineCode',
                 ],
             },
+            **({'services_with_attribute': known_services} if known_services else {}),
         )
 
+    DISCOVERY_CACHE.set(('attribute_values', service_code, attribute_name), values)
+    return values
+
+
+def _fetch_attribute_values(pricing_client, service_code: str, attribute_name: str) -> List[str]:
+    """Retrieve the sorted values of an attribute with pagination handling."""
+    values = []
+    next_token = None
+
+    while True:
+        if next_token:
+            response = pricing_client.get_attribute_values(
+                ServiceCode=service_code,
+                AttributeName=attribute_name,
+                MaxResults=10000,
+                NextToken=next_token,
+            )
+        else:
+            response = pricing_client.get_attribute_values(
+                ServiceCode=service_code, AttributeName=attribute_name, MaxResults=10000
+            )
+
+        for attr_value in response.get('AttributeValues', []):
+            if 'Value' in attr_value:
+                values.append(attr_value['Value'])
+
+        if 'NextToken' in response:
+            next_token = response['NextToken']
+        else:
+            break
+
+    CATALOG_INDEX.add_attribute_values(service_code, attribute_name, values)
     return sorted(values)
 
 
+def _get_cached_attribute_values(service_code: str, attribute_name: str) -> Optional[List[str]]:
+    """Get attribute values from the discovery cache, refreshing them when stale."""
+    return DISCOVERY_CACHE.get(
+        ('attribute_values', service_code, attribute_name),
+        lambda: _fetch_attribute_values(create_pricing_client(), service_code, attribute_name),
+    )
+
+
 @mcp.tool(
     name='get_pricing_attribute_values',
     description="""Get valid values for pricing filter attributes.
@@ -1191,6 +1312,7 @@ async def _get_single_attribute_values(
     - Service code from get_pricing_service_codes() (e.g., 'AmazonEC2', 'AmazonRDS')
     - List of attribute names from get_pricing_service_attributes() (e.g., ['instanceType', 'location'])
     - filters (optional): Dictionary mapping attribute names to regex patterns (e.g., {'instanceType': 't3'})
+    - region (optional): Region(s) to get values of from price lists loaded with load_price_list(). Omit to get the values of all regions.
 
     **RETURNS:** Dictionary mapping attribute names to their valid values. Filtered attributes return only matching values, unfiltered attributes return all values.
 
@@ -1217,6 +1339,7 @@ async def get_pricing_attribute_values(
     service_code: str = SERVICE_CODE_FIELD,
     attribute_names: List[str] = ATTRIBUTE_NAMES_FIELD,
     filters: Optional[Dict[str, str]] = ATTRIBUTE_VALUES_FILTERS_FIELD,
+    region: Optional[Union[str, List[str]]] = ATTRIBUTE_VALUES_REGION_FIELD,
 ) -> Union[Dict[str, List[str]], Dict[str, Any]]:
     """Retrieve all possible values for specific attributes of an AWS service.
 
@@ -1224,6 +1347,7 @@ async def get_pricing_attribute_values(
         service_code: The service code to query (e.g., 'AmazonEC2', 'AmazonS3')
         attribute_names: List of attribute names to get values for (e.g., ['instanceType', 'location'])
         filters: Optional dictionary mapping attribute names to regex patterns for filtering
+        region: Optional region(s) to get the values of from the local price list store
         ctx: MCP context for logging and state management
 
     Returns:
@@ -1231,6 +1355,8 @@ async def get_pricing_attribute_values(
     """
     if isinstance(filters, FieldInfo):
         filters = filters.default
+    if isinstance(region, FieldInfo):
+        region = region.default
 
     if not attribute_names:
         return await create_error_response(
@@ -1246,17 +1372,27 @@ async def get_pricing_attribute_values(
         f'Retrieving values for {len(attribute_names)} attributes of service: {service_code}'
     )
 
+    # Values in the stored price lists of the requested regions are read from the local store,
+    # other values from the discovery cache
+    cached_values = {
+        attribute_name: await _get_local_attribute_values(service_code, attribute_name, region)
+        or _get_cached_attribute_values(service_code, attribute_name)
+        for attribute_name in attribute_names
+    }
+
     # Create pricing client with error handling
-    try:
-        pricing_client = create_pricing_client()
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='client_creation_failed',
-            message=f'Failed to create AWS Pricing client: {str(e)}',
-            service_code=service_code,
-            attribute_names=attribute_names,
-        )
+    pricing_client = None
+    if any(values is None for values in cached_values.values()):
+        try:
+            pricing_client = create_pricing_client()
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='client_creation_failed',
+                message=f'Failed to create AWS Pricing client: {str(e)}',
+                service_code=service_code,
+                attribute_names=attribute_names,
+            )
 
     # Process each attribute - all-or-nothing approach
     result = {}
@@ -1264,9 +1400,11 @@ async def get_pricing_attribute_values(
         logger.debug(f'Processing attribute: {attribute_name}')
 
         try:
-            values_result = await _get_single_attribute_values(
-                pricing_client, service_code, attribute_name
-            )
+            values_result = cached_values[attribute_name]
+            if values_result is None:
+                values_result = await _get_single_attribute_values(
+                    pricing_client, service_code, attribute_name
+                )
 
             # Apply filtering if a filter is provided for this attribute
             if filters and attribute_name in filters:
@@ -1501,6 +1639,99 @@ async def get_price_list_urls(
     return result['urls']
 
 
+@mcp.tool(
+    name='load_price_list',
+    description="""Load a bulk price list into the local price list store.
+
+    **PURPOSE:** Answer get_pricing() and get_pricing_attribute_values() from local data instead of the AWS Pricing API.
+
+    **WORKFLOW:** Use this once per service and region before running many pricing queries against them (e.g., paging through EC2 instance types or comparing many configurations).
+
+    **PARAMETERS:**
+    - Service code from get_pricing_service_codes() (e.g., 'AmazonEC2', 'AmazonS3')
+    - AWS region (e.g., 'us-east-1', 'eu-west-1')
+    - Optional: source URL from get_price_list_urls(), or path of a JSON bulk price list file under PRICING_SOURCE_DIR (default: the current price list from get_price_list_urls())
+
+    **RETURNS:** Number of stored products, version and publication date of the price list.
+
+    **BEHAVIOR:**
+    - get_pricing() queries for regions whose price lists are all stored are answered locally, with 'local:' pagination tokens
+    - get_pricing_attribute_values() with a region returns the values found in its stored price list
+    - Stored price lists older than PRICING_STORE_MAX_AGE_DAYS (default: 7) are ignored until loaded again
+    - Large services take a while to load (the EC2 price list of a region is several gigabytes)
+    """,
+)
+async def load_price_list(
+    ctx: Context,
+    service_code: str = SERVICE_CODE_FIELD,
+    region: str = Field(..., description='AWS region (e.g., "us-east-1", "eu-west-1")'),
+    source: Optional[str] = PRICE_LIST_SOURCE_FIELD,
+) -> Dict[str, Any]:
+    """Load a JSON bulk price list file into the local price list store.
+
+    Args:
+        ctx: MCP context for logging and state management
+        service_code: AWS service code (e.g., 'AmazonEC2', 'AmazonS3')
+        region: AWS region (e.g., 'us-east-1')
+        source: URL from get_price_list_urls, or path of a JSON bulk price list file under
+            PRICING_SOURCE_DIR (default: current price list)
+
+    Returns:
+        Dictionary describing the stored price list, or error dictionary on failure
+    """
+    if isinstance(source, FieldInfo):
+        source = source.default
+
+    if source is None:
+        urls = await get_price_list_urls(ctx, service_code, region, None)
+        if urls.get('status') == 'error':
+            return urls
+        if 'json' not in urls:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='json_format_unavailable',
+                message=f'No JSON price list file is available for service "{service_code}" in region "{region}"',
+                service_code=service_code,
+                region=region,
+                available_formats=list(urls),
+            )
+        source = str(urls['json'])
+
+    try:
+        resolved_source = resolve_price_list_source(source)
+    except ValueError as e:
+        return await create_error_response(
+            ctx=ctx,
+            error_type='invalid_price_list_source',
+            message=str(e),
+            service_code=service_code,
+            region=region,
+            suggestion='Omit the source to load the current price list, or use a URL returned by get_price_list_urls(). Local files must be under the PRICING_SOURCE_DIR directory.',
+        )
+
+    try:
+        stored = await asyncio.to_thread(
+            build_price_list_store, service_code, region, resolved_source
+        )
+    except Exception as e:
+        return await create_error_response(
+            ctx=ctx,
+            error_type='price_list_load_failed',
+            message=f'Failed to load price list of service "{service_code}" in region "{region}": {str(e)}',
+            service_code=service_code,
+            region=region,
+            suggestion='Verify that the source is a JSON bulk price list file. Use get_price_list_urls() to get the URL of the current price list.',
+        )
+
+    await ctx.info(f'Stored {stored["product_count"]} products of {service_code} in {region}')
+
+    return {
+        'status': 'success',
+        **stored,
+        'message': f'Stored the price list of {service_code} in {region}. get_pricing() queries for this service and region are now answered locally.',
+    }
+
+
 def main():
     """Run the MCP server with CLI argument support."""
     mcp.run()
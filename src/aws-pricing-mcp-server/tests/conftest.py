@@ -22,6 +22,30 @@ from typing import Any, Dict, Generator
 from unittest.mock import AsyncMock, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def price_list_store_dir(tmp_path, monkeypatch):
+    """Keep the local price list store of each test in a temporary directory."""
+    from awslabs.aws_pricing_mcp_server import consts
+
+    store_dir = str(tmp_path / 'price-lists')
+    monkeypatch.setattr(consts, 'PRICING_STORE_DIR', store_dir)
+    monkeypatch.setattr(consts, 'PRICING_SOURCE_DIR', str(tmp_path))
+    return store_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_state():
+    """Start each test without cached pricing clients and discovery responses."""
+    from awslabs.aws_pricing_mcp_server.discovery_cache import clear_discovery_cache
+    from awslabs.aws_pricing_mcp_server.pricing_client import clear_pricing_clients
+
+    clear_pricing_clients()
+    clear_discovery_cache()
+    yield
+    clear_pricing_clients()
+    clear_discovery_cache()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock MCP context."""
@@ -0,0 +1,271 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the discovery_cache module of the aws-pricing-mcp-server."""
+
+import asyncio
+import pytest
+from awslabs.aws_pricing_mcp_server.discovery_cache import (
+    CATALOG_INDEX,
+    DISCOVERY_CACHE,
+    CatalogIndex,
+    DiscoveryCache,
+)
+from awslabs.aws_pricing_mcp_server.models import PricingFilter
+from awslabs.aws_pricing_mcp_server.pricing_client import create_pricing_client
+from awslabs.aws_pricing_mcp_server.server import (
+    get_pricing,
+    get_pricing_attribute_values,
+    get_pricing_service_attributes,
+    get_pricing_service_codes,
+)
+from unittest.mock import MagicMock, patch
+
+
+def _age(cache, key, seconds):
+    """Make a cache entry older by a number of seconds."""
+    timestamp, value = cache._entries[key]
+    cache._entries[key] = (timestamp - seconds, value)
+
+
+async def _wait_for_refresh(cache):
+    """Wait until background refreshes of the cache are done."""
+    while cache._tasks:
+        await asyncio.gather(*cache._tasks)
+
+
+class TestDiscoveryCache:
+    """Tests for the DiscoveryCache class."""
+
+    def test_fresh_entry(self):
+        """Test that fresh entries are returned as copies without refreshing."""
+        cache = DiscoveryCache(ttl_seconds=60, stale_seconds=60)
+        refresh = MagicMock()
+
+        assert cache.get('key', refresh) is None
+        cache.set('key', ['a', 'b'])
+        value = cache.get('key', refresh)
+        assert value == ['a', 'b']
+        assert value is not None
+        value.append('c')
+
+        assert cache.get('key', refresh) == ['a', 'b']
+        refresh.assert_not_called()
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_expired_entry(self):
+        """Test that entries older than the TTL and stale period are discarded."""
+        cache = DiscoveryCache(ttl_seconds=60, stale_seconds=60)
+        cache.set('key', ['a'])
+        _age(cache, 'key', 121)
+
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        """Test that a TTL of 0 disables the cache."""
+        cache = DiscoveryCache(ttl_seconds=0)
+        cache.set('key', ['a'])
+
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_refreshed_in_background(self):
+        """Test that a stale entry is served while a single refresh runs."""
+        cache = DiscoveryCache(ttl_seconds=60, stale_seconds=60)
+        cache.set('key', ['old'])
+        _age(cache, 'key', 90)
+        refresh = MagicMock(return_value=['new'])
+
+        assert cache.get('key', refresh) == ['old']
+        assert cache.get('key', refresh) == ['old']
+        await _wait_for_refresh(cache)
+
+        refresh.assert_called_once()
+        assert cache.get('key', refresh) == ['new']
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_entry(self):
+        """Test that a failed refresh keeps serving the stale entry."""
+        cache = DiscoveryCache(ttl_seconds=60, stale_seconds=60)
+        cache.set('key', ['old'])
+        _age(cache, 'key', 90)
+
+        assert cache.get('key', MagicMock(side_effect=Exception('Throttled'))) == ['old']
+        await _wait_for_refresh(cache)
+
+        refresh = MagicMock(return_value=['new'])
+        assert cache.get('key', refresh) == ['old']
+        await _wait_for_refresh(cache)
+        refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_value_keeps_entry(self):
+        """Test that a refresh finding no value keeps serving the stale entry."""
+        cache = DiscoveryCache(ttl_seconds=60, stale_seconds=60)
+        cache.set('key', ['old'])
+        _age(cache, 'key', 90)
+
+        assert cache.get('key', MagicMock(return_value=None)) == ['old']
+        await _wait_for_refresh(cache)
+
+        assert cache.get('key') == ['old']
+
+
+class TestCatalogIndex:
+    """Tests for the CatalogIndex class."""
+
+    def test_lookups(self):
+        """Test looking up services by attribute and attributes by value."""
+        index = CatalogIndex()
+        index.add_service_attributes('AmazonEC2', ['instanceType', 'location'])
+        index.add_attribute_values('AmazonRDS', 'instanceType', ['db.t3.medium'])
+        index.add_attribute_values('AmazonEC2', 'instanceType', ['t3.medium', 'm5.large'])
+        index.add_attribute_values('AmazonEC2', 'location', ['US East (N. Virginia)'])
+        index.add_attribute_values('AmazonS3', 'location', ['US East (N. Virginia)'])
+
+        assert index.services_with_attribute('instanceType') == ['AmazonEC2', 'AmazonRDS']
+        assert index.services_with_attribute('storageClass') == []
+        assert index.find_value('T3.MEDIUM') == [
+            {'service_code': 'AmazonEC2', 'attribute_name': 'instanceType'}
+        ]
+        assert index.find_value('US East (N. Virginia)') == [
+            {'service_code': 'AmazonEC2', 'attribute_name': 'location'},
+            {'service_code': 'AmazonS3', 'attribute_name': 'location'},
+        ]
+
+        index.clear()
+        assert index.find_value('t3.medium') == []
+
+
+@pytest.fixture
+def pricing_client():
+    """Create a pricing client answering discovery requests."""
+    client = MagicMock()
+
+    def describe_services(**kwargs):
+        if 'ServiceCode' in kwargs:
+            return {
+                'Services': [
+                    {'ServiceCode': kwargs['ServiceCode'], 'AttributeNames': ['instanceType']}
+                ]
+            }
+        return {'Services': [{'ServiceCode': 'AmazonEC2'}, {'ServiceCode': 'AWSLambda'}]}
+
+    client.describe_services.side_effect = describe_services
+    client.get_attribute_values.return_value = {
+        'AttributeValues': [{'Value': 't3.medium'}, {'Value': 't3.micro'}, {'Value': 'm5.large'}]
+    }
+    client.get_products.return_value = {'PriceList': []}
+    with patch('awslabs.aws_pricing_mcp_server.server.create_pricing_client', return_value=client):
+        yield client
+
+
+class TestCachedDiscoveryTools:
+    """Tests for the discovery tools answering from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_service_codes_cached(self, pricing_client, mock_context):
+        """Test that service codes are retrieved from the API once."""
+        first = await get_pricing_service_codes(mock_context, filter=None)
+        second = await get_pricing_service_codes(mock_context, filter='Lambda')
+
+        assert pricing_client.describe_services.call_count == 1
+        assert first == ['AWSLambda', 'AmazonEC2']
+        assert second == ['AWSLambda']
+
+    @pytest.mark.asyncio
+    async def test_service_attributes_cached(self, pricing_client, mock_context):
+        """Test that service attributes are retrieved from the API once per service."""
+        first = await get_pricing_service_attributes(mock_context, 'AmazonEC2')
+        second = await get_pricing_service_attributes(mock_context, 'AmazonEC2')
+        await get_pricing_service_attributes(mock_context, 'AmazonRDS')
+
+        assert first == second == ['instanceType']
+        assert pricing_client.describe_services.call_count == 2
+        assert CATALOG_INDEX.services_with_attribute('instanceType') == [
+            'AmazonEC2',
+            'AmazonRDS',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_attribute_values_cached(self, pricing_client, mock_context):
+        """Test that cached attribute values do not call the API."""
+        first = await get_pricing_attribute_values(mock_context, 'AmazonEC2', ['instanceType'])
+        second = await get_pricing_attribute_values(
+            mock_context, 'AmazonEC2', ['instanceType'], {'instanceType': '^t3'}
+        )
+
+        pricing_client.get_attribute_values.assert_called_once()
+        assert first == {'instanceType': ['m5.large', 't3.medium', 't3.micro']}
+        assert second == {'instanceType': ['t3.medium', 't3.micro']}
+
+    @pytest.mark.asyncio
+    async def test_stale_service_codes_refreshed(self, pricing_client, mock_context):
+        """Test that stale service codes are returned and refreshed in the background."""
+        await get_pricing_service_codes(mock_context, filter=None)
+        _age(DISCOVERY_CACHE, ('service_codes',), DISCOVERY_CACHE.ttl_seconds + 1)
+        pricing_client.describe_services.side_effect = None
+        pricing_client.describe_services.return_value = {'Services': [{'ServiceCode': 'AmazonS3'}]}
+
+        assert await get_pricing_service_codes(mock_context, filter=None) == [
+            'AWSLambda',
+            'AmazonEC2',
+        ]
+        await _wait_for_refresh(DISCOVERY_CACHE)
+
+        assert await get_pricing_service_codes(mock_context, filter=None) == ['AmazonS3']
+        assert pricing_client.describe_services.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_pricing_points_to_known_values(self, pricing_client, mock_context):
+        """Test that empty pricing results list the attributes a filter value belongs to."""
+        await get_pricing_attribute_values(mock_context, 'AmazonEC2', ['instanceType'])
+
+        result = await get_pricing(
+            mock_context,
+            'AmazonEC2',
+            'us-east-1',
+            [PricingFilter(Field='usagetype', Type='EQUALS', Value='t3.medium')],
+        )
+
+        assert result['error_type'] == 'empty_results'
+        assert result['known_filter_values'] == {
+            't3.medium': [{'service_code': 'AmazonEC2', 'attribute_name': 'instanceType'}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_missing_values_point_to_known_services(self, pricing_client, mock_context):
+        """Test that attributes without values list the services known to have them."""
+        await get_pricing_service_attributes(mock_context, 'AmazonEC2')
+        pricing_client.get_attribute_values.return_value = {'AttributeValues': []}
+
+        result = await get_pricing_attribute_values(mock_context, 'AmazonS3', ['instanceType'])
+
+        assert result['error_type'] == 'no_attribute_values_found'
+        assert result['services_with_attribute'] == ['AmazonEC2']
+
+
+def test_pricing_client_shared():
+    """Test that pricing clients are created once per profile and region."""
+    with patch('awslabs.aws_pricing_mcp_server.pricing_client.boto3.Session') as mock_session:
+        mock_session.return_value.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        first = create_pricing_client(region='us-east-1')
+        assert create_pricing_client(region='us-west-2') is first
+        other = create_pricing_client(region='eu-west-1')
+
+    assert other is not first
+    assert mock_session.call_count == 2
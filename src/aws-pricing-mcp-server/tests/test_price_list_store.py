@@ -0,0 +1,420 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the price_list_store module of the aws-pricing-mcp-server."""
+
+import http.client
+import io
+import json
+import os
+import pytest
+import time
+import urllib.request
+from awslabs.aws_pricing_mcp_server import price_list_store
+from awslabs.aws_pricing_mcp_server.models import PricingFilter
+from awslabs.aws_pricing_mcp_server.price_list_store import (
+    _JsonObjectStream,
+    build_price_list_store,
+    find_price_list,
+    get_store_path,
+    get_stored_attribute_values,
+    query_price_list,
+    resolve_price_list_source,
+)
+from awslabs.aws_pricing_mcp_server.pricing_transformer import transform_pricing_data
+from awslabs.aws_pricing_mcp_server.server import (
+    get_pricing,
+    get_pricing_attribute_values,
+    load_price_list,
+)
+from unittest.mock import patch
+
+
+INSTANCE_TYPES = ['t3.micro', 't3.medium', 'm5.large', 'c5.xlarge']
+
+
+def _offer_file(region):
+    """Create a bulk price list offer file with one product per instance type."""
+    products = {}
+    terms = {}
+    for i, instance_type in enumerate(INSTANCE_TYPES):
+        sku = f'{region.upper()}-SKU{i}'
+        products[sku] = {
+            'sku': sku,
+            'productFamily': 'Compute Instance',
+            'attributes': {
+                'instanceType': instance_type,
+                'regionCode': region,
+                'operatingSystem': 'Linux' if i % 2 == 0 else 'Windows',
+            },
+        }
+        terms[sku] = {
+            f'{sku}.TERM': {
+                'offerTermCode': 'TERM',
+                'sku': sku,
+                'priceDimensions': {
+                    f'{sku}.TERM.DIM': {
+                        'unit': 'Hrs',
+                        'pricePerUnit': {'USD': f'0.{i + 1}'},
+                    }
+                },
+            }
+        }
+    return {
+        'formatVersion': 'v1.0',
+        'offerCode': 'AmazonEC2',
+        'version': '20250101000000',
+        'publicationDate': '2025-01-01T00:00:00Z',
+        'products': products,
+        'terms': {'OnDemand': terms},
+    }
+
+
+@pytest.fixture
+def offer_file(tmp_path):
+    """Write an offer file for us-east-1 and return its path."""
+    path = tmp_path / 'us-east-1.json'
+    path.write_text(json.dumps(_offer_file('us-east-1'), indent=2))
+    return str(path)
+
+
+@pytest.fixture
+def stored_price_list(offer_file):
+    """Load the us-east-1 offer file into the store."""
+    return build_price_list_store('AmazonEC2', 'us-east-1', offer_file)
+
+
+def _instance_types(response):
+    return [item['product']['attributes']['instanceType'] for item in response['PriceList']]
+
+
+class TestJsonObjectStream:
+    """Tests for the incremental JSON reader."""
+
+    def test_small_chunks(self, monkeypatch):
+        """Test that values split across read chunks are decoded."""
+        monkeypatch.setattr(price_list_store, '_READ_CHUNK_SIZE', 3)
+        stream = _JsonObjectStream(
+            io.StringIO('{"a": 12345, "b": {"c": [1, 2]}, "d": {"e": "f"}, "g": {}}')
+        )
+
+        keys = []
+        for key in stream.iter_object():
+            keys.append(key)
+            if key in ('d', 'g'):
+                keys.append({inner: stream.read_value() for inner in stream.iter_object()})
+            else:
+                keys.append(stream.read_value())
+
+        assert keys == ['a', 12345, 'b', {'c': [1, 2]}, 'd', {'e': 'f'}, 'g', {}]
+
+    def test_truncated_document(self):
+        """Test that a truncated document is reported as invalid."""
+        stream = _JsonObjectStream(io.StringIO('{"a": 1, '))
+
+        with pytest.raises(ValueError):
+            for _ in stream.iter_object():
+                stream.read_value()
+
+
+class TestBuildPriceListStore:
+    """Tests for loading bulk price list files."""
+
+    def test_build(self, stored_price_list, price_list_store_dir):
+        """Test that products and metadata of the offer file are stored."""
+        assert stored_price_list['product_count'] == len(INSTANCE_TYPES)
+        assert stored_price_list['version'] == '20250101000000'
+        assert stored_price_list['publication_date'] == '2025-01-01T00:00:00Z'
+        assert stored_price_list['path'] == os.path.join(
+            price_list_store_dir, 'AmazonEC2', 'us-east-1.db'
+        )
+        assert find_price_list('AmazonEC2', 'us-east-1') == stored_price_list['path']
+        assert not os.path.exists(f'{stored_price_list["path"]}.tmp')
+
+    def test_invalid_file_keeps_previous_store(self, stored_price_list, tmp_path):
+        """Test that a failed load leaves the stored price list in place."""
+        invalid = tmp_path / 'invalid.json'
+        invalid.write_text('{"products": {"SKU": ')
+
+        with pytest.raises(ValueError):
+            build_price_list_store('AmazonEC2', 'us-east-1', str(invalid))
+
+        assert find_price_list('AmazonEC2', 'us-east-1') == stored_price_list['path']
+        assert not os.path.exists(f'{stored_price_list["path"]}.tmp')
+
+    @pytest.mark.parametrize(
+        'source',
+        [
+            'http://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/index.json',
+            'https://pricing.us-east-1.amazonaws.com.example.com/index.json',
+            'https://169.254.169.254/latest/meta-data/',
+            'file:///etc/passwd',
+            '/etc/passwd',
+            '../outside.json',
+        ],
+    )
+    def test_rejected_sources(self, source):
+        """Test that only price list URLs and files under the source directory are loaded."""
+        with pytest.raises(ValueError):
+            build_price_list_store('AmazonEC2', 'us-east-1', source)
+
+    def test_accepted_sources(self, tmp_path, monkeypatch):
+        """Test that price list URLs and files under the source directory are accepted."""
+        url = 'https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/index.json'
+        assert resolve_price_list_source(url) == url
+        assert resolve_price_list_source('us-east-1.json') == str(tmp_path / 'us-east-1.json')
+
+        monkeypatch.setattr(price_list_store.consts, 'PRICING_SOURCE_DIR', None)
+        with pytest.raises(ValueError):
+            resolve_price_list_source(str(tmp_path / 'us-east-1.json'))
+
+    def test_redirect_off_pricing_host_refused(self):
+        """Test that downloads are not redirected away from the price list hosts."""
+        handler = price_list_store._PricingRedirectHandler()
+        request = urllib.request.Request('https://pricing.us-east-1.amazonaws.com/index.json')
+
+        with pytest.raises(ValueError):
+            handler.redirect_request(
+                request,
+                io.BytesIO(),
+                302,
+                'Found',
+                http.client.HTTPMessage(),
+                'http://169.254.169.254/latest/',
+            )
+
+    def test_invalid_names(self):
+        """Test that service codes and regions must be usable as file names."""
+        with pytest.raises(ValueError):
+            get_store_path('../AmazonEC2', 'us-east-1')
+        assert find_price_list('AmazonEC2', 'us-east-1/..') is None
+
+    def test_stale_store_ignored(self, stored_price_list):
+        """Test that price lists older than the maximum age are not used."""
+        old = time.time() - 30 * 86400
+        os.utime(stored_price_list['path'], (old, old))
+
+        assert find_price_list('AmazonEC2', 'us-east-1') is None
+        assert query_price_list('AmazonEC2', ['us-east-1']) is None
+
+
+class TestQueryPriceList:
+    """Tests for querying stored price lists."""
+
+    @pytest.mark.parametrize(
+        'filter_type,value,expected',
+        [
+            ('EQUALS', 't3.medium', ['t3.medium']),
+            ('TERM_MATCH', 'T3.MEDIUM', ['t3.medium']),
+            ('ANY_OF', ['m5.large', 'c5.xlarge'], ['c5.xlarge', 'm5.large']),
+            ('ANY_OF', 'm5.large,c5.xlarge', ['c5.xlarge', 'm5.large']),
+            ('NONE_OF', ['t3.micro', 't3.medium'], ['c5.xlarge', 'm5.large']),
+            ('CONTAINS', 't3', ['t3.medium', 't3.micro']),
+            ('CONTAINS', '%', []),
+        ],
+    )
+    def test_filters(self, stored_price_list, filter_type, value, expected):
+        """Test that filters of every type match the same products as the API."""
+        response = query_price_list(
+            'AmazonEC2',
+            ['us-east-1'],
+            [PricingFilter(Field='instanceType', Type=filter_type, Value=value)],
+        )
+
+        assert response is not None
+        assert sorted(_instance_types(response)) == expected
+        assert 'NextToken' not in response
+
+    def test_items_include_terms(self, stored_price_list):
+        """Test that items have the shape of GetProducts price list items."""
+        response = query_price_list(
+            'AmazonEC2',
+            ['us-east-1'],
+            [PricingFilter(Field='productFamily', Type='EQUALS', Value='Compute Instance')],
+            max_results=1,
+        )
+
+        assert response is not None
+        item = response['PriceList'][0]
+        assert item['product']['sku'] == 'US-EAST-1-SKU0'
+        assert 'US-EAST-1-SKU0.TERM' in item['terms']['OnDemand']
+        assert item['version'] == '20250101000000'
+
+    def test_pagination_across_regions(self, offer_file, tmp_path):
+        """Test that local pagination tokens page through all requested regions."""
+        build_price_list_store('AmazonEC2', 'us-east-1', offer_file)
+        west = tmp_path / 'us-west-2.json'
+        west.write_text(json.dumps(_offer_file('us-west-2')))
+        build_price_list_store('AmazonEC2', 'us-west-2', str(west))
+
+        skus = []
+        next_token = None
+        while True:
+            response = query_price_list(
+                'AmazonEC2', ['us-east-1', 'us-west-2'], max_results=3, next_token=next_token
+            )
+            assert response is not None
+            skus.extend(item['product']['sku'] for item in response['PriceList'])
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
+            assert next_token.startswith('local:')
+
+        assert len(skus) == 2 * len(INSTANCE_TYPES)
+        assert len(set(skus)) == len(skus)
+
+    def test_missing_region_or_api_token(self, stored_price_list):
+        """Test that queries the store cannot answer are left to the API."""
+        assert query_price_list('AmazonEC2', ['us-east-1', 'eu-west-1']) is None
+        assert query_price_list('AmazonEC2', ['us-east-1'], next_token='api-token') is None
+        assert query_price_list('AmazonS3', ['us-east-1']) is None
+
+    def test_unsupported_filter_type(self, stored_price_list):
+        """Test that unknown filter types are rejected."""
+        pricing_filter = PricingFilter(Field='instanceType', Type='EQUALS', Value='t3.micro')
+        pricing_filter.type = 'GREATER_THAN'  # type: ignore[assignment]
+
+        with pytest.raises(ValueError, match='Unsupported filter type'):
+            query_price_list('AmazonEC2', ['us-east-1'], [pricing_filter])
+
+    def test_attribute_values(self, stored_price_list):
+        """Test that attribute values are read from the stored price lists of the regions."""
+        assert get_stored_attribute_values('AmazonEC2', 'instanceType', ['us-east-1']) == sorted(
+            INSTANCE_TYPES
+        )
+        assert get_stored_attribute_values('AmazonEC2', 'regionCode', ['us-east-1']) == [
+            'us-east-1'
+        ]
+        assert get_stored_attribute_values('AmazonEC2', 'unknownAttribute', ['us-east-1']) is None
+        assert (
+            get_stored_attribute_values('AmazonEC2', 'instanceType', ['us-east-1', 'eu-west-1'])
+            is None
+        )
+        assert get_stored_attribute_values('AmazonEC2', 'instanceType', []) is None
+        assert get_stored_attribute_values('AmazonS3', 'instanceType', ['us-east-1']) is None
+
+    def test_transform_parsed_items(self, stored_price_list):
+        """Test that parsed items are transformed like API price list strings."""
+        response = query_price_list('AmazonEC2', ['us-east-1'])
+        assert response is not None
+
+        transformed = transform_pricing_data(response['PriceList'], None)
+
+        assert transformed == transform_pricing_data(
+            [json.dumps(item) for item in response['PriceList']], None
+        )
+
+
+class TestLocalPricingTools:
+    """Tests for tools answering from the local price list store."""
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_from_store(self, stored_price_list, mock_context):
+        """Test that get_pricing does not call the API for stored regions."""
+        with patch('awslabs.aws_pricing_mcp_server.server.create_pricing_client') as client:
+            result = await get_pricing(
+                mock_context,
+                'AmazonEC2',
+                'us-east-1',
+                [PricingFilter(Field='instanceType', Type='EQUALS', Value='m5.large')],
+            )
+
+        client.assert_not_called()
+        assert result['status'] == 'success'
+        assert 'local price list store' in result['message']
+        assert len(result['data']) == 1
+        assert result['data'][0]['product']['attributes']['instanceType'] == 'm5.large'
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_falls_back_to_api(
+        self, stored_price_list, mock_boto3, mock_context
+    ):
+        """Test that regions without a stored price list are queried through the API."""
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing(mock_context, 'AmazonEC2', ['us-east-1', 'eu-west-1'])
+
+        assert result['status'] == 'success'
+        assert 'AWS Pricing API' in result['message']
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_attribute_values_from_store(self, stored_price_list, mock_context):
+        """Test that stored attribute values of a region are filtered without calling the API."""
+        with patch('awslabs.aws_pricing_mcp_server.server.create_pricing_client') as client:
+            result = await get_pricing_attribute_values(
+                mock_context, 'AmazonEC2', ['instanceType'], {'instanceType': '^t3'}, 'us-east-1'
+            )
+
+        client.assert_not_called()
+        assert result == {'instanceType': ['t3.medium', 't3.micro']}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('region', [None, ['us-east-1', 'eu-west-1']])
+    async def test_get_pricing_attribute_values_falls_back_to_api(
+        self, stored_price_list, mock_context, region
+    ):
+        """Test that values of all regions come from the API unless the regions are stored."""
+        with patch('awslabs.aws_pricing_mcp_server.server.create_pricing_client') as create_client:
+            create_client.return_value.get_attribute_values.return_value = {
+                'AttributeValues': [{'Value': 'us-east-1'}, {'Value': 'eu-west-1'}]
+            }
+            result = await get_pricing_attribute_values(
+                mock_context, 'AmazonEC2', ['regionCode'], None, region
+            )
+
+        assert result == {'regionCode': ['eu-west-1', 'us-east-1']}
+
+    @pytest.mark.asyncio
+    async def test_load_price_list(self, offer_file, mock_context):
+        """Test loading a price list from a local file."""
+        result = await load_price_list(mock_context, 'AmazonEC2', 'us-east-1', offer_file)
+
+        assert result['status'] == 'success'
+        assert result['product_count'] == len(INSTANCE_TYPES)
+        assert find_price_list('AmazonEC2', 'us-east-1') == result['path']
+
+    @pytest.mark.asyncio
+    async def test_load_price_list_current_url(self, offer_file, mock_context):
+        """Test that the JSON file of the current price list is loaded by default."""
+        with patch(
+            'awslabs.aws_pricing_mcp_server.server.get_price_list_urls',
+            return_value={'csv': 'https://example.com/index.csv', 'json': offer_file},
+        ) as get_urls:
+            result = await load_price_list(mock_context, 'AmazonEC2', 'us-east-1')
+
+        get_urls.assert_called_once_with(mock_context, 'AmazonEC2', 'us-east-1', None)
+        assert result['status'] == 'success'
+
+    @pytest.mark.asyncio
+    async def test_load_price_list_invalid_source(self, tmp_path, mock_context):
+        """Test that a source that is not a JSON price list is reported."""
+        invalid = tmp_path / 'index.csv'
+        invalid.write_text('FormatVersion,v1.0\n')
+
+        result = await load_price_list(mock_context, 'AmazonEC2', 'us-east-1', str(invalid))
+
+        assert result['status'] == 'error'
+        assert result['error_type'] == 'price_list_load_failed'
+        mock_context.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_load_price_list_rejected_source(self, mock_context):
+        """Test that sources other than price list files are not read."""
+        with patch('awslabs.aws_pricing_mcp_server.server.build_price_list_store') as build:
+            result = await load_price_list(
+                mock_context, 'AmazonEC2', 'us-east-1', 'http://169.254.169.254/latest/'
+            )
+
+        build.assert_not_called()
+        assert result['status'] == 'error'
+        assert result['error_type'] == 'invalid_price_list_source'
@@ -192,3 +192,17 @@ class LogsQueryCancelResult(BaseModel):
         ...,
         description='True if the logs insight query was successfully cancelled, false otherwise',
     )
+
+
+class LogsQueryTarget(BaseModel):
+    """Represents the log groups of one region queried by a fan-out Logs Insights query."""
+
+    region: str = Field(default='us-east-1', description='AWS region of the log groups')
+    log_group_names: Optional[List[str]] = Field(
+        default=None,
+        description='Names of the log groups to query. Exactly one of log_group_names or log_group_identifiers must be provided.',
+    )
+    log_group_identifiers: Optional[List[str]] = Field(
+        default=None,
+        description='Names or ARNs of the log groups to query. Exactly one of log_group_names or log_group_identifiers must be provided.',
+    )
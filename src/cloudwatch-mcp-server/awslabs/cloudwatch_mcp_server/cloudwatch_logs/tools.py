@@ -17,6 +17,7 @@
 import asyncio
 import boto3
 import datetime
+import json
 import os
 from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
 from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import (
@@ -27,6 +28,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import (
     LogsAnalysisResult,
     LogsMetadata,
     LogsQueryCancelResult,
+    LogsQueryTarget,
     SavedLogsInsightsQuery,
 )
 from awslabs.cloudwatch_mcp_server.common import (
@@ -45,6 +47,18 @@ from typing import Annotated, Dict, List, Literal, Optional
 class CloudWatchLogsTools:
     """CloudWatch Logs tools for MCP server."""
 
+    # Polling of running queries starts fast and backs off exponentially
+    QUERY_POLL_INITIAL_INTERVAL_SECONDS = 0.5
+    QUERY_POLL_MAX_INTERVAL_SECONDS = 5.0
+    QUERY_POLL_BACKOFF_FACTOR = 1.5
+
+    # Maximum number of log groups in a single Logs Insights query
+    MAX_LOG_GROUPS_PER_QUERY = 50
+
+    # Maximum number of fan-out queries running at once in a region, leaving room below the
+    # Logs Insights quota of concurrent queries per account and region for other clients
+    MAX_CONCURRENT_QUERIES_PER_REGION = 10
+
     def __init__(self):
         """Initialize the CloudWatch Logs tools."""
         self._logs_client = None
@@ -153,23 +167,39 @@ class CloudWatchLogsTools:
         }
 
     async def _poll_for_query_completion(
-        self, logs_client, query_id: str, max_timeout: int, ctx: Context
+        self,
+        logs_client,
+        query_id: str,
+        max_timeout: int,
+        ctx: Context,
+        stream_partial_results: bool = False,
+        scan_statistics: Optional[Dict[str, Dict]] = None,
     ) -> Dict:
         """Poll for query completion within the specified timeout.
 
+        The polling interval starts at QUERY_POLL_INITIAL_INTERVAL_SECONDS and grows by
+        QUERY_POLL_BACKOFF_FACTOR up to QUERY_POLL_MAX_INTERVAL_SECONDS, so short queries
+        return quickly and long queries do not waste API calls.
+
         Args:
             logs_client: The CloudWatch Logs client to use
             query_id: The query ID to poll for
             max_timeout: Maximum time to wait in seconds
             ctx: MCP context for warnings
+            stream_partial_results: Whether to report partial results and statistics to the
+                context while the query runs, and return them on timeout
+            scan_statistics: Latest statistics of each query of a fan-out by query ID, to
+                report progress summed over all its queries instead of for this query only
 
         Returns:
             Query results dictionary or timeout message
         """
         poll_start = timer()
+        interval = self.QUERY_POLL_INITIAL_INTERVAL_SECONDS
+        partial_result = None
         while poll_start + max_timeout > timer():
             try:
-                response = logs_client.get_query_results(queryId=query_id)
+                response = await asyncio.to_thread(logs_client.get_query_results, queryId=query_id)
                 status = response['status']
 
                 logger.debug(f'Query {query_id} status: {status}')
@@ -190,6 +220,14 @@ class CloudWatchLogsTools:
                     logger.warning(f'Query {query_id} has unexpected status: {status}')
                     return self._process_query_results(response, query_id)
 
+                if stream_partial_results:
+                    partial_result = await self._report_partial_results(
+                        ctx,
+                        self._process_query_results(response, query_id),
+                        partial_result,
+                        scan_statistics,
+                    )
+
             except Exception as e:
                 logger.error(f'Error polling for query {query_id} completion: {str(e)}')
                 await ctx.error(f'Error during query polling: {str(e)}')
@@ -200,17 +238,64 @@ class CloudWatchLogsTools:
                     'results': [],
                 }
 
-            await asyncio.sleep(1)
+            remaining = poll_start + max_timeout - timer()
+            await asyncio.sleep(max(0.0, min(interval, remaining)))
+            interval = min(
+                interval * self.QUERY_POLL_BACKOFF_FACTOR, self.QUERY_POLL_MAX_INTERVAL_SECONDS
+            )
 
         msg = f'Query {query_id} did not complete within {max_timeout} seconds. Use get_logs_insight_query_results with the returned queryId to try again to retrieve query results.'
         logger.warning(msg)
         await ctx.warning(msg)
-        return {
+        result = {
             'queryId': query_id,
             'status': 'Polling Timeout',
             'message': msg,
             'results': [],
         }
+        if partial_result is not None:
+            result['statistics'] = partial_result['statistics']
+            result['results'] = partial_result['results']
+        return result
+
+    async def _report_partial_results(
+        self,
+        ctx: Context,
+        result: Dict,
+        previous_result: Optional[Dict],
+        scan_statistics: Optional[Dict[str, Dict]] = None,
+    ) -> Dict:
+        """Report the partial results of a running query if they changed since the last poll.
+
+        Args:
+            ctx: MCP context to report progress and partial results to
+            result: Processed results of the running query
+            previous_result: Processed results reported at the previous poll, if any
+            scan_statistics: Latest statistics of each query of a fan-out by query ID, updated
+                with the statistics of this query and summed into the reported progress
+
+        Returns:
+            The processed results, to compare with at the next poll
+        """
+        statistics = result['statistics']
+        if previous_result is not None and previous_result['statistics'] == statistics:
+            return result
+
+        if scan_statistics is None:
+            records_scanned = statistics.get('recordsScanned', 0)
+            bytes_scanned = statistics.get('bytesScanned', 0)
+            message = f'Query {result["queryId"]} {result["status"]}: {len(result["results"])} results so far, {records_scanned:.0f} records and {bytes_scanned:.0f} bytes scanned'
+        else:
+            scan_statistics[result['queryId']] = statistics
+            records_scanned = sum(s.get('recordsScanned', 0) for s in scan_statistics.values())
+            bytes_scanned = sum(s.get('bytesScanned', 0) for s in scan_statistics.values())
+            message = f'{len(scan_statistics)} queries started: {records_scanned:.0f} records and {bytes_scanned:.0f} bytes scanned'
+        await ctx.report_progress(progress=records_scanned, message=message)
+        if result['results'] and (
+            previous_result is None or previous_result['results'] != result['results']
+        ):
+            await ctx.info(json.dumps(result))
+        return result
 
     def register(self, mcp):
         """Register all CloudWatch Logs tools with the MCP server."""
@@ -223,6 +308,9 @@ class CloudWatchLogsTools:
         # Register execute_log_insights_query tool
         mcp.tool(name='execute_log_insights_query')(self.execute_log_insights_query)
 
+        # Register execute_log_insights_query_fanout tool
+        mcp.tool(name='execute_log_insights_query_fanout')(self.execute_log_insights_query_fanout)
+
         # Register get_logs_insight_query_results tool
         mcp.tool(name='get_logs_insight_query_results')(self.get_logs_insight_query_results)
 
@@ -555,6 +643,12 @@ class CloudWatchLogsTools:
             str,
             Field(description='AWS region to query. Defaults to us-east-1.'),
         ] = 'us-east-1',
+        stream_partial_results: Annotated[
+            bool,
+            Field(
+                description='Report partial results and scan statistics (recordsScanned, bytesScanned) as progress while the query runs, and return the partial results if the query does not complete within max_timeout.'
+            ),
+        ] = False,
     ) -> Dict:
         """Executes a CloudWatch Logs Insights query and waits for the results to be available.
 
@@ -592,13 +686,9 @@ class CloudWatchLogsTools:
             # Create logs client for the specified region
             logs_client = self._get_logs_client(region)
 
-            # Start the query
-            start_response = logs_client.start_query(**remove_null_values(kwargs))
-            query_id = start_response['queryId']
-            logger.info(f'Started query with ID: {query_id}')
-
-            # Poll for completion
-            return await self._poll_for_query_completion(logs_client, query_id, max_timeout, ctx)
+            return await self._start_and_poll_query(
+                logs_client, kwargs, max_timeout, ctx, stream_partial_results
+            )
 
         except Exception as e:
             logger.error(f'Error in execute_log_insights_query_tool: {str(e)}')
@@ -613,6 +703,233 @@ class CloudWatchLogsTools:
                 'results': [],
             }
 
+    async def _start_and_poll_query(
+        self,
+        logs_client,
+        kwargs: Dict,
+        max_timeout: int,
+        ctx: Context,
+        stream_partial_results: bool,
+        scan_statistics: Optional[Dict[str, Dict]] = None,
+    ) -> Dict:
+        """Start a Logs Insights query and poll for its completion.
+
+        Args:
+            logs_client: The CloudWatch Logs client to use
+            kwargs: Parameters of the start_query call
+            max_timeout: Maximum time to wait in seconds
+            ctx: MCP context for warnings and progress
+            stream_partial_results: Whether to report partial results while the query runs
+            scan_statistics: Statistics of the queries of a fan-out, see _poll_for_query_completion
+
+        Returns:
+            Query results dictionary or timeout message
+        """
+        start_response = await asyncio.to_thread(
+            logs_client.start_query, **remove_null_values(kwargs)
+        )
+        query_id = start_response['queryId']
+        logger.info(f'Started query with ID: {query_id}')
+
+        return await self._poll_for_query_completion(
+            logs_client, query_id, max_timeout, ctx, stream_partial_results, scan_statistics
+        )
+
+    async def execute_log_insights_query_fanout(
+        self,
+        ctx: Context,
+        targets: Annotated[
+            List[LogsQueryTarget],
+            Field(
+                description='The regions and log groups to query. Log groups of a region are queried in batches of up to 50 log groups per query.'
+            ),
+        ],
+        start_time: str = Field(
+            ...,
+            description=(
+                'ISO 8601 formatted start time for the CloudWatch Logs Insights query window (e.g., "2025-04-19T20:00:00+00:00").'
+            ),
+        ),
+        end_time: str = Field(
+            ...,
+            description=(
+                'ISO 8601 formatted end time for the CloudWatch Logs Insights query window (e.g., "2025-04-19T21:00:00+00:00").'
+            ),
+        ),
+        query_string: str = Field(
+            ...,
+            description='The query string in the Cloudwatch Log Insights Query Language. See https://docs.aws.amazon.com/AmazonCloudWatch/latest/logs/CWL_QuerySyntax.html.',
+        ),
+        limit: Annotated[
+            int | None,
+            Field(
+                description='The maximum number of log events to return for each query and for the merged results. It is critical to use either this parameter or a `| limit <int>` operator in the query to avoid consuming too many tokens of the agent.'
+            ),
+        ] = None,
+        max_timeout: Annotated[
+            int,
+            Field(
+                description='Maximum time in second to poll for complete results before giving up'
+            ),
+        ] = 30,
+        stream_partial_results: Annotated[
+            bool,
+            Field(
+                description='Report partial results and scan statistics as progress while the queries run.'
+            ),
+        ] = False,
+    ) -> Dict:
+        """Executes the same CloudWatch Logs Insights query over many log groups and regions concurrently and merges the results.
+
+        CRITICAL: The volume of returned logs can easily overwhelm the agent context window. Always include a limit in the query
+        (| limit 50) or using the limit parameter.
+
+        Usage: Use to search the same logs across regions, or across more log groups than a single query supports (50).
+        Each region is queried with its own client, and its log groups are split into queries of up to 50 log groups.
+        Queries run concurrently, up to 10 at a time in each region. Progress is reported as the records scanned by
+        all queries together.
+
+        Returns:
+        --------
+            A dictionary containing the merged query results, including:
+                - status: Complete if all queries completed, otherwise the status of the first query that did not complete
+                - results: The results of all queries, each with a @region field. Results are sorted by @timestamp
+                  descending when all results have one.
+                - statistics: Sum of the statistics of all queries
+                - queries: The queryId, region, status and statistics of each query, to retrieve or cancel them individually
+        """
+        try:
+            queries = []
+            for target in targets:
+                self._validate_log_group_parameters(
+                    target.log_group_names, target.log_group_identifiers
+                )
+                use_names = bool(target.log_group_names)
+                log_groups = (
+                    target.log_group_names if use_names else target.log_group_identifiers
+                ) or []
+                for offset in range(0, len(log_groups), self.MAX_LOG_GROUPS_PER_QUERY):
+                    batch = log_groups[offset : offset + self.MAX_LOG_GROUPS_PER_QUERY]
+                    queries.append(
+                        (target.region, batch if use_names else None, None if use_names else batch)
+                    )
+
+            logger.info(
+                f'Starting {len(queries)} Logs Insights queries across {len(targets)} targets'
+            )
+
+            # Create one client per region, without blocking the event loop
+            regions = list(dict.fromkeys(region for region, _, _ in queries))
+            clients = dict(
+                zip(
+                    regions,
+                    await asyncio.gather(
+                        *[asyncio.to_thread(self._get_logs_client, region) for region in regions]
+                    ),
+                )
+            )
+            semaphores = {
+                region: asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES_PER_REGION)
+                for region in regions
+            }
+            scan_statistics: Dict[str, Dict] = {}
+
+            async def run_query(
+                region: str, names: Optional[List[str]], identifiers: Optional[List[str]]
+            ) -> Dict:
+                try:
+                    kwargs = self._build_logs_query_params(
+                        names, identifiers, start_time, end_time, query_string, limit
+                    )
+                    async with semaphores[region]:
+                        return await self._start_and_poll_query(
+                            clients[region],
+                            kwargs,
+                            max_timeout,
+                            ctx,
+                            stream_partial_results,
+                            scan_statistics,
+                        )
+                except Exception as e:
+                    logger.error(f'Error in Logs Insights query in {region}: {str(e)}')
+                    error_msg = f'Error executing CloudWatch Logs Insights query: {str(e)}'
+                    await ctx.error(error_msg)
+                    return {
+                        'queryId': '',
+                        'status': 'Error',
+                        'message': error_msg,
+                        'results': [],
+                    }
+
+            results = await asyncio.gather(
+                *[run_query(region, names, identifiers) for region, names, identifiers in queries]
+            )
+
+            return self._merge_query_results([region for region, _, _ in queries], results, limit)
+
+        except Exception as e:
+            logger.error(f'Error in execute_log_insights_query_fanout: {str(e)}')
+            error_msg = f'Error executing CloudWatch Logs Insights queries: {str(e)}'
+            await ctx.error(error_msg)
+
+            return {
+                'status': 'Error',
+                'message': error_msg,
+                'results': [],
+                'queries': [],
+            }
+
+    def _merge_query_results(
+        self, regions: List[str], results: List[Dict], limit: Optional[int]
+    ) -> Dict:
+        """Merge the processed results of queries run in the given regions.
+
+        Args:
+            regions: The region of each query
+            results: The processed results of each query
+            limit: Maximum number of merged results to return
+
+        Returns:
+            Merged query results dictionary
+        """
+        merged_rows = [
+            {**row, '@region': region}
+            for region, result in zip(regions, results)
+            for row in result.get('results', [])
+        ]
+        if merged_rows and all('@timestamp' in row for row in merged_rows):
+            merged_rows.sort(key=lambda row: row['@timestamp'], reverse=True)
+        if limit:
+            merged_rows = merged_rows[:limit]
+
+        statistics: Dict[str, float] = {}
+        for result in results:
+            for name, value in result.get('statistics', {}).items():
+                if isinstance(value, (int, float)):
+                    statistics[name] = statistics.get(name, 0) + value
+
+        incomplete = [result for result in results if result.get('status') != 'Complete']
+        merged = {
+            'status': incomplete[0].get('status', 'Error') if incomplete else 'Complete',
+            'statistics': statistics,
+            'results': merged_rows,
+            'queries': [
+                {
+                    key: value
+                    for key, value in {
+                        'queryId': result.get('queryId', ''),
+                        'region': region,
+                        'status': result.get('status'),
+                        'statistics': result.get('statistics'),
+                        'message': result.get('message'),
+                    }.items()
+                    if value is not None
+                }
+                for region, result in zip(regions, results)
+            ],
+        }
+        return merged
+
     async def get_logs_insight_query_results(
         self,
         ctx: Context,
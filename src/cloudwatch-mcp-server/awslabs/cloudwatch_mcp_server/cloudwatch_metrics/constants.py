@@ -23,6 +23,9 @@ DAYS_PER_WEEK = 7
 # Analysis constants
 DEFAULT_ANALYSIS_PERIOD_MINUTES = 20160  # 2 weeks
 
+# Maximum number of metric data queries in a single GetMetricData request
+MAX_METRIC_DATA_QUERIES = 500
+
 # Threshold constants
 COMPARISON_OPERATOR_ANOMALY = 'LessThanLowerOrGreaterThanUpperThreshold'
 
@@ -25,9 +25,13 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     Seasonality,
     Trend,
 )
-from collections import Counter
+from collections import Counter, defaultdict
 from loguru import logger
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Valid CloudWatch periods: 1, 5, 10 and 30 seconds, then 1 minute to 60 hours in minutes
+VALID_PERIODS = np.array([1, 5, 10, 30] + [i * 60 for i in range(1, 3601)])
 
 
 class MetricAnalyzer:
@@ -89,6 +93,122 @@ class MetricAnalyzer:
             logger.error(f'Error during metric analysis: {str(e)}')
             return {'message': 'Unable to analyze metric data'}
 
+    def analyze_metric_data_batch(
+        self, timestamps_ms: np.ndarray, values: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """Analyze many metrics sharing the same timestamps at once.
+
+        Statistics are computed for all series with vectorized NumPy reductions. The
+        results match what analyze_metric_data returns for each series on its own.
+
+        Args:
+            timestamps_ms: Sorted timestamps in epoch milliseconds, shape (n_timestamps,)
+            values: Metric values with NaN for missing data points, shape (n_series, n_timestamps)
+
+        Returns:
+            List with the analysis results of each series, in the order of the rows of values
+        """
+        timestamps_ms = np.asarray(timestamps_ms, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(timestamps_ms))
+        valid = np.isfinite(values)
+        counts = valid.sum(axis=1)
+
+        results: List[Dict[str, Any]] = [
+            {'message': 'No metric data available for analysis'}
+            if count == 0
+            else {'message': 'Insufficient valid data points for analysis'}
+            for count in counts
+        ]
+        rows = np.flatnonzero(counts >= 2)
+        if rows.size == 0:
+            return results
+
+        statistics = self._compute_statistics_batch(values[rows])
+        data_quality: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            clean_timestamps = timestamps_ms[valid[row]].tolist()
+            try:
+                publishing_period_seconds = self._compute_publishing_period(clean_timestamps)
+                density_ratio = self._compute_density_ratio(
+                    clean_timestamps, publishing_period_seconds or 0.0
+                )
+                data_quality[row] = {
+                    'total_points': int(counts[row]),
+                    'density_ratio': density_ratio,
+                    'publishing_period_seconds': publishing_period_seconds,
+                }
+            except Exception as e:
+                logger.error(f'Error during metric analysis of series {row}: {str(e)}')
+                results[row] = {'message': 'Unable to analyze metric data'}
+
+        decompositions = self._compute_seasonality_and_trend_batch(
+            timestamps_ms, values, valid, data_quality
+        )
+        for i, row in enumerate(rows):
+            if row not in data_quality:
+                continue
+            if row not in decompositions:
+                results[row] = {'message': 'Unable to analyze metric data'}
+                continue
+            results[row] = {
+                'data_points_found': int(counts[row]),
+                'seasonality_seconds': decompositions[row].seasonality.value,
+                'trend': decompositions[row].trend,
+                'statistics': statistics[i],
+                'data_quality': data_quality[row],
+                'message': 'Metric analysis completed successfully',
+            }
+
+        return results
+
+    def _compute_seasonality_and_trend_batch(
+        self,
+        timestamps_ms: np.ndarray,
+        values: np.ndarray,
+        valid: np.ndarray,
+        data_quality: Dict[int, Dict[str, Any]],
+    ) -> Dict[int, DecompositionResult]:
+        """Compute seasonality and trend of many series with batched decomposition.
+
+        Series with the same publishing period and the same first and last valid timestamps
+        are interpolated to the same regular grid and decomposed together.
+
+        Returns:
+            Dict mapping the rows that were decomposed to their DecompositionResult
+        """
+        decompositions: Dict[int, DecompositionResult] = {}
+        groups: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+        for row, quality in data_quality.items():
+            density_ratio = quality['density_ratio']
+            publishing_period_seconds = quality['publishing_period_seconds']
+            if density_ratio is None or publishing_period_seconds is None or density_ratio <= 0.5:
+                decompositions[row] = DecompositionResult(
+                    seasonality=Seasonality.NONE, trend=Trend.NONE
+                )
+                continue
+            row_timestamps = timestamps_ms[valid[row]]
+            key = (int(publishing_period_seconds), int(row_timestamps[0]), int(row_timestamps[-1]))
+            groups[key].append(row)
+
+        for (period_seconds, _, _), group_rows in groups.items():
+            try:
+                grid_values = np.vstack(
+                    [
+                        self.decomposer._interpolate_to_regular_grid(
+                            timestamps_ms[valid[row]], values[row, valid[row]], period_seconds
+                        )[1]
+                        for row in group_rows
+                    ]
+                )
+                results = self.decomposer.detect_seasonality_and_trend_batch(
+                    grid_values, period_seconds
+                )
+                decompositions.update(zip(group_rows, results))
+            except Exception as e:
+                logger.error(f'Error computing seasonality and trend of series {group_rows}: {e}')
+
+        return decompositions
+
     def _compute_seasonality_and_trend(
         self,
         timestamps_ms: list[int],
@@ -129,12 +249,8 @@ class MetricAnalyzer:
 
     def _get_closest_cloudwatch_period(self, period_seconds: float) -> float:
         """Validate and normalize period to CloudWatch valid values."""
-        valid_periods = [1, 5, 10, 30] + [
-            i * 60 for i in range(1, 3601)
-        ]  # 1min to 1hour multiples
-
         # Find closest valid period
-        closest_period = min(valid_periods, key=lambda x: abs(x - period_seconds))
+        closest_period = int(VALID_PERIODS[np.argmin(np.abs(VALID_PERIODS - period_seconds))])
 
         # Only return if within 10% tolerance
         if abs(closest_period - period_seconds) / closest_period <= 0.1:
@@ -163,6 +279,27 @@ class MetricAnalyzer:
             logger.error(f'Error calculating density ratio: {e}', exc_info=True)
             raise
 
+    def _compute_statistics_batch(self, values: np.ndarray) -> List[Dict[str, Any]]:
+        """Compute the statistics of _compute_statistics for each row, ignoring NaN values."""
+        mean_val = np.nanmean(values, axis=1)
+        std_dev = np.nanstd(values, axis=1, ddof=0)
+        minimum = np.nanmin(values, axis=1)
+        maximum = np.nanmax(values, axis=1)
+        median = np.nanmedian(values, axis=1)
+        stable = np.abs(mean_val) > NUMERICAL_STABILITY_THRESHOLD
+        cv = np.divide(std_dev, np.abs(mean_val), out=np.zeros_like(std_dev), where=stable)
+
+        return [
+            {
+                'min': float(minimum[i]),
+                'max': float(maximum[i]),
+                'std_deviation': float(std_dev[i]),
+                'coefficient_of_variation': float(cv[i]) if stable[i] else None,
+                'median': float(median[i]),
+            }
+            for i in range(values.shape[0])
+        ]
+
     def _compute_statistics(self, values: list[float]) -> Dict[str, Any]:
         """Compute essential statistical measures for LLM consumption."""
         if not values:
@@ -13,8 +13,6 @@
 # limitations under the License.
 
 import numpy as np
-import pandas as pd
-import statsmodels.api as sm
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.constants import (
     NUMERICAL_STABILITY_THRESHOLD,
 )
@@ -23,9 +21,8 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     Seasonality,
     Trend,
 )
-from loguru import logger
-from statsmodels.regression.linear_model import OLS
-from typing import List, Optional, Tuple
+from scipy import stats
+from typing import List, Optional, Tuple, Union
 
 
 class MetricDataDecomposer:
@@ -33,6 +30,13 @@ class MetricDataDecomposer:
 
     SEASONALITY_STRENGTH_THRESHOLD = 0.6  # See https://robjhyndman.com/hyndsight/tsoutliers/
     STATISTICAL_SIGNIFICANCE_THRESHOLD = 0.05
+    SEASONAL_PERIODS = [
+        Seasonality.FIFTEEN_MINUTES,
+        Seasonality.ONE_HOUR,
+        Seasonality.SIX_HOURS,
+        Seasonality.ONE_DAY,
+        Seasonality.ONE_WEEK,
+    ]
 
     def detect_seasonality_and_trend(
         self,
@@ -51,36 +55,120 @@ class MetricDataDecomposer:
             return DecompositionResult(seasonality=Seasonality.NONE, trend=Trend.NONE)
 
         # Interpolate if we have sufficient density
-        timestamps_ms, values = self._interpolate_to_regular_grid(
+        grid_timestamps, grid_values = self._interpolate_to_regular_grid(
             timestamps_ms, values, publishing_period_seconds
         )
 
-        return self._detect_strongest_seasonality(timestamps_ms, values, publishing_period_seconds)
+        return self._detect_strongest_seasonality(
+            grid_timestamps, grid_values, publishing_period_seconds
+        )
+
+    def detect_seasonality_and_trend_batch(
+        self, values: np.ndarray, period_seconds: float
+    ) -> List[DecompositionResult]:
+        """Analyze the seasonality and trend of many series at once.
+
+        The series must be aligned on the same regular grid without missing values, e.g. the
+        output of _interpolate_to_regular_grid for series sharing start and end timestamps.
+        Each result matches what _detect_strongest_seasonality returns for the row on its own.
+
+        Args:
+            values: Series values with shape (n_series, n_points)
+            period_seconds: Spacing of the grid in seconds
+
+        Returns:
+            List with the DecompositionResult of each row of values
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2:
+            raise ValueError(f'Expected a 2-D array of series, got shape {values.shape}')
+
+        n_series, n_points = values.shape
+        if n_series == 0:
+            return []
+        if n_points == 0:
+            return [DecompositionResult(seasonality=Seasonality.NONE, trend=Trend.NONE)] * n_series
+
+        if period_seconds is None or period_seconds <= 0:
+            period_seconds = 300  # 5 minutes default
+
+        # Winsorize values
+        lo, hi = np.quantile(values, [0.001, 0.999], axis=1)
+        winsorized_values = np.clip(values, lo[:, np.newaxis], hi[:, np.newaxis])
+
+        # Test seasonal periods for all series, keeping the first strongest per series
+        best_strength = np.zeros(n_series)
+        best_period = np.full(n_series, -1)
+        for index, seasonality in enumerate(self.SEASONAL_PERIODS):
+            datapoints_per_period = seasonality.value / period_seconds
+            if n_points < datapoints_per_period * 2 or datapoints_per_period <= 0:
+                continue
+
+            strength = self._calculate_seasonal_strengths(
+                winsorized_values, int(datapoints_per_period)
+            )
+            stronger = strength > best_strength
+            best_strength[stronger] = strength[stronger]
+            best_period[stronger] = index
+
+        # Compute trend from deseasonalized data if seasonality detected, else on raw values
+        seasonal = (best_strength > self.SEASONALITY_STRENGTH_THRESHOLD) & (best_period >= 0)
+        trends = np.full(n_series, Trend.NONE, dtype=object)
+        not_seasonal = np.flatnonzero(~seasonal)
+        trends[not_seasonal] = self._compute_trends(winsorized_values[not_seasonal])
+        for index in np.unique(best_period[seasonal]):
+            rows = np.flatnonzero(seasonal & (best_period == index))
+            datapoints_per_period = int(self.SEASONAL_PERIODS[index].value / period_seconds)
+            truncated, seasonal_pattern = self._seasonal_components(
+                winsorized_values[rows], datapoints_per_period
+            )
+            trends[rows] = self._compute_trends(truncated - seasonal_pattern)
+
+        return [
+            DecompositionResult(
+                seasonality=self.SEASONAL_PERIODS[best_period[row]]
+                if seasonal[row]
+                else Seasonality.NONE,
+                trend=trends[row],
+            )
+            for row in range(n_series)
+        ]
 
     def _interpolate_to_regular_grid(
-        self, timestamps_ms: List[int], values: List[float], period_seconds: float
-    ) -> Tuple[List[int], List[float]]:
+        self,
+        timestamps_ms: Union[List[int], np.ndarray],
+        values: Union[List[float], np.ndarray],
+        period_seconds: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Interpolate data to regular grid using numpy."""
+        timestamps_ms = np.asarray(timestamps_ms, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
         if len(timestamps_ms) < 2:
             return timestamps_ms, values
 
         period_ms = int(period_seconds * 1000)
+        if period_ms <= 0:
+            raise ValueError(f'Invalid period for interpolation: {period_seconds} seconds')
+
         start_time = timestamps_ms[0]
         end_time = timestamps_ms[-1]
 
         # Create regular grid
-        regular_timestamps = list(range(start_time, end_time + period_ms, period_ms))
+        regular_timestamps = np.arange(start_time, end_time + period_ms, period_ms)
 
         # Interpolate using numpy
-        interpolated_values = np.interp(regular_timestamps, timestamps_ms, values).tolist()
+        interpolated_values = np.interp(regular_timestamps, timestamps_ms, values)
 
         return regular_timestamps, interpolated_values
 
     def _detect_strongest_seasonality(
-        self, timestamps_ms: List[int], values: List[float], period_seconds: Optional[float]
+        self,
+        timestamps_ms: Union[List[int], np.ndarray],
+        values: Union[List[float], np.ndarray],
+        period_seconds: Optional[float],
     ) -> DecompositionResult:
         """Detect seasonal patterns and compute trend in the data."""
-        timestamps_ms = sorted(timestamps_ms)
+        timestamps_ms = np.sort(np.asarray(timestamps_ms, dtype=np.int64))
 
         # Calculate period for analysis
         if period_seconds is None and len(timestamps_ms) > 1:
@@ -89,130 +177,115 @@ class MetricDataDecomposer:
         if period_seconds is None or period_seconds <= 0:
             period_seconds = 300  # 5 minutes default
 
-        # Winsorize values
-        values_array = np.array(values)
-        qtiles = np.quantile(values_array, [0.001, 0.999])
-        lo, hi = qtiles
-        winsorized_values = np.clip(values_array, lo, hi)
-
-        # Test seasonal periods
-        seasonal_periods_seconds = [
-            Seasonality.FIFTEEN_MINUTES.value,
-            Seasonality.ONE_HOUR.value,
-            Seasonality.SIX_HOURS.value,
-            Seasonality.ONE_DAY.value,
-            Seasonality.ONE_WEEK.value,
-        ]
+        return self.detect_seasonality_and_trend_batch(
+            np.asarray(values, dtype=np.float64).reshape(1, -1), period_seconds
+        )[0]
 
-        best_seasonality = Seasonality.NONE
-        best_strength = 0.0
-        best_deseasonalized = None
+    def _seasonal_components(
+        self, values: np.ndarray, seasonal_period: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Split series into whole seasonal cycles and their mean seasonal pattern.
 
-        for seasonal_period_seconds in seasonal_periods_seconds:
-            datapoints_per_period = seasonal_period_seconds / period_seconds
-            min_required_points = datapoints_per_period * 2
+        Returns:
+            Tuple of (truncated_values, tiled_pattern), both with n_cycles * seasonal_period columns
+        """
+        n_series, n_points = values.shape
+        n_cycles = n_points // seasonal_period
+        truncated_values = values[:, : n_cycles * seasonal_period]
 
-            if len(values) < min_required_points or datapoints_per_period <= 0:
-                continue
+        # Calculate seasonal pattern (mean across cycles)
+        reshaped = truncated_values.reshape(n_series, n_cycles, seasonal_period)
+        seasonal_pattern = reshaped.mean(axis=1)
+        tiled_pattern = np.tile(seasonal_pattern, n_cycles)
+        return truncated_values, tiled_pattern
 
-            strength, deseasonalized = self._calculate_seasonal_strength(
-                winsorized_values, int(datapoints_per_period)
-            )
-            if strength > best_strength:
-                best_strength = strength
-                best_seasonality = Seasonality.from_seconds(seasonal_period_seconds)
-                best_deseasonalized = deseasonalized
-
-        # Compute trend from deseasonalized data if seasonality detected
-        if best_strength > self.SEASONALITY_STRENGTH_THRESHOLD and best_deseasonalized is not None:
-            trend = self._compute_trend(best_deseasonalized)
-            return DecompositionResult(seasonality=best_seasonality, trend=trend)
-        else:
-            # No seasonality, compute trend on raw values
-            trend = self._compute_trend(winsorized_values)
-            return DecompositionResult(seasonality=Seasonality.NONE, trend=trend)
-
-    def _calculate_seasonal_strength(
+    def _calculate_seasonal_strengths(
         self, values: np.ndarray, seasonal_period: int
-    ) -> Tuple[float, Optional[np.ndarray]]:
-        """Calculate seasonal strength and extract deseasonalized data for trend.
+    ) -> np.ndarray:
+        """Calculate the seasonal strength of each row of values for a seasonal period.
 
         Returns:
-            Tuple of (strength, deseasonalized_values) where deseasonalized = original - seasonal_pattern
+            Array with the strength of each row, NaN where the detrended values are constant
         """
-        if len(values) < seasonal_period * 2 or seasonal_period <= 0:
-            return (0.0, None)
+        n_series, n_points = values.shape
+        if seasonal_period <= 0 or n_points < seasonal_period * 2:
+            return np.zeros(n_series)
 
-        # Reshape data into seasonal cycles
-        n_cycles = len(values) // seasonal_period
-        if n_cycles <= 0:
-            return (0.0, None)
-
-        truncated_values = values[: n_cycles * seasonal_period]
-        reshaped = truncated_values.reshape(n_cycles, seasonal_period)
-
-        # Calculate seasonal pattern (mean across cycles)
-        seasonal_pattern = np.mean(reshaped, axis=0)
-        tiled_pattern = np.tile(seasonal_pattern, n_cycles)
+        truncated_values, tiled_pattern = self._seasonal_components(values, seasonal_period)
 
-        # Calculate trend (moving average) for seasonal strength calculation
-        trend_series = (
-            pd.Series(truncated_values)
-            .rolling(window=seasonal_period, center=True, min_periods=1)
-            .mean()
-        )
-        trend = np.asarray(trend_series)
+        # Calculate trend (centered moving average) for seasonal strength calculation
+        trend = self._centered_moving_average(truncated_values, seasonal_period)
 
         # Calculate components
         detrended = truncated_values - trend
         remainder = detrended - tiled_pattern
 
         # Seasonal strength = 1 - Var(remainder) / Var(detrended)
-        var_remainder = np.var(remainder)
-        var_detrended = np.var(detrended)
-
-        if var_detrended <= NUMERICAL_STABILITY_THRESHOLD:
-            return (0.0, None)
-
-        strength = max(0.0, float(1 - var_remainder / var_detrended))
-
-        # Return deseasonalized data (original - seasonal pattern) for trend calculation
-        deseasonalized = truncated_values - tiled_pattern
-        return (strength, deseasonalized)
-
-    def _compute_trend(self, values: np.ndarray) -> Trend:
-        """Compute trend using OLS on trend component values."""
-        if len(values) <= 2:
-            return Trend.NONE
+        var_remainder = np.var(remainder, axis=1)
+        var_detrended = np.var(detrended, axis=1)
 
-        try:
-            valid_data = [
-                (i, v) for i, v in enumerate(values) if not np.isnan(v) and not np.isinf(v)
-            ]
-            if len(valid_data) <= 2:
-                return Trend.NONE
+        stable = var_detrended > NUMERICAL_STABILITY_THRESHOLD
+        strength = np.full(n_series, np.nan)
+        strength[stable] = np.maximum(0.0, 1 - var_remainder[stable] / var_detrended[stable])
+        return strength
 
-            x_vals = np.array([x for x, _ in valid_data])
-            y_vals = np.array([y for _, y in valid_data])
+    def _centered_moving_average(self, values: np.ndarray, window: int) -> np.ndarray:
+        """Compute the centered moving average of each row, shrinking the window at the edges.
 
-            # Check if all values are the same (flat line)
-            if np.std(y_vals) < NUMERICAL_STABILITY_THRESHOLD:
-                return Trend.NONE
+        This matches pandas rolling(window, center=True, min_periods=1).mean().
+        """
+        n_points = values.shape[1]
+        cumulative = np.zeros((values.shape[0], n_points + 1))
+        np.cumsum(values, axis=1, out=cumulative[:, 1:])
 
-            x_vals = (x_vals - x_vals.min()) / (
-                x_vals.max() - x_vals.min() + NUMERICAL_STABILITY_THRESHOLD
-            )
+        positions = np.arange(n_points)
+        starts = np.maximum(positions - window // 2, 0)
+        ends = np.minimum(positions + window - window // 2, n_points)
+        return (cumulative[:, ends] - cumulative[:, starts]) / (ends - starts)
 
-            X = sm.add_constant(x_vals)
-            model = OLS(y_vals, X).fit()
+    def _compute_trends(
+        self, values: np.ndarray, x_vals: Optional[np.ndarray] = None
+    ) -> List[Trend]:
+        """Compute the trend of each row with a least squares fit of a line.
 
-            slope = model.params[1]
-            p_value = model.pvalues[1]
+        The slope of a row is significant when the two-sided p-value of its t statistic is below
+        STATISTICAL_SIGNIFICANCE_THRESHOLD, as for an OLS fit with an intercept.
 
-            if p_value >= self.STATISTICAL_SIGNIFICANCE_THRESHOLD:
-                return Trend.NONE
+        Args:
+            values: Finite values with shape (n_series, n_points)
+            x_vals: Positions of the columns (default: 0, 1, 2, ...)
 
-            return Trend.POSITIVE if slope > 0 else Trend.NEGATIVE
-        except Exception as e:
-            logger.warning(f'Error computing trend: {e}')
-            return Trend.NONE
+        Returns:
+            List with the trend of each row
+        """
+        n_series, n_points = values.shape
+        if n_points <= 2:
+            return [Trend.NONE] * n_series
+        if x_vals is None:
+            x_vals = np.arange(n_points, dtype=np.float64)
+
+        x_centered = x_vals - x_vals.mean()
+        sxx = x_centered @ x_centered
+        y_centered = values - values.mean(axis=1, keepdims=True)
+        slope = y_centered @ x_centered / sxx
+
+        residuals = y_centered - slope[:, np.newaxis] * x_centered
+        degrees_of_freedom = n_points - 2
+        standard_error = np.sqrt((residuals * residuals).sum(axis=1) / degrees_of_freedom / sxx)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = np.abs(slope) / standard_error
+
+        significant = t_stat > stats.t.ppf(
+            1 - self.STATISTICAL_SIGNIFICANCE_THRESHOLD / 2, degrees_of_freedom
+        )
+        # Check if all values are the same (flat line)
+        flat = np.std(values, axis=1) < NUMERICAL_STABILITY_THRESHOLD
+
+        return [
+            Trend.NONE
+            if flat[row] or not significant[row]
+            else Trend.POSITIVE
+            if slope[row] > 0
+            else Trend.NEGATIVE
+            for row in range(n_series)
+        ]
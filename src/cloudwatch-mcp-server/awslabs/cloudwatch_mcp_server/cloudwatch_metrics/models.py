@@ -14,6 +14,7 @@
 
 """Data models for CloudWatch Metrics MCP tools."""
 
+import numpy as np
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.constants import (
     DAYS_PER_WEEK,
     HOURS_PER_DAY,
@@ -23,7 +24,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.constants import (
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field, field_validator, model_serializer, model_validator
-from typing import Any, ClassVar, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Literal, Optional, Tuple, Union
 
 
 class Trend(str, Enum):
@@ -113,6 +114,79 @@ class GetMetricDataResponse(BaseModel):
     )
 
 
+class MetricQuery(BaseModel):
+    """Represents one metric of a batched GetMetricData request."""
+
+    namespace: str = Field(..., description="The namespace of the metric (e.g., 'AWS/EC2')")
+    metric_name: str = Field(..., description="The name of the metric (e.g., 'CPUUtilization')")
+    dimensions: List[Dimension] = Field(
+        default_factory=list, description='The dimensions that identify the metric'
+    )
+    statistic: Literal[
+        'AVG',
+        'COUNT',
+        'MAX',
+        'MIN',
+        'SUM',
+        'Average',
+        'Sum',
+        'Maximum',
+        'Minimum',
+        'SampleCount',
+    ] = Field(default='AVG', description='The statistic to use for the metric')
+    id: Optional[str] = Field(
+        default=None,
+        pattern=r'^[a-z][a-zA-Z0-9_]*$',
+        description='Unique ID of the query in the batch (default: m0, m1, ... by position)',
+    )
+
+
+class MetricSeries(BaseModel):
+    """Represents the values of one metric, aligned to the timestamps of a batch response."""
+
+    id: str = Field(..., description='The ID of the metric data query')
+    label: str = Field(..., description='The label of the metric')
+    statusCode: str = Field(..., description='The status code of the query result')
+    values: List[Optional[float]] = Field(
+        default_factory=list,
+        description='The value at each timestamp of the response, null where the metric has no data point',
+    )
+    messages: List[Dict[str, Any]] = Field(
+        default_factory=list, description='Messages related to the metric data query'
+    )
+
+
+class GetMetricDataBatchResponse(BaseModel):
+    """Represents the columnar result of a batched GetMetricData request."""
+
+    period_seconds: int = Field(..., description='The aggregation period in seconds')
+    timestamps: List[datetime] = Field(
+        default_factory=list, description='The sorted timestamps shared by all series'
+    )
+    series: List[MetricSeries] = Field(
+        default_factory=list, description='The values of each metric, in the order requested'
+    )
+    messages: List[Dict[str, Any]] = Field(
+        default_factory=list, description='Messages related to the GetMetricData operations'
+    )
+
+    def to_numpy(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert the response into arrays for vectorized analysis.
+
+        Returns:
+            Tuple of (timestamps in epoch milliseconds with shape (n_timestamps,), values with
+            shape (n_series, n_timestamps) and NaN where a metric has no data point)
+        """
+        timestamps_ms = np.array(
+            [int(ts.timestamp() * 1000) for ts in self.timestamps], dtype=np.int64
+        )
+        values = np.array(
+            [[np.nan if v is None else v for v in s.values] for s in self.series],
+            dtype=np.float64,
+        ).reshape(len(self.series), len(self.timestamps))
+        return timestamps_ms, values
+
+
 class MetricMetadataIndexKey:
     """Key class for indexing metric metadata."""
 
@@ -16,6 +16,7 @@
 
 import boto3
 import json
+import numpy as np
 import os
 from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.cloudformation_template_generator import (
@@ -24,6 +25,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.cloudformation_template_ge
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.constants import (
     COMPARISON_OPERATOR_ANOMALY,
     DEFAULT_ANALYSIS_PERIOD_MINUTES,
+    MAX_METRIC_DATA_QUERIES,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_analyzer import MetricAnalyzer
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_decomposer import Seasonality
@@ -34,12 +36,15 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     AlarmRecommendationThreshold,
     AnomalyDetectionAlarmThreshold,
     Dimension,
+    GetMetricDataBatchResponse,
     GetMetricDataResponse,
     MetricData,
     MetricDataPoint,
     MetricDataResult,
     MetricMetadata,
     MetricMetadataIndexKey,
+    MetricQuery,
+    MetricSeries,
     StaticAlarmThreshold,
 )
 from botocore.config import Config
@@ -148,12 +153,18 @@ class CloudWatchMetricsTools:
         # Register get_metric_data tool
         mcp.tool(name='get_metric_data')(self.get_metric_data)
 
+        # Register get_metric_data_batch tool
+        mcp.tool(name='get_metric_data_batch')(self.get_metric_data_batch)
+
         # Register get_metric_metadata tool
         mcp.tool(name='get_metric_metadata')(self.get_metric_metadata)
 
         # Register analyze_metric tool
         mcp.tool(name='analyze_metric')(self.analyze_metric)
 
+        # Register analyze_metrics tool
+        mcp.tool(name='analyze_metrics')(self.analyze_metrics)
+
         # Register get_recommended_metric_alarms tool
         mcp.tool(name='get_recommended_metric_alarms')(self.get_recommended_metric_alarms)
 
@@ -386,6 +397,159 @@ class CloudWatchMetricsTools:
             await ctx.error(f'Error getting metric data: {str(e)}')
             raise
 
+    async def get_metric_data_batch(
+        self,
+        ctx: Context,
+        metrics: Annotated[
+            List[MetricQuery],
+            Field(
+                description='The metrics to retrieve, each with namespace, name, dimensions and statistic'
+            ),
+        ],
+        start_time: Annotated[
+            Union[str, datetime],
+            Field(description='The start time for the metric data query (ISO format or datetime)'),
+        ],
+        end_time: Annotated[
+            Union[str, datetime] | None,
+            Field(
+                description='The end time for the metric data query (ISO format or datetime), defaults to current time'
+            ),
+        ] = None,
+        target_datapoints: Annotated[
+            int,
+            Field(
+                description='Target number of data points to return per metric (default: 60). Controls the granularity of the returned data.'
+            ),
+        ] = 60,
+        region: Annotated[
+            str,
+            Field(description='AWS region to query. Defaults to us-east-1.'),
+        ] = 'us-east-1',
+    ) -> GetMetricDataBatchResponse:
+        """Retrieves CloudWatch metric data for many metrics at once.
+
+        This tool packs up to 500 metrics into each GetMetricData request and follows the
+        pagination of the responses. All metrics share the same time range and period, and
+        the result is columnar: one list of timestamps, and for each metric one list of
+        values aligned to those timestamps (null where the metric has no data point).
+
+        Usage: Use this tool instead of repeated get_metric_data calls when comparing many
+        metrics, e.g. the CPU utilization of all instances of a fleet.
+
+        Returns:
+            GetMetricDataBatchResponse: The shared timestamps and the values of each metric
+
+        Example:
+            result = await get_metric_data_batch(
+                ctx,
+                metrics=[
+                    MetricQuery(
+                        namespace="AWS/EC2",
+                        metric_name="CPUUtilization",
+                        dimensions=[Dimension(name="InstanceId", value=instance_id)],
+                    )
+                    for instance_id in instance_ids
+                ],
+                start_time="2023-01-01T00:00:00Z",
+            )
+            timestamps_ms, values = result.to_numpy()
+        """
+        try:
+            start_time, end_time, period = self._prepare_time_parameters(
+                start_time, end_time, target_datapoints
+            )
+
+            metric_queries = self._build_batch_metric_queries(metrics, period)
+
+            cloudwatch_client = self._get_cloudwatch_client(region)
+
+            return self._get_metric_data_batch(
+                cloudwatch_client, metric_queries, start_time, end_time, period
+            )
+
+        except Exception as e:
+            logger.error(f'Error in get_metric_data_batch: {str(e)}')
+            await ctx.error(f'Error getting metric data batch: {str(e)}')
+            raise
+
+    def _build_batch_metric_queries(self, metrics, period):
+        """Build standard metric queries with unique IDs for a batch."""
+        metric_queries = []
+        for index, metric in enumerate(metrics):
+            metric_query = self._build_standard_metric_query(
+                metric.namespace, metric.metric_name, metric.dimensions, metric.statistic, period
+            )
+            metric_query['Id'] = metric.id or f'm{index}'
+            metric_queries.append(metric_query)
+
+        query_ids = [query['Id'] for query in metric_queries]
+        if len(set(query_ids)) != len(query_ids):
+            raise ValueError(f'Metric IDs must be unique within a batch: {query_ids}')
+
+        return metric_queries
+
+    def _get_metric_data_batch(
+        self, cloudwatch_client, metric_queries, start_time, end_time, period
+    ):
+        """Get the data of many metric queries and align it to shared timestamps."""
+        timestamps_by_id = {query['Id']: [] for query in metric_queries}
+        values_by_id = {query['Id']: [] for query in metric_queries}
+        results_by_id = {}
+        messages = []
+
+        paginator = cloudwatch_client.get_paginator('get_metric_data')
+        for offset in range(0, len(metric_queries), MAX_METRIC_DATA_QUERIES):
+            for page in paginator.paginate(
+                MetricDataQueries=metric_queries[offset : offset + MAX_METRIC_DATA_QUERIES],
+                StartTime=start_time,
+                EndTime=end_time,
+            ):
+                messages.extend(page.get('Messages', []))
+                for result in page.get('MetricDataResults', []):
+                    query_id = result.get('Id', '')
+                    timestamps_by_id[query_id].extend(
+                        int(ts.timestamp() * 1000) for ts in result.get('Timestamps', [])
+                    )
+                    values_by_id[query_id].extend(result.get('Values', []))
+                    previous = results_by_id.get(query_id, {})
+                    results_by_id[query_id] = {
+                        'Label': result.get('Label', previous.get('Label', '')),
+                        'StatusCode': result.get('StatusCode', 'Complete'),
+                        'Messages': previous.get('Messages', []) + result.get('Messages', []),
+                    }
+
+        # Align all series to the sorted union of their timestamps
+        all_timestamps = [
+            np.array(timestamps_by_id[q['Id']], dtype=np.int64) for q in metric_queries
+        ]
+        timestamps_ms = np.unique(np.concatenate(all_timestamps)) if all_timestamps else []
+
+        series = []
+        for query, query_timestamps in zip(metric_queries, all_timestamps):
+            query_id = query['Id']
+            aligned = np.full(len(timestamps_ms), np.nan)
+            aligned[np.searchsorted(timestamps_ms, query_timestamps)] = values_by_id[query_id]
+            result = results_by_id.get(query_id, {})
+            series.append(
+                MetricSeries(
+                    id=query_id,
+                    label=result.get('Label', query['MetricStat']['Metric']['MetricName']),
+                    statusCode=result.get('StatusCode', 'Complete'),
+                    values=[None if np.isnan(v) else v for v in aligned.tolist()],
+                    messages=result.get('Messages', []),
+                )
+            )
+
+        return GetMetricDataBatchResponse(
+            period_seconds=period,
+            timestamps=[
+                datetime.fromtimestamp(ts / 1000, tz=timezone.utc) for ts in timestamps_ms
+            ],
+            series=series,
+            messages=messages,
+        )
+
     def _prepare_time_parameters(self, start_time, end_time, target_datapoints):
         """Process time parameters and calculate the period."""
         # Convert string times to datetime objects
@@ -1163,3 +1327,87 @@ class CloudWatchMetricsTools:
             logger.error(f'Error in analyze_metric: {str(e)}')
             await ctx.error(f'Error encountered when analyzing metric: {str(e)}')
             raise
+
+    async def analyze_metrics(
+        self,
+        ctx: Context,
+        metrics: Annotated[
+            List[MetricQuery],
+            Field(
+                description='The metrics to analyze, each with namespace, name, dimensions and statistic'
+            ),
+        ],
+        region: Annotated[
+            str,
+            Field(description='AWS region to query. Defaults to us-east-1.'),
+        ] = 'us-east-1',
+    ) -> List[Dict[str, Any]]:
+        """Analyzes many CloudWatch metrics at once for seasonality, trend, data density and statistical properties.
+
+        This tool returns the same analysis as analyze_metric for each metric, but retrieves
+        the data of all metrics with batched GetMetricData requests and computes the
+        statistics of all metrics together.
+
+        Usage: Use this tool instead of repeated analyze_metric calls when investigating many
+        metrics, e.g. all metrics of a dashboard.
+
+        Args:
+            ctx: The MCP context object for error handling and logging.
+            metrics: The metrics to analyze
+            region: AWS region to query. Defaults to 'us-east-1'.
+
+        Returns:
+            List[Dict[str, Any]]: The analysis results of each metric, in the order requested,
+                with the same keys as the results of analyze_metric
+
+        Example:
+            analyses = await analyze_metrics(
+                ctx,
+                metrics=[
+                    MetricQuery(namespace="AWS/Lambda", metric_name="Duration"),
+                    MetricQuery(namespace="AWS/Lambda", metric_name="Errors", statistic="Sum"),
+                ],
+            )
+            for analysis in analyses:
+                print(f"{analysis['metric_info']['metric_name']}: {analysis['trend']}")
+        """
+        try:
+            analysis_period_minutes = DEFAULT_ANALYSIS_PERIOD_MINUTES
+
+            logger.info(f'Analyzing {len(metrics)} metrics in region {region}')
+
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(minutes=analysis_period_minutes)
+
+            batch_response = await self.get_metric_data_batch(
+                ctx=ctx,
+                metrics=metrics,
+                start_time=start_time,
+                end_time=end_time,
+                target_datapoints=analysis_period_minutes,
+                region=region,
+            )
+
+            timestamps_ms, values = batch_response.to_numpy()
+            analysis_results = self.metric_analyzer.analyze_metric_data_batch(
+                timestamps_ms, values
+            )
+
+            for metric, analysis_result in zip(metrics, analysis_results):
+                analysis_result['metric_info'] = {
+                    'namespace': metric.namespace,
+                    'metric_name': metric.metric_name,
+                    'statistic': metric.statistic,
+                    'dimensions': [{'name': d.name, 'value': d.value} for d in metric.dimensions],
+                    'analysis_period_minutes': analysis_period_minutes,
+                    'time_range': {
+                        'start': start_time.isoformat(),
+                        'end': end_time.isoformat(),
+                    },
+                }
+
+            return analysis_results
+        except Exception as e:
+            logger.error(f'Error in analyze_metrics: {str(e)}')
+            await ctx.error(f'Error encountered when analyzing metrics: {str(e)}')
+            raise
@@ -0,0 +1,328 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for polling, streaming and fan-out of CloudWatch Logs Insights queries."""
+
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import LogsQueryTarget
+from awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools import CloudWatchLogsTools
+from unittest.mock import AsyncMock, Mock, patch
+
+
+START_TIME = '2023-01-01T00:00:00+00:00'
+END_TIME = '2023-01-01T01:00:00+00:00'
+
+
+@pytest_asyncio.fixture
+async def mock_context():
+    """Create mock MCP context."""
+    context = Mock()
+    context.info = AsyncMock()
+    context.warning = AsyncMock()
+    context.error = AsyncMock()
+    context.report_progress = AsyncMock()
+    return context
+
+
+@pytest.fixture
+def tools():
+    """Create CloudWatchLogsTools instance."""
+    with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        yield CloudWatchLogsTools()
+
+
+def _response(status, messages=(), records_scanned=0):
+    return {
+        'status': status,
+        'results': [[{'field': '@message', 'value': message}] for message in messages],
+        'statistics': {
+            'recordsMatched': float(len(messages)),
+            'recordsScanned': float(records_scanned),
+            'bytesScanned': float(records_scanned * 100),
+        },
+    }
+
+
+class TestAdaptivePolling:
+    """Tests for the polling interval of running queries."""
+
+    @pytest.mark.asyncio
+    async def test_interval_backs_off(self, tools, mock_context):
+        """Test that the polling interval grows exponentially up to the maximum."""
+        mock_client = Mock()
+        mock_client.get_query_results.side_effect = [_response('Running')] * 7 + [
+            _response('Complete', ['done'])
+        ]
+
+        with patch(
+            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.asyncio.sleep',
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            result = await tools._poll_for_query_completion(
+                mock_client, 'test-query-id', 300, mock_context
+            )
+
+        assert result['status'] == 'Complete'
+        assert result['results'] == [{'@message': 'done'}]
+        intervals = [call.args[0] for call in mock_sleep.call_args_list]
+        assert intervals == pytest.approx([0.5, 0.75, 1.125, 1.6875, 2.53125, 3.796875, 5.0])
+        mock_context.report_progress.assert_not_called()
+
+
+class TestStreamingResults:
+    """Tests for reporting partial results of running queries."""
+
+    @pytest.mark.asyncio
+    async def test_partial_results_reported(self, tools, mock_context):
+        """Test that progress and partial results are reported when they change."""
+        mock_client = Mock()
+        mock_client.get_query_results.side_effect = [
+            _response('Scheduled'),
+            _response('Running', ['a'], records_scanned=10),
+            _response('Running', ['a'], records_scanned=10),
+            _response('Running', ['a', 'b'], records_scanned=20),
+            _response('Complete', ['a', 'b', 'c'], records_scanned=30),
+        ]
+
+        with patch(
+            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.asyncio.sleep',
+            new_callable=AsyncMock,
+        ):
+            result = await tools._poll_for_query_completion(
+                mock_client, 'test-query-id', 300, mock_context, stream_partial_results=True
+            )
+
+        assert len(result['results']) == 3
+        progress = [
+            call.kwargs['progress'] for call in mock_context.report_progress.call_args_list
+        ]
+        assert progress == [0, 10, 20]
+        assert (
+            '20 records and 2000 bytes scanned'
+            in (mock_context.report_progress.call_args.kwargs['message'])
+        )
+        partial_results = [json.loads(call.args[0]) for call in mock_context.info.call_args_list]
+        assert [len(partial['results']) for partial in partial_results] == [1, 2]
+        assert partial_results[-1]['statistics']['recordsScanned'] == 20
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_partial_results(self, tools, mock_context):
+        """Test that a timed out streaming query returns its partial results."""
+        mock_client = Mock()
+        mock_client.get_query_results.return_value = _response('Running', ['a'], 10)
+
+        result = await tools._poll_for_query_completion(
+            mock_client, 'test-query-id', 1, mock_context, stream_partial_results=True
+        )
+
+        assert result['status'] == 'Polling Timeout'
+        assert result['results'] == [{'@message': 'a'}]
+        assert result['statistics']['recordsScanned'] == 10
+        mock_context.warning.assert_called_once()
+
+
+class TestFanOut:
+    """Tests for the execute_log_insights_query_fanout tool."""
+
+    @pytest.mark.asyncio
+    async def test_fanout_merges_results(self, tools, mock_context):
+        """Test that log groups are split into queries per region and results merged."""
+        clients = {}
+
+        def get_client(region):
+            if region in clients:
+                return clients[region]
+            client = Mock()
+            started = []
+
+            def start_query(**kwargs):
+                started.append(kwargs)
+                return {'queryId': f'{region}-{len(started)}'}
+
+            def get_query_results(queryId):
+                return {
+                    'status': 'Complete',
+                    'results': [
+                        [
+                            {'field': '@timestamp', 'value': f'2023-01-01 00:0{len(queryId)}'},
+                            {'field': '@message', 'value': queryId},
+                        ]
+                    ],
+                    'statistics': {'recordsMatched': 1.0, 'recordsScanned': 5.0},
+                }
+
+            client.start_query.side_effect = start_query
+            client.get_query_results.side_effect = get_query_results
+            client.started = started
+            clients[region] = client
+            return client
+
+        with patch.object(tools, '_get_logs_client', side_effect=get_client):
+            result = await tools.execute_log_insights_query_fanout(
+                mock_context,
+                targets=[
+                    LogsQueryTarget(
+                        region='us-east-1', log_group_names=[f'/group/{i}' for i in range(60)]
+                    ),
+                    LogsQueryTarget(region='eu-west-1', log_group_identifiers=['arn:group']),
+                ],
+                start_time=START_TIME,
+                end_time=END_TIME,
+                query_string='fields @timestamp, @message',
+                limit=None,
+                max_timeout=30,
+            )
+
+        assert result['status'] == 'Complete'
+        assert result['statistics'] == {'recordsMatched': 3.0, 'recordsScanned': 15.0}
+        assert [query['region'] for query in result['queries']] == [
+            'us-east-1',
+            'us-east-1',
+            'eu-west-1',
+        ]
+        assert sorted(len(kwargs['logGroupNames']) for kwargs in clients['us-east-1'].started) == [
+            10,
+            50,
+        ]
+        assert clients['eu-west-1'].started[0]['logGroupIdentifiers'] == ['arn:group']
+        assert [row['@region'] for row in result['results']] == [
+            'us-east-1',
+            'us-east-1',
+            'eu-west-1',
+        ]
+        timestamps = [row['@timestamp'] for row in result['results']]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_fanout_reports_incomplete_queries(self, tools, mock_context):
+        """Test that the merged status reflects queries that did not complete."""
+        mock_client = Mock()
+        mock_client.start_query.return_value = {'queryId': 'failed-query'}
+        mock_client.get_query_results.return_value = _response('Failed')
+
+        with patch.object(tools, '_get_logs_client', return_value=mock_client):
+            result = await tools.execute_log_insights_query_fanout(
+                mock_context,
+                targets=[LogsQueryTarget(log_group_names=['/group'])],
+                start_time=START_TIME,
+                end_time=END_TIME,
+                query_string='fields @message',
+                limit=10,
+                max_timeout=30,
+            )
+
+        assert result['status'] == 'Failed'
+        assert result['queries'][0]['queryId'] == 'failed-query'
+
+    @pytest.mark.asyncio
+    async def test_fanout_invalid_target(self, tools, mock_context):
+        """Test that a target without log groups returns an error result."""
+        result = await tools.execute_log_insights_query_fanout(
+            mock_context,
+            targets=[LogsQueryTarget(region='us-west-2')],
+            start_time=START_TIME,
+            end_time=END_TIME,
+            query_string='fields @message',
+            limit=10,
+            max_timeout=30,
+        )
+
+        assert result['status'] == 'Error'
+        assert 'Exactly one of log_group_names or log_group_identifiers' in result['message']
+        mock_context.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fanout_bounds_queries_per_region(self, tools, mock_context):
+        """Test that queries of a region run at most MAX_CONCURRENT_QUERIES_PER_REGION at once."""
+        tools.MAX_CONCURRENT_QUERIES_PER_REGION = 2
+        running = []
+        max_running = []
+
+        async def start_and_poll(logs_client, kwargs, *args):
+            running.append(kwargs['logGroupNames'])
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(kwargs['logGroupNames'])
+            return {'queryId': 'query', 'status': 'Complete', 'statistics': {}, 'results': []}
+
+        with (
+            patch.object(tools, '_get_logs_client', return_value=Mock()) as get_client,
+            patch.object(tools, '_start_and_poll_query', side_effect=start_and_poll),
+        ):
+            result = await tools.execute_log_insights_query_fanout(
+                mock_context,
+                targets=[
+                    LogsQueryTarget(
+                        region='us-east-1', log_group_names=[f'/group/{i}' for i in range(300)]
+                    )
+                ],
+                start_time=START_TIME,
+                end_time=END_TIME,
+                query_string='fields @message',
+                limit=10,
+                max_timeout=30,
+            )
+
+        assert result['status'] == 'Complete'
+        assert len(result['queries']) == 6
+        assert max(max_running) == 2
+        get_client.assert_called_once_with('us-east-1')
+
+    @pytest.mark.asyncio
+    async def test_fanout_progress_summed_across_queries(self, tools, mock_context):
+        """Test that streamed progress is the records scanned by all queries together."""
+        responses = {
+            'us-east-1': [_response('Running', records_scanned=10), _response('Complete')],
+            'eu-west-1': [_response('Running', records_scanned=5), _response('Complete')],
+        }
+
+        def get_client(region):
+            client = Mock()
+            client.start_query.return_value = {'queryId': region}
+            client.get_query_results.side_effect = responses[region]
+            return client
+
+        with (
+            patch.object(tools, '_get_logs_client', side_effect=get_client),
+            patch(
+                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.asyncio.sleep',
+                new_callable=AsyncMock,
+            ),
+        ):
+            await tools.execute_log_insights_query_fanout(
+                mock_context,
+                targets=[
+                    LogsQueryTarget(region='us-east-1', log_group_names=['/group']),
+                    LogsQueryTarget(region='eu-west-1', log_group_names=['/group']),
+                ],
+                start_time=START_TIME,
+                end_time=END_TIME,
+                query_string='fields @message',
+                limit=10,
+                max_timeout=30,
+                stream_partial_results=True,
+            )
+
+        progress = [
+            call.kwargs['progress'] for call in mock_context.report_progress.call_args_list
+        ]
+        assert len(progress) == 2
+        assert progress[-1] == 15
+        assert (
+            '2 queries started: 15 records'
+            in (mock_context.report_progress.call_args.kwargs['message'])
+        )
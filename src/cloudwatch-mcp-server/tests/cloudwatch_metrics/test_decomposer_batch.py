@@ -0,0 +1,130 @@
+"""Tests for batched decomposition in MetricDataDecomposer."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_analyzer import MetricAnalyzer
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_decomposer import (
+    MetricDataDecomposer,
+)
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
+    DecompositionResult,
+    Seasonality,
+    Trend,
+)
+
+
+HOUR_POINTS = np.arange(10 * 24)
+
+
+@pytest.fixture
+def decomposer():
+    """Create MetricDataDecomposer instance for testing."""
+    return MetricDataDecomposer()
+
+
+def _series():
+    rng = np.random.default_rng(42)
+    daily = 1000 + 500 * np.sin(2 * np.pi * HOUR_POINTS / 24)
+    return np.vstack(
+        [
+            daily,
+            daily + 5 * HOUR_POINTS,
+            daily - 5 * HOUR_POINTS,
+            rng.normal(100, 10, len(HOUR_POINTS)),
+            100 + 0.5 * HOUR_POINTS + rng.normal(0, 10, len(HOUR_POINTS)),
+            np.full(len(HOUR_POINTS), 7.0),
+        ]
+    )
+
+
+def test_batch_decomposition(decomposer):
+    """Test seasonality and trend detection over many hourly series at once."""
+    results = decomposer.detect_seasonality_and_trend_batch(_series(), 3600)
+
+    assert [r.seasonality for r in results] == [
+        Seasonality.ONE_DAY,
+        Seasonality.ONE_DAY,
+        Seasonality.ONE_DAY,
+        Seasonality.NONE,
+        Seasonality.NONE,
+        Seasonality.NONE,
+    ]
+    assert [r.trend for r in results] == [
+        Trend.NONE,
+        Trend.POSITIVE,
+        Trend.NEGATIVE,
+        Trend.NONE,
+        Trend.POSITIVE,
+        Trend.NONE,
+    ]
+
+
+def test_batch_matches_single_series(decomposer):
+    """Test that each row of a batch gets the result of the single series decomposition."""
+    timestamps_ms = (HOUR_POINTS * 3600 * 1000).tolist()
+    series = _series()
+
+    results = decomposer.detect_seasonality_and_trend_batch(series, 3600)
+
+    for row, result in zip(series, results):
+        assert result == decomposer.detect_seasonality_and_trend(
+            timestamps_ms, row.tolist(), 1.0, 3600
+        )
+
+
+def test_batch_edge_shapes(decomposer):
+    """Test batches without series or without points."""
+    assert decomposer.detect_seasonality_and_trend_batch(np.empty((0, 10)), 60) == []
+    assert (
+        decomposer.detect_seasonality_and_trend_batch(np.empty((2, 0)), 60)
+        == [DecompositionResult(seasonality=Seasonality.NONE, trend=Trend.NONE)] * 2
+    )
+    with pytest.raises(ValueError, match='2-D array'):
+        decomposer.detect_seasonality_and_trend_batch(np.arange(10.0), 60)
+
+
+def test_centered_moving_average_matches_pandas(decomposer):
+    """Test that the moving average matches the pandas centered rolling mean."""
+    values = np.random.default_rng(0).normal(size=(3, 50))
+
+    for window in (1, 4, 7, 24):
+        expected = np.vstack(
+            [pd.Series(row).rolling(window, center=True, min_periods=1).mean() for row in values]
+        )
+        np.testing.assert_allclose(
+            decomposer._centered_moving_average(values, window), expected, rtol=1e-12
+        )
+
+
+def test_trends_match_ols(decomposer):
+    """Test that least squares trends match the significance of statsmodels OLS fits."""
+    rng = np.random.default_rng(1)
+    x_vals = np.arange(40.0)
+    values = rng.normal(0, 1, (200, 40)) + rng.normal(0, 0.05, (200, 1)) * x_vals
+
+    trends = decomposer._compute_trends(values)
+
+    for row, trend in zip(values, trends):
+        model = sm.OLS(row, sm.add_constant(x_vals)).fit()
+        if model.pvalues[1] >= decomposer.STATISTICAL_SIGNIFICANCE_THRESHOLD:
+            assert trend == Trend.NONE
+        else:
+            assert trend == (Trend.POSITIVE if model.params[1] > 0 else Trend.NEGATIVE)
+
+
+def test_analyzer_groups_series_by_grid():
+    """Test that batched analysis decomposes series with different spans and periods."""
+    analyzer = MetricAnalyzer()
+    timestamps_ms = np.arange(7 * 24 * 12, dtype=np.int64) * 300_000
+    daily = 50 + 20 * np.sin(2 * np.pi * np.arange(len(timestamps_ms)) / (24 * 12))
+    late_start = daily.copy()
+    late_start[:100] = np.nan
+    ten_minutes = np.where(np.arange(len(timestamps_ms)) % 2 == 0, daily, np.nan)
+    values = np.vstack([daily, late_start, ten_minutes])
+
+    results = analyzer.analyze_metric_data_batch(timestamps_ms, values)
+
+    assert [r['seasonality_seconds'] for r in results] == [Seasonality.ONE_DAY.value] * 3
+    assert [r['data_quality']['publishing_period_seconds'] for r in results] == [300, 300, 600]
@@ -8,7 +8,6 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_decomposer imp
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import Seasonality, Trend
 from datetime import datetime
-from unittest.mock import patch
 
 
 class TestDecomposerTrend:
@@ -144,119 +143,94 @@ class TestDecomposerTrend:
 
     def test_seasonal_strength_zero_cycles(self, decomposer):
         """Test seasonal strength calculation with zero cycles."""
-        values = np.array([1.0, 2.0])  # Too few values for any seasonal period
+        values = np.array([[1.0, 2.0]])  # Too few values for any seasonal period
         seasonal_period = 10
 
-        strength, deseasonalized = decomposer._calculate_seasonal_strength(values, seasonal_period)
+        strength = decomposer._calculate_seasonal_strengths(values, seasonal_period)
 
-        assert strength == 0.0
-        assert deseasonalized is None
+        assert strength.tolist() == [0.0]
 
-    def test_compute_trend_with_nan_values(self, decomposer):
-        """Test trend computation with NaN values."""
-        values = np.array([1.0, 2.0, np.nan, 4.0, 5.0, np.nan, 7.0, 8.0, 9.0, 10.0])
+    def test_compute_trends_with_positions(self, decomposer):
+        """Test trend computation with the positions of the values."""
+        values = np.array([[1.0, 2.0, 4.0, 5.0, 7.0, 8.0, 9.0, 10.0]])
+        x_vals = np.array([0.0, 1.0, 3.0, 4.0, 6.0, 7.0, 8.0, 9.0])
 
-        result = decomposer._compute_trend(values)
+        result = decomposer._compute_trends(values, x_vals)
 
-        # Should handle NaN values and still detect trend
-        assert result == Trend.POSITIVE
+        # Should use the positions and still detect trend
+        assert result == [Trend.POSITIVE]
 
-    def test_compute_trend_with_inf_values(self, decomposer):
-        """Test trend computation with infinite values."""
-        values = np.array([1.0, 2.0, np.inf, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+    def test_compute_trends_of_each_row(self, decomposer):
+        """Test trend computation of several series at once."""
+        values = np.array(
+            [
+                [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                [6.0, 5.0, 4.0, 3.0, 2.0, 1.0],
+                [3.0, 3.0, 3.0, 3.0, 3.0, 3.0],
+            ]
+        )
 
-        result = decomposer._compute_trend(values)
+        result = decomposer._compute_trends(values)
 
-        # Should handle inf values and still detect trend
-        assert result == Trend.POSITIVE
+        assert result == [Trend.POSITIVE, Trend.NEGATIVE, Trend.NONE]
 
-    def test_compute_trend_insufficient_data(self, decomposer):
-        """Test trend computation with insufficient valid data."""
-        values = np.array([1.0, np.nan])
+    def test_compute_trends_insufficient_data(self, decomposer):
+        """Test trend computation with insufficient data."""
+        values = np.array([[1.0, 2.0]])
 
-        result = decomposer._compute_trend(values)
+        result = decomposer._compute_trends(values)
 
-        assert result == Trend.NONE
+        # Should return NONE with only 2 points
+        assert result == [Trend.NONE]
 
-    def test_compute_trend_exception_handling(self, decomposer):
-        """Test trend computation exception handling."""
-        # Empty array should trigger exception handling
-        values = np.array([])
+    def test_compute_trends_no_series(self, decomposer):
+        """Test trend computation without any series."""
+        values = np.empty((0, 10))
 
-        result = decomposer._compute_trend(values)
+        result = decomposer._compute_trends(values)
 
-        assert result == Trend.NONE
+        assert result == []
 
-    def test_compute_trend_only_two_valid_points(self, decomposer):
-        """Test trend computation with exactly 2 valid data points."""
-        values = np.array([np.nan, 1.0, np.nan, 2.0, np.nan])
-
-        result = decomposer._compute_trend(values)
-
-        # Should return NONE with only 2 valid points
-        assert result == Trend.NONE
-
-    def test_compute_trend_negative_slope(self, decomposer):
+    def test_compute_trends_negative_slope(self, decomposer):
         """Test trend computation detects negative slope."""
-        values = np.array([10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0])
+        values = np.array([[10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0]])
 
-        result = decomposer._compute_trend(values)
+        result = decomposer._compute_trends(values)
 
-        assert result == Trend.NEGATIVE
+        assert result == [Trend.NEGATIVE]
 
-    def test_compute_trend_with_statsmodels_exception(self, decomposer):
-        """Test trend computation handles statsmodels exceptions."""
-        # Create values that might cause numerical issues
-        values = np.array([1e-100, 1e-100, 1e-100, 1e-100, 1e-100])
+    def test_compute_trends_tiny_constant_values(self, decomposer):
+        """Test trend computation of constant values close to zero."""
+        values = np.array([[1e-100, 1e-100, 1e-100, 1e-100, 1e-100]])
 
-        result = decomposer._compute_trend(values)
+        result = decomposer._compute_trends(values)
 
-        # Should handle exception and return NONE
-        assert result == Trend.NONE
+        assert result == [Trend.NONE]
 
-    def test_calculate_seasonal_strength_edge_case(self, decomposer):
-        """Test seasonal strength with edge case that triggers n_cycles check."""
-        # Create array where length is less than 2*seasonal_period but division gives 0
-        values = np.array([1.0])
+    def test_calculate_seasonal_strengths_edge_case(self, decomposer):
+        """Test seasonal strength with a single value."""
+        values = np.array([[1.0]])
         seasonal_period = 10
 
-        strength, deseasonalized = decomposer._calculate_seasonal_strength(values, seasonal_period)
+        strength = decomposer._calculate_seasonal_strengths(values, seasonal_period)
 
-        assert strength == 0.0
-        assert deseasonalized is None
+        assert strength.tolist() == [0.0]
 
-    def test_calculate_seasonal_strength_negative_period(self, decomposer):
+    def test_calculate_seasonal_strengths_negative_period(self, decomposer):
         """Test seasonal strength with negative seasonal period."""
-        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        values = np.array([[1.0, 2.0, 3.0, 4.0, 5.0]])
         seasonal_period = -1
 
-        strength, deseasonalized = decomposer._calculate_seasonal_strength(values, seasonal_period)
+        strength = decomposer._calculate_seasonal_strengths(values, seasonal_period)
 
-        assert strength == 0.0
-        assert deseasonalized is None
+        assert strength.tolist() == [0.0]
 
-    def test_calculate_seasonal_strength_exactly_one_cycle(self, decomposer):
+    def test_calculate_seasonal_strengths_exactly_one_cycle(self, decomposer):
         """Test seasonal strength with exactly one seasonal cycle."""
-        # This should trigger the n_cycles <= 0 check since we need at least 2 cycles
         seasonal_period = 5
-        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])  # Exactly 1 cycle
+        values = np.array([[1.0, 2.0, 3.0, 4.0, 5.0]])  # Exactly 1 cycle
 
-        strength, deseasonalized = decomposer._calculate_seasonal_strength(values, seasonal_period)
+        strength = decomposer._calculate_seasonal_strengths(values, seasonal_period)
 
         # Should return 0.0 because we need at least 2 cycles
-        assert strength == 0.0
-        assert deseasonalized is None
-
-    def test_compute_trend_ols_exception(self, decomposer):
-        """Test trend computation handles OLS exceptions."""
-        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
-
-        # Mock OLS to raise an exception
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_decomposer.OLS'
-        ) as mock_ols:
-            mock_ols.side_effect = Exception('OLS error')
-
-            result = decomposer._compute_trend(values)
-
-            assert result == Trend.NONE
+        assert strength.tolist() == [0.0]
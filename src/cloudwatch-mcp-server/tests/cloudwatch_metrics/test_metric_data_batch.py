@@ -0,0 +1,238 @@
+"""Tests for batched metric data retrieval and analysis."""
+
+import numpy as np
+import pytest
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_analyzer import MetricAnalyzer
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
+    Dimension,
+    GetMetricDataBatchResponse,
+    MetricData,
+    MetricQuery,
+    MetricSeries,
+)
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+
+END_TIME = datetime(2023, 1, 1, 1, 0, tzinfo=timezone.utc)
+
+
+def _ts(minute):
+    return datetime(2023, 1, 1, 0, minute, tzinfo=timezone.utc)
+
+
+def _ms(minute):
+    return int(_ts(minute).timestamp() * 1000)
+
+
+@pytest.fixture
+def ctx():
+    """Create mock context."""
+    ctx = AsyncMock()
+    ctx.error = AsyncMock()
+    return ctx
+
+
+@pytest.fixture
+def cloudwatch_metrics_tools():
+    """Create CloudWatchMetricsTools instance."""
+    with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        return CloudWatchMetricsTools()
+
+
+@pytest.fixture
+def paginator(cloudwatch_metrics_tools):
+    """Mock the get_metric_data paginator of the CloudWatch client."""
+    mock_client = Mock()
+    mock_paginator = Mock()
+    mock_client.get_paginator.return_value = mock_paginator
+    with patch.object(
+        cloudwatch_metrics_tools, '_get_cloudwatch_client', return_value=mock_client
+    ):
+        yield mock_paginator
+
+
+def _metrics(count):
+    return [
+        MetricQuery(
+            namespace='AWS/EC2',
+            metric_name='CPUUtilization',
+            dimensions=[Dimension(name='InstanceId', value=f'i-{i}')],
+        )
+        for i in range(count)
+    ]
+
+
+class TestGetMetricDataBatch:
+    """Test cases for the get_metric_data_batch tool."""
+
+    @pytest.mark.asyncio
+    async def test_queries_split_into_requests(self, ctx, cloudwatch_metrics_tools, paginator):
+        """Test that at most 500 queries are sent per request."""
+        paginator.paginate.return_value = [{'MetricDataResults': []}]
+
+        result = await cloudwatch_metrics_tools.get_metric_data_batch(
+            ctx, metrics=_metrics(501), start_time=_ts(0), end_time=END_TIME
+        )
+
+        calls = paginator.paginate.call_args_list
+        assert [len(call.kwargs['MetricDataQueries']) for call in calls] == [500, 1]
+        assert calls[1].kwargs['MetricDataQueries'][0]['Id'] == 'm500'
+        assert calls[0].kwargs['MetricDataQueries'][0]['MetricStat']['Stat'] == 'Average'
+        assert len(result.series) == 501
+        assert result.timestamps == []
+
+    @pytest.mark.asyncio
+    async def test_pages_merged_and_aligned(self, ctx, cloudwatch_metrics_tools, paginator):
+        """Test that pages are merged per query and aligned to shared timestamps."""
+        paginator.paginate.return_value = [
+            {
+                'MetricDataResults': [
+                    {
+                        'Id': 'm0',
+                        'Label': 'i-0',
+                        'StatusCode': 'PartialData',
+                        'Timestamps': [_ts(2), _ts(0)],
+                        'Values': [3.0, 1.0],
+                    },
+                    {'Id': 'errors', 'Label': 'i-1', 'Timestamps': [_ts(1)], 'Values': [5.0]},
+                ],
+                'Messages': [{'Code': 'Info', 'Value': 'first page'}],
+            },
+            {
+                'MetricDataResults': [
+                    {
+                        'Id': 'm0',
+                        'Label': 'i-0',
+                        'StatusCode': 'Complete',
+                        'Timestamps': [_ts(3)],
+                        'Values': [4.0],
+                    }
+                ]
+            },
+        ]
+        metrics = _metrics(2)
+        metrics[1].id = 'errors'
+
+        result = await cloudwatch_metrics_tools.get_metric_data_batch(
+            ctx, metrics=metrics, start_time=_ts(0), end_time=END_TIME
+        )
+
+        assert result.period_seconds == 60
+        assert result.timestamps == [_ts(0), _ts(1), _ts(2), _ts(3)]
+        assert [s.id for s in result.series] == ['m0', 'errors']
+        assert result.series[0].statusCode == 'Complete'
+        assert result.series[0].values == [1.0, None, 3.0, 4.0]
+        assert result.series[1].values == [None, 5.0, None, None]
+        assert result.messages == [{'Code': 'Info', 'Value': 'first page'}]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids(self, ctx, cloudwatch_metrics_tools, paginator):
+        """Test that duplicate query IDs are rejected."""
+        metrics = _metrics(2)
+        metrics[0].id = 'm1'
+
+        with pytest.raises(ValueError, match='must be unique'):
+            await cloudwatch_metrics_tools.get_metric_data_batch(
+                ctx, metrics=metrics, start_time=_ts(0), end_time=END_TIME
+            )
+
+        ctx.error.assert_called_once()
+        paginator.paginate.assert_not_called()
+
+
+def test_batch_response_to_numpy():
+    """Test converting a batch response into arrays."""
+    response = GetMetricDataBatchResponse(
+        period_seconds=60,
+        timestamps=[_ts(0), _ts(1)],
+        series=[
+            MetricSeries(id='m0', label='a', statusCode='Complete', values=[1.0, None]),
+            MetricSeries(id='m1', label='b', statusCode='Complete', values=[None, 2.0]),
+        ],
+    )
+
+    timestamps_ms, values = response.to_numpy()
+
+    assert timestamps_ms.tolist() == [_ms(0), _ms(1)]
+    np.testing.assert_array_equal(values, [[1.0, np.nan], [np.nan, 2.0]])
+
+
+class TestAnalyzeMetricDataBatch:
+    """Test cases for MetricAnalyzer.analyze_metric_data_batch."""
+
+    def test_matches_single_series_analysis(self):
+        """Test that batched analysis returns the results of the single series analysis."""
+        rng = np.random.default_rng(0)
+        timestamps_ms = np.arange(3 * 24 * 60, dtype=np.int64) * 60_000
+        daily = 50 + 20 * np.sin(2 * np.pi * np.arange(len(timestamps_ms)) / (24 * 60))
+        gappy = rng.normal(10, 1, len(timestamps_ms))
+        gappy[::7] = np.nan
+        values = np.vstack(
+            [
+                daily,
+                gappy,
+                np.full(len(timestamps_ms), np.nan),
+                np.where(np.arange(len(timestamps_ms)) == 5, 1.0, np.nan),
+                np.linspace(0, 100, len(timestamps_ms)),
+            ]
+        )
+        analyzer = MetricAnalyzer()
+
+        results = analyzer.analyze_metric_data_batch(timestamps_ms, values)
+
+        assert len(results) == 5
+        assert results[2] == {'message': 'No metric data available for analysis'}
+        assert results[3] == {'message': 'Insufficient valid data points for analysis'}
+        for row in (0, 1, 4):
+            valid = np.isfinite(values[row])
+            expected = analyzer.analyze_metric_data(
+                MetricData(
+                    period_seconds=60,
+                    timestamps=timestamps_ms[valid].tolist(),
+                    values=values[row, valid].tolist(),
+                )
+            )
+            assert results[row]['statistics'] == pytest.approx(expected.pop('statistics'))
+            results[row].pop('statistics')
+            assert results[row] == expected
+
+
+class TestAnalyzeMetrics:
+    """Test cases for the analyze_metrics tool."""
+
+    @pytest.mark.asyncio
+    async def test_analyze_metrics(self, ctx, cloudwatch_metrics_tools, paginator):
+        """Test analyzing several metrics from one batch."""
+        paginator.paginate.return_value = [
+            {
+                'MetricDataResults': [
+                    {
+                        'Id': 'm0',
+                        'Timestamps': [_ts(i) for i in range(5)],
+                        'Values': [10.0 + i for i in range(5)],
+                    },
+                    {'Id': 'm1', 'Timestamps': [], 'Values': []},
+                ]
+            }
+        ]
+
+        results = await cloudwatch_metrics_tools.analyze_metrics(ctx, metrics=_metrics(2))
+
+        assert results[0]['message'] == 'Metric analysis completed successfully'
+        assert results[0]['data_points_found'] == 5
+        assert results[0]['statistics']['median'] == 12.0
+        assert results[1]['message'] == 'No metric data available for analysis'
+        assert results[1]['metric_info']['dimensions'] == [{'name': 'InstanceId', 'value': 'i-1'}]
+        assert len(paginator.paginate.call_args.kwargs['MetricDataQueries']) == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_metrics_error(self, ctx, cloudwatch_metrics_tools, paginator):
+        """Test that errors are reported to the context and raised."""
+        paginator.paginate.side_effect = Exception('Throttled')
+
+        with pytest.raises(Exception, match='Throttled'):
+            await cloudwatch_metrics_tools.analyze_metrics(ctx, metrics=_metrics(1))
+
+        assert ctx.error.call_count == 2
@@ -473,12 +473,14 @@ class TestEdgeCases:
             tools.register(mock_mcp)
 
             # Verify all tools are registered
-            assert mock_mcp.tool.call_count == 4
+            assert mock_mcp.tool.call_count == 6
             tool_calls = [call[1]['name'] for call in mock_mcp.tool.call_args_list]
             expected_tools = [
                 'get_metric_data',
+                'get_metric_data_batch',
                 'get_metric_metadata',
                 'analyze_metric',
+                'analyze_metrics',
                 'get_recommended_metric_alarms',
             ]
             for tool in expected_tools:
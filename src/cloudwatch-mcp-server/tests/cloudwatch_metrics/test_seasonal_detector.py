@@ -227,8 +227,8 @@ class TestSeasonalDetector:
             timestamps_ms, values, 60
         )
 
-        assert interpolated_timestamps == timestamps_ms
-        assert interpolated_values == values
+        assert interpolated_timestamps.tolist() == timestamps_ms
+        assert interpolated_values.tolist() == values
 
     def test_interpolation_with_empty_data(self, detector):
         """Test interpolation with empty data."""
@@ -236,8 +236,8 @@ class TestSeasonalDetector:
             [], [], 60
         )
 
-        assert interpolated_timestamps == []
-        assert interpolated_values == []
+        assert interpolated_timestamps.tolist() == []
+        assert interpolated_values.tolist() == []
 
     # Seasonal strength calculation tests
     def test_seasonal_strength_calculation(self, detector):
@@ -245,7 +245,7 @@ class TestSeasonalDetector:
         # Create perfect sine wave
         values = np.array([math.sin(2 * math.pi * i / 24) for i in range(72)])  # 3 days
 
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
         # Perfect sine wave should have high seasonal strength
         assert strength > MetricDataDecomposer.SEASONALITY_STRENGTH_THRESHOLD
@@ -254,16 +254,16 @@ class TestSeasonalDetector:
         """Test seasonal strength calculation with flat line."""
         values = np.array([1000.0] * 72)
 
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
-        # Flat line should have zero seasonal strength
-        assert strength == 0.0
+        # Flat line has no seasonal strength
+        assert np.isnan(strength)
 
     def test_seasonal_strength_insufficient_data(self, detector):
         """Test seasonal strength calculation with insufficient data."""
         values = np.array([1.0, 2.0, 3.0])  # Less than 2 periods
 
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
         assert strength == 0.0
 
@@ -271,7 +271,7 @@ class TestSeasonalDetector:
         """Test seasonal strength calculation with zero period."""
         values = np.array([1.0, 2.0, 3.0, 4.0])
 
-        strength, _ = detector._calculate_seasonal_strength(values, 0)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 0)
 
         assert strength == 0.0
 
@@ -279,7 +279,7 @@ class TestSeasonalDetector:
         """Test seasonal strength calculation with negative period."""
         values = np.array([1.0, 2.0, 3.0, 4.0])
 
-        strength, _ = detector._calculate_seasonal_strength(values, -1)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), -1)
 
         assert strength == 0.0
 
@@ -385,10 +385,10 @@ class TestSeasonalDetector:
         """Test numerical stability with constant values."""
         values = np.array([1000.0] * 72)
 
-        # This should not crash and should return 0 strength
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        # This should not crash and should return no strength
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
-        assert strength == 0.0
+        assert np.isnan(strength)
 
     def test_interpolation_with_none_period(self, detector):
         """Test interpolation with None period."""
@@ -426,7 +426,7 @@ class TestSeasonalDetector:
         # Create data shorter than one seasonal period
         values = np.array([1.0, 2.0])  # Only 2 points for period of 24
 
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
         assert strength == 0.0
 
@@ -461,7 +461,7 @@ class TestSeasonalDetector:
         # Create data that results in exactly 0 cycles
         values = np.array([])  # Empty array
 
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
         assert strength == 0.0
 
@@ -470,7 +470,7 @@ class TestSeasonalDetector:
         # Single value with period larger than data length
         values = np.array([1.0])  # 1 value, period 24 -> n_cycles = 1//24 = 0
 
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
         assert strength == 0.0
 
@@ -479,7 +479,7 @@ class TestSeasonalDetector:
         # 2 values with period 24 -> n_cycles = 2//24 = 0
         values = np.array([1.0, 2.0])  # 2 values, period 24
 
-        strength, _ = detector._calculate_seasonal_strength(values, 24)
+        (strength,) = detector._calculate_seasonal_strengths(values.reshape(1, -1), 24)
 
         assert strength == 0.0
 
@@ -490,7 +490,9 @@ class TestSeasonalDetector:
         seasonal_period = 10  # period > len(values), so n_cycles = 3//10 = 0
 
         # Call the method directly
-        strength, _ = detector._calculate_seasonal_strength(values, seasonal_period)
+        (strength,) = detector._calculate_seasonal_strengths(
+            values.reshape(1, -1), seasonal_period
+        )
 
-        # Should return 0.0 due to n_cycles <= 0 condition
+        # Should return 0.0 with fewer than two cycles
         assert strength == 0.0
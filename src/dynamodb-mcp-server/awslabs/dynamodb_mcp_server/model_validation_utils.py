@@ -13,8 +13,12 @@
 # limitations under the License.
 
 import boto3
+import itertools
+import json
 import os
 import psutil
+import re
+import shlex
 import shutil
 import socket
 import subprocess
@@ -23,10 +27,12 @@ import tarfile
 import tempfile
 import time
 import urllib.request
-from botocore.exceptions import ClientError, EndpointConnectionError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, EndpointConnectionError
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 
@@ -44,6 +50,8 @@ class DynamoDBLocalConfig:
     JAVA_PROPERTY_NAME = CONTAINER_NAME.replace('-', '.')
     DOWNLOAD_TIMEOUT = 30
     BATCH_SIZE = 25
+    MAX_WORKERS = 16
+    HEALTH_CHECK_TIMEOUT = 2
 
 
 class ContainerTools:
@@ -52,6 +60,44 @@ class ContainerTools:
     TOOLS = ['docker', 'finch', 'podman', 'nerdctl']
 
 
+class DynamoDBOperations:
+    """AWS CLI DynamoDB operations of access pattern implementations."""
+
+    # Operations that do not modify data, so they can run in parallel with each other. PartiQL
+    # operations only read data when all of their statements are SELECT statements.
+    READ_ONLY = {
+        'batch-get-item',
+        'describe-table',
+        'get-item',
+        'list-tables',
+        'query',
+        'scan',
+        'transact-get-items',
+    }
+    # PartiQL operations and the option holding their statements
+    PARTIQL_STATEMENT_OPTIONS = {
+        'batch-execute-statement': '--statements',
+        'execute-statement': '--statement',
+        'execute-transaction': '--transact-statements',
+    }
+    # Operations that accept --return-consumed-capacity
+    CONSUMED_CAPACITY = {
+        'batch-execute-statement',
+        'batch-get-item',
+        'batch-write-item',
+        'delete-item',
+        'execute-statement',
+        'execute-transaction',
+        'get-item',
+        'put-item',
+        'query',
+        'scan',
+        'transact-get-items',
+        'transact-write-items',
+        'update-item',
+    }
+
+
 class DynamoDBClientConfig:
     """Configuration for DynamoDB client setup."""
 
@@ -60,16 +106,23 @@ class DynamoDBClientConfig:
     DEFAULT_REGION = 'us-east-1'
 
 
-def _create_dynamodb_client(endpoint_url: Optional[str] = None):
+# Endpoint of the DynamoDB Local instance of the previous validation, reused while it responds
+_dynamodb_local_endpoint: Optional[str] = None
+
+
+def _create_dynamodb_client(endpoint_url: Optional[str] = None, config: Optional[Config] = None):
     """Create a DynamoDB client with appropriate configuration.
 
     Args:
         endpoint_url: Optional endpoint URL for local DynamoDB
+        config: Optional botocore client configuration
 
     Returns:
         boto3.client: Configured DynamoDB client
     """
-    client_kwargs = {'endpoint_url': endpoint_url} if endpoint_url else {}
+    client_kwargs: Dict[str, Any] = {'endpoint_url': endpoint_url} if endpoint_url else {}
+    if config:
+        client_kwargs['config'] = config
     if endpoint_url:
         client_kwargs.update(
             {
@@ -207,6 +260,49 @@ def _extract_port_from_cmdline(cmdline: list) -> Optional[int]:
     return None
 
 
+def _is_dynamodb_local_responding(endpoint: str) -> bool:
+    """Check with a single short request whether DynamoDB Local responds at an endpoint.
+
+    Args:
+        endpoint: DynamoDB Local endpoint URL
+
+    Returns:
+        bool: True if DynamoDB Local responds, False otherwise
+    """
+    client = _create_dynamodb_client(
+        endpoint,
+        Config(
+            connect_timeout=DynamoDBLocalConfig.HEALTH_CHECK_TIMEOUT,
+            read_timeout=DynamoDBLocalConfig.HEALTH_CHECK_TIMEOUT,
+            retries={'max_attempts': 1},
+        ),
+    )
+    try:
+        client.list_tables(Limit=1)
+        return True
+    except (BotoCoreError, ClientError) as e:
+        logger.debug(f'DynamoDB Local not responding at {endpoint}: {e}')
+        return False
+
+
+def _run_concurrently(func: Callable, args: List[Any]) -> List[Any]:
+    """Call a function for each argument in a thread pool.
+
+    Args:
+        func: Function to call with each argument
+        args: Arguments to call the function with
+
+    Returns:
+        List of results in the order of the arguments
+    """
+    if len(args) <= 1:
+        return [func(arg) for arg in args]
+    with ThreadPoolExecutor(
+        max_workers=min(DynamoDBLocalConfig.MAX_WORKERS, len(args))
+    ) as executor:
+        return list(executor.map(func, args))
+
+
 def _safe_extract_members(members):
     """Filter tar members to prevent path traversal attacks.
 
@@ -636,20 +732,27 @@ def check_dynamodb_readiness(endpoint: str) -> str:
 def setup_dynamodb_local() -> str:
     """Setup DynamoDB Local environment.
 
+    The instance of the previous validation is reused while it responds, without
+    discovering it again through the container tool or the running Java processes.
+
     Returns:
         str: DynamoDB Local endpoint URL
 
     Raises:
         RuntimeError: If neither Docker nor Java is available or setup fails
     """
-    # Try container setup first
-    endpoint = _try_container_setup()
-    if endpoint:
-        return endpoint
+    global _dynamodb_local_endpoint
+
+    if _dynamodb_local_endpoint:
+        if _is_dynamodb_local_responding(_dynamodb_local_endpoint):
+            logger.info(f'Reusing DynamoDB Local at {_dynamodb_local_endpoint}')
+            return _dynamodb_local_endpoint
+        _dynamodb_local_endpoint = None
 
-    # Fallback to Java
-    endpoint = _try_java_setup()
+    # Try container setup first, fallback to Java
+    endpoint = _try_container_setup() or _try_java_setup()
     if endpoint:
+        _dynamodb_local_endpoint = endpoint
         return endpoint
 
     raise RuntimeError(
@@ -712,26 +815,23 @@ def cleanup_validation_resources(dynamodb_client) -> Dict[str, Any]:
                 f'Got endpoint: {endpoint_url}. This prevents accidental production table deletion.'
             )
 
-    cleanup_response = {}
-
-    table_names = list_tables(dynamodb_client)
-
-    for table_name in table_names:
+    def delete_table(table_name: str) -> Dict[str, Any]:
         try:
             dynamodb_client.delete_table(TableName=table_name)
-            cleanup_response[table_name] = {
+            return {
                 'status': 'deleted',
                 'message': f'Table {table_name} deleted successfully',
             }
         except dynamodb_client.exceptions.ResourceNotFoundException:
-            cleanup_response[table_name] = {
+            return {
                 'status': 'not_found',
                 'message': f'Table {table_name} not found',
             }
         except Exception as e:
-            cleanup_response[table_name] = {'status': 'error', 'error': str(e)}
+            return {'status': 'error', 'error': str(e)}
 
-    return cleanup_response
+    table_names = list_tables(dynamodb_client)
+    return dict(zip(table_names, _run_concurrently(delete_table, table_names)))
 
 
 def list_tables(dynamodb_client) -> list:
@@ -753,7 +853,7 @@ def list_tables(dynamodb_client) -> list:
 
 
 def create_tables(dynamodb_client, tables: list) -> Dict[str, Any]:
-    """Create DynamoDB tables.
+    """Create DynamoDB tables concurrently.
 
     Args:
         dynamodb_client: Valid boto3 DynamoDB client
@@ -762,32 +862,37 @@ def create_tables(dynamodb_client, tables: list) -> Dict[str, Any]:
     Returns:
         Dictionary with table creation response for each table.
     """
-    table_creation_response = {}
 
-    for table_config in tables:
-        if not isinstance(table_config, dict) or 'TableName' not in table_config:
-            continue
+    def create_table(table_config: Dict[str, Any]) -> Dict[str, Any]:
         table_name = table_config['TableName']
-
         try:
             response = dynamodb_client.create_table(**table_config)
-            table_creation_response[table_name] = {
+            return {
                 'status': 'success',
                 'table_arn': response['TableDescription']['TableArn'],
             }
         except dynamodb_client.exceptions.ResourceInUseException:
-            table_creation_response[table_name] = {
+            return {
                 'status': 'exists',
                 'message': f'Table {table_name} already exists',
             }
         except Exception as e:
-            table_creation_response[table_name] = {'status': 'error', 'error': str(e)}
+            return {'status': 'error', 'error': str(e)}
 
-    return table_creation_response
+    table_configs = [
+        table_config
+        for table_config in tables
+        if isinstance(table_config, dict) and 'TableName' in table_config
+    ]
+    responses = _run_concurrently(create_table, table_configs)
+    return {
+        table_config['TableName']: response
+        for table_config, response in zip(table_configs, responses)
+    }
 
 
 def insert_items(dynamodb_client, items: dict) -> Dict[str, Any]:
-    """Insert items into DynamoDB tables using batch_write_item.
+    """Insert items into DynamoDB tables using concurrent batch_write_item calls.
 
     Args:
         dynamodb_client: Valid boto3 DynamoDB client
@@ -796,32 +901,197 @@ def insert_items(dynamodb_client, items: dict) -> Dict[str, Any]:
     Returns:
         Dictionary with insertion response for each table.
     """
-    item_insertion_response = {}
 
+    def write_batch(batch: tuple) -> tuple:
+        table_name, batch_items = batch
+        try:
+            response = dynamodb_client.batch_write_item(RequestItems={table_name: batch_items})
+            unprocessed_items = response.get('UnprocessedItems', {}).get(table_name, [])
+            return len(batch_items) - len(unprocessed_items), None
+        except Exception as e:
+            return 0, str(e)
+
+    # Split the items of all tables into batches
+    batches = []
     for table_name, table_items in items.items():
         if not isinstance(table_items, list):
             continue
+        for i in range(0, len(table_items), DynamoDBLocalConfig.BATCH_SIZE):
+            batches.append((table_name, table_items[i : i + DynamoDBLocalConfig.BATCH_SIZE]))
+
+    item_insertion_response = {
+        table_name: {'status': 'success', 'items_processed': 0}
+        for table_name, table_items in items.items()
+        if isinstance(table_items, list)
+    }
+    for (table_name, _), (processed_items, error) in zip(
+        batches, _run_concurrently(write_batch, batches)
+    ):
+        table_response = item_insertion_response[table_name]
+        if error is not None:
+            if table_response['status'] == 'success':
+                item_insertion_response[table_name] = {'status': 'error', 'error': error}
+        elif table_response['status'] == 'success':
+            table_response['items_processed'] += processed_items
+
+    return item_insertion_response
+
+
+def get_command_operation(command: str) -> Optional[str]:
+    """Get the operation of an AWS CLI DynamoDB command.
+
+    Args:
+        command: AWS CLI command string (e.g., "aws dynamodb query --table-name MyTable")
+
+    Returns:
+        Optional[str]: Operation name (e.g., 'query'), or None if it is not a DynamoDB command
+    """
+    parts = command.split()
+    if len(parts) > 2 and parts[0] == 'aws' and parts[1] == 'dynamodb':
+        return parts[2]
+    return None
 
-        total_items = len(table_items)
-        processed_items = 0
 
+def get_partiql_statements(command: str) -> Optional[List[str]]:
+    """Get the statements of an AWS CLI DynamoDB PartiQL command.
+
+    Statements are read from the --statement option of execute-statement, and from the JSON
+    or shorthand syntax of the statement lists of batch-execute-statement and
+    execute-transaction.
+
+    Args:
+        command: AWS CLI command string
+
+    Returns:
+        Optional[List[str]]: The statements, or None if the command is not a PartiQL command
+            or its statements cannot be read (e.g., they are given in a file)
+    """
+    option = DynamoDBOperations.PARTIQL_STATEMENT_OPTIONS.get(get_command_operation(command) or '')
+    if option is None:
+        return None
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+
+    values = []
+    for i, arg in enumerate(args):
+        if arg.startswith(f'{option}='):
+            values = [arg[len(option) + 1 :]]
+            break
+        if arg == option:
+            values = list(
+                itertools.takewhile(lambda value: not value.startswith('--'), args[i + 1 :])
+            )
+            break
+    if not values:
+        return None
+    if option == '--statement':
+        return values[:1]
+
+    try:
+        entries = json.loads(values[0])
+        statements = [entry['Statement'] for entry in entries]
+    except (ValueError, TypeError, KeyError):
+        # Shorthand syntax: Statement=SELECT ...,Parameters=[...] per statement
+        statements = [
+            value[len('Statement=') :].split(',Parameters=')[0]
+            for value in values
+            if value.startswith('Statement=')
+        ]
+    if not statements or not all(isinstance(statement, str) for statement in statements):
+        return None
+    return statements
+
+
+def is_read_only_command(command: str) -> bool:
+    """Check if an AWS CLI DynamoDB command only reads data.
+
+    PartiQL commands only read data when all of their statements are SELECT statements.
+    PartiQL commands whose statements cannot be read are treated as writes.
+
+    Args:
+        command: AWS CLI command string
+
+    Returns:
+        bool: True if the command does not modify data
+    """
+    if get_command_operation(command) in DynamoDBOperations.PARTIQL_STATEMENT_OPTIONS:
+        statements = get_partiql_statements(command)
+        return statements is not None and all(
+            re.match(r'\s*SELECT\b', statement, re.IGNORECASE) for statement in statements
+        )
+    return get_command_operation(command) in DynamoDBOperations.READ_ONLY
+
+
+def add_return_consumed_capacity(command: str) -> str:
+    """Request the total consumed capacity in an AWS CLI DynamoDB command.
+
+    Args:
+        command: AWS CLI command string
+
+    Returns:
+        str: Command with --return-consumed-capacity TOTAL, if the operation supports it and
+            the command does not request consumed capacity already
+    """
+    if (
+        get_command_operation(command) in DynamoDBOperations.CONSUMED_CAPACITY
+        and '--return-consumed-capacity' not in command
+    ):
+        return f'{command.rstrip()} --return-consumed-capacity TOTAL'
+    return command
+
+
+def get_consumed_capacity(response: Any) -> Any:
+    """Get the ConsumedCapacity of an AWS CLI DynamoDB command response.
+
+    Args:
+        response: Response dictionary, or execution result with the raw JSON response
+
+    Returns:
+        ConsumedCapacity dictionary or list, or None if the response has none
+    """
+    data = response
+    if not isinstance(response, dict):
+        raw_response = getattr(getattr(response, 'response', None), 'as_json', None)
         try:
-            # Process items in batches
-            for i in range(0, total_items, DynamoDBLocalConfig.BATCH_SIZE):
-                batch_items = table_items[i : i + DynamoDBLocalConfig.BATCH_SIZE]
-                response = dynamodb_client.batch_write_item(RequestItems={table_name: batch_items})
-                processed_items += len(batch_items) - len(
-                    response.get('UnprocessedItems', {}).get(table_name, [])
-                )
+            data = json.loads(raw_response) if isinstance(raw_response, str) else None
+        except ValueError:
+            data = None
+    if not isinstance(data, dict):
+        return None
+    return data.get('ConsumedCapacity')
 
-            item_insertion_response[table_name] = {
-                'status': 'success',
-                'items_processed': processed_items,
-            }
-        except Exception as e:
-            item_insertion_response[table_name] = {'status': 'error', 'error': str(e)}
 
-    return item_insertion_response
+def get_capacity_units(consumed_capacity: Any, read_only: bool) -> tuple[float, float]:
+    """Get the read and write capacity units of a ConsumedCapacity value.
+
+    Args:
+        consumed_capacity: ConsumedCapacity dictionary, or list of them for batch operations
+        read_only: Whether the operation only reads data, which attributes CapacityUnits
+            without a read/write breakdown to reads rather than writes
+
+    Returns:
+        tuple[float, float]: (read_capacity_units, write_capacity_units)
+    """
+    if isinstance(consumed_capacity, dict):
+        consumed_capacity = [consumed_capacity]
+    if not isinstance(consumed_capacity, list):
+        return 0.0, 0.0
+
+    read_capacity_units = 0.0
+    write_capacity_units = 0.0
+    for capacity in consumed_capacity:
+        if not isinstance(capacity, dict):
+            continue
+        if 'ReadCapacityUnits' in capacity or 'WriteCapacityUnits' in capacity:
+            read_capacity_units += capacity.get('ReadCapacityUnits', 0.0)
+            write_capacity_units += capacity.get('WriteCapacityUnits', 0.0)
+        elif read_only:
+            read_capacity_units += capacity.get('CapacityUnits', 0.0)
+        else:
+            write_capacity_units += capacity.get('CapacityUnits', 0.0)
+    return read_capacity_units, write_capacity_units
 
 
 def get_validation_result_transform_prompt() -> str:
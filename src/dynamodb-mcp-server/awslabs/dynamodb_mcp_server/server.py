@@ -14,17 +14,25 @@
 
 #!/usr/bin/env python3
 
+import asyncio
 import json
 import os
+import time
 from awslabs.aws_api_mcp_server.server import call_aws
 from awslabs.dynamodb_mcp_server.common import handle_exceptions
 from awslabs.dynamodb_mcp_server.db_analyzer import analyzer_utils
 from awslabs.dynamodb_mcp_server.db_analyzer.plugin_registry import PluginRegistry
 from awslabs.dynamodb_mcp_server.model_validation_utils import (
+    DynamoDBLocalConfig,
+    add_return_consumed_capacity,
     create_validation_resources,
+    get_capacity_units,
+    get_consumed_capacity,
     get_validation_result_transform_prompt,
+    is_read_only_command,
     setup_dynamodb_local,
 )
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pathlib import Path
@@ -308,10 +316,13 @@ async def dynamodb_data_model_validation(
 
     2. If dynamodb_data_model.json exists:
        - Validates the JSON structure (checks for required keys: tables, items, access_patterns)
-       - Sets up DynamoDB Local environment (Docker/Podman/Finch/nerdctl or Java fallback)
+       - Sets up DynamoDB Local environment (Docker/Podman/Finch/nerdctl or Java fallback),
+         reusing the instance of the previous validation while it is running
        - Cleans up existing tables from previous validation runs
-       - Creates tables and inserts test data from your model specification
-       - Tests all defined access patterns by executing their AWS CLI implementations
+       - Creates tables and inserts test data from your model specification concurrently
+       - Tests all defined access patterns by executing their AWS CLI implementations, running
+         consecutive read-only patterns in parallel and write patterns one at a time in order
+       - Records the latency and consumed read/write capacity units of each access pattern
        - Saves detailed validation results to dynamodb_model_validation.json
        - Transforms results to markdown format for comprehensive review
 
@@ -387,34 +398,57 @@ async def _execute_access_patterns(
 ) -> dict:
     """Execute all data model validation access patterns operations.
 
+    Consecutive read-only access patterns are executed in parallel. Access patterns that
+    modify data are executed one at a time in their order, so every pattern observes the
+    same data as in a sequential execution.
+
     Args:
         workspace_dir: Absolute path of the workspace directory
         access_patterns: List of access patterns to test
         endpoint_url: DynamoDB endpoint URL
 
     Returns:
-        Dictionary with all execution results
+        Dictionary with all execution results and a summary of their latency and capacity
     """
     try:
-        results = []
-        for pattern in access_patterns:
-            if 'implementation' not in pattern:
-                results.append(pattern)
-                continue
-
-            command = pattern['implementation']
-            result = await execute_dynamodb_command(command, endpoint_url)
-            results.append(
-                {
-                    'pattern_id': pattern.get('pattern'),
-                    'description': pattern.get('description'),
-                    'dynamodb_operation': pattern.get('dynamodb_operation'),
-                    'command': command,
-                    'response': result if isinstance(result, dict) else str(result),
-                }
+        # Access patterns without implementation are reported as they are
+        results: List[Any] = list(access_patterns)
+        start_time = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=DynamoDBLocalConfig.MAX_WORKERS) as executor:
+            read_only_indexes: List[int] = []
+            for index, pattern in enumerate(access_patterns):
+                if 'implementation' not in pattern:
+                    continue
+                if is_read_only_command(pattern['implementation']):
+                    read_only_indexes.append(index)
+                    continue
+                await _execute_access_pattern_group(
+                    executor, access_patterns, read_only_indexes, results, endpoint_url
+                )
+                read_only_indexes = []
+                await _execute_access_pattern_group(
+                    executor, access_patterns, [index], results, endpoint_url
+                )
+            await _execute_access_pattern_group(
+                executor, access_patterns, read_only_indexes, results, endpoint_url
             )
 
-        validation_response = {'validation_response': results}
+        executed = [
+            result
+            for pattern, result in zip(access_patterns, results)
+            if 'implementation' in pattern
+        ]
+        validation_response = {
+            'validation_response': results,
+            'performance_summary': {
+                'patterns_executed': len(executed),
+                'total_duration_ms': round((time.perf_counter() - start_time) * 1000, 2),
+                'total_latency_ms': round(sum(result['latency_ms'] for result in executed), 2),
+                'read_capacity_units': sum(result['read_capacity_units'] for result in executed),
+                'write_capacity_units': sum(result['write_capacity_units'] for result in executed),
+            },
+        }
 
         output_file = os.path.join(workspace_dir, DATA_MODEL_VALIDATION_RESULT_JSON_FILE)
         with open(output_file, 'w') as f:
@@ -426,5 +460,73 @@ async def _execute_access_patterns(
         return {'validation_response': [], 'error': str(e)}
 
 
+async def _execute_access_pattern_group(
+    executor: ThreadPoolExecutor,
+    access_patterns: List[Dict[str, Any]],
+    indexes: List[int],
+    results: List[Any],
+    endpoint_url: Optional[str],
+) -> None:
+    """Execute access patterns in parallel and store their results.
+
+    Args:
+        executor: Thread pool to execute the access patterns in
+        access_patterns: List of access patterns to test
+        indexes: Indexes of the access patterns to execute
+        results: List of results to store the execution results in, by access pattern index
+        endpoint_url: DynamoDB endpoint URL
+    """
+    loop = asyncio.get_running_loop()
+    pattern_results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                executor, _execute_access_pattern, access_patterns[index], endpoint_url
+            )
+            for index in indexes
+        )
+    )
+    for index, pattern_result in zip(indexes, pattern_results):
+        results[index] = pattern_result
+
+
+def _execute_access_pattern(
+    pattern: Dict[str, Any], endpoint_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """Execute an access pattern and measure its latency and consumed capacity.
+
+    The command is executed with its own event loop, so that access patterns executed in
+    worker threads do not wait for each other.
+
+    Args:
+        pattern: Access pattern with its AWS CLI implementation
+        endpoint_url: DynamoDB endpoint URL
+
+    Returns:
+        Dictionary with the execution result of the access pattern
+    """
+    command = pattern['implementation']
+    start_time = time.perf_counter()
+    result = asyncio.run(
+        execute_dynamodb_command(add_return_consumed_capacity(command), endpoint_url)
+    )
+    latency_ms = (time.perf_counter() - start_time) * 1000
+
+    consumed_capacity = get_consumed_capacity(result)
+    read_capacity_units, write_capacity_units = get_capacity_units(
+        consumed_capacity, is_read_only_command(command)
+    )
+    return {
+        'pattern_id': pattern.get('pattern'),
+        'description': pattern.get('description'),
+        'dynamodb_operation': pattern.get('dynamodb_operation'),
+        'command': command,
+        'response': result if isinstance(result, dict) else str(result),
+        'latency_ms': round(latency_ms, 2),
+        'consumed_capacity': consumed_capacity,
+        'read_capacity_units': read_capacity_units,
+        'write_capacity_units': write_capacity_units,
+    }
+
+
 if __name__ == '__main__':
     main()
@@ -28,3 +28,11 @@ def mock_mysql_functions(monkeypatch):
         'awslabs.dynamodb_mcp_server.server.DBConnectionSingleton.initialize', mock_initialize
     )
     monkeypatch.setattr('awslabs.dynamodb_mcp_server.server.mysql_query', mock_query)
+
+
+@pytest.fixture(autouse=True)
+def reset_dynamodb_local_endpoint(monkeypatch):
+    """Forget the DynamoDB Local endpoint reused between validations."""
+    monkeypatch.setattr(
+        'awslabs.dynamodb_mcp_server.model_validation_utils._dynamodb_local_endpoint', None
+    )
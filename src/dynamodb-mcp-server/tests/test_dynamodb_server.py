@@ -2,6 +2,7 @@ import json
 import os
 import pytest
 import pytest_asyncio
+import threading
 from awslabs.dynamodb_mcp_server.db_analyzer import analyzer_utils
 from awslabs.dynamodb_mcp_server.server import (
     _execute_access_patterns,
@@ -673,6 +674,58 @@ async def test_execute_access_patterns_exception_handling():
         assert 'Command failed' in result['error']
 
 
+@pytest.mark.asyncio
+async def test_execute_access_patterns_reads_in_parallel_between_writes():
+    """Test that consecutive reads run in parallel and writes run alone in order."""
+    access_patterns = [
+        {'pattern': 'AP1', 'implementation': 'aws dynamodb query --table-name Users'},
+        {'pattern': 'AP2', 'implementation': 'aws dynamodb get-item --table-name Users'},
+        {'pattern': 'AP3', 'implementation': 'aws dynamodb put-item --table-name Users'},
+        {'pattern': 'AP4', 'description': 'Pattern without implementation'},
+        {'pattern': 'AP5', 'implementation': 'aws dynamodb scan --table-name Users'},
+    ]
+    events = []
+    reads_started = threading.Barrier(2, timeout=5)
+
+    async def execute(command, endpoint_url=None):
+        operation = command.split()[2]
+        events.append(f'start {operation}')
+        if operation in ('query', 'get-item'):
+            # Both reads must be running at the same time to pass the barrier
+            reads_started.wait()
+            capacity = {'TableName': 'Users', 'CapacityUnits': 0.5}
+        else:
+            capacity = {'TableName': 'Users', 'CapacityUnits': 1.0}
+        events.append(f'end {operation}')
+        return {'ConsumedCapacity': capacity}
+
+    with patch(
+        'awslabs.dynamodb_mcp_server.server.execute_dynamodb_command', side_effect=execute
+    ) as mock_execute:
+        with patch('builtins.open', mock_open()):
+            result = await _execute_access_patterns('/tmp', access_patterns)
+
+    assert 'error' not in result
+    responses = result['validation_response']
+    assert [response['pattern_id'] for response in responses[:3]] == ['AP1', 'AP2', 'AP3']
+    assert responses[3] == access_patterns[3]
+    assert responses[0]['command'] == 'aws dynamodb query --table-name Users'
+    assert responses[0]['read_capacity_units'] == 0.5
+    assert responses[2]['write_capacity_units'] == 1.0
+    assert responses[4]['read_capacity_units'] == 1.0
+    assert all(responses[i]['latency_ms'] >= 0 for i in (0, 1, 2, 4))
+    assert events[4:] == ['start put-item', 'end put-item', 'start scan', 'end scan']
+    assert all(
+        call.args[0].endswith('--return-consumed-capacity TOTAL')
+        for call in mock_execute.call_args_list
+    )
+
+    summary = result['performance_summary']
+    assert summary['patterns_executed'] == 4
+    assert summary['read_capacity_units'] == 2.0
+    assert summary['write_capacity_units'] == 1.0
+
+
 # Tests for dynamodb_data_model_validation
 @pytest.mark.asyncio
 async def test_dynamodb_data_model_validation_success():
@@ -18,18 +18,24 @@ from awslabs.dynamodb_mcp_server.model_validation_utils import (
     _extract_port_from_cmdline,
     _safe_extract_members,
     _validate_download_url,
+    add_return_consumed_capacity,
     check_dynamodb_readiness,
     cleanup_validation_resources,
     create_tables,
     create_validation_resources,
     download_dynamodb_local_jar,
     find_available_port,
+    get_capacity_units,
+    get_command_operation,
+    get_consumed_capacity,
     get_container_path,
     get_existing_container_dynamodb_local_endpoint,
     get_existing_java_dynamodb_local_endpoint,
     get_java_path,
+    get_partiql_statements,
     get_validation_result_transform_prompt,
     insert_items,
+    is_read_only_command,
     list_tables,
     setup_dynamodb_local,
     start_container,
@@ -314,6 +320,43 @@ class TestDynamoDBLocalSetup:
 
             assert 'No working container tool or Java found' in str(exc_info.value)
 
+    def test_setup_dynamodb_local_reuses_warm_endpoint(self):
+        """Test setup reuses the endpoint of the previous setup without discovering it again."""
+        with (
+            patch(
+                'awslabs.dynamodb_mcp_server.model_validation_utils._try_container_setup',
+                return_value='http://localhost:8001',
+            ) as mock_container_setup,
+            patch(
+                'awslabs.dynamodb_mcp_server.model_validation_utils._create_dynamodb_client'
+            ) as mock_create_client,
+        ):
+            assert setup_dynamodb_local() == 'http://localhost:8001'
+            assert setup_dynamodb_local() == 'http://localhost:8001'
+
+            mock_container_setup.assert_called_once()
+            mock_create_client.return_value.list_tables.assert_called_once_with(Limit=1)
+
+    def test_setup_dynamodb_local_warm_endpoint_not_responding(self):
+        """Test setup discovers DynamoDB Local again when the previous endpoint stopped."""
+        with (
+            patch(
+                'awslabs.dynamodb_mcp_server.model_validation_utils._try_container_setup',
+                side_effect=['http://localhost:8001', 'http://localhost:8002'],
+            ) as mock_container_setup,
+            patch(
+                'awslabs.dynamodb_mcp_server.model_validation_utils._create_dynamodb_client'
+            ) as mock_create_client,
+        ):
+            mock_create_client.return_value.list_tables.side_effect = EndpointConnectionError(
+                endpoint_url='http://localhost:8001'
+            )
+
+            assert setup_dynamodb_local() == 'http://localhost:8001'
+            assert setup_dynamodb_local() == 'http://localhost:8002'
+
+            assert mock_container_setup.call_count == 2
+
     def test_parse_container_port_no_arrow(self):
         """Test _parse_container_port when no arrow is present."""
         from awslabs.dynamodb_mcp_server.model_validation_utils import _parse_container_port
@@ -857,6 +900,43 @@ class TestInsertItems:
         assert_successful_result(result, 'table1')
         assert_successful_result(result, 'table2')
 
+    def test_insert_items_multiple_batches(self, mock_dynamodb_client):
+        """Test item insertion split into concurrent batches of 25 items."""
+        items = {
+            'table1': [TestDataFactory.create_item_request(str(i)) for i in range(60)],
+            'table2': [TestDataFactory.create_item_request(str(i)) for i in range(10)],
+        }
+        result = insert_items(mock_dynamodb_client, items)
+
+        assert result == {
+            'table1': {'status': 'success', 'items_processed': 60},
+            'table2': {'status': 'success', 'items_processed': 10},
+        }
+        batch_sizes = sorted(
+            (table_name, len(table_items))
+            for call in mock_dynamodb_client.batch_write_item.call_args_list
+            for table_name, table_items in call.kwargs['RequestItems'].items()
+        )
+        assert batch_sizes == [('table1', 10), ('table1', 25), ('table1', 25), ('table2', 10)]
+
+    def test_insert_items_batch_error(self, mock_dynamodb_client):
+        """Test that a failed batch reports an error for its table only."""
+
+        def batch_write_item(RequestItems):
+            if 'table1' in RequestItems:
+                raise Exception('Batch write error')
+            return {'UnprocessedItems': {}}
+
+        mock_dynamodb_client.batch_write_item.side_effect = batch_write_item
+        items = {
+            'table1': [TestDataFactory.create_item_request(str(i)) for i in range(30)],
+            'table2': [TestDataFactory.create_item_request('1')],
+        }
+        result = insert_items(mock_dynamodb_client, items)
+
+        assert_error_result(result, 'table1', 'Batch write error')
+        assert result['table2'] == {'status': 'success', 'items_processed': 1}
+
     def test_insert_items_empty_items(self, mock_dynamodb_client):
         """Test item insertion with empty items dictionary."""
         result = insert_items(mock_dynamodb_client, {})
@@ -1608,3 +1688,132 @@ class TestGetValidationResultTransformPrompt:
 
             with pytest.raises(exception_type):
                 get_validation_result_transform_prompt()
+
+
+class TestAccessPatternCommands:
+    """Test cases for the access pattern command and consumed capacity helpers."""
+
+    @pytest.mark.parametrize(
+        'command,operation,read_only',
+        [
+            ('aws dynamodb query --table-name Users', 'query', True),
+            (
+                'aws dynamodb batch-get-item --request-items file://items.json',
+                'batch-get-item',
+                True,
+            ),
+            ('aws dynamodb put-item --table-name Users --item {}', 'put-item', False),
+            (
+                'aws dynamodb execute-statement --statement "SELECT * FROM Users WHERE id = \'1\'"',
+                'execute-statement',
+                True,
+            ),
+            (
+                "aws dynamodb execute-statement --statement='  select * from Users'",
+                'execute-statement',
+                True,
+            ),
+            (
+                'aws dynamodb execute-statement --statement "UPDATE Users SET a = 1"',
+                'execute-statement',
+                False,
+            ),
+            (
+                'aws dynamodb batch-execute-statement --statements '
+                '\'[{"Statement": "SELECT * FROM Users"}, {"Statement": "SELECT * FROM Orders"}]\'',
+                'batch-execute-statement',
+                True,
+            ),
+            (
+                'aws dynamodb batch-execute-statement --statements '
+                '\'[{"Statement": "SELECT * FROM Users"}, {"Statement": "DELETE FROM Users"}]\'',
+                'batch-execute-statement',
+                False,
+            ),
+            (
+                'aws dynamodb execute-transaction --transact-statements '
+                '"Statement=SELECT * FROM Users,Parameters=[{S=1}]" '
+                '"Statement=SELECT * FROM Orders" --endpoint-url http://localhost:8000',
+                'execute-transaction',
+                True,
+            ),
+            (
+                'aws dynamodb batch-execute-statement --statements file://statements.json',
+                'batch-execute-statement',
+                False,
+            ),
+            ('aws dynamodb execute-statement --statement "SELECT', 'execute-statement', False),
+            ('aws s3 ls', None, False),
+            ('aws', None, False),
+        ],
+    )
+    def test_get_command_operation(self, command, operation, read_only):
+        """Test getting the operation of a command and whether it only reads data."""
+        assert get_command_operation(command) == operation
+        assert is_read_only_command(command) is read_only
+
+    @pytest.mark.parametrize(
+        'command,expected',
+        [
+            (
+                'aws dynamodb query --table-name Users ',
+                'aws dynamodb query --table-name Users --return-consumed-capacity TOTAL',
+            ),
+            (
+                'aws dynamodb query --table-name Users --return-consumed-capacity INDEXES',
+                'aws dynamodb query --table-name Users --return-consumed-capacity INDEXES',
+            ),
+            ('aws dynamodb describe-table --table-name Users', None),
+        ],
+    )
+    def test_add_return_consumed_capacity(self, command, expected):
+        """Test requesting consumed capacity only for operations that support it."""
+        assert add_return_consumed_capacity(command) == (expected or command)
+
+    def test_get_consumed_capacity(self):
+        """Test getting the consumed capacity of dictionary and raw JSON responses."""
+        capacity = {'TableName': 'Users', 'CapacityUnits': 0.5}
+        raw_response = Mock()
+        raw_response.response.as_json = '{"Items": [], "ConsumedCapacity": {"CapacityUnits": 1}}'
+        invalid_response = Mock()
+        invalid_response.response.as_json = 'not json'
+
+        assert get_consumed_capacity({'ConsumedCapacity': capacity}) == capacity
+        assert get_consumed_capacity(raw_response) == {'CapacityUnits': 1}
+        assert get_consumed_capacity(invalid_response) is None
+        assert get_consumed_capacity(Exception('Command failed')) is None
+        assert get_consumed_capacity({'Items': []}) is None
+
+    def test_get_capacity_units(self):
+        """Test summing read and write capacity units."""
+        assert get_capacity_units({'CapacityUnits': 0.5}, read_only=True) == (0.5, 0.0)
+        assert get_capacity_units({'CapacityUnits': 2.0}, read_only=False) == (0.0, 2.0)
+        assert get_capacity_units(
+            [
+                {'TableName': 'Users', 'ReadCapacityUnits': 1.0, 'WriteCapacityUnits': 2.0},
+                {'TableName': 'Orders', 'CapacityUnits': 3.0},
+                'invalid',
+            ],
+            read_only=False,
+        ) == (1.0, 5.0)
+        assert get_capacity_units(None, read_only=True) == (0.0, 0.0)
+
+    def test_partiql_select_capacity_reported_as_reads(self):
+        """Test that the total capacity of a PartiQL SELECT is reported as read units."""
+        command = 'aws dynamodb execute-statement --statement "SELECT * FROM Users"'
+
+        assert get_capacity_units(
+            {'TableName': 'Users', 'CapacityUnits': 0.5}, is_read_only_command(command)
+        ) == (0.5, 0.0)
+
+    def test_get_partiql_statements(self):
+        """Test reading the statements of PartiQL commands."""
+        assert get_partiql_statements(
+            'aws dynamodb execute-statement --statement "SELECT * FROM Users"'
+        ) == ['SELECT * FROM Users']
+        assert get_partiql_statements(
+            'aws dynamodb batch-execute-statement --statements '
+            '\'[{"Statement": "INSERT INTO Users VALUE {}"}]\''
+        ) == ['INSERT INTO Users VALUE {}']
+        assert get_partiql_statements('aws dynamodb execute-statement') is None
+        assert get_partiql_statements('aws dynamodb query --table-name Users') is None
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Default constants for Git Repository Research MCP Server."""
 
+import os
+
 
 class Constants:
     """Constants used throughout the Git Repository Research MCP Server."""
@@ -216,6 +218,19 @@ class Constants:
     # Default directory for storing indices
     DEFAULT_INDEX_DIR = '.git_repo_research'
 
+    # Number of repository indices kept loaded in memory for search
+    RESIDENT_INDEX_CACHE_SIZE = int(os.getenv('GIT_REPO_RESEARCH_INDEX_CACHE_SIZE', '4'))
+
+    # Number of chunks sent per request to embedding models that accept several (Cohere)
+    EMBEDDING_BATCH_SIZE = int(os.getenv('GIT_REPO_RESEARCH_EMBEDDING_BATCH_SIZE', '32'))
+
+    # Maximum number of requests sent to the embedding model concurrently
+    EMBEDDING_MAX_CONCURRENCY = int(os.getenv('GIT_REPO_RESEARCH_EMBEDDING_CONCURRENCY', '4'))
+
+    # Maximum number of attempts of a throttled batch and maximum backoff between them
+    EMBEDDING_MAX_TRIES = 8
+    EMBEDDING_MAX_BACKOFF_SECONDS = 30
+
     # Default patterns for file inclusion
     DEFAULT_INCLUDE_PATTERNS = [
         '**/*.md',
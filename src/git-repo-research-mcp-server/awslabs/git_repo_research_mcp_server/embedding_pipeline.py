@@ -0,0 +1,353 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Embedding pipeline for Git Repository Research MCP Server.
+
+This module embeds the chunks of a repository in concurrent batches, backs off when
+the embedding model is throttled, and checkpoints embedded chunks to disk so an
+interrupted indexing run can resume. Every batch is a single request to the embedding
+model, so a retried batch only re-sends texts that were not embedded.
+"""
+
+import asyncio
+import backoff
+import numpy as np
+import os
+import sqlite3
+import threading
+import time
+from awslabs.git_repo_research_mcp_server.defaults import Constants
+from awslabs.git_repo_research_mcp_server.embeddings import content_hash
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from langchain_core.embeddings.embeddings import Embeddings
+from loguru import logger
+from typing import Any, Dict, List, Mapping, Optional, Tuple, cast
+
+
+CHECKPOINT_FILE = 'embeddings.checkpoint.db'
+
+# Model providers whose embedding requests carry several texts. LangChain embeds the texts
+# of other models, such as Amazon Titan, with one request per text.
+BATCH_EMBEDDING_PROVIDERS = ('cohere.',)
+
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceUnavailableException',
+    'ModelNotReadyException',
+}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Check if an error, or an error it was raised from, reports throttling.
+
+    Args:
+        error: Error raised by the embedding model
+
+    Returns:
+        True if the request can be retried after backing off
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, ClientError):
+            if current.response.get('Error', {}).get('Code') in THROTTLING_ERROR_CODES:
+                return True
+        elif any(code in str(current) for code in THROTTLING_ERROR_CODES):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def get_embedding_batch_size(model_id: str) -> int:
+    """Get the number of texts to embed per request for a model.
+
+    Args:
+        model_id: ID of the embedding model
+
+    Returns:
+        The configured batch size for models that embed several texts per request, else 1
+    """
+    if model_id.startswith(BATCH_EMBEDDING_PROVIDERS):
+        return Constants.EMBEDDING_BATCH_SIZE
+    return 1
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit of concurrent requests that halves on throttling and grows back on success."""
+
+    def __init__(self, max_concurrency: int):
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum number of concurrent requests
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+
+    def release(self, throttled: bool = False) -> None:
+        """Record the end of a request.
+
+        Args:
+            throttled: Whether the request was throttled
+        """
+        with self._condition:
+            self._active -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+
+class EmbeddingCheckpoint:
+    """Embeddings of an indexing run stored in SQLite, keyed by content hash."""
+
+    def __init__(self, path: str, model_id: str):
+        """Initialize the checkpoint.
+
+        Args:
+            path: Path to the checkpoint database
+            model_id: Embedding model the checkpointed embeddings were created with
+        """
+        self.path = path
+        self.model_id = model_id
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def load(self) -> Dict[str, List[float]]:
+        """Load the embeddings of an interrupted run.
+
+        Returns:
+            Content hash to embedding mapping, empty if there is no usable checkpoint
+        """
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT value FROM meta WHERE key = 'model_id'").fetchone()
+            if row is None or row[0] != self.model_id:
+                logger.info(f'Discarding embedding checkpoint of another model at {self.path}')
+                self.remove()
+                return {}
+            return {
+                key: cast(List[float], np.frombuffer(vector, dtype=np.float32).tolist())
+                for key, vector in conn.execute('SELECT key, vector FROM embeddings')
+            }
+        except sqlite3.Error as e:
+            logger.warning(f'Ignoring unreadable embedding checkpoint {self.path}: {e}')
+            self.remove()
+            return {}
+
+    def save(self, embeddings: Dict[str, List[float]]) -> None:
+        """Add embeddings to the checkpoint.
+
+        Args:
+            embeddings: Content hash to embedding mapping
+        """
+        conn = self._connect()
+        conn.executemany(
+            'INSERT OR REPLACE INTO embeddings VALUES (?, ?)',
+            (
+                (key, np.asarray(vector, dtype=np.float32).tobytes())
+                for key, vector in embeddings.items()
+            ),
+        )
+        conn.commit()
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the index it was created for is saved."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self) -> None:
+        """Close the checkpoint database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)'
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('model_id', ?)", (self.model_id,)
+            )
+            self._conn.commit()
+        return self._conn
+
+
+class EmbeddingPipeline:
+    """Embeds texts in concurrent batches with adaptive backoff and checkpointing."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        checkpoint: Optional[EmbeddingCheckpoint] = None,
+        batch_size: int = Constants.EMBEDDING_BATCH_SIZE,
+        max_concurrency: int = Constants.EMBEDDING_MAX_CONCURRENCY,
+        max_tries: int = Constants.EMBEDDING_MAX_TRIES,
+        max_backoff: float = Constants.EMBEDDING_MAX_BACKOFF_SECONDS,
+    ):
+        """Initialize the embedding pipeline.
+
+        Args:
+            embeddings: Embedding model
+            checkpoint: Checkpoint of embedded texts (optional)
+            batch_size: Number of texts per request to the embedding model, 1 for models
+                that embed each text with its own request (see get_embedding_batch_size)
+            max_concurrency: Maximum number of requests sent concurrently
+            max_tries: Maximum number of attempts of a throttled batch
+            max_backoff: Maximum number of seconds to wait before retrying a batch
+        """
+        self.embeddings = embeddings
+        self.checkpoint = checkpoint
+        self.batch_size = max(1, batch_size)
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self.throttled = 0
+        self._embed_batch = backoff.on_exception(
+            backoff.expo,
+            Exception,
+            max_tries=max_tries,
+            max_value=max_backoff,
+            giveup=lambda e: not is_throttling_error(e),
+            on_backoff=self._on_backoff,
+        )(self._invoke)
+
+    async def embed(
+        self,
+        texts: List[str],
+        ctx: Optional[Any] = None,
+        progress_range: Tuple[float, float] = (75, 90),
+    ) -> List[List[float]]:
+        """Embed texts, skipping those already in the checkpoint.
+
+        Args:
+            texts: Texts to embed
+            ctx: Context object for progress tracking (optional)
+            progress_range: Progress reported when embedding starts and ends
+
+        Returns:
+            Embedding of each text
+        """
+        keys = [content_hash(text) for text in texts]
+        vectors = self.checkpoint.load() if self.checkpoint is not None else {}
+        if vectors:
+            logger.info(f'Resuming from {len(vectors)} checkpointed embeddings')
+
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in pending:
+                pending[key] = text
+        items = list(pending.items())
+        batches = [items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+
+        if batches:
+            await self._embed_batches(batches, vectors, ctx, progress_range)
+        return [vectors[key] for key in keys]
+
+    async def _embed_batches(
+        self,
+        batches: List[List[Tuple[str, str]]],
+        vectors: Dict[str, List[float]],
+        ctx: Optional[Any],
+        progress_range: Tuple[float, float],
+    ) -> None:
+        total = sum(len(batch) for batch in batches)
+        logger.info(
+            f'Embedding {total} chunks in {len(batches)} batches '
+            f'with up to {self.limiter.max_concurrency} concurrent requests'
+        )
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.limiter.max_concurrency)
+        start_time = time.time()
+        embedded = 0
+        progress_start, progress_end = progress_range
+        # Checkpoint writes are grouped, as batches can hold a single text
+        unsaved: Dict[str, List[float]] = {}
+
+        async def run(batch: List[Tuple[str, str]]) -> Dict[str, List[float]]:
+            texts = [text for _, text in batch]
+            batch_vectors = await loop.run_in_executor(executor, self._embed_batch, texts)
+            return {key: vector for (key, _), vector in zip(batch, batch_vectors)}
+
+        tasks = [asyncio.ensure_future(run(batch)) for batch in batches]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                batch_vectors = await completed
+                vectors.update(batch_vectors)
+                if self.checkpoint is not None:
+                    unsaved.update(batch_vectors)
+                    if len(unsaved) >= Constants.EMBEDDING_BATCH_SIZE:
+                        self.checkpoint.save(unsaved)
+                        unsaved.clear()
+
+                embedded += len(batch_vectors)
+                rate = embedded / max(time.time() - start_time, 1e-6)
+                if ctx:
+                    await ctx.report_progress(
+                        progress_start + (progress_end - progress_start) * embedded / total,
+                        100,
+                        f'Embedded {embedded}/{total} chunks ({rate:.1f} chunks/sec)',
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            if self.checkpoint is not None:
+                if unsaved:
+                    self.checkpoint.save(unsaved)
+                self.checkpoint.close()
+
+        elapsed = time.time() - start_time
+        logger.info(
+            f'Embedded {total} chunks in {elapsed:.1f}s ({total / max(elapsed, 1e-6):.1f} '
+            f'chunks/sec, {self.throttled} throttled requests)'
+        )
+
+    def _invoke(self, texts: List[str]) -> List[List[float]]:
+        self.limiter.acquire()
+        throttled = False
+        try:
+            return self.embeddings.embed_documents(texts)
+        except Exception as e:
+            throttled = is_throttling_error(e)
+            raise
+        finally:
+            self.limiter.release(throttled)
+
+    def _on_backoff(self, details: Mapping[str, Any]) -> None:
+        self.throttled += 1
+        logger.warning(
+            f'Embedding model throttled, retrying in {details["wait"]:.1f}s '
+            f'with up to {self.limiter.limit} concurrent requests'
+        )
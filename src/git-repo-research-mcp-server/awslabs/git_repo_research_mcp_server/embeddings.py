@@ -17,12 +17,14 @@ This module provides functionality for generating embeddings from text
 using Amazon Bedrock models via LangChain.
 """
 
+import hashlib
 import os
+import threading
 from awslabs.git_repo_research_mcp_server.models import EmbeddingModel
 from langchain_aws import BedrockEmbeddings
 from langchain_core.embeddings.embeddings import Embeddings
 from loguru import logger
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 def create_bedrock_embeddings(
@@ -67,3 +69,74 @@ def get_embedding_model(
         Embeddings instance
     """
     return create_bedrock_embeddings(model_id, aws_region, aws_profile)
+
+
+def content_hash(text: str) -> str:
+    """Get the key of a text in an embedding cache.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        SHA-256 hex digest of the text
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that only sends texts it has not embedded before to the model.
+
+    Embeddings are cached by content hash, so unchanged chunks of a re-indexed repository
+    reuse the vectors of the previous index instead of being embedded again. Batches may be
+    embedded concurrently from several threads.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: Optional[Dict[str, List[float]]] = None):
+        """Initialize the cached embeddings.
+
+        Args:
+            embeddings: Embedding model used for texts missing from the cache
+            cache: Initial content hash to embedding mapping (optional)
+        """
+        self.embeddings = embeddings
+        self.cache: Dict[str, List[float]] = cache if cache is not None else {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, using cached embeddings where available.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding of each text
+        """
+        keys = [content_hash(text) for text in texts]
+
+        # Embed each distinct missing text once
+        missing: Dict[str, str] = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key not in self.cache and key not in missing:
+                    missing[key] = text
+
+        embedded = self.embeddings.embed_documents(list(missing.values())) if missing else []
+
+        with self._lock:
+            self.cache.update(zip(missing.keys(), embedded))
+            self.misses += len(missing)
+            self.hits += len(texts) - len(missing)
+            return [self.cache[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query with the underlying model.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding of the query
+        """
+        return self.embeddings.embed_query(text)
@@ -0,0 +1,346 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Index storage for Git Repository Research MCP Server.
+
+This module provides the on-disk layout of the document store of an index and
+keeps the indices used for search resident in memory between queries.
+"""
+
+import faiss
+import json
+import os
+import sqlite3
+import threading
+from awslabs.git_repo_research_mcp_server.defaults import Constants
+from collections import OrderedDict
+from langchain_community.docstore.base import Docstore
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_core.documents import Document
+from loguru import logger
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+
+FAISS_FILE = 'index.faiss'
+DOCSTORE_FILE = 'docstore.db'
+LEGACY_DOCSTORE_FILE = 'docstore.json'
+LEGACY_MAPPING_FILE = 'index_mapping.json'
+
+
+def write_docstore(
+    index_path: str, documents: Dict[str, Document], index_to_docstore_id: Dict[int, str]
+) -> None:
+    """Write the documents of an index to a SQLite database.
+
+    Each document is stored in a row keyed by its position in the FAISS index, so a
+    search only reads the rows of the documents it returns. The database is written to
+    a temporary file and then moved into place, so readers never see a partial file.
+
+    Args:
+        index_path: Path to the index directory
+        documents: Mapping of document ID to document
+        index_to_docstore_id: Mapping of FAISS index position to document ID
+    """
+    docstore_path = os.path.join(index_path, DOCSTORE_FILE)
+    tmp_path = f'{docstore_path}.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute(
+            'CREATE TABLE documents ('
+            'position INTEGER PRIMARY KEY, '
+            'doc_id TEXT NOT NULL UNIQUE, '
+            'page_content TEXT NOT NULL, '
+            'metadata TEXT NOT NULL)'
+        )
+        conn.executemany(
+            'INSERT INTO documents VALUES (?, ?, ?, ?)',
+            (
+                (
+                    position,
+                    doc_id,
+                    documents[doc_id].page_content,
+                    json.dumps(documents[doc_id].metadata),
+                )
+                for position, doc_id in sorted(index_to_docstore_id.items())
+                if doc_id in documents
+            ),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, docstore_path)
+
+    # Remove the JSON files of indices written before the SQLite layout
+    for legacy_file in (LEGACY_DOCSTORE_FILE, LEGACY_MAPPING_FILE):
+        legacy_path = os.path.join(index_path, legacy_file)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+
+
+def read_docstore(index_path: str) -> Tuple[InMemoryDocstore, Dict[int, str]]:
+    """Read all documents of an index into memory.
+
+    Args:
+        index_path: Path to the index directory
+
+    Returns:
+        Tuple of the document store and the mapping of FAISS index position to document ID
+    """
+    docstore_path = os.path.join(index_path, DOCSTORE_FILE)
+    if not os.path.exists(docstore_path):
+        return read_legacy_docstore(index_path)
+
+    documents = {}
+    index_to_docstore_id = {}
+    conn = sqlite3.connect(f'file:{docstore_path}?mode=ro', uri=True)
+    try:
+        for position, doc_id, page_content, metadata in conn.execute(
+            'SELECT position, doc_id, page_content, metadata FROM documents'
+        ):
+            documents[doc_id] = Document(page_content=page_content, metadata=json.loads(metadata))
+            index_to_docstore_id[position] = doc_id
+    finally:
+        conn.close()
+    return InMemoryDocstore(documents), index_to_docstore_id
+
+
+def read_legacy_docstore(index_path: str) -> Tuple[InMemoryDocstore, Dict[int, str]]:
+    """Read the documents of an index stored as JSON files.
+
+    Args:
+        index_path: Path to the index directory
+
+    Returns:
+        Tuple of the document store and the mapping of FAISS index position to document ID
+    """
+    with open(os.path.join(index_path, LEGACY_DOCSTORE_FILE), 'r') as f:
+        docstore_data = json.load(f)
+    documents = {
+        doc_id: Document(page_content=doc_data['page_content'], metadata=doc_data['metadata'])
+        for doc_id, doc_data in docstore_data.items()
+    }
+
+    with open(os.path.join(index_path, LEGACY_MAPPING_FILE), 'r') as f:
+        mapping_data = json.load(f)
+    # Convert string keys back to integers for the mapping
+    index_to_docstore_id = {int(k): v for k, v in mapping_data.items()}
+
+    return InMemoryDocstore(documents), index_to_docstore_id
+
+
+def write_faiss_index(index: Any, index_path: str) -> None:
+    """Write a FAISS index to a temporary file and move it into place.
+
+    Searches may have the previous file memory-mapped, so it is replaced rather than
+    overwritten in place.
+
+    Args:
+        index: FAISS index
+        index_path: Path to the index directory
+    """
+    faiss_path = os.path.join(index_path, FAISS_FILE)
+    tmp_path = f'{faiss_path}.tmp'
+    faiss.write_index(index, tmp_path)
+    os.replace(tmp_path, faiss_path)
+
+
+class SQLiteDocstore(Docstore):
+    """Read-only document store that reads documents from SQLite on demand."""
+
+    def __init__(self, docstore_path: str):
+        """Open the document store.
+
+        Args:
+            docstore_path: Path to the SQLite database
+        """
+        self._conn = sqlite3.connect(
+            f'file:{docstore_path}?mode=ro', uri=True, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+
+    def search(self, search: str) -> Union[str, Document]:
+        """Get a document by ID.
+
+        Args:
+            search: Document ID
+
+        Returns:
+            The document, or a message if it is not found
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT page_content, metadata FROM documents WHERE doc_id = ?', (search,)
+            ).fetchone()
+        if row is None:
+            return f'ID {search} not found.'
+        return Document(page_content=row[0], metadata=json.loads(row[1]))
+
+    def index_to_docstore_id(self) -> Dict[int, str]:
+        """Get the mapping of FAISS index position to document ID.
+
+        Returns:
+            Mapping of FAISS index position to document ID
+        """
+        with self._lock:
+            return dict(self._conn.execute('SELECT position, doc_id FROM documents'))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResidentIndex(NamedTuple):
+    """Components of an index kept in memory for search."""
+
+    index: Any
+    docstore: Docstore
+    index_to_docstore_id: Dict[int, str]
+
+
+def _index_signature(index_path: str) -> Tuple[int, ...]:
+    """Get the modification times of the files of an index.
+
+    Args:
+        index_path: Path to the index directory
+
+    Returns:
+        Modification times in nanoseconds of the index files that exist
+    """
+    signature = []
+    for file_name in (FAISS_FILE, DOCSTORE_FILE, LEGACY_DOCSTORE_FILE, LEGACY_MAPPING_FILE):
+        path = os.path.join(index_path, file_name)
+        signature.append(os.stat(path).st_mtime_ns if os.path.exists(path) else 0)
+    return tuple(signature)
+
+
+class ResidentIndexManager:
+    """Bounded LRU of loaded indices, keyed by index path and file modification times.
+
+    The FAISS index is memory-mapped, so the operating system pages vectors in as needed
+    and shares them across processes, and documents are read from SQLite on demand. An
+    index that was rebuilt on disk is reloaded on its next use.
+    """
+
+    def __init__(self, max_size: int = Constants.RESIDENT_INDEX_CACHE_SIZE):
+        """Initialize the manager; a max_size of 0 disables residency.
+
+        Args:
+            max_size: Maximum number of indices kept loaded
+        """
+        self.max_size = max_size
+        self._indices: 'OrderedDict[str, Tuple[Tuple[int, ...], ResidentIndex]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, index_path: str) -> ResidentIndex:
+        """Get the loaded index at a path, loading it if needed.
+
+        Args:
+            index_path: Path to the index directory
+
+        Returns:
+            The loaded index
+        """
+        index_path = os.path.abspath(index_path)
+        signature = _index_signature(index_path)
+
+        with self._lock:
+            cached = self._indices.get(index_path)
+            if cached is not None and cached[0] == signature:
+                self._indices.move_to_end(index_path)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        resident = self._load(index_path)
+        if self.max_size <= 0:
+            return resident
+
+        with self._lock:
+            previous = self._indices.pop(index_path, None)
+            if previous is not None:
+                self._close(previous[1])
+            self._indices[index_path] = (signature, resident)
+            while len(self._indices) > self.max_size:
+                _, (_, evicted) = self._indices.popitem(last=False)
+                self._close(evicted)
+        return resident
+
+    def invalidate(self, index_path: str) -> None:
+        """Unload the index at a path, e.g. before it is deleted.
+
+        Args:
+            index_path: Path to the index directory
+        """
+        with self._lock:
+            cached = self._indices.pop(os.path.abspath(index_path), None)
+        if cached is not None:
+            self._close(cached[1])
+
+    def clear(self) -> None:
+        """Unload all indices."""
+        with self._lock:
+            indices = list(self._indices.values())
+            self._indices.clear()
+        for _, resident in indices:
+            self._close(resident)
+
+    def __len__(self) -> int:
+        """Get the number of loaded indices."""
+        return len(self._indices)
+
+    @staticmethod
+    def _load(index_path: str) -> ResidentIndex:
+        faiss_path = os.path.join(index_path, FAISS_FILE)
+        try:
+            index = faiss.read_index(faiss_path, faiss.IO_FLAG_MMAP)
+        except RuntimeError as e:
+            logger.debug(f'Cannot memory-map {faiss_path}, reading it instead: {e}')
+            index = faiss.read_index(faiss_path)
+
+        docstore_path = os.path.join(index_path, DOCSTORE_FILE)
+        if os.path.exists(docstore_path):
+            docstore = SQLiteDocstore(docstore_path)
+            index_to_docstore_id = docstore.index_to_docstore_id()
+        else:
+            docstore, index_to_docstore_id = read_legacy_docstore(index_path)
+
+        logger.info(f'Loaded index at {index_path} with {index.ntotal} vectors')
+        return ResidentIndex(index, docstore, index_to_docstore_id)
+
+    @staticmethod
+    def _close(resident: ResidentIndex) -> None:
+        if isinstance(resident.docstore, SQLiteDocstore):
+            resident.docstore.close()
+
+
+RESIDENT_INDEXES = ResidentIndexManager()
+
+
+def get_resident_index(index_path: str) -> Optional[ResidentIndex]:
+    """Get the loaded index at a path.
+
+    Args:
+        index_path: Path to the index directory
+
+    Returns:
+        The loaded index, or None if there is no index at the path
+    """
+    if not os.path.exists(os.path.join(index_path, FAISS_FILE)):
+        return None
+    return RESIDENT_INDEXES.get(index_path)
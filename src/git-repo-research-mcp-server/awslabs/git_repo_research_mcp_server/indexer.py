@@ -19,33 +19,55 @@ for Git repositories using LangChain's FAISS implementation.
 
 import faiss
 import json
+import numpy as np
 import os
 import shutil
 import time
 from awslabs.git_repo_research_mcp_server.defaults import Constants
-from awslabs.git_repo_research_mcp_server.embeddings import get_embedding_model
+from awslabs.git_repo_research_mcp_server.embedding_pipeline import (
+    CHECKPOINT_FILE,
+    EmbeddingCheckpoint,
+    EmbeddingPipeline,
+    get_embedding_batch_size,
+)
+from awslabs.git_repo_research_mcp_server.embeddings import (
+    CachedEmbeddings,
+    content_hash,
+    get_embedding_model,
+)
+from awslabs.git_repo_research_mcp_server.index_store import (
+    get_resident_index,
+    read_docstore,
+    write_docstore,
+    write_faiss_index,
+)
 from awslabs.git_repo_research_mcp_server.models import (
     EmbeddingModel,
     IndexMetadata,
     IndexRepositoryResponse,
 )
 from awslabs.git_repo_research_mcp_server.repository import (
+    chunk_files,
     cleanup_repository,
     clone_repository,
+    get_changed_files,
+    get_file_extension_stats,
     get_repository_name,
+    get_uncommitted_files,
     is_git_repo,
     is_git_url,
+    is_text_file,
     process_repository,
 )
+from awslabs.git_repo_research_mcp_server.utils import load_metadata
 from datetime import datetime
 from git import Repo
-from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from loguru import logger
 from pydantic import BaseModel, field_validator
 from pydantic_core.core_schema import ValidationInfo
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 
 class RepositoryConfig(BaseModel):
@@ -61,6 +83,7 @@ class RepositoryConfig(BaseModel):
     exclude_patterns: Optional[List[str]] = None
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    incremental: bool = True
 
     @field_validator('repository_path')
     @classmethod
@@ -190,6 +213,33 @@ def get_docstore_dict_size(docstore):
     return len(get_docstore_dict(docstore))
 
 
+def get_embedding_cache(vector_store, doc_ids=None) -> Dict[str, List[float]]:
+    """Get the embeddings stored in a FAISS vector store, keyed by content hash.
+
+    Args:
+        vector_store: FAISS vector store
+        doc_ids: IDs of the documents to get the embeddings of (optional, all if not provided)
+
+    Returns:
+        Dictionary mapping the content hash of each document to its embedding, empty if
+        the index does not support reconstructing vectors
+    """
+    docstore = get_docstore_dict(vector_store.docstore)
+    doc_id_to_index = {doc_id: i for i, doc_id in vector_store.index_to_docstore_id.items()}
+
+    cache = {}
+    try:
+        for doc_id in doc_id_to_index if doc_ids is None else doc_ids:
+            doc = docstore.get(doc_id)
+            if doc is not None and doc_id in doc_id_to_index:
+                vector = vector_store.index.reconstruct(doc_id_to_index[doc_id])
+                cache[content_hash(doc.page_content)] = vector.tolist()
+    except RuntimeError as e:
+        logger.warning(f'Cannot reuse embeddings of the existing index: {e}')
+        return {}
+    return cache
+
+
 def save_index_without_pickle(vector_store, index_path):
     """Save FAISS index without using pickle.
 
@@ -197,30 +247,18 @@ def save_index_without_pickle(vector_store, index_path):
         vector_store: FAISS vector store
         index_path: Path to save the index
 
-    This function saves a FAISS index using FAISS's native methods and JSON
-    instead of pickle for serialization.
+    This function saves a FAISS index using FAISS's native methods and the
+    documents in SQLite instead of pickle for serialization.
     """
     os.makedirs(index_path, exist_ok=True)
 
     # 1. Save FAISS index using faiss's native methods
-    faiss_path = os.path.join(index_path, 'index.faiss')
-    faiss.write_index(vector_store.index, faiss_path)
+    write_faiss_index(vector_store.index, index_path)
 
-    # 2. Save docstore as JSON
-    docstore_path = os.path.join(index_path, 'docstore.json')
-    docstore_data = {}
-    for doc_id, doc in get_docstore_dict(vector_store.docstore).items():
-        docstore_data[doc_id] = {'page_content': doc.page_content, 'metadata': doc.metadata}
-
-    with open(docstore_path, 'w') as f:
-        json.dump(docstore_data, f)
-
-    # 3. Save index_to_docstore_id mapping as JSON
-    mapping_path = os.path.join(index_path, 'index_mapping.json')
-    # Convert numeric keys to strings for JSON serialization
-    mapping = {str(k): v for k, v in vector_store.index_to_docstore_id.items()}
-    with open(mapping_path, 'w') as f:
-        json.dump(mapping, f)
+    # 2. Save docstore and index_to_docstore_id mapping in SQLite
+    write_docstore(
+        index_path, get_docstore_dict(vector_store.docstore), vector_store.index_to_docstore_id
+    )
 
 
 def save_chunk_map_without_pickle(chunk_map, index_path):
@@ -382,6 +420,32 @@ class RepositoryIndexer:
             if ctx:
                 await ctx.report_progress(0, 100)
 
+            index_path = self._get_index_path(config.output_path or repository_name)
+            previous_metadata, previous_store = (
+                self._load_previous_index(index_path) if config.incremental else (None, None)
+            )
+
+            if previous_metadata is not None and previous_store is not None:
+                changed_files = (
+                    get_changed_files(repo_path, previous_metadata.last_commit_id)
+                    if self._has_same_settings(previous_metadata, config)
+                    else None
+                )
+                if changed_files is not None:
+                    return await self._update_index(
+                        {
+                            'repo_path': repo_path,
+                            'repository_name': repository_name,
+                            'config': config,
+                            'index_path': index_path,
+                            'metadata': previous_metadata,
+                            'vector_store': previous_store,
+                            'changed_files': changed_files,
+                            'start_time': start_time,
+                        },
+                        ctx,
+                    )
+
             chunks, chunk_to_file, extension_stats = await repo_processor.process_content(
                 repo_path, config, ctx
             )
@@ -406,16 +470,30 @@ class RepositoryIndexer:
 
             # Step 2: Index creation
             documents = await index_builder.create_documents(chunks, chunk_to_file, ctx)
-            index_path = self._get_index_path(config.output_path or repository_name)
             repo_files_path = os.path.join(index_path, 'repository')
             os.makedirs(repo_files_path, exist_ok=True)
 
             # Step 3: File management
             await file_manager.copy_repository_files(repo_path, repo_files_path, ctx)
+
+            # Chunks already embedded in the previous index are not sent to the model again
+            embeddings = CachedEmbeddings(
+                self.embedding_generator,
+                get_embedding_cache(previous_store) if previous_store is not None else None,
+            )
+            checkpoint = self._get_checkpoint(index_path)
             vector_store = await index_builder.create_vector_store(
-                documents, self.embedding_generator, ctx
+                documents,
+                embeddings,
+                ctx,
+                checkpoint,
+                batch_size=get_embedding_batch_size(self.embedding_model),
+            )
+            logger.info(
+                f'Embedded {embeddings.misses} chunks, reused {embeddings.hits} cached embeddings'
             )
             index_builder.save_index(vector_store, index_path)
+            checkpoint.remove()
 
             # Save chunk map
             chunk_map_data = {'chunks': chunks, 'chunk_to_file': chunk_to_file}
@@ -436,6 +514,7 @@ class RepositoryIndexer:
                     'chunk_to_file': chunk_to_file,
                     'extension_stats': extension_stats,
                     'last_commit_id': last_commit_id,
+                    'uncommitted_files': get_uncommitted_files(repo_path),
                     'embedding_model': self.embedding_model,
                 },
                 ctx,
@@ -487,45 +566,238 @@ class RepositoryIndexer:
             if temp_dir:
                 cleanup_repository(temp_dir)
 
+    def _load_previous_index(
+        self, index_path: str
+    ) -> Tuple[Optional[IndexMetadata], Optional[FAISS]]:
+        """Load an existing index of a repository that was built with the same embedding model.
+
+        Args:
+            index_path: Path to the index directory
+
+        Returns:
+            Tuple of the index metadata and vector store, (None, None) if there is no
+            usable index
+        """
+        metadata = load_metadata(os.path.join(index_path, 'metadata.json'))
+        if metadata is None or metadata.embedding_model != self.embedding_model:
+            return None, None
+
+        try:
+            return metadata, self.load_index_without_pickle(index_path)
+        except Exception as e:
+            logger.warning(f'Cannot load existing index at {index_path}: {e}')
+            return None, None
+
+    def _get_checkpoint(self, index_path: str) -> EmbeddingCheckpoint:
+        """Get the checkpoint of the embeddings created while indexing a repository.
+
+        Args:
+            index_path: Path to the index directory
+
+        Returns:
+            Embedding checkpoint stored in the index directory
+        """
+        os.makedirs(index_path, exist_ok=True)
+        return EmbeddingCheckpoint(os.path.join(index_path, CHECKPOINT_FILE), self.embedding_model)
+
+    @staticmethod
+    def _has_same_settings(metadata: IndexMetadata, config: RepositoryConfig) -> bool:
+        """Check if an index was built with the same file patterns and chunking.
+
+        Args:
+            metadata: Metadata of the existing index
+            config: Repository configuration of the new indexing run
+
+        Returns:
+            True if the index can be updated with only the changed files
+        """
+        return (
+            metadata.chunk_size == config.chunk_size
+            and metadata.chunk_overlap == config.chunk_overlap
+            and metadata.include_patterns == config.include_patterns
+            and metadata.exclude_patterns == config.exclude_patterns
+        )
+
+    async def _update_index(
+        self, params: Dict[str, Any], ctx: Optional[Any] = None
+    ) -> IndexRepositoryResponse:
+        """Update an existing index with the files changed since it was built.
+
+        The chunks of changed and deleted files are removed from the index, and changed
+        files are chunked and embedded again. Chunks whose content did not change reuse
+        their previous embedding.
+
+        Args:
+            params: Dictionary containing the repository, the existing index and the
+                changed files
+            ctx: Context object for progress tracking (optional)
+
+        Returns:
+            IndexRepositoryResponse object with information about the updated index
+        """
+        config: RepositoryConfig = params['config']
+        metadata: IndexMetadata = params['metadata']
+        vector_store: FAISS = params['vector_store']
+        repo_path = params['repo_path']
+        index_path = params['index_path']
+
+        # Files that were dirty when last indexed may have been reverted since
+        changed_files = set(params['changed_files']) | set(metadata.uncommitted_files)
+        logger.info(
+            f'Updating index at {index_path} with {len(changed_files)} changed files '
+            f'since commit {metadata.last_commit_id}'
+        )
+        if ctx:
+            await ctx.info(
+                f'Updating index with {len(changed_files)} files changed since commit '
+                f'{metadata.last_commit_id}'
+            )
+            await ctx.report_progress(10, 100)
+
+        docstore = get_docstore_dict(vector_store.docstore)
+        stale_ids = [
+            doc_id
+            for doc_id, doc in docstore.items()
+            if doc.metadata.get('source') in changed_files
+        ]
+        embeddings = CachedEmbeddings(
+            self.embedding_generator, get_embedding_cache(vector_store, stale_ids)
+        )
+
+        include_patterns = config.include_patterns or Constants.TEXT_FILE_INCLUDE_PATTERNS
+        exclude_patterns = config.exclude_patterns or Constants.TEXT_FILE_EXCLUDE_PATTERNS
+        rel_paths = sorted(
+            rel_path
+            for rel_path in changed_files
+            if os.path.isfile(os.path.join(repo_path, rel_path))
+            and is_text_file(
+                os.path.join(repo_path, rel_path), rel_path, include_patterns, exclude_patterns
+            )
+        )
+        chunks, chunk_paths = chunk_files(
+            repo_path, rel_paths, config.chunk_size, config.chunk_overlap
+        )
+
+        if ctx:
+            await ctx.info(
+                f'Replacing {len(stale_ids)} chunks with {len(chunks)} chunks '
+                f'from {len(rel_paths)} files...'
+            )
+            await ctx.report_progress(40, 100)
+
+        if stale_ids:
+            vector_store.delete(stale_ids)
+
+        if chunks:
+            next_chunk_id = (
+                max((doc.metadata.get('chunk_id', -1) for doc in docstore.values()), default=-1)
+                + 1
+            )
+            checkpoint = self._get_checkpoint(index_path)
+            pipeline = EmbeddingPipeline(
+                embeddings, checkpoint, batch_size=get_embedding_batch_size(self.embedding_model)
+            )
+            vectors = np.array(
+                await pipeline.embed(chunks, ctx, progress_range=(40, 70)), dtype=np.float32
+            )
+            faiss.normalize_L2(vectors)
+            # A 2-D array converts to one list of floats per chunk
+            vector_rows = cast(List[List[float]], vectors.tolist())
+            vector_store.add_embeddings(
+                list(zip(chunks, vector_rows)),
+                metadatas=[
+                    {'source': rel_path, 'chunk_id': next_chunk_id + i}
+                    for i, rel_path in enumerate(chunk_paths)
+                ],
+            )
+        logger.info(
+            f'Embedded {embeddings.misses} chunks, reused {embeddings.hits} cached embeddings'
+        )
+
+        if ctx:
+            await ctx.report_progress(70, 100)
+
+        IndexBuilder().save_index(vector_store, index_path)
+        self._get_checkpoint(index_path).remove()
+
+        # Rebuild the chunk map from the updated docstore, in index order
+        docstore = get_docstore_dict(vector_store.docstore)
+        documents = [
+            docstore[doc_id] for _, doc_id in sorted(vector_store.index_to_docstore_id.items())
+        ]
+        all_chunks = [doc.page_content for doc in documents]
+        chunk_to_file = {doc.page_content: doc.metadata.get('source') for doc in documents}
+        file_manager = FileManager()
+        file_manager.save_chunk_map(
+            {'chunks': all_chunks, 'chunk_to_file': chunk_to_file}, index_path
+        )
+
+        repo_files_path = os.path.join(index_path, 'repository')
+        await file_manager.sync_repository_files(repo_path, repo_files_path, changed_files, ctx)
+
+        last_commit_id = await RepositoryProcessor().get_commit_id(
+            repo_path, params['repository_name'], config.repository_path
+        )
+        indexed_files = sorted({doc.metadata.get('source') for doc in documents})
+        updated_metadata = await MetadataManager().create_and_save(
+            {
+                'repository_name': params['repository_name'],
+                'config': config,
+                'index_path': index_path,
+                'repo_files_path': repo_files_path,
+                'chunks': all_chunks,
+                'chunk_to_file': chunk_to_file,
+                'extension_stats': get_file_extension_stats(indexed_files),
+                'last_commit_id': last_commit_id,
+                'uncommitted_files': get_uncommitted_files(repo_path),
+                'embedding_model': self.embedding_model,
+            },
+            ctx,
+        )
+
+        execution_time_ms = int((time.time() - params['start_time']) * 1000)
+        logger.info(f'Incremental indexing completed in {execution_time_ms}ms')
+        if ctx:
+            await ctx.info(f'Indexing completed in {execution_time_ms}ms')
+            await ctx.report_progress(100, 100)
+
+        return IndexRepositoryResponse(
+            status='success',
+            repository_name=updated_metadata.repository_name,
+            repository_path=config.repository_path,
+            index_path=index_path,
+            repository_directory=repo_files_path,
+            file_count=updated_metadata.file_count,
+            chunk_count=updated_metadata.chunk_count,
+            embedding_model=self.embedding_model,
+            execution_time_ms=execution_time_ms,
+            message=(
+                f'Incrementally updated repository index with {len(changed_files)} changed files '
+                f'({len(stale_ids)} chunks removed, {len(chunks)} chunks added, '
+                f'{embeddings.misses} chunks embedded)'
+            ),
+        )
+
     def load_index_without_pickle(self, index_path):
         """Load FAISS index without using pickle.
 
         Args:
             index_path: Path to the index
-            embedding_function: Embedding function to use
 
         Returns:
             FAISS vector store
 
-        This function loads a FAISS index using FAISS's native methods and JSON
-        instead of pickle for serialization.
+        This function loads a FAISS index using FAISS's native methods and the
+        documents from SQLite (or JSON for older indices) instead of pickle. The
+        returned vector store is a private copy that can be modified.
         """
         # 1. Load FAISS index using faiss's native methods
-        faiss_path = os.path.join(index_path, 'index.faiss')
-        index = faiss.read_index(faiss_path)
-
-        # 2. Load docstore from JSON
-        docstore_path = os.path.join(index_path, 'docstore.json')
-        with open(docstore_path, 'r') as f:
-            docstore_data = json.load(f)
-
-        # Reconstruct the document store
-        docstore = InMemoryDocstore({})
-        for doc_id, doc_data in docstore_data.items():
-            dict_obj = ensure_docstore_dict(docstore)
-            dict_obj[doc_id] = Document(
-                page_content=doc_data['page_content'], metadata=doc_data['metadata']
-            )
+        index = faiss.read_index(os.path.join(index_path, 'index.faiss'))
 
-        # 3. Load index_to_docstore_id mapping from JSON
-        mapping_path = os.path.join(index_path, 'index_mapping.json')
-        with open(mapping_path, 'r') as f:
-            mapping_data = json.load(f)
+        # 2. Load docstore and index_to_docstore_id mapping
+        docstore, index_to_docstore_id = read_docstore(index_path)
 
-        # Convert string keys back to integers for the mapping
-        index_to_docstore_id = {int(k): v for k, v in mapping_data.items()}
-
-        # 4. Create and return the FAISS vector store
+        # 3. Create and return the FAISS vector store
         return FAISS(
             embedding_function=self.embedding_generator,
             index=index,
@@ -533,6 +805,26 @@ class RepositoryIndexer:
             index_to_docstore_id=index_to_docstore_id,
         )
 
+    def load_resident_index(self, index_path):
+        """Load a FAISS index for search, reusing it across calls.
+
+        Args:
+            index_path: Path to the index
+
+        Returns:
+            Read-only FAISS vector store backed by the memory-mapped index, or None if
+            there is no index at the path
+        """
+        resident = get_resident_index(index_path)
+        if resident is None:
+            return None
+        return FAISS(
+            embedding_function=self.embedding_generator,
+            index=resident.index,
+            docstore=resident.docstore,
+            index_to_docstore_id=resident.index_to_docstore_id,
+        )
+
 
 class RepositoryProcessor:
     """Handles repository-specific operations for indexing."""
@@ -675,14 +967,25 @@ class IndexBuilder:
         return documents
 
     async def create_vector_store(
-        self, documents: List[Document], embedding_generator, ctx: Optional[Any] = None
+        self,
+        documents: List[Document],
+        embedding_generator,
+        ctx: Optional[Any] = None,
+        checkpoint: Optional[EmbeddingCheckpoint] = None,
+        batch_size: int = 1,
     ) -> FAISS:
         """Create a FAISS vector store from documents.
 
+        Documents are embedded in concurrent batches that back off when the embedding
+        model is throttled. Embedded batches are added to the checkpoint, if provided, so
+        an interrupted run resumes where it stopped.
+
         Args:
             documents: List of LangChain Document objects
             embedding_generator: Embedding function to use
             ctx: Context object for progress tracking (optional)
+            checkpoint: Checkpoint of embedded documents (optional)
+            batch_size: Number of documents per request to the embedding model
 
         Returns:
             FAISS vector store
@@ -694,27 +997,25 @@ class IndexBuilder:
 
         logger.debug(f'Using embedding function: {embedding_generator}')
 
-        # Test the embedding function
-        try:
-            logger.info('Testing embedding function on sample document...')
-            test_content = documents[0].page_content if documents else 'Test content'
-            test_result = embedding_generator.embed_documents([test_content])
-            logger.info(
-                f'Test embedding successful - shape: {len(test_result)}x{len(test_result[0])}'
-            )
-        except Exception as e:
-            logger.error(f'Embedding function test failed: {e}')
-            raise
-
         if ctx:
-            await ctx.info('Generating embeddings and creating vector store...')
+            await ctx.info(f'Generating embeddings for {len(documents)} chunks...')
             await ctx.report_progress(75, 100)
 
         logger.debug(f'Number of documents: {len(documents)}')
 
         try:
-            vector_store = FAISS.from_documents(
-                documents=documents, embedding=embedding_generator, normalize_L2=True
+            texts = [doc.page_content for doc in documents]
+            pipeline = EmbeddingPipeline(
+                embedding_generator,
+                checkpoint,
+                batch_size=batch_size,
+            )
+            vectors = await pipeline.embed(texts, ctx)
+            vector_store = FAISS.from_embeddings(
+                list(zip(texts, vectors)),
+                embedding_generator,
+                metadatas=[doc.metadata for doc in documents],
+                normalize_L2=True,
             )
             logger.debug(
                 f'Created vector store with {get_docstore_dict_size(vector_store.docstore)} documents'
@@ -788,6 +1089,53 @@ class FileManager:
         logger.info(f'Copied {copied_files} files to {repo_files_path}')
         return copied_files
 
+    async def sync_repository_files(
+        self,
+        repo_path: str,
+        repo_files_path: str,
+        changed_files: Set[str],
+        ctx: Optional[Any] = None,
+    ) -> int:
+        """Update the copied repository files with the files that changed.
+
+        Args:
+            repo_path: Source repository path
+            repo_files_path: Target path of the copied files
+            changed_files: Paths relative to the repository root of added, modified and
+                deleted files
+            ctx: Context object for progress tracking (optional)
+
+        Returns:
+            Number of copied or removed files
+        """
+        if not os.path.isdir(repo_files_path):
+            return await self.copy_repository_files(repo_path, repo_files_path, ctx)
+
+        if ctx:
+            await ctx.info('Updating repository files...')
+            await ctx.report_progress(80, 100)
+
+        synced_files = 0
+        for rel_path in changed_files:
+            if '.git' in rel_path.split('/'):
+                continue
+            source_file = os.path.join(repo_path, rel_path)
+            target_file = os.path.join(repo_files_path, rel_path)
+            try:
+                if os.path.isfile(source_file):
+                    os.makedirs(os.path.dirname(target_file), exist_ok=True)
+                    shutil.copy2(source_file, target_file)
+                elif os.path.isfile(target_file):
+                    os.remove(target_file)
+                else:
+                    continue
+                synced_files += 1
+            except Exception as e:
+                logger.warning(f'Error updating file {target_file}: {e}')
+
+        logger.info(f'Updated {synced_files} files in {repo_files_path}')
+        return synced_files
+
     def save_chunk_map(self, chunk_map_data: Dict, index_path: str):
         """Save chunk map without using pickle.
 
@@ -840,6 +1188,11 @@ class MetadataManager:
             index_size_bytes=index_size,
             last_commit_id=params['last_commit_id'],
             repository_directory=params['repo_files_path'],
+            chunk_size=params['config'].chunk_size,
+            chunk_overlap=params['config'].chunk_overlap,
+            include_patterns=params['config'].include_patterns,
+            exclude_patterns=params['config'].exclude_patterns,
+            uncommitted_files=params.get('uncommitted_files', []),
         )
 
         # Save metadata
@@ -60,6 +60,18 @@ class IndexMetadata(BaseModel):
     repository_directory: Optional[str] = Field(
         None, description='Path to the cloned repository directory'
     )
+    chunk_size: Optional[int] = Field(default=None, description='Chunk size used to split files')
+    chunk_overlap: Optional[int] = Field(default=None, description='Overlap used to split files')
+    include_patterns: Optional[List[str]] = Field(
+        default=None, description='Glob patterns of the files included in the index'
+    )
+    exclude_patterns: Optional[List[str]] = Field(
+        default=None, description='Glob patterns of the files excluded from the index'
+    )
+    uncommitted_files: List[str] = Field(
+        default_factory=list,
+        description='Files that differed from the last commit when they were indexed',
+    )
 
 
 class SearchResult(BaseModel):
@@ -24,7 +24,7 @@ import tempfile
 from awslabs.git_repo_research_mcp_server.defaults import Constants
 from git import Repo
 from loguru import logger
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 
@@ -133,6 +133,48 @@ def get_repository_name(repo_path: str) -> str:
         return os.path.basename(os.path.abspath(repo_path))
 
 
+def is_text_file(
+    file_path: str,
+    rel_path: str,
+    include_patterns: List[str],
+    exclude_patterns: List[str],
+) -> bool:
+    """Check if a file should be indexed as text.
+
+    Args:
+        file_path: Path to the file
+        rel_path: Path of the file relative to the repository root
+        include_patterns: Glob patterns for files to include
+        exclude_patterns: Glob patterns for files to exclude
+
+    Returns:
+        True if the file matches the patterns and is a non-empty UTF-8 text file
+    """
+    # Check if the file matches any include pattern
+    included = any(fnmatch.fnmatch(rel_path, pattern) for pattern in include_patterns)
+    if not included:
+        return False
+
+    # Check if the file matches any exclude pattern
+    excluded = any(fnmatch.fnmatch(rel_path, pattern) for pattern in exclude_patterns)
+    if excluded:
+        return False
+
+    # Try to read the file as text
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            # Read a small sample to check if it's text
+            sample = f.read(1024)
+            # If we can decode it as UTF-8, it's probably text
+            return bool(sample)
+    except UnicodeDecodeError:
+        # Not a text file
+        return False
+    except Exception as e:
+        logger.warning(f'Error reading file {file_path}: {e}')
+        return False
+
+
 def get_text_files(
     repo_path: str,
     include_patterns: Optional[List[str]] = None,
@@ -158,34 +200,93 @@ def get_text_files(
         for file in files:
             file_path = os.path.join(root, file)
             rel_path = os.path.relpath(file_path, repo_path)
-
-            # Check if the file matches any include pattern
-            included = any(fnmatch.fnmatch(rel_path, pattern) for pattern in include_patterns)
-            if not included:
-                continue
-
-            # Check if the file matches any exclude pattern
-            excluded = any(fnmatch.fnmatch(rel_path, pattern) for pattern in exclude_patterns)
-            if excluded:
-                continue
-
-            # Try to read the file as text
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    # Read a small sample to check if it's text
-                    sample = f.read(1024)
-                    # If we can decode it as UTF-8, it's probably text
-                    if sample:
-                        text_files.append(file_path)
-            except UnicodeDecodeError:
-                # Not a text file
-                pass
-            except Exception as e:
-                logger.warning(f'Error reading file {file_path}: {e}')
+            if is_text_file(file_path, rel_path, include_patterns, exclude_patterns):
+                text_files.append(file_path)
 
     return text_files
 
 
+def get_changed_files(repo_path: str, since_commit: Optional[str]) -> Optional[Set[str]]:
+    """Get the files that changed in a repository since a commit.
+
+    The working tree is compared to the commit, so committed, uncommitted and untracked
+    changes are all included. Renames are reported as a deletion and an addition.
+
+    Args:
+        repo_path: Path to the repository
+        since_commit: ID of the commit to compare against
+
+    Returns:
+        Paths relative to the repository root of the added, modified and deleted files,
+        or None if the changes cannot be determined (no commit, unknown commit, not a
+        Git repository)
+    """
+    if not since_commit or since_commit == 'unknown':
+        return None
+
+    try:
+        repo = Repo(repo_path)
+        repo.commit(since_commit)
+        diff = repo.git.diff('--name-only', '--no-renames', since_commit, '--')
+        changed_files = {line for line in diff.splitlines() if line}
+        changed_files.update(repo.untracked_files)
+    except Exception as e:
+        logger.info(f'Cannot determine changes since commit {since_commit}: {e}')
+        return None
+
+    logger.info(f'{len(changed_files)} files changed since commit {since_commit}')
+    return changed_files
+
+
+def get_uncommitted_files(repo_path: str) -> List[str]:
+    """Get the files of a repository that differ from its last commit.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        Paths relative to the repository root of modified, deleted and untracked files,
+        empty if the repository has no commits or is not a Git repository
+    """
+    changed_files = get_changed_files(repo_path, 'HEAD')
+    return sorted(changed_files) if changed_files else []
+
+
+def chunk_files(
+    repo_path: str,
+    rel_paths: List[str],
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+) -> Tuple[List[str], List[str]]:
+    """Read and chunk files of a repository.
+
+    Args:
+        repo_path: Path to the repository
+        rel_paths: Paths of the files relative to the repository root
+        chunk_size: Maximum size of each chunk in characters
+        chunk_overlap: Overlap between chunks in characters
+
+    Returns:
+        Tuple containing:
+        - List of text chunks
+        - List of the relative path of the file of each chunk
+    """
+    chunks = []
+    chunk_paths = []
+
+    for rel_path in rel_paths:
+        file_path = os.path.join(repo_path, rel_path)
+        try:
+            content = read_file_content(file_path)
+            for chunk in chunk_text(content, chunk_size, chunk_overlap):
+                chunks.append(chunk)
+                chunk_paths.append(rel_path)
+        except Exception as e:
+            logger.warning(f'Error processing file {file_path}: {e}')
+
+    return chunks, chunk_paths
+
+
 def get_file_extension_stats(file_paths: List[str]) -> Dict[str, int]:
     """Get statistics about file extensions.
 
@@ -291,20 +392,9 @@ def process_repository(
     extension_stats = get_file_extension_stats(text_files)
     logger.info(f'File extension statistics: {extension_stats}')
 
-    chunks = []
-    chunk_to_file = {}
-
-    for file_path in text_files:
-        try:
-            content = read_file_content(file_path)
-            file_chunks = chunk_text(content, chunk_size, chunk_overlap)
-
-            rel_path = os.path.relpath(file_path, repo_path)
-            for chunk in file_chunks:
-                chunks.append(chunk)
-                chunk_to_file[chunk] = rel_path
-        except Exception as e:
-            logger.warning(f'Error processing file {file_path}: {e}')
+    rel_paths = [os.path.relpath(file_path, repo_path) for file_path in text_files]
+    chunks, chunk_paths = chunk_files(repo_path, rel_paths, chunk_size, chunk_overlap)
+    chunk_to_file = dict(zip(chunks, chunk_paths))
 
     logger.info(f'Created {len(chunks)} text chunks')
     return chunks, chunk_to_file, extension_stats
@@ -23,7 +23,6 @@ from awslabs.git_repo_research_mcp_server.defaults import Constants
 from awslabs.git_repo_research_mcp_server.embeddings import get_embedding_model
 from awslabs.git_repo_research_mcp_server.indexer import (
     IndexConfig,
-    get_docstore_dict_size,
     get_repository_indexer,
 )
 from awslabs.git_repo_research_mcp_server.models import (
@@ -212,8 +211,8 @@ class RepositorySearcher:
                 repository_name = index_path
                 index_path = self.repository_indexer._get_index_path(repository_name)
 
-            # Load the index and chunk map
-            vector_store = self.repository_indexer.load_index_without_pickle(index_path)
+            # Load the index, reusing it if it is still resident from a previous search
+            vector_store = self.repository_indexer.load_resident_index(index_path)
             if vector_store is None:
                 logger.error(f'Index or chunk map not found for repository {repository_name}')
                 # Set repository_directory even if index is not found
@@ -233,9 +232,7 @@ class RepositorySearcher:
 
             # Debug: Print vector store info
             logger.info(f'Vector store type: {type(vector_store)}')
-            logger.info(
-                f'Vector store docstore size: {get_docstore_dict_size(vector_store.docstore)}'
-            )
+            logger.info(f'Vector store size: {vector_store.index.ntotal}')
 
             # Use the same approach as in the test script
             try:
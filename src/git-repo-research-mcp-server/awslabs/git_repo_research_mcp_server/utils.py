@@ -20,6 +20,7 @@ import json
 import os
 import shutil
 from awslabs.git_repo_research_mcp_server.defaults import Constants
+from awslabs.git_repo_research_mcp_server.index_store import RESIDENT_INDEXES
 from awslabs.git_repo_research_mcp_server.models import (
     DetailedIndexedRepositoriesResponse,
     DetailedIndexedRepositoryInfo,
@@ -300,6 +301,9 @@ async def delete_indexed_repository(
             'permission_issues': permission_issues,
         }
 
+    # Unload the index so no search keeps its files open
+    RESIDENT_INDEXES.invalidate(index_path)
+
     # Delete the files
     deleted_files = []
     errors = []
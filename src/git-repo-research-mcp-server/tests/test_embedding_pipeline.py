@@ -0,0 +1,216 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the embedding pipeline of the Git Repository Research MCP Server."""
+
+import pytest
+import threading
+from awslabs.git_repo_research_mcp_server.embedding_pipeline import (
+    AdaptiveConcurrencyLimiter,
+    EmbeddingCheckpoint,
+    EmbeddingPipeline,
+    get_embedding_batch_size,
+    is_throttling_error,
+)
+from awslabs.git_repo_research_mcp_server.models import EmbeddingModel
+from botocore.exceptions import ClientError
+from langchain_core.embeddings import Embeddings
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _throttling_error():
+    return ClientError(
+        {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'InvokeModel'
+    )
+
+
+def _vector(text):
+    return [float(len(text)), 1.0]
+
+
+class RecordingEmbeddings(Embeddings):
+    """Embedding model recording the batches it receives."""
+
+    def __init__(self, failures=None):
+        """Initialize with the errors raised by the first calls (None for success)."""
+        self.batches = []
+        self.failures = list(failures or [])
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts):
+        """Record a batch and embed it."""
+        with self._lock:
+            self.batches.append(list(texts))
+            failure = self.failures.pop(0) if self.failures else None
+        if failure is not None:
+            raise failure
+        return [_vector(text) for text in texts]
+
+    def embed_query(self, text):
+        """Embed a query."""
+        return _vector(text)
+
+
+def test_is_throttling_error():
+    """Test that throttling is detected in client errors and errors raised from them."""
+    try:
+        try:
+            raise _throttling_error()
+        except ClientError as e:
+            raise ValueError('Error raised by inference endpoint') from e
+    except ValueError as wrapped:
+        assert is_throttling_error(wrapped)
+
+    assert is_throttling_error(_throttling_error())
+    assert not is_throttling_error(ValueError('Invalid input'))
+    assert not is_throttling_error(
+        ClientError({'Error': {'Code': 'AccessDeniedException'}}, 'InvokeModel')
+    )
+
+
+def test_adaptive_concurrency_limiter():
+    """Test that the limit halves on throttling and grows back after successes."""
+    limiter = AdaptiveConcurrencyLimiter(4)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 3
+
+
+def test_get_embedding_batch_size():
+    """Test that only models embedding several texts per request are batched."""
+    assert get_embedding_batch_size(EmbeddingModel.COHERE_EMBED_ENGLISH_V3) == 32
+    assert get_embedding_batch_size(EmbeddingModel.AMAZON_TITAN_EMBED_TEXT_V2) == 1
+
+
+class TestEmbeddingPipeline:
+    """Tests for the EmbeddingPipeline class."""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_order(self):
+        """Test that distinct texts are embedded in batches and returned in order."""
+        model = RecordingEmbeddings()
+        pipeline = EmbeddingPipeline(model, batch_size=2, max_concurrency=2)
+
+        vectors = await pipeline.embed(['a', 'bb', 'a', 'ccc', 'dddd', 'eeeee'])
+
+        assert vectors == [_vector(t) for t in ['a', 'bb', 'a', 'ccc', 'dddd', 'eeeee']]
+        assert sorted(len(batch) for batch in model.batches) == [1, 2, 2]
+        assert sorted(t for batch in model.batches for t in batch) == [
+            'a',
+            'bb',
+            'ccc',
+            'dddd',
+            'eeeee',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_throttled_batch_retried(self):
+        """Test that a throttled batch is retried with a lower concurrency limit."""
+        model = RecordingEmbeddings(failures=[_throttling_error()])
+        pipeline = EmbeddingPipeline(model, batch_size=10, max_concurrency=4, max_backoff=0)
+
+        vectors = await pipeline.embed(['a', 'bb'])
+
+        assert vectors == [_vector('a'), _vector('bb')]
+        assert len(model.batches) == 2
+        assert pipeline.throttled == 1
+        assert pipeline.limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_throttled_text_retried_alone(self):
+        """Test that a throttled request of a model without batching re-sends only its text."""
+        model = RecordingEmbeddings(failures=[None, _throttling_error()])
+        pipeline = EmbeddingPipeline(
+            model,
+            batch_size=get_embedding_batch_size(EmbeddingModel.AMAZON_TITAN_EMBED_TEXT_V2),
+            max_concurrency=1,
+            max_backoff=0,
+        )
+
+        vectors = await pipeline.embed(['a', 'bb', 'ccc'])
+
+        assert vectors == [_vector('a'), _vector('bb'), _vector('ccc')]
+        assert model.batches == [['a'], ['bb'], ['bb'], ['ccc']]
+        assert pipeline.throttled == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_retried(self):
+        """Test that errors other than throttling are raised immediately."""
+        model = RecordingEmbeddings(failures=[ValueError('Invalid input')])
+        pipeline = EmbeddingPipeline(model, max_backoff=0)
+
+        with pytest.raises(ValueError, match='Invalid input'):
+            await pipeline.embed(['a'])
+        assert len(model.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_progress_reports_rate(self):
+        """Test that progress is reported with the number of chunks per second."""
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        pipeline = EmbeddingPipeline(RecordingEmbeddings(), batch_size=1, max_concurrency=1)
+
+        await pipeline.embed(['a', 'bb'], ctx, progress_range=(40, 70))
+
+        calls = ctx.report_progress.call_args_list
+        assert [call.args[0] for call in calls] == [55, 70]
+        assert 'Embedded 2/2 chunks' in calls[-1].args[2]
+        assert 'chunks/sec' in calls[-1].args[2]
+
+
+class TestEmbeddingCheckpoint:
+    """Tests for resuming embedding from a checkpoint."""
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_resumes(self, tmp_path):
+        """Test that batches embedded before a failure are not embedded again."""
+        path = str(tmp_path / 'embeddings.checkpoint.db')
+        failing_model = RecordingEmbeddings(failures=[None, ValueError('Interrupted')])
+        with pytest.raises(ValueError):
+            await EmbeddingPipeline(
+                failing_model, EmbeddingCheckpoint(path, 'model'), batch_size=2, max_concurrency=1
+            ).embed(['a', 'bb', 'ccc', 'dddd'])
+
+        model = RecordingEmbeddings()
+        vectors = await EmbeddingPipeline(
+            model, EmbeddingCheckpoint(path, 'model'), batch_size=2, max_concurrency=1
+        ).embed(['a', 'bb', 'ccc', 'dddd'])
+
+        assert vectors == [_vector(t) for t in ['a', 'bb', 'ccc', 'dddd']]
+        assert model.batches == [['ccc', 'dddd']]
+
+    def test_checkpoint_of_other_model_discarded(self, tmp_path):
+        """Test that embeddings created with another model are not reused."""
+        path = str(tmp_path / 'embeddings.checkpoint.db')
+        checkpoint = EmbeddingCheckpoint(path, 'model-a')
+        checkpoint.save({'key': [1.0, 2.0]})
+        checkpoint.close()
+
+        assert EmbeddingCheckpoint(path, 'model-a').load() == {'key': [1.0, 2.0]}
+        assert EmbeddingCheckpoint(path, 'model-b').load() == {}
+
+    def test_remove(self, tmp_path):
+        """Test that removing a checkpoint deletes its file."""
+        path = tmp_path / 'embeddings.checkpoint.db'
+        checkpoint = EmbeddingCheckpoint(str(path), 'model')
+        checkpoint.save({'key': [1.0]})
+
+        checkpoint.remove()
+
+        assert not path.exists()
@@ -0,0 +1,225 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for incremental re-indexing of repositories."""
+
+import hashlib
+import os
+import pytest
+import subprocess
+from awslabs.git_repo_research_mcp_server.embeddings import CachedEmbeddings, content_hash
+from awslabs.git_repo_research_mcp_server.indexer import (
+    IndexConfig,
+    RepositoryConfig,
+    RepositoryIndexer,
+    get_docstore_dict,
+)
+from awslabs.git_repo_research_mcp_server.repository import get_changed_files
+from unittest.mock import MagicMock, patch
+
+
+def _embed(text):
+    """Deterministic embedding of a text."""
+    digest = hashlib.sha256(text.encode()).digest()
+    return [float(b) + 1.0 for b in digest[:8]]
+
+
+def _git(repo_dir, *args):
+    subprocess.run(['git', *args], cwd=repo_dir, check=True, capture_output=True)
+
+
+def _write(repo_dir, rel_path, content):
+    path = os.path.join(repo_dir, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a Git repository with a few committed files."""
+    repo_dir = str(tmp_path / 'repo')
+    os.makedirs(repo_dir)
+    _git(repo_dir, 'init')
+    _git(repo_dir, 'config', 'user.name', 'Test User')
+    _git(repo_dir, 'config', 'user.email', 'test@example.com')
+    _write(repo_dir, 'README.md', '# Project\n\nOverview of the project.\n')
+    _write(repo_dir, 'docs/guide.md', '# Guide\n\nHow to use the project.\n')
+    _write(repo_dir, 'docs/old.md', '# Old\n\nDeprecated page.\n')
+    _git(repo_dir, 'add', '.')
+    _git(repo_dir, 'commit', '-m', 'Initial commit')
+    return repo_dir
+
+
+@pytest.fixture
+def mock_embeddings():
+    """Mock Bedrock embeddings recording the texts sent to the model."""
+    with patch('awslabs.git_repo_research_mcp_server.embeddings.BedrockEmbeddings') as bedrock:
+        embeddings = MagicMock()
+        embeddings.embed_documents.side_effect = lambda texts: [_embed(t) for t in texts]
+        embeddings.embed_query.side_effect = _embed
+        bedrock.return_value = embeddings
+        yield embeddings
+
+
+def _embedded_texts(mock_embeddings):
+    return [text for call in mock_embeddings.embed_documents.call_args_list for text in call[0][0]]
+
+
+def _sources(indexer, index_path):
+    vector_store = indexer.load_index_without_pickle(index_path)
+    return sorted(
+        {doc.metadata['source'] for doc in get_docstore_dict(vector_store.docstore).values()}
+    )
+
+
+class TestCachedEmbeddings:
+    """Tests for the CachedEmbeddings class."""
+
+    def test_only_missing_texts_embedded(self):
+        """Test that cached and duplicate texts are not sent to the model."""
+        model = MagicMock()
+        model.embed_documents.side_effect = lambda texts: [_embed(t) for t in texts]
+        embeddings = CachedEmbeddings(model)
+
+        first = embeddings.embed_documents(['a', 'b', 'a'])
+        second = embeddings.embed_documents(['b', 'c'])
+
+        assert first == [_embed('a'), _embed('b'), _embed('a')]
+        assert second == [_embed('b'), _embed('c')]
+        assert [call[0][0] for call in model.embed_documents.call_args_list] == [['a', 'b'], ['c']]
+        assert (embeddings.hits, embeddings.misses) == (2, 3)
+
+    def test_fully_cached_batch_not_sent(self):
+        """Test that the model is not called when every text is cached."""
+        model = MagicMock()
+        embeddings = CachedEmbeddings(model, {content_hash('a'): [1.0]})
+
+        assert embeddings.embed_documents(['a', 'a']) == [[1.0], [1.0]]
+        model.embed_documents.assert_not_called()
+
+
+class TestGetChangedFiles:
+    """Tests for the get_changed_files function."""
+
+    def test_committed_uncommitted_and_untracked_changes(self, git_repo):
+        """Test that all kinds of changes since a commit are reported."""
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=git_repo, capture_output=True, text=True
+        ).stdout.strip()
+        _write(git_repo, 'README.md', '# Project\n\nNew overview.\n')
+        _git(git_repo, 'commit', '-am', 'Update README')
+        _write(git_repo, 'docs/guide.md', '# Guide\n\nUncommitted change.\n')
+        os.remove(os.path.join(git_repo, 'docs/old.md'))
+        _write(git_repo, 'docs/new.md', '# New\n')
+
+        assert get_changed_files(git_repo, commit) == {
+            'README.md',
+            'docs/guide.md',
+            'docs/old.md',
+            'docs/new.md',
+        }
+
+    @pytest.mark.parametrize('commit', [None, 'unknown', '0' * 40])
+    def test_unusable_commit(self, git_repo, commit):
+        """Test that changes cannot be determined without a known commit."""
+        assert get_changed_files(git_repo, commit) is None
+
+
+class TestIncrementalIndexing:
+    """Tests for incremental indexing in RepositoryIndexer."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_files_reindexed(self, git_repo, tmp_path, mock_embeddings):
+        """Test that re-indexing only embeds changed chunks and removes stale ones."""
+        indexer = RepositoryIndexer(
+            IndexConfig(
+                embedding_model='amazon.titan-embed-text-v2:0', index_dir=str(tmp_path / 'idx')
+            )
+        )
+        config = RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.md'])
+
+        first = await indexer.index_repository(config)
+        assert first.status == 'success'
+        assert _sources(indexer, first.index_path) == ['README.md', 'docs/guide.md', 'docs/old.md']
+
+        _write(git_repo, 'README.md', '# Project\n\nUpdated overview.\n')
+        os.remove(os.path.join(git_repo, 'docs/old.md'))
+        _write(git_repo, 'docs/new.md', '# New\n\nA new page.\n')
+        _git(git_repo, 'add', '-A')
+        _git(git_repo, 'commit', '-m', 'Update docs')
+        mock_embeddings.embed_documents.reset_mock()
+
+        second = await indexer.index_repository(config)
+
+        assert second.status == 'success', second.message
+        assert second.message is not None and 'Incrementally updated' in second.message
+        assert _embedded_texts(mock_embeddings) == [
+            '# Project\n\nUpdated overview.\n',
+            '# New\n\nA new page.\n',
+        ]
+        assert _sources(indexer, second.index_path) == [
+            'README.md',
+            'docs/guide.md',
+            'docs/new.md',
+        ]
+        assert second.chunk_count == 3
+        repo_files = os.path.join(second.index_path, 'repository')
+        assert os.path.exists(os.path.join(repo_files, 'docs/new.md'))
+        assert not os.path.exists(os.path.join(repo_files, 'docs/old.md'))
+
+        results = indexer.load_index_without_pickle(second.index_path).similarity_search_by_vector(
+            _embed('# New\n\nA new page.\n'), k=1
+        )
+        assert results[0].metadata['source'] == 'docs/new.md'
+
+    @pytest.mark.asyncio
+    async def test_unchanged_repository_embeds_nothing(self, git_repo, tmp_path, mock_embeddings):
+        """Test that re-indexing an unchanged repository does not call the model."""
+        indexer = RepositoryIndexer(
+            IndexConfig(
+                embedding_model='amazon.titan-embed-text-v2:0', index_dir=str(tmp_path / 'idx')
+            )
+        )
+        config = RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.md'])
+        await indexer.index_repository(config)
+        mock_embeddings.embed_documents.reset_mock()
+
+        result = await indexer.index_repository(config)
+
+        assert result.status == 'success'
+        assert result.chunk_count == 3
+        mock_embeddings.embed_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changed_settings_rebuild_with_cached_embeddings(
+        self, git_repo, tmp_path, mock_embeddings
+    ):
+        """Test that a full rebuild still reuses the embeddings of unchanged chunks."""
+        indexer = RepositoryIndexer(
+            IndexConfig(
+                embedding_model='amazon.titan-embed-text-v2:0', index_dir=str(tmp_path / 'idx')
+            )
+        )
+        await indexer.index_repository(
+            RepositoryConfig(repository_path=git_repo, include_patterns=['**/*.md'])
+        )
+        mock_embeddings.embed_documents.reset_mock()
+
+        result = await indexer.index_repository(
+            RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.md'])
+        )
+
+        assert result.status == 'success'
+        assert result.message is not None and 'Successfully indexed' in result.message
+        assert _embedded_texts(mock_embeddings) == ['# Project\n\nOverview of the project.\n']
@@ -0,0 +1,186 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the index storage of the Git Repository Research MCP Server."""
+
+import json
+import os
+import pytest
+from awslabs.git_repo_research_mcp_server.index_store import (
+    DOCSTORE_FILE,
+    LEGACY_DOCSTORE_FILE,
+    LEGACY_MAPPING_FILE,
+    ResidentIndexManager,
+    SQLiteDocstore,
+    read_docstore,
+    write_docstore,
+    write_faiss_index,
+)
+from awslabs.git_repo_research_mcp_server.indexer import IndexConfig, RepositoryIndexer
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from unittest.mock import MagicMock, patch
+
+
+def _write_index(index_path, vectors):
+    """Write a FAISS index and a document store with one document per vector."""
+    os.makedirs(index_path, exist_ok=True)
+    vector_store = FAISS.from_embeddings(
+        [(f'content {i}', vector) for i, vector in enumerate(vectors)],
+        MagicMock(spec=Embeddings),
+    )
+    write_faiss_index(vector_store.index, str(index_path))
+    documents = {
+        f'doc-{i}': Document(page_content=f'content {i}', metadata={'source': f'file{i}.py'})
+        for i in range(len(vectors))
+    }
+    write_docstore(str(index_path), documents, {i: f'doc-{i}' for i in range(len(vectors))})
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    """Create an index with three documents."""
+    path = tmp_path / 'test_repo'
+    _write_index(path, [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    return str(path)
+
+
+class TestDocstore:
+    """Tests for reading and writing document stores."""
+
+    def test_sqlite_round_trip(self, index_path):
+        """Test that documents written to SQLite are read back unchanged."""
+        docstore, index_to_docstore_id = read_docstore(index_path)
+
+        assert index_to_docstore_id == {0: 'doc-0', 1: 'doc-1', 2: 'doc-2'}
+        document = docstore.search('doc-1')
+        assert isinstance(document, Document)
+        assert document.page_content == 'content 1'
+        assert document.metadata == {'source': 'file1.py'}
+
+    def test_legacy_json_docstore(self, tmp_path):
+        """Test that indices written before the SQLite layout can still be read."""
+        with open(tmp_path / LEGACY_DOCSTORE_FILE, 'w') as f:
+            json.dump({'doc-0': {'page_content': 'legacy', 'metadata': {'source': 'a.py'}}}, f)
+        with open(tmp_path / LEGACY_MAPPING_FILE, 'w') as f:
+            json.dump({'0': 'doc-0'}, f)
+
+        docstore, index_to_docstore_id = read_docstore(str(tmp_path))
+
+        assert index_to_docstore_id == {0: 'doc-0'}
+        assert docstore.search('doc-0').page_content == 'legacy'  # type: ignore[union-attr]
+
+    def test_write_replaces_legacy_files(self, tmp_path):
+        """Test that writing a SQLite docstore removes the legacy JSON files."""
+        for file_name in (LEGACY_DOCSTORE_FILE, LEGACY_MAPPING_FILE):
+            (tmp_path / file_name).write_text('{}')
+
+        write_docstore(str(tmp_path), {'doc-0': Document(page_content='x')}, {0: 'doc-0'})
+
+        assert os.path.exists(tmp_path / DOCSTORE_FILE)
+        assert not os.path.exists(tmp_path / LEGACY_DOCSTORE_FILE)
+        assert not os.path.exists(tmp_path / LEGACY_MAPPING_FILE)
+
+    def test_sqlite_docstore_missing_document(self, index_path):
+        """Test that the lazy document store reports unknown IDs."""
+        docstore = SQLiteDocstore(os.path.join(index_path, DOCSTORE_FILE))
+        try:
+            assert docstore.search('missing') == 'ID missing not found.'
+        finally:
+            docstore.close()
+
+
+class TestResidentIndexManager:
+    """Tests for the ResidentIndexManager class."""
+
+    def test_index_reused_until_files_change(self, index_path):
+        """Test that an index is loaded once and reloaded after it is rewritten."""
+        manager = ResidentIndexManager(max_size=2)
+
+        first = manager.get(index_path)
+        second = manager.get(index_path)
+        assert first is second
+        assert (manager.hits, manager.misses) == (1, 1)
+        assert isinstance(first.docstore, SQLiteDocstore)
+
+        _write_index(index_path, [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 2.0]])
+        # Make sure the modification time changes on file systems with coarse timestamps
+        faiss_path = os.path.join(index_path, 'index.faiss')
+        stat = os.stat(faiss_path)
+        os.utime(faiss_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        third = manager.get(index_path)
+        assert third is not first
+        assert third.index.ntotal == 4
+        manager.clear()
+
+    def test_least_recently_used_index_evicted(self, tmp_path):
+        """Test that the least recently used index is unloaded when the cache is full."""
+        paths = []
+        for name in ('a', 'b', 'c'):
+            path = str(tmp_path / name)
+            _write_index(path, [[1.0, 0.0]])
+            paths.append(path)
+        manager = ResidentIndexManager(max_size=2)
+
+        first = manager.get(paths[0])
+        manager.get(paths[1])
+        manager.get(paths[0])
+        manager.get(paths[2])
+
+        assert len(manager) == 2
+        assert manager.get(paths[0]) is first
+        assert manager.misses == 3
+        manager.get(paths[1])
+        assert manager.misses == 4
+        manager.clear()
+        assert len(manager) == 0
+
+    def test_invalidate(self, index_path):
+        """Test that an invalidated index is loaded again on its next use."""
+        manager = ResidentIndexManager(max_size=2)
+        first = manager.get(index_path)
+
+        manager.invalidate(index_path)
+
+        assert len(manager) == 0
+        assert manager.get(index_path) is not first
+        manager.clear()
+
+    def test_disabled_cache(self, index_path):
+        """Test that a cache size of 0 loads the index on every use."""
+        manager = ResidentIndexManager(max_size=0)
+
+        manager.get(index_path)
+        manager.get(index_path)
+
+        assert len(manager) == 0
+        assert manager.misses == 2
+
+
+@patch('awslabs.git_repo_research_mcp_server.indexer.get_embedding_model')
+def test_load_resident_index_search(mock_get_embedding_model, index_path):
+    """Test searching an index loaded through the resident index manager."""
+    embeddings = MagicMock(spec=Embeddings)
+    embeddings.embed_query.return_value = [0.0, 1.0]
+    mock_get_embedding_model.return_value = embeddings
+    indexer = RepositoryIndexer(IndexConfig(embedding_model='amazon.titan-embed-text-v2:0'))
+
+    vector_store = indexer.load_resident_index(index_path)
+
+    assert vector_store is not None
+    results = vector_store.similarity_search('query', k=1)
+    assert results[0].page_content == 'content 1'
+    assert results[0].metadata == {'source': 'file1.py'}
+    assert indexer.load_resident_index(os.path.dirname(index_path)) is None
@@ -289,7 +289,7 @@ def test_search_with_repository_name():
         mock_vector_store.similarity_search.return_value = [mock_doc1, mock_doc2]
         mock_vector_store.docstore._dict = {1: mock_doc1, 2: mock_doc2}
 
-        mock_indexer.load_index_without_pickle.return_value = mock_vector_store
+        mock_indexer.load_resident_index.return_value = mock_vector_store
 
         # Create a RepositorySearcher instance with the mock indexer
         searcher = RepositorySearcher()
@@ -333,7 +333,7 @@ def test_search_with_repository_name():
 
         # Verify the mock calls
         mock_indexer._get_index_path.assert_called_once_with('test_repo')
-        mock_indexer.load_index_without_pickle.assert_called_once_with('/tmp/index/test_repo')
+        mock_indexer.load_resident_index.assert_called_once_with('/tmp/index/test_repo')
         mock_vector_store.similarity_search.assert_called_once_with('test query', k=10)
 
 
@@ -366,7 +366,7 @@ def test_search_with_directory_path():
         mock_vector_store.similarity_search.return_value = [mock_doc1]
         mock_vector_store.docstore._dict = {1: mock_doc1}
 
-        mock_indexer.load_index_without_pickle.return_value = mock_vector_store
+        mock_indexer.load_resident_index.return_value = mock_vector_store
 
         # Create a RepositorySearcher instance with the mock indexer
         searcher = RepositorySearcher()
@@ -390,7 +390,7 @@ def test_search_with_directory_path():
         assert result.results[0].score == 1.0
 
         # Verify the mock calls
-        mock_indexer.load_index_without_pickle.assert_called_once_with('/tmp/index/test_repo')
+        mock_indexer.load_resident_index.assert_called_once_with('/tmp/index/test_repo')
 
 
 def test_search_with_similarity_search_with_score_fallback():
@@ -424,7 +424,7 @@ def test_search_with_similarity_search_with_score_fallback():
         mock_vector_store.similarity_search_with_score.return_value = [(mock_doc1, 0.5)]
         mock_vector_store.docstore._dict = {1: mock_doc1}
 
-        mock_indexer.load_index_without_pickle.return_value = mock_vector_store
+        mock_indexer.load_resident_index.return_value = mock_vector_store
 
         # Create a RepositorySearcher instance with the mock indexer
         searcher = RepositorySearcher()
@@ -449,7 +449,7 @@ def test_search_with_similarity_search_with_score_fallback():
 
         # Verify the mock calls
         mock_indexer._get_index_path.assert_called_once_with('test_repo')
-        mock_indexer.load_index_without_pickle.assert_called_once_with('/tmp/index/test_repo')
+        mock_indexer.load_resident_index.assert_called_once_with('/tmp/index/test_repo')
         mock_vector_store.similarity_search.assert_called_once_with('test query', k=10)
         mock_vector_store.similarity_search_with_score.assert_called_once_with('test query', k=10)
         mock_logger_error.assert_called_once()
@@ -480,7 +480,7 @@ def test_search_with_both_search_methods_failing():
         mock_vector_store.similarity_search_with_score.side_effect = Exception('Test exception 2')
         mock_vector_store.docstore._dict = {1: MagicMock()}
 
-        mock_indexer.load_index_without_pickle.return_value = mock_vector_store
+        mock_indexer.load_resident_index.return_value = mock_vector_store
 
         # Create a RepositorySearcher instance with the mock indexer
         searcher = RepositorySearcher()
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import functools
 import inspect
 import json
 import logging
+import threading
 from awslabs.mcp_lambda_handler.session import DynamoDBSessionStore, NoOpSessionStore, SessionStore
 from awslabs.mcp_lambda_handler.types import (
     Capabilities,
@@ -31,7 +33,8 @@ from awslabs.mcp_lambda_handler.types import (
     StaticResource,
     TextContent,
 )
-from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 from enum import Enum
 from typing import (
     Any,
@@ -100,7 +103,12 @@ class MCPLambdaHandler:
         self.version = version
         self.tools: Dict[str, Dict] = {}
         self.tool_implementations: Dict[str, Callable] = {}
+        # Argument converters per tool (e.g. enum string values to enum members)
+        self.tool_converters: Dict[str, Dict[str, Callable[[Any], Any]]] = {}
         self.resources: Dict[str, Resource] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Serializes the session updates of tools called concurrently by a batch
+        self._session_lock = threading.RLock()
 
         # Configure session storage
         if session_store is None:
@@ -142,6 +150,10 @@ class MCPLambdaHandler:
     def update_session(self, updater_func: Callable[[SessionData], None]) -> bool:
         """Update session data using a function.
 
+        The update is atomic with respect to the other calls of update_session in the
+        container, so tools called concurrently by a batch do not overwrite each other's
+        changes.
+
         Args:
             updater_func: Function that takes SessionData and updates it in place
 
@@ -149,20 +161,22 @@ class MCPLambdaHandler:
             True if successful, False if no session exists
 
         """
-        session = self.get_session()
-        if not session:
-            return False
+        with self._session_lock:
+            session = self.get_session()
+            if not session:
+                return False
 
-        # Update the session data
-        updater_func(session)
+            # Update the session data
+            updater_func(session)
 
-        # Save back to storage
-        return self.set_session(session.raw())
+            # Save back to storage
+            return self.set_session(session.raw())
 
     def tool(self):
         """Create a decorator for a function as an MCP tool.
 
         Uses function name, docstring, and type hints to generate the MCP tool schema.
+        Both regular functions and coroutine functions (``async def``) can be tools.
         """
 
         def decorator(func: Callable):
@@ -241,7 +255,8 @@ class MCPLambdaHandler:
                 # Default for unknown complex types
                 return {'type': 'string'}
 
-            # Build properties from type hints
+            # Build properties from type hints, and the argument converters used on tool calls
+            converters = {}
             for param_name, param_type in hints.items():
                 param_schema = get_type_schema(param_type)
 
@@ -251,6 +266,9 @@ class MCPLambdaHandler:
                 properties[param_name] = param_schema
                 required.append(param_name)
 
+                if isinstance(param_type, type) and issubclass(param_type, Enum):
+                    converters[param_name] = param_type
+
             # Create tool schema
             tool_schema = {
                 'name': tool_name,
@@ -261,6 +279,15 @@ class MCPLambdaHandler:
             # Register the tool
             self.tools[tool_name] = tool_schema
             self.tool_implementations[tool_name] = func
+            self.tool_converters[tool_name] = converters
+
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    return await func(*args, **kwargs)
+
+                return async_wrapper
 
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
@@ -387,7 +414,13 @@ class MCPLambdaHandler:
         return {'statusCode': 200, 'body': response.model_dump_json(), 'headers': headers}
 
     def handle_request(self, event: Dict, context: Any) -> Dict:
-        """Handle an incoming Lambda request."""
+        """Handle an incoming Lambda request.
+
+        The body is either a single JSON-RPC message or a batch (array) of messages. A single
+        message is handled synchronously, except for calls of coroutine tools, which run on an
+        event loop. The messages of a batch are dispatched concurrently, and the responses to
+        the messages that are not notifications are returned together as an array.
+        """
         request_id = None
         session_id = None
 
@@ -421,34 +454,135 @@ class MCPLambdaHandler:
             try:
                 body = json.loads(event['body'])
                 logger.debug(f'Parsed request body: {body}')
-                request_id = body.get('id') if isinstance(body, dict) else None
-
-                # Check if this is a notification (no id field)
-                if isinstance(body, dict) and 'id' not in body:
-                    logger.debug('Request is a notification')
-                    return {
-                        'statusCode': 202,
-                        'body': '',
-                        'headers': {'Content-Type': 'application/json', 'MCP-Version': '0.6'},
-                    }
-
-                # Validate basic JSON-RPC structure
-                if (
-                    not isinstance(body, dict)
-                    or body.get('jsonrpc') != '2.0'
-                    or 'method' not in body
-                ):
-                    return self._create_error_response(-32700, 'Parse error', request_id)
-
             except json.JSONDecodeError:
                 return self._create_error_response(-32700, 'Parse error')
 
+            if isinstance(body, list):
+                return self._run(self._handle_batch(body, session_id))
+
+            request_id = body.get('id') if isinstance(body, dict) else None
+            return self._handle_message(body, session_id, self._call_tool)
+
+        except Exception as e:
+            logger.error(f'Error processing request: {str(e)}', exc_info=True)
+            return self._create_error_response(-32000, str(e), request_id, session_id=session_id)
+        finally:
+            # Write the session updates buffered during the invocation
+            try:
+                if not self.session_store.flush():
+                    logger.error('Failed to write the session updates of the request')
+            except Exception as e:
+                logger.error(f'Error flushing session store: {str(e)}')
+            # Clear session context
+            current_session_id.set(None)
+
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine to completion on the event loop of the handler.
+
+        The loop is created once and reused by the later invocations of a warm container.
+        When handle_request is called from a running event loop, the coroutine runs on its
+        own loop in a worker thread instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+
+        context = copy_context()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(context.run, asyncio.run, coro).result()
+
+    def _call_tool(self, tool_func: Callable, arguments: Dict[str, Any]) -> Any:
+        """Call the tool of a single message, running coroutine tools on the event loop."""
+        if inspect.iscoroutinefunction(tool_func):
+            return self._run(tool_func(**arguments))
+        return tool_func(**arguments)
+
+    async def _handle_batch(self, messages: List[Any], session_id: Optional[str]) -> Dict:
+        """Handle a JSON-RPC batch by dispatching its messages concurrently.
+
+        Each message is handled in a worker thread, so regular tools run there, while the
+        coroutine tools of all messages are awaited together on the event loop.
+        """
+        if not messages:
+            return self._create_error_response(-32600, 'Invalid Request', session_id=session_id)
+
+        logger.debug(f'Handling batch of {len(messages)} messages')
+        loop = asyncio.get_running_loop()
+
+        def call_tool(tool_func: Callable, arguments: Dict[str, Any]) -> Any:
+            if inspect.iscoroutinefunction(tool_func):
+                return asyncio.run_coroutine_threadsafe(tool_func(**arguments), loop).result()
+            return tool_func(**arguments)
+
+        responses = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._handle_message, message, session_id, call_tool, True)
+                if isinstance(message, dict)
+                else self._invalid_batch_message(session_id)
+                for message in messages
+            )
+        )
+
+        # Notifications have no response, and a batch of notifications has no body
+        bodies = [response['body'] for response in responses if response.get('body')]
+        headers = {'Content-Type': 'application/json', 'MCP-Version': '0.6'}
+        if session_id:
+            headers['MCP-Session-Id'] = session_id
+        if not bodies:
+            return {'statusCode': 202, 'body': '', 'headers': headers}
+        return {'statusCode': 200, 'body': f'[{",".join(bodies)}]', 'headers': headers}
+
+    async def _invalid_batch_message(self, session_id: Optional[str]) -> Dict:
+        """Create the response to a batch element that is not a JSON-RPC message."""
+        return self._create_error_response(-32600, 'Invalid Request', session_id=session_id)
+
+    def _handle_message(
+        self,
+        body: Any,
+        session_id: Optional[str],
+        call_tool: Callable[[Callable, Dict[str, Any]], Any],
+        in_batch: bool = False,
+    ) -> Dict:
+        """Handle a single JSON-RPC message.
+
+        Args:
+            body: Parsed JSON-RPC message
+            session_id: Session ID from the request headers
+            call_tool: Function calling a tool implementation with its converted arguments
+            in_batch: Whether the message is part of a batch, which cannot contain the
+                initialize request
+        """
+        request_id = body.get('id') if isinstance(body, dict) else None
+
+        try:
+            # Check if this is a notification (no id field)
+            if isinstance(body, dict) and 'id' not in body:
+                logger.debug('Request is a notification')
+                return {
+                    'statusCode': 202,
+                    'body': '',
+                    'headers': {'Content-Type': 'application/json', 'MCP-Version': '0.6'},
+                }
+
+            # Validate basic JSON-RPC structure
+            if not isinstance(body, dict) or body.get('jsonrpc') != '2.0' or 'method' not in body:
+                return self._create_error_response(-32700, 'Parse error', request_id)
+
             # Parse and validate the request
             request = JSONRPCRequest.model_validate(body)
             logger.debug(f'Validated request: {request}')
 
             # Handle initialization request
             if request.method == 'initialize':
+                if in_batch:
+                    # The session created by initialize could not be used by the other
+                    # messages of the batch, so initialize must be sent on its own
+                    return self._create_error_response(
+                        -32600, 'Invalid Request: initialize cannot be part of a batch', request.id
+                    )
                 logger.info('Handling initialize request')
                 # Create new session
                 session_id = self.session_store.create_session()
@@ -494,19 +628,17 @@ class MCPLambdaHandler:
                     )
 
                 try:
-                    # Convert enum string values to enum objects
-                    converted_args = {}
+                    # Convert argument values with the converters built at registration
                     tool_func = self.tool_implementations[tool_name]
-                    hints = get_type_hints(tool_func)
-
-                    for arg_name, arg_value in tool_args.items():
-                        arg_type = hints.get(arg_name)
-                        if isinstance(arg_type, type) and issubclass(arg_type, Enum):
-                            converted_args[arg_name] = arg_type(arg_value)
-                        else:
-                            converted_args[arg_name] = arg_value
+                    converters = self.tool_converters.get(tool_name, {})
+                    converted_args = {
+                        arg_name: converters[arg_name](arg_value)
+                        if arg_name in converters
+                        else arg_value
+                        for arg_name, arg_value in tool_args.items()
+                    }
 
-                    result = tool_func(**converted_args)
+                    result = call_tool(tool_func, converted_args)
                     content = self._convert_result_to_content(result)
                     return self._create_success_response(
                         {'content': content}, request.id, session_id
@@ -594,6 +726,3 @@ class MCPLambdaHandler:
         except Exception as e:
             logger.error(f'Error processing request: {str(e)}', exc_info=True)
             return self._create_error_response(-32000, str(e), request_id, session_id=session_id)
-        finally:
-            # Clear session context
-            current_session_id.set(None)
@@ -15,10 +15,15 @@
 """Session management for MCP server with pluggable storage."""
 
 import boto3
+import copy
 import logging
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from botocore.exceptions import ClientError
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
@@ -81,6 +86,18 @@ class SessionStore(ABC):
         """
         pass
 
+    def flush(self) -> bool:
+        """Write pending session updates to the storage.
+
+        Called by the handler at the end of every invocation. Stores that write updates
+        immediately have nothing to flush.
+
+        Returns:
+            True if all pending updates were written, False otherwise
+
+        """
+        return True
+
 
 class NoOpSessionStore(SessionStore):
     """A no-op session store that doesn't actually store sessions."""
@@ -213,3 +230,312 @@ class DynamoDBSessionStore(SessionStore):
         except Exception as e:
             logger.error(f'Error deleting session {session_id}: {e}')
             return False
+
+
+@dataclass
+class _CachedSession:
+    """A session held in the cache of a CachedDynamoDBSessionStore."""
+
+    data: Dict[str, Any]
+    # Data as of the cached version, to find the keys changed by a buffered update
+    base: Dict[str, Any]
+    version: int
+    expires_at: float
+    loaded_at: float
+    dirty: bool = False
+
+
+def _merge_session_data(
+    base: Dict[str, Any], data: Dict[str, Any], stored: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Apply the top-level keys that data changed from base to the stored session data."""
+    merged = copy.deepcopy(stored)
+    for key in base.keys() - data.keys():
+        merged.pop(key, None)
+    for key, value in data.items():
+        if key not in base or base[key] != value:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+class CachedDynamoDBSessionStore(DynamoDBSessionStore):
+    """DynamoDB session store with an in-process cache for warm Lambda containers.
+
+    Sessions read or written by an invocation are kept in a least recently used cache, so
+    the following requests of a session served by the same container do not read them
+    from DynamoDB again. Updates are buffered in the cache and written once, when the
+    handler flushes the store at the end of the invocation.
+
+    Every item carries a version attribute that is incremented by each write, and writes
+    are conditional on the version read. When another container updated the session in the
+    meantime, the session is read again, the top-level keys changed by the buffered update
+    are applied to the stored data, and the write is retried, up to MAX_WRITE_ATTEMPTS
+    times. Updates that cannot be written make flush return False.
+
+    A cached session is used for up to ttl_seconds without being read again, so a request
+    served by this container may not see an update written by another container during
+    that time.
+    """
+
+    MAX_WRITE_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        table_name: str = 'mcp_sessions',
+        max_sessions: int = 128,
+        ttl_seconds: float = 30,
+    ):
+        """Initialize the session store.
+
+        Args:
+            table_name: Name of DynamoDB table to use for sessions
+            max_sessions: Maximum number of sessions held in the cache
+            ttl_seconds: Number of seconds a cached session is used before it is read again,
+                i.e. how long updates written by other containers may go unseen
+
+        """
+        super().__init__(table_name)
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._cache: OrderedDict[str, _CachedSession] = OrderedDict()
+        self._lock = threading.RLock()
+        # Whether the update of a session evicted since the last flush could not be written
+        self._eviction_write_failed = False
+
+    def create_session(self, session_data: Optional[Dict[str, Any]] = None) -> str:
+        """Create a new session.
+
+        Args:
+            session_data: Optional initial session data
+
+        Returns:
+            The session ID
+
+        """
+        session_id = str(uuid.uuid4())
+        now = int(time.time())
+        item = {
+            'session_id': session_id,
+            'expires_at': now + (24 * 60 * 60),
+            'created_at': now,
+            'version': 0,
+            'data': session_data or {},
+        }
+
+        self.table.put_item(Item=item)
+        logger.info(f'Created session {session_id}')
+
+        self._cache_item(item)
+        return session_id
+
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get session data, from the cache if the session is cached.
+
+        Args:
+            session_id: The session ID to look up
+
+        Returns:
+            Copy of the session data or None if not found
+
+        """
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is not None:
+                now = time.time()
+                if entry.expires_at < now:
+                    del self._cache[session_id]
+                elif entry.dirty or now - entry.loaded_at <= self.ttl_seconds:
+                    self._cache.move_to_end(session_id)
+                    return copy.deepcopy(entry.data)
+
+        try:
+            response = self.table.get_item(Key={'session_id': session_id})
+            item = response.get('Item')
+
+            if not item:
+                self._evict(session_id)
+                return None
+
+            # Check if session has expired
+            if item.get('expires_at', 0) < time.time():
+                self.delete_session(session_id)
+                return None
+
+            return copy.deepcopy(self._cache_item(item).data)
+
+        except Exception as e:
+            logger.error(f'Error getting session {session_id}: {e}')
+            return None
+
+    def update_session(self, session_id: str, session_data: Dict[str, Any]) -> bool:
+        """Buffer a session update until the store is flushed.
+
+        Args:
+            session_id: The session ID to update
+            session_data: New session data
+
+        Returns:
+            True if the update was buffered, False if the session does not exist
+
+        """
+        with self._lock:
+            entry = self._cache.get(session_id)
+        if entry is None:
+            # Load the session to get the version the update is conditional on
+            if self.get_session(session_id) is None:
+                return False
+
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is None:
+                return False
+            entry.data = copy.deepcopy(session_data)
+            entry.dirty = True
+            self._cache.move_to_end(session_id)
+            return True
+
+    def delete_session(self, session_id: str) -> bool:
+        """Delete a session.
+
+        Args:
+            session_id: The session ID to delete
+
+        Returns:
+            True if successful, False otherwise
+
+        """
+        self._evict(session_id)
+        return super().delete_session(session_id)
+
+    def flush(self) -> bool:
+        """Write the buffered session updates with conditional writes.
+
+        Returns:
+            True if all buffered updates were written, False otherwise
+
+        """
+        with self._lock:
+            pending = [
+                (session_id, entry) for session_id, entry in self._cache.items() if entry.dirty
+            ]
+            success = not self._eviction_write_failed
+            self._eviction_write_failed = False
+
+        for session_id, entry in pending:
+            if not self._write(session_id, entry):
+                self._evict(session_id)
+                success = False
+        return success
+
+    def _write(self, session_id: str, entry: _CachedSession) -> bool:
+        """Write a buffered update, merging it with updates written by other containers."""
+        with self._lock:
+            data = copy.deepcopy(entry.data)
+            base = copy.deepcopy(entry.base)
+            version = entry.version
+            entry.dirty = False
+
+        for _ in range(self.MAX_WRITE_ATTEMPTS):
+            try:
+                written_version = self._write_version(session_id, data, version)
+                break
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                    logger.error(f'Error updating session {session_id}: {e}')
+                    return False
+            except Exception as e:
+                logger.error(f'Error updating session {session_id}: {e}')
+                return False
+
+            # Another container updated the session since it was read
+            logger.info(f'Session {session_id} was modified concurrently, merging update')
+            try:
+                item = self.table.get_item(
+                    Key={'session_id': session_id}, ConsistentRead=True
+                ).get('Item')
+            except Exception as e:
+                logger.error(f'Error getting session {session_id}: {e}')
+                return False
+            if not item:
+                logger.error(f'Session {session_id} was deleted, discarding update')
+                return False
+            stored = item.get('data', {})
+            data = _merge_session_data(base, data, stored)
+            base = copy.deepcopy(stored)
+            version = int(item.get('version', 0))
+        else:
+            logger.error(
+                f'Session {session_id} was modified concurrently {self.MAX_WRITE_ATTEMPTS} '
+                'times, discarding update'
+            )
+            return False
+
+        with self._lock:
+            # An update buffered during the write keeps the version it is based on, so its
+            # write is merged with this one
+            if not entry.dirty:
+                entry.data = data
+                entry.base = copy.deepcopy(data)
+                entry.version = written_version
+                entry.loaded_at = time.time()
+        return True
+
+    def _write_version(self, session_id: str, data: Dict[str, Any], version: int) -> int:
+        """Write session data if the stored version is the given version.
+
+        Returns:
+            The version of the written data
+
+        Raises:
+            ClientError: ConditionalCheckFailedException if the stored version differs
+        """
+        # Sessions created without a version attribute are at version 0
+        condition = 'attribute_exists(session_id) AND #version = :version'
+        if version == 0:
+            condition = (
+                'attribute_exists(session_id) AND '
+                '(attribute_not_exists(#version) OR #version = :version)'
+            )
+
+        response = self.table.update_item(
+            Key={'session_id': session_id},
+            UpdateExpression='SET #data = :data, #version = if_not_exists(#version, :zero) + :one',
+            ConditionExpression=condition,
+            ExpressionAttributeNames={'#data': 'data', '#version': 'version'},
+            ExpressionAttributeValues={
+                ':data': data,
+                ':version': version,
+                ':zero': 0,
+                ':one': 1,
+            },
+            ReturnValues='UPDATED_NEW',
+        )
+        return int(response.get('Attributes', {}).get('version', version + 1))
+
+    def _cache_item(self, item: Dict[str, Any]) -> _CachedSession:
+        """Add a session item read from or written to DynamoDB to the cache."""
+        entry = _CachedSession(
+            data=copy.deepcopy(item.get('data', {})),
+            base=copy.deepcopy(item.get('data', {})),
+            version=int(item.get('version', 0)),
+            expires_at=float(item.get('expires_at', 0)),
+            loaded_at=time.time(),
+        )
+        evicted = []
+        with self._lock:
+            self._cache[item['session_id']] = entry
+            self._cache.move_to_end(item['session_id'])
+            while len(self._cache) > self.max_sessions:
+                evicted.append(self._cache.popitem(last=False))
+
+        # Write the updates of evicted sessions instead of losing them
+        for session_id, evicted_entry in evicted:
+            if evicted_entry.dirty and not self._write(session_id, evicted_entry):
+                with self._lock:
+                    self._eviction_write_failed = True
+        return entry
+
+    def _evict(self, session_id: str) -> None:
+        """Remove a session from the cache."""
+        with self._lock:
+            self._cache.pop(session_id, None)
@@ -0,0 +1,201 @@
+"""Tests for the CachedDynamoDBSessionStore."""
+
+import boto3
+import json
+import pytest
+from awslabs.mcp_lambda_handler.mcp_lambda_handler import MCPLambdaHandler
+from awslabs.mcp_lambda_handler.session import CachedDynamoDBSessionStore
+from moto import mock_aws
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+
+TABLE_NAME = 'mcp_sessions'
+
+
+@pytest.fixture
+def table(monkeypatch):
+    """Create the session table in a mocked DynamoDB."""
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    with mock_aws():
+        dynamodb: Any = boto3.resource('dynamodb')
+        yield dynamodb.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[{'AttributeName': 'session_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'session_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST',
+        )
+
+
+def make_store(**kwargs):
+    """Create a store whose table calls are recorded."""
+    store = CachedDynamoDBSessionStore(TABLE_NAME, **kwargs)
+    store.table = MagicMock(wraps=store.table)
+    return store
+
+
+def test_session_served_from_cache(table):
+    """Test that created and read sessions are not read from DynamoDB again."""
+    store = make_store()
+    session_id = store.create_session({'user': 'alice'})
+
+    data = store.get_session(session_id)
+    assert data is not None
+    data['user'] = 'bob'
+
+    assert store.get_session(session_id) == {'user': 'alice'}
+    store.table.get_item.assert_not_called()
+
+    other = make_store()
+    assert other.get_session(session_id) == {'user': 'alice'}
+    assert other.get_session(session_id) == {'user': 'alice'}
+    other.table.get_item.assert_called_once()
+
+
+def test_updates_coalesced_until_flush(table):
+    """Test that several updates are written once, with an incremented version."""
+    store = make_store()
+    session_id = store.create_session()
+
+    assert store.update_session(session_id, {'count': 1})
+    assert store.update_session(session_id, {'count': 2})
+    assert store.get_session(session_id) == {'count': 2}
+    store.table.update_item.assert_not_called()
+
+    assert store.flush()
+    assert store.flush()
+
+    store.table.update_item.assert_called_once()
+    item = table.get_item(Key={'session_id': session_id})['Item']
+    assert item['data'] == {'count': 2}
+    assert item['version'] == 1
+
+
+def test_concurrent_updates_merged(table):
+    """Test that an update based on an outdated version is merged with the newer data."""
+    first = make_store()
+    second = make_store()
+    session_id = first.create_session({'count': 0, 'user': 'alice', 'temp': 1})
+    second.get_session(session_id)
+
+    first.update_session(session_id, {'count': 1, 'user': 'alice', 'temp': 1, 'a': 1})
+    assert first.flush()
+    second.update_session(session_id, {'count': 0, 'user': 'bob'})
+    assert second.flush()
+
+    expected = {'count': 1, 'user': 'bob', 'a': 1}
+    item = table.get_item(Key={'session_id': session_id})['Item']
+    assert item['data'] == expected
+    assert item['version'] == 2
+    assert second.get_session(session_id) == expected
+
+    # The merged version is cached, so the next update is written without a conflict
+    second.update_session(session_id, {**expected, 'count': 2})
+    assert second.flush()
+    assert second.table.get_item.call_count == 2
+
+
+def test_update_of_deleted_session_reported(table):
+    """Test that an update of a session deleted by another container fails the flush."""
+    first = make_store()
+    second = make_store()
+    session_id = first.create_session()
+    second.get_session(session_id)
+
+    first.update_session(session_id, {'a': 1})
+    assert first.flush()
+    table.delete_item(Key={'session_id': session_id})
+    second.update_session(session_id, {'b': 1})
+
+    assert not second.flush()
+    assert second.get_session(session_id) is None
+
+
+def test_failed_eviction_write_reported(table):
+    """Test that an evicted update that cannot be written fails the next flush."""
+    store = make_store(max_sessions=1)
+    first = store.create_session()
+    store.update_session(first, {'a': 1})
+
+    with patch.object(store, '_write_version', side_effect=Exception('Throttled')):
+        store.create_session()
+
+    assert not store.flush()
+    assert store.flush()
+
+
+def test_session_without_version(table):
+    """Test updating a session created without a version attribute."""
+    table.put_item(Item={'session_id': 'legacy', 'expires_at': 2**40, 'created_at': 0, 'data': {}})
+    store = make_store()
+
+    assert store.update_session('legacy', {'migrated': True})
+    assert store.flush()
+
+    item = table.get_item(Key={'session_id': 'legacy'})['Item']
+    assert item['data'] == {'migrated': True}
+    assert item['version'] == 1
+
+
+def test_missing_and_deleted_sessions(table):
+    """Test that missing and deleted sessions are not cached."""
+    store = make_store()
+    session_id = store.create_session()
+
+    assert not store.update_session('missing', {'a': 1})
+    assert store.delete_session(session_id)
+    assert store.get_session(session_id) is None
+    assert not store.update_session(session_id, {'a': 1})
+
+
+def test_evicted_updates_written(table):
+    """Test that least recently used sessions are evicted and their updates written."""
+    store = make_store(max_sessions=1)
+    first = store.create_session()
+    store.update_session(first, {'a': 1})
+
+    store.create_session()
+
+    assert table.get_item(Key={'session_id': first})['Item']['data'] == {'a': 1}
+    assert store.get_session(first) == {'a': 1}
+    assert store.table.get_item.call_count == 1
+
+
+def test_handler_flushes_at_end_of_invocation(table):
+    """Test that session updates made by tools are written when the request is handled."""
+    store = make_store()
+    handler = MCPLambdaHandler('test-server', session_store=store)
+
+    @handler.tool()
+    def increment(times: int) -> int:
+        def add_one(session):
+            session.set('count', session.get('count', 0) + 1)
+
+        for _ in range(times):
+            handler.update_session(add_one)
+        session = handler.get_session()
+        assert session is not None
+        return session.get('count')
+
+    session_id = store.create_session()
+    event = {
+        'httpMethod': 'POST',
+        'headers': {'content-type': 'application/json', 'mcp-session-id': session_id},
+        'body': json.dumps(
+            {
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'tools/call',
+                'params': {'name': 'increment', 'arguments': {'times': 3}},
+            }
+        ),
+    }
+
+    resp = handler.handle_request(event, None)
+
+    assert json.loads(resp['body'])['result']['content'][0]['text'] == '3'
+    store.table.get_item.assert_not_called()
+    store.table.update_item.assert_called_once()
+    assert table.get_item(Key={'session_id': session_id})['Item']['data'] == {'count': 3}
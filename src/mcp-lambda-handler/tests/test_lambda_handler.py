@@ -337,7 +337,7 @@ def make_lambda_event(jsonrpc_payload):
             'requestId': 'test-request-id',
         },
         'body': json.dumps(jsonrpc_payload)
-        if isinstance(jsonrpc_payload, dict)
+        if isinstance(jsonrpc_payload, (dict, list))
         else jsonrpc_payload,
         'isBase64Encoded': False,
     }
@@ -1483,3 +1483,235 @@ def test_multiple_resources_same_handler():
             assert 'Content' in content['text']
     finally:
         os.unlink(temp_path)
+
+
+def test_tool_decorator_precomputes_converters():
+    """Test that tool calls use the converters built at registration time."""
+    from enum import Enum
+
+    class Size(Enum):
+        SMALL = 'small'
+        LARGE = 'large'
+
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    def order(size: Size, count: int) -> str:
+        return f'{count} {size.name}'
+
+    assert handler.tool_converters['order'] == {'size': Size}
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'order', 'arguments': {'size': 'large', 'count': 2}},
+    }
+    with patch(
+        'awslabs.mcp_lambda_handler.mcp_lambda_handler.get_type_hints',
+        side_effect=AssertionError('type hints resolved on call'),
+    ):
+        resp = handler.handle_request(make_lambda_event(req), None)
+
+    body = json.loads(resp['body'])
+    assert body['result']['content'][0]['text'] == '2 LARGE'
+
+
+def test_handle_request_async_tool():
+    """Test calling a coroutine tool."""
+    import asyncio
+    import inspect
+
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    async def slow_echo(text: str) -> str:
+        await asyncio.sleep(0)
+        return text
+
+    assert inspect.iscoroutinefunction(slow_echo)
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'slow_echo', 'arguments': {'text': 'hello'}},
+    }
+    resp = handler.handle_request(make_lambda_event(req), None)
+
+    body = json.loads(resp['body'])
+    assert body['result']['content'][0]['text'] == 'hello'
+
+
+def test_handle_request_batch():
+    """Test that the messages of a batch are dispatched concurrently."""
+    import asyncio
+    import threading
+
+    handler = MCPLambdaHandler('test-server')
+    threads = []
+
+    @handler.tool()
+    async def wait(seconds: float) -> str:
+        await asyncio.sleep(seconds)
+        return f'waited {seconds}'
+
+    @handler.tool()
+    def blocking_wait(seconds: float) -> str:
+        threads.append(threading.get_ident())
+        time.sleep(seconds)
+        return f'blocked {seconds}'
+
+    def call(request_id, name, seconds):
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'method': 'tools/call',
+            'params': {'name': name, 'arguments': {'seconds': seconds}},
+        }
+
+    batch = [
+        call(1, 'wait', 0.2),
+        call(2, 'wait', 0.2),
+        call(3, 'blocking_wait', 0.2),
+        call(4, 'blocking_wait', 0.2),
+        {'jsonrpc': '2.0', 'method': 'notifications/initialized'},
+        {'jsonrpc': '2.0', 'id': 5, 'method': 'ping'},
+        call(6, 'missing', 0),
+        'not a message',
+    ]
+    start = time.monotonic()
+    resp = handler.handle_request(make_lambda_event(batch), None)
+    elapsed = time.monotonic() - start
+
+    assert resp['statusCode'] == 200
+    body = json.loads(resp['body'])
+    assert [message['id'] for message in body] == [1, 2, 3, 4, 5, 6, None]
+    assert body[0]['result']['content'][0]['text'] == 'waited 0.2'
+    assert body[3]['result']['content'][0]['text'] == 'blocked 0.2'
+    assert body[4]['result'] == {}
+    assert body[5]['error']['code'] == -32601
+    assert body[6]['error']['code'] == -32600
+    assert threading.get_ident() not in threads
+    assert elapsed < 0.6
+
+
+def test_handle_request_batch_without_responses():
+    """Test batches that are empty or only contain notifications."""
+    handler = MCPLambdaHandler('test-server')
+
+    resp = handler.handle_request(make_lambda_event([]), None)
+    assert resp['statusCode'] == 400
+    assert json.loads(resp['body'])['error']['code'] == -32600
+
+    notifications = [{'jsonrpc': '2.0', 'method': 'notifications/initialized'}] * 2
+    resp = handler.handle_request(make_lambda_event(notifications), None)
+    assert resp['statusCode'] == 202
+    assert resp['body'] == ''
+
+
+def test_handle_request_batch_initialize():
+    """Test that initialize is rejected in a batch, as its session could not be shared."""
+    mock_store = MagicMock()
+    mock_store.create_session.return_value = 'new-session'
+    handler = MCPLambdaHandler('test-server', session_store=mock_store)
+
+    batch = [{'jsonrpc': '2.0', 'id': 1, 'method': 'initialize'}]
+    resp = handler.handle_request(make_lambda_event(batch), None)
+
+    assert 'MCP-Session-Id' not in resp['headers']
+    assert json.loads(resp['body'])[0]['error']['code'] == -32600
+    mock_store.create_session.assert_not_called()
+
+
+def test_handle_request_sync_tool_runs_event_loop():
+    """Test that a synchronous tool can run its own event loop with asyncio.run."""
+    import asyncio
+
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    def run_loop(text: str) -> str:
+        async def echo():
+            return text
+
+        return asyncio.run(echo())
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'run_loop', 'arguments': {'text': 'hello'}},
+    }
+    resp = handler.handle_request(make_lambda_event(req), None)
+    assert json.loads(resp['body'])['result']['content'][0]['text'] == 'hello'
+
+    resp = handler.handle_request(make_lambda_event([req, {**req, 'id': 2}]), None)
+    assert [message['result']['content'][0]['text'] for message in json.loads(resp['body'])] == [
+        'hello',
+        'hello',
+    ]
+
+
+def test_handle_request_from_running_event_loop():
+    """Test that handle_request works when called from a running event loop."""
+    import asyncio
+
+    handler = MCPLambdaHandler('test-server')
+
+    @handler.tool()
+    async def slow_echo(text: str) -> str:
+        await asyncio.sleep(0)
+        return text
+
+    req = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'slow_echo', 'arguments': {'text': 'hello'}},
+    }
+
+    async def main():
+        single = handler.handle_request(make_lambda_event(req), None)
+        batch = handler.handle_request(make_lambda_event([req]), None)
+        return json.loads(single['body']), json.loads(batch['body'])
+
+    single, batch = asyncio.run(main())
+    assert single['result']['content'][0]['text'] == 'hello'
+    assert batch[0]['result']['content'][0]['text'] == 'hello'
+
+
+def test_handle_request_batch_session_updates():
+    """Test that concurrent session updates of a batch do not overwrite each other."""
+    sessions = {'session-1': {'count': 0}}
+    mock_store = MagicMock()
+    mock_store.get_session.side_effect = lambda session_id: dict(sessions[session_id])
+
+    def update_session(session_id, data):
+        time.sleep(0.01)
+        sessions[session_id] = data
+        return True
+
+    mock_store.update_session.side_effect = update_session
+    handler = MCPLambdaHandler('test-server', session_store=mock_store)
+
+    @handler.tool()
+    def increment() -> int:
+        handler.update_session(lambda session: session.set('count', session.get('count') + 1))
+        return 0
+
+    batch = [
+        {
+            'jsonrpc': '2.0',
+            'id': i,
+            'method': 'tools/call',
+            'params': {'name': 'increment', 'arguments': {}},
+        }
+        for i in range(5)
+    ]
+    event = make_lambda_event(batch)
+    event['headers']['mcp-session-id'] = 'session-1'
+    resp = handler.handle_request(event, None)
+
+    assert resp['statusCode'] == 200
+    assert sessions['session-1']['count'] == 5
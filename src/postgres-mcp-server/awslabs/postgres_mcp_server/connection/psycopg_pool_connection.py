@@ -19,16 +19,82 @@ It supports both Aurora PostgreSQL and RDS PostgreSQL instances via direct conne
 parameters (host, port, database, user, password) or via AWS Secrets Manager.
 """
 
+import asyncio
 import boto3
 import json
+import re
+import threading
+import time
 from aiorwlock import RWLock
 from awslabs.postgres_mcp_server import __user_agent__
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
 from botocore.config import Config
-from datetime import datetime, timedelta
+from datetime import datetime
 from loguru import logger
+from psycopg import AsyncConnection, OperationalError
 from psycopg_pool import AsyncConnectionPool
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Number of rows fetched from a server-side cursor per round trip
+FETCH_BATCH_SIZE = 1000
+
+# RDS IAM auth tokens are valid for 15 minutes, and are replaced 1 minute before they expire
+IAM_AUTH_TOKEN_LIFETIME_SECONDS = 15 * 60
+IAM_AUTH_TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+# Statements that can run on a server-side cursor (DECLARE ... CURSOR FOR <query>)
+_CURSOR_QUERY_PATTERN = re.compile(r'^[\s(]*(select|values|table|with)\b', re.IGNORECASE)
+
+# Keywords of queries that cannot be declared as cursors: SELECT ... INTO and data-modifying
+# WITH queries. Queries that merely mention them (e.g. in a string) use a client-side cursor.
+_NON_CURSOR_QUERY_PATTERN = re.compile(r'\b(into|insert|update|delete|merge)\b', re.IGNORECASE)
+
+
+def _is_cursor_query(sql: str) -> bool:
+    """Check whether a statement can run on a server-side cursor."""
+    return bool(_CURSOR_QUERY_PATTERN.match(sql)) and not _NON_CURSOR_QUERY_PATTERN.search(sql)
+
+
+def _to_native(value: Any) -> Any:
+    """Convert a value returned by psycopg to a JSON-friendly value.
+
+    Scalars are returned as they are, other types (e.g. dates and decimals) are converted
+    to strings, like execute_query does.
+    """
+    if value is None or isinstance(value, (str, bool, int, float, bytes)):
+        return value
+    return str(value)
+
+
+class CachedCredentials:
+    """Database user and password (or IAM auth token) cached for a limited time."""
+
+    def __init__(self, fetch: Callable[[], Tuple[str, str]], ttl_seconds: float):
+        """Initialize the cache.
+
+        Args:
+            fetch: Function returning the current user and password
+            ttl_seconds: Number of seconds the fetched credentials are used
+        """
+        self.ttl_seconds = ttl_seconds
+        self._fetch = fetch
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Tuple[str, str]:
+        """Get the cached credentials, fetching them again when they are expired."""
+        with self._lock:
+            if self._credentials is None or time.monotonic() >= self._expires_at:
+                self._credentials = self._fetch()
+                self._expires_at = time.monotonic() + self.ttl_seconds
+            return self._credentials
+
+    def invalidate(self) -> None:
+        """Fetch the credentials again on their next use."""
+        with self._lock:
+            self._credentials = None
 
 
 class PsycopgPoolConnection(AbstractDBConnection):
@@ -39,7 +105,11 @@ class PsycopgPoolConnection(AbstractDBConnection):
     - RDS PostgreSQL (using the instance endpoint)
     - Self-hosted PostgreSQL
 
-    It uses AWS Secrets Manager (secret_arn and region) for authentication.
+    It uses AWS Secrets Manager (secret_arn and region) or IAM authentication. Every new
+    physical connection authenticates with the current credentials: IAM auth tokens are
+    cached until shortly before they expire, and secrets are read again after
+    pool_expiry_min. Pooled connections are retired one by one when they reach their
+    maximum lifetime of pool_expiry_min, so the pool is never rebuilt as a whole.
     """
 
     def __init__(
@@ -68,7 +138,7 @@ class PsycopgPoolConnection(AbstractDBConnection):
             db_user: Database username
             region: AWS region for Secrets Manager
             is_iam_auth: Whether to use IAM authentication
-            pool_expiry_min: Pool expiry time in minutes
+            pool_expiry_min: Maximum lifetime of pooled connections in minutes
             min_size: Minimum number of connections in the pool
             max_size: Maximum number of connections in the pool
             is_test: Whether this is a test connection
@@ -94,9 +164,17 @@ class PsycopgPoolConnection(AbstractDBConnection):
             if not db_user:
                 raise ValueError('db_user must be set when is_iam_auth is True')
 
-            # set pool expiry before IAM auth token expiry of 15 minutes
+            # retire connections at the rate IAM auth tokens are replaced
             self.pool_expiry_min = 14
             logger.info(f'Use IAM auth for user: {db_user}')
+            self._credentials = CachedCredentials(
+                self._fetch_iam_credentials,
+                IAM_AUTH_TOKEN_LIFETIME_SECONDS - IAM_AUTH_TOKEN_REFRESH_MARGIN_SECONDS,
+            )
+        else:
+            self._credentials = CachedCredentials(
+                self._fetch_secret_credentials, self.pool_expiry_min * 60
+            )
 
     async def initialize_pool(self):
         """Initialize the connection pool."""
@@ -118,19 +196,20 @@ class PsycopgPoolConnection(AbstractDBConnection):
                 f'is_iam_auth:{self.is_iam_auth}\n'
             )
 
-            if self.is_iam_auth:
-                logger.info(f'Retrieving IAM auth token for {self.user}')
-                password = self.get_iam_auth_token()
-            else:
-                logger.info(f'Retrieving credentials from Secrets Manager: {self.secret_arn}')
-                self.user, password = self._get_credentials_from_secret(
-                    self.secret_arn, self.region, self.is_test
-                )
+            # Fetch the credentials up front, so that invalid credentials fail here
+            self.user, _ = await asyncio.to_thread(self._credentials.get)
 
             self.created_time = datetime.now()
-            self.conninfo = f'host={self.host} port={self.port} dbname={self.database} user={self.user} password={password}'
+            self.conninfo = (
+                f'host={self.host} port={self.port} dbname={self.database} user={self.user}'
+            )
             self.pool = AsyncConnectionPool(
-                self.conninfo, min_size=self.min_size, max_size=self.max_size, open=False
+                self.conninfo,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                open=False,
+                max_lifetime=self.pool_expiry_min * 60,
+                connection_class=self._create_connection_class(),
             )
 
             # wait up to 30 seconds to fill the pool with connections
@@ -147,16 +226,46 @@ class PsycopgPoolConnection(AbstractDBConnection):
             return self.pool.connection(timeout=15.0)
 
     async def check_expiry(self):
-        """Check and handle pool expiry."""
+        """Initialize the pool if it is not initialized.
+
+        The pool itself does not expire: its connections are replaced in the background
+        when they reach their maximum lifetime, without stalling queries.
+        """
         async with self.rw_lock.reader_lock:
-            if self.pool and datetime.now() - self.created_time < timedelta(
-                minutes=self.pool_expiry_min
-            ):
+            if self.pool is not None:
                 return
 
-        await self.close()
         await self.initialize_pool()
 
+    def _create_connection_class(self) -> type:
+        """Create the class of pooled connections, authenticating with current credentials."""
+        credentials = self._credentials
+
+        class CredentialsAwareConnection(AsyncConnection):
+            @classmethod
+            async def connect(cls, conninfo: str = '', **kwargs: Any):
+                user, password = await asyncio.to_thread(credentials.get)
+                try:
+                    return await super().connect(
+                        conninfo, **{**kwargs, 'user': user, 'password': password}
+                    )
+                except OperationalError:
+                    # Credentials may have been rotated, fetch them again on the next attempt
+                    credentials.invalidate()
+                    raise
+
+        return CredentialsAwareConnection
+
+    def _fetch_iam_credentials(self) -> Tuple[str, str]:
+        """Generate an IAM auth token for the database user."""
+        logger.info(f'Retrieving IAM auth token for {self.user}')
+        return self.user, self.get_iam_auth_token()
+
+    def _fetch_secret_credentials(self) -> Tuple[str, str]:
+        """Get the database user and password from Secrets Manager."""
+        logger.info(f'Retrieving credentials from Secrets Manager: {self.secret_arn}')
+        return self._get_credentials_from_secret(self.secret_arn, self.region, self.is_test)
+
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
@@ -219,6 +328,87 @@ class PsycopgPoolConnection(AbstractDBConnection):
             logger.error(f'Database connection error: {str(e)}')
             raise e
 
+    async def execute_query_columnar(
+        self,
+        sql: str,
+        parameters: Optional[List[Dict[str, Any]]] = None,
+        max_rows: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Execute a SQL query and return the result column by column.
+
+        Unlike execute_query, the values are not wrapped in RDS Data API-style cells. Queries
+        run on a server-side cursor and rows are fetched in batches, so at most max_rows + 1
+        rows are transferred from the database.
+
+        Args:
+            sql: The SQL query to execute
+            parameters: Optional parameters for the query
+            max_rows: Maximum number of rows to return (None for all rows)
+
+        Returns:
+            Dict with the column names ('columns'), the values of each column ('values'),
+            the number of returned rows ('row_count') and whether rows were left out
+            because of max_rows ('truncated')
+        """
+        try:
+            async with await self._get_connection() as conn:
+                async with conn.transaction():
+                    if self.readonly_query:
+                        logger.info('SET TRANSACTION READ ONLY')
+                        await conn.execute('SET TRANSACTION READ ONLY')
+
+                    # Other statements (e.g. INSERT ... RETURNING) cannot be declared as cursors
+                    if _is_cursor_query(sql):
+                        cursor = conn.cursor(name='mcp_query_cursor')
+                    else:
+                        cursor = conn.cursor()
+
+                    async with cursor:
+                        if parameters:
+                            params = self._convert_parameters(parameters)
+                            await cursor.execute(sql, params)
+                        else:
+                            await cursor.execute(sql)
+
+                        if not cursor.description:
+                            # No results (e.g., for INSERT, UPDATE, etc.)
+                            return {
+                                'columns': [],
+                                'values': [],
+                                'row_count': 0,
+                                'truncated': False,
+                            }
+
+                        columns = [desc[0] for desc in cursor.description]
+                        values: List[List[Any]] = [[] for _ in columns]
+                        row_count = 0
+                        truncated = False
+                        while True:
+                            size = FETCH_BATCH_SIZE
+                            if max_rows is not None:
+                                # Fetch one more row than needed to detect truncation
+                                size = min(size, max_rows - row_count + 1)
+                            rows = await cursor.fetchmany(size)
+                            if max_rows is not None and row_count + len(rows) > max_rows:
+                                rows = rows[: max_rows - row_count]
+                                truncated = True
+                            for column_values, column in zip(values, zip(*rows)):
+                                column_values.extend(map(_to_native, column))
+                            row_count += len(rows)
+                            if truncated or len(rows) < size:
+                                break
+
+                        return {
+                            'columns': columns,
+                            'values': values,
+                            'row_count': row_count,
+                            'truncated': truncated,
+                        }
+
+        except Exception as e:
+            logger.error(f'Database connection error: {str(e)}')
+            raise e
+
     def _convert_parameters(self, parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Transform structured parameter format to psycopg's native parameter format."""
         result = {}
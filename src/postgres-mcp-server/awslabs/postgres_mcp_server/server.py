@@ -55,6 +55,7 @@ write_query_prohibited_key = 'Your MCP tool only allows readonly query. If you w
 query_comment_prohibited_key = 'The comment in query is prohibited because of injection risk'
 query_injection_risk_key = 'Your query contains risky injection patterns'
 readonly_query = True
+default_max_rows = 1000
 
 
 class DummyCtx:
@@ -99,6 +100,33 @@ def parse_execute_response(response: dict) -> list[dict]:
     return records
 
 
+def parse_execute_response_columnar(response: dict, max_rows: Optional[int] = None) -> dict:
+    """Convert RDS Data API execute_statement response to column-oriented result."""
+    columns = [col['name'] for col in response.get('columnMetadata', [])]
+    records = response.get('records', [])
+    truncated = max_rows is not None and len(records) > max_rows
+    if truncated:
+        records = records[:max_rows]
+
+    values: List[List[Any]] = [[] for _ in columns]
+    for row in records:
+        for column_values, cell in zip(values, row):
+            column_values.append(extract_cell(cell))
+
+    return {
+        'columns': columns,
+        'values': values,
+        'row_count': len(records),
+        'truncated': truncated,
+    }
+
+
+def columnar_to_rows(result: dict) -> list[dict]:
+    """Convert column-oriented result to list of rows."""
+    columns = result['columns']
+    return [dict(zip(columns, row)) for row in zip(*result['values'])]
+
+
 mcp = FastMCP(
     'pg-mcp MCP server. This is the starting point for all solutions created',
     dependencies=[
@@ -107,44 +135,22 @@ mcp = FastMCP(
 )
 
 
-@mcp.tool(name='run_query', description='Run a SQL query against PostgreSQL')
-async def run_query(
-    sql: Annotated[str, Field(description='The SQL query to run')],
+async def _get_checked_connection(
+    sql: str,
     ctx: Context,
-    connection_method: Annotated[ConnectionMethod, Field(description='connection method')],
-    cluster_identifier: Annotated[str, Field(description='Cluster identifier')],
-    db_endpoint: Annotated[str, Field(description='database endpoint')],
-    database: Annotated[str, Field(description='database name')],
-    query_parameters: Annotated[
-        Optional[List[Dict[str, Any]]], Field(description='Parameters for the SQL query')
-    ] = None,
-) -> list[dict]:  # type: ignore
-    """Run a SQL query against PostgreSQL.
-
-    Args:
-        sql: The sql statement to run
-        ctx: MCP context for logging and state management
-        connection_method: connection method
-        cluster_identifier: Cluster identifier
-        db_endpoint: database endpoint
-        database: database name
-        query_parameters: Parameters for the SQL query
+    connection_method: ConnectionMethod,
+    cluster_identifier: str,
+    db_endpoint: str,
+    database: str,
+) -> Tuple[Any, Optional[str]]:
+    """Get the connection a query runs on, after checking that the query is allowed.
 
     Returns:
-        List of dictionary that contains query response rows
+        Tuple of the database connection and an error message if the query cannot run
     """
-    global client_error_code_key
-    global unexpected_error_key
     global write_query_prohibited_key
     global db_connection_map
 
-    logger.info(
-        f'Entered run_query with '
-        f'method:{connection_method}, cluster_identifier:{cluster_identifier}, '
-        f'db_endpoint:{db_endpoint}, database:{database}, '
-        f'sql:{sql}'
-    )
-
     db_connection = db_connection_map.get(
         method=connection_method,
         cluster_identifier=cluster_identifier,
@@ -158,7 +164,7 @@ async def run_query(
         )
         logger.error(err)
         await ctx.error(err)
-        return [{'error': err}]
+        return None, err
 
     if db_connection.readonly_query:
         matches = detect_mutating_keywords(sql)
@@ -170,7 +176,7 @@ async def run_query(
                 )
             )
             await ctx.error(write_query_prohibited_key)
-            return [{'error': write_query_prohibited_key}]
+            return None, write_query_prohibited_key
 
     issues = check_sql_injection_risk(sql)
     if issues:
@@ -180,7 +186,52 @@ async def run_query(
         await ctx.error(
             str({'message': 'Query parameter contains suspicious pattern', 'details': issues})
         )
-        return [{'error': query_injection_risk_key}]
+        return None, query_injection_risk_key
+
+    return db_connection, None
+
+
+@mcp.tool(name='run_query', description='Run a SQL query against PostgreSQL')
+async def run_query(
+    sql: Annotated[str, Field(description='The SQL query to run')],
+    ctx: Context,
+    connection_method: Annotated[ConnectionMethod, Field(description='connection method')],
+    cluster_identifier: Annotated[str, Field(description='Cluster identifier')],
+    db_endpoint: Annotated[str, Field(description='database endpoint')],
+    database: Annotated[str, Field(description='database name')],
+    query_parameters: Annotated[
+        Optional[List[Dict[str, Any]]], Field(description='Parameters for the SQL query')
+    ] = None,
+) -> list[dict]:  # type: ignore
+    """Run a SQL query against PostgreSQL.
+
+    Args:
+        sql: The sql statement to run
+        ctx: MCP context for logging and state management
+        connection_method: connection method
+        cluster_identifier: Cluster identifier
+        db_endpoint: database endpoint
+        database: database name
+        query_parameters: Parameters for the SQL query
+
+    Returns:
+        List of dictionary that contains query response rows
+    """
+    global client_error_code_key
+    global unexpected_error_key
+
+    logger.info(
+        f'Entered run_query with '
+        f'method:{connection_method}, cluster_identifier:{cluster_identifier}, '
+        f'db_endpoint:{db_endpoint}, database:{database}, '
+        f'sql:{sql}'
+    )
+
+    db_connection, error = await _get_checked_connection(
+        sql, ctx, connection_method, cluster_identifier, db_endpoint, database
+    )
+    if error:
+        return [{'error': error}]
 
     try:
         logger.info(
@@ -192,6 +243,12 @@ async def run_query(
             )
         )
 
+        if isinstance(db_connection, PsycopgPoolConnection):
+            # Skip the RDS Data API-style cells when connected with psycopg
+            result = await db_connection.execute_query_columnar(sql, query_parameters)
+            logger.success(f'run_query successfully executed query:{sql}')
+            return columnar_to_rows(result)
+
         response = await db_connection.execute_query(sql, query_parameters)
 
         logger.success(f'run_query successfully executed query:{sql}')
@@ -209,6 +266,83 @@ async def run_query(
         return [{'error': unexpected_error_key}]
 
 
+@mcp.tool(
+    name='run_query_columnar',
+    description='Run a SQL query against PostgreSQL and return the result column by column',
+)
+async def run_query_columnar(
+    sql: Annotated[str, Field(description='The SQL query to run')],
+    ctx: Context,
+    connection_method: Annotated[ConnectionMethod, Field(description='connection method')],
+    cluster_identifier: Annotated[str, Field(description='Cluster identifier')],
+    db_endpoint: Annotated[str, Field(description='database endpoint')],
+    database: Annotated[str, Field(description='database name')],
+    query_parameters: Annotated[
+        Optional[List[Dict[str, Any]]], Field(description='Parameters for the SQL query')
+    ] = None,
+    max_rows: Annotated[
+        int, Field(description='Maximum number of rows to return', ge=0)
+    ] = default_max_rows,
+) -> dict:
+    """Run a SQL query against PostgreSQL and return the result column by column.
+
+    With a pgwire connection, the query runs on a server-side cursor and only the returned
+    rows are fetched from the database.
+
+    Args:
+        sql: The sql statement to run
+        ctx: MCP context for logging and state management
+        connection_method: connection method
+        cluster_identifier: Cluster identifier
+        db_endpoint: database endpoint
+        database: database name
+        query_parameters: Parameters for the SQL query
+        max_rows: Maximum number of rows to return
+
+    Returns:
+        Dictionary with the column names, the values of each column, the number of
+        returned rows and whether rows beyond max_rows were left out
+    """
+    logger.info(
+        f'Entered run_query_columnar with '
+        f'method:{connection_method}, cluster_identifier:{cluster_identifier}, '
+        f'db_endpoint:{db_endpoint}, database:{database}, '
+        f'max_rows:{max_rows}, sql:{sql}'
+    )
+
+    db_connection, error = await _get_checked_connection(
+        sql, ctx, connection_method, cluster_identifier, db_endpoint, database
+    )
+    if error:
+        return {'error': error}
+
+    try:
+        if isinstance(db_connection, PsycopgPoolConnection):
+            result = await db_connection.execute_query_columnar(
+                sql, query_parameters, max_rows=max_rows
+            )
+        else:
+            response = await db_connection.execute_query(sql, query_parameters)
+            result = parse_execute_response_columnar(response, max_rows)
+
+        logger.success(
+            f'run_query_columnar successfully executed query:{sql}, '
+            f'rows:{result["row_count"]}, truncated:{result["truncated"]}'
+        )
+        return result
+    except ClientError as e:
+        logger.exception(client_error_code_key)
+        await ctx.error(
+            str({'code': e.response['Error']['Code'], 'message': e.response['Error']['Message']})
+        )
+        return {'error': client_error_code_key}
+    except Exception as e:
+        logger.exception(unexpected_error_key)
+        error_details = f'{type(e).__name__}: {str(e)}'
+        await ctx.error(str({'message': error_details}))
+        return {'error': unexpected_error_key}
+
+
 @mcp.tool(name='get_table_schema', description='Fetch table columns and comments from Postgres')
 async def get_table_schema(
     connection_method: Annotated[ConnectionMethod, Field(description='connection method')],
@@ -17,11 +17,213 @@ import concurrent.futures
 import pytest
 import threading
 import time
-from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
-from datetime import datetime, timedelta
+from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import (
+    CachedCredentials,
+    PsycopgPoolConnection,
+)
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from psycopg import AsyncConnection, OperationalError
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+class FakeCursor:
+    """Cursor returning rows in the batches requested with fetchmany."""
+
+    def __init__(self, name, columns, rows):
+        """Initialize the cursor."""
+        self.name = name
+        self.description = [(column,) for column in columns] if columns else None
+        self.rows = rows
+        self.fetch_sizes = []
+        self.execute = AsyncMock()
+
+    async def __aenter__(self):
+        """Enter the cursor context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Exit the cursor context."""
+        return False
+
+    async def fetchmany(self, size):
+        """Fetch the next rows."""
+        self.fetch_sizes.append(size)
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+
+class FakeConnection:
+    """Connection handing out a FakeCursor."""
+
+    def __init__(self, columns, rows):
+        """Initialize the connection."""
+        self.columns = columns
+        self.rows = rows
+        self.cursors = []
+        self.execute = AsyncMock()
+
+    async def __aenter__(self):
+        """Enter the connection context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Exit the connection context."""
+        return False
+
+    def transaction(self):
+        """Start a transaction."""
+        return self
+
+    def cursor(self, name=None):
+        """Create a cursor."""
+        cursor = FakeCursor(name, self.columns, self.rows)
+        self.cursors.append(cursor)
+        return cursor
+
+
+def _columnar_connection(fake_conn, readonly=True):
+    """Create a connection that uses a FakeConnection."""
+    conn = PsycopgPoolConnection(
+        host='localhost',
+        port=5432,
+        database='test_db',
+        readonly=readonly,
+        secret_arn='test_secret_arn',  # pragma: allowlist secret
+        db_user='test_user',
+        region='us-east-1',
+        is_test=True,
+    )
+    conn._get_connection = AsyncMock(return_value=fake_conn)
+    return conn
+
+
+class TestPsycopgColumnar:
+    """Tests for PsycopgPoolConnection.execute_query_columnar."""
+
+    @pytest.mark.asyncio
+    async def test_rows_returned_by_column(self):
+        """Test that values are returned natively, column by column."""
+        fake_conn = FakeConnection(
+            ['id', 'name', 'created', 'price', 'note'],
+            [
+                (1, 'a', date(2024, 1, 1), Decimal('1.50'), None),
+                (2, 'b', date(2024, 1, 2), Decimal('2.00'), True),
+            ],
+        )
+        conn = _columnar_connection(fake_conn)
+
+        result = await conn.execute_query_columnar(
+            'SELECT * FROM t WHERE id > %(id)s',
+            [{'name': 'id', 'value': {'longValue': 0}}],
+        )
+
+        assert result == {
+            'columns': ['id', 'name', 'created', 'price', 'note'],
+            'values': [
+                [1, 2],
+                ['a', 'b'],
+                ['2024-01-01', '2024-01-02'],
+                ['1.50', '2.00'],
+                [None, True],
+            ],
+            'row_count': 2,
+            'truncated': False,
+        }
+        cursor = fake_conn.cursors[0]
+        assert cursor.name == 'mcp_query_cursor'
+        cursor.execute.assert_called_once_with('SELECT * FROM t WHERE id > %(id)s', {'id': 0})
+        fake_conn.execute.assert_called_once_with('SET TRANSACTION READ ONLY')
+
+    @pytest.mark.asyncio
+    async def test_rows_fetched_in_batches(self):
+        """Test that rows are fetched in batches until the cursor is exhausted."""
+        fake_conn = FakeConnection(['n'], [(i,) for i in range(2500)])
+        conn = _columnar_connection(fake_conn)
+
+        result = await conn.execute_query_columnar('SELECT n FROM t')
+
+        assert result['row_count'] == 2500
+        assert result['values'] == [list(range(2500))]
+        assert not result['truncated']
+        assert fake_conn.cursors[0].fetch_sizes == [1000, 1000, 1000]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'row_total,max_rows,truncated,fetch_sizes',
+        [
+            (10, 5, True, [6]),
+            (5, 5, False, [6]),
+            (1500, 1200, True, [1000, 201]),
+            (3, 0, True, [1]),
+        ],
+    )
+    async def test_max_rows(self, row_total, max_rows, truncated, fetch_sizes):
+        """Test that at most max_rows + 1 rows are fetched and truncation is reported."""
+        fake_conn = FakeConnection(['n'], [(i,) for i in range(row_total)])
+        conn = _columnar_connection(fake_conn)
+
+        result = await conn.execute_query_columnar('SELECT n FROM t', max_rows=max_rows)
+
+        assert result['row_count'] == min(row_total, max_rows)
+        assert result['values'] == [list(range(min(row_total, max_rows)))]
+        assert result['truncated'] is truncated
+        assert fake_conn.cursors[0].fetch_sizes == fetch_sizes
+
+    @pytest.mark.asyncio
+    async def test_statement_without_results(self):
+        """Test that statements other than queries run on a client-side cursor."""
+        fake_conn = FakeConnection(None, [])
+        conn = _columnar_connection(fake_conn, readonly=False)
+
+        result = await conn.execute_query_columnar("UPDATE t SET name = 'x'")
+
+        assert result == {'columns': [], 'values': [], 'row_count': 0, 'truncated': False}
+        assert fake_conn.cursors[0].name is None
+        fake_conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'sql',
+        [
+            'WITH recent AS (SELECT n FROM t WHERE n > 1) SELECT n FROM recent',
+            'with recursive r(n) AS (VALUES (1) UNION ALL SELECT n + 1 FROM r) SELECT n FROM r',
+            '(SELECT n FROM t) UNION (SELECT n FROM u)',
+            'TABLE t',
+        ],
+    )
+    async def test_read_only_queries_use_server_side_cursor(self, sql):
+        """Test that read-only queries, including WITH queries, are declared as cursors."""
+        fake_conn = FakeConnection(['n'], [(1,)])
+        conn = _columnar_connection(fake_conn)
+
+        result = await conn.execute_query_columnar(sql)
+
+        assert result['values'] == [[1]]
+        assert fake_conn.cursors[0].name == 'mcp_query_cursor'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'sql',
+        [
+            'SELECT n INTO new_t FROM t',
+            'WITH moved AS (DELETE FROM t RETURNING n) SELECT n FROM moved',
+            'WITH added AS (INSERT INTO t VALUES (1) RETURNING n) SELECT n FROM added',
+            "WITH changed AS (UPDATE t SET name = 'x' RETURNING n) SELECT n FROM changed",
+        ],
+    )
+    async def test_non_declarable_queries_use_client_side_cursor(self, sql):
+        """Test that SELECT ... INTO and data-modifying WITH queries are not declared."""
+        fake_conn = FakeConnection(['n'], [(1,)])
+        conn = _columnar_connection(fake_conn, readonly=False)
+
+        result = await conn.execute_query_columnar(sql)
+
+        assert result['values'] == [[1]]
+        assert fake_conn.cursors[0].name is None
+        fake_conn.cursors[0].execute.assert_called_once_with(sql)
+
+
 class TestPsycopgConnector:
     """Tests for the PsycopgPoolConnection class."""
 
@@ -930,7 +1132,10 @@ class TestPsycopgConnector:
 
             mock_get_token.assert_called_once()
             mock_pool_class.assert_called_once()
-            assert 'password=iam_token_123' in conn.conninfo
+            assert 'password' not in conn.conninfo
+            pool_kwargs = mock_pool_class.call_args.kwargs
+            assert pool_kwargs['max_lifetime'] == 14 * 60
+            assert issubclass(pool_kwargs['connection_class'], AsyncConnection)
 
     @pytest.mark.asyncio
     async def test_initialize_pool_already_initialized(self):
@@ -986,8 +1191,8 @@ class TestPsycopgConnector:
             mock_pool.close.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_check_expiry_expired(self):
-        """Test check_expiry when pool is expired."""
+    async def test_check_expiry_keeps_pool_after_expiry(self):
+        """Test that check_expiry does not rebuild the pool when it is older than the expiry."""
         with (
             patch('psycopg_pool.AsyncConnectionPool') as mock_pool_class,
             patch.object(PsycopgPoolConnection, 'initialize_pool') as mock_init,
@@ -1014,6 +1219,89 @@ class TestPsycopgConnector:
 
             await conn.check_expiry()
 
-            # Should close and reinitialize
-            mock_pool.close.assert_called_once()
-            mock_init.assert_called_once()
+            # Connections are retired by the pool, the pool is kept
+            mock_pool.close.assert_not_called()
+            mock_init.assert_not_called()
+
+
+class TestCredentialsAwareConnections:
+    """Tests for authenticating new pooled connections with current credentials."""
+
+    def test_cached_credentials(self):
+        """Test that credentials are fetched again after their TTL or invalidation."""
+        fetch = MagicMock(side_effect=[('user', 'token1'), ('user', 'token2'), ('user', 'token3')])
+        credentials = CachedCredentials(fetch, ttl_seconds=60)
+
+        assert credentials.get() == ('user', 'token1')
+        assert credentials.get() == ('user', 'token1')
+        credentials._expires_at = time.monotonic() - 1
+        assert credentials.get() == ('user', 'token2')
+        credentials.invalidate()
+        assert credentials.get() == ('user', 'token3')
+        assert fetch.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_connections_use_cached_iam_token(self):
+        """Test that new connections authenticate with the cached IAM auth token."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=False,
+            secret_arn='',
+            db_user='iam_user',
+            is_iam_auth=True,
+            region='us-east-1',
+            is_test=True,
+        )
+        connection_class = conn._create_connection_class()
+
+        with (
+            patch.object(conn, 'get_iam_auth_token', side_effect=['token1', 'token2']),
+            patch.object(AsyncConnection, 'connect', new_callable=AsyncMock) as mock_connect,
+        ):
+            await connection_class.connect('host=localhost', connect_timeout=5)
+            await connection_class.connect('host=localhost')
+            assert conn._credentials.ttl_seconds == 14 * 60
+            conn._credentials._expires_at = time.monotonic() - 1
+            await connection_class.connect('host=localhost')
+
+        passwords = [call.kwargs['password'] for call in mock_connect.call_args_list]
+        assert passwords == ['token1', 'token1', 'token2']
+        assert mock_connect.call_args_list[0].kwargs['user'] == 'iam_user'
+        assert mock_connect.call_args_list[0].kwargs['connect_timeout'] == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_connection_invalidates_credentials(self):
+        """Test that a failed connection fetches the secret again on the next attempt."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=False,
+            secret_arn='arn:secret',
+            db_user='',
+            region='us-east-1',
+            is_test=True,
+        )
+        connection_class = conn._create_connection_class()
+
+        with (
+            patch.object(
+                conn,
+                '_get_credentials_from_secret',
+                side_effect=[('user', 'old'), ('user', 'rotated')],
+            ) as mock_get_creds,
+            patch.object(
+                AsyncConnection,
+                'connect',
+                new_callable=AsyncMock,
+                side_effect=[OperationalError('password authentication failed'), MagicMock()],
+            ) as mock_connect,
+        ):
+            with pytest.raises(OperationalError):
+                await connection_class.connect('host=localhost')
+            await connection_class.connect('host=localhost')
+
+        assert mock_get_creds.call_count == 2
+        assert mock_connect.call_args.kwargs['password'] == 'rotated'
@@ -36,7 +36,9 @@ from awslabs.postgres_mcp_server.server import (
     get_table_schema,
     is_database_connected,
     main,
+    parse_execute_response_columnar,
     run_query,
+    run_query_columnar,
     unexpected_error_key,
     write_query_prohibited_key,
 )
@@ -1177,3 +1179,120 @@ if __name__ == '__main__':
     asyncio.run(test_run_query_throw_client_error())
     asyncio.run(test_run_query_write_queries_on_readonly_setting())
     asyncio.run(test_run_query_write_queries_on_readonly_setting())
+
+
+def test_parse_execute_response_columnar():
+    """Test converting an RDS Data API response to a column-oriented result."""
+    response = {
+        'columnMetadata': [{'name': 'id'}, {'name': 'name'}],
+        'records': [
+            [{'longValue': 1}, {'stringValue': 'a'}],
+            [{'longValue': 2}, {'isNull': True}],
+            [{'longValue': 3}, {'stringValue': 'c'}],
+        ],
+    }
+
+    assert parse_execute_response_columnar(response) == {
+        'columns': ['id', 'name'],
+        'values': [[1, 2, 3], ['a', None, 'c']],
+        'row_count': 3,
+        'truncated': False,
+    }
+    assert parse_execute_response_columnar(response, max_rows=2) == {
+        'columns': ['id', 'name'],
+        'values': [[1, 2], ['a', None]],
+        'row_count': 2,
+        'truncated': True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_query_columnar_rds_api():
+    """Test that run_query_columnar converts RDS Data API responses."""
+    mock_db_connection = Mock_DBConnection(readonly=True)
+    mock_db_connection.data_client.add_mock_response({})
+    mock_db_connection.data_client.add_mock_response(get_mock_normal_query_response())
+    setup_mock_connection(mock_db_connection)
+
+    result = await run_query_columnar(
+        'SELECT * FROM example_table',
+        DummyCtx(),
+        ConnectionMethod.RDS_API,
+        'test-cluster',
+        'test-endpoint',
+        'test-db',
+        max_rows=10,
+    )
+
+    assert result['row_count'] == 1
+    assert not result['truncated']
+    assert len(result['columns']) == len(result['values'])
+
+
+@pytest.mark.asyncio
+async def test_run_query_psycopg_skips_data_api_cells():
+    """Test that queries on psycopg connections use the column-oriented result."""
+    conn = PsycopgPoolConnection(
+        host='localhost',
+        port=5432,
+        database='test-db',
+        readonly=True,
+        secret_arn='test_secret_arn',  # pragma: allowlist secret
+        db_user='test_user',
+        region='us-east-1',
+        is_test=True,
+    )
+    columnar = {
+        'columns': ['id', 'name'],
+        'values': [[1, 2], ['a', 'b']],
+        'row_count': 2,
+        'truncated': True,
+    }
+    setup_mock_connection(conn, ConnectionMethod.PG_WIRE_PROTOCOL)
+
+    with (
+        patch.object(conn, 'execute_query', new_callable=AsyncMock) as mock_execute,
+        patch.object(
+            conn, 'execute_query_columnar', new_callable=AsyncMock, return_value=columnar
+        ) as mock_columnar,
+    ):
+        rows = await run_query(
+            'SELECT id, name FROM t',
+            DummyCtx(),
+            ConnectionMethod.PG_WIRE_PROTOCOL,
+            'test-cluster',
+            'test-endpoint',
+            'test-db',
+        )
+        result = await run_query_columnar(
+            'SELECT id, name FROM t',
+            DummyCtx(),
+            ConnectionMethod.PG_WIRE_PROTOCOL,
+            'test-cluster',
+            'test-endpoint',
+            'test-db',
+            max_rows=2,
+        )
+
+    assert rows == [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]
+    assert result == columnar
+    mock_execute.assert_not_called()
+    assert mock_columnar.call_args_list[0].args == ('SELECT id, name FROM t', None)
+    assert mock_columnar.call_args_list[1].kwargs == {'max_rows': 2}
+
+
+@pytest.mark.asyncio
+async def test_run_query_columnar_rejects_write_on_readonly():
+    """Test that run_query_columnar applies the readonly check of run_query."""
+    setup_mock_connection(Mock_DBConnection(readonly=True))
+
+    result = await run_query_columnar(
+        'DROP TABLE t',
+        DummyCtx(),
+        ConnectionMethod.RDS_API,
+        'test-cluster',
+        'test-endpoint',
+        'test-db',
+    )
+
+    assert result == {'error': write_query_prohibited_key}
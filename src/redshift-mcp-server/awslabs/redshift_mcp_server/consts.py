@@ -22,7 +22,11 @@ CLIENT_USER_AGENT_NAME = 'awslabs/mcp/redshift-mcp-server'
 DEFAULT_LOG_LEVEL = 'WARNING'
 QUERY_TIMEOUT = 3600
 QUERY_POLL_INTERVAL = 1
+QUERY_POLL_INITIAL_INTERVAL = 0.1
+QUERY_POLL_BACKOFF_FACTOR = 1.5
+QUERY_MAX_ROWS = 10000
 SESSION_KEEPALIVE = 600
+CATALOG_CACHE_TTL = 300
 
 # Best practices
 
@@ -64,62 +68,100 @@ REDSHIFT_BEST_PRACTICES = """
 
 # SQL queries
 
-SVV_REDSHIFT_DATABASES_QUERY = """
+# Catalog of a database, with one row per database, schema, table and column, loaded in one query
+# for the catalog cache. The object_type column tells which of the following columns are set.
+SVV_CATALOG_QUERY = """
 SELECT
+    'database'::VARCHAR(8) AS object_type,
     database_name,
-    database_owner,
-    database_type,
-    database_acl,
-    database_options,
-    database_isolation_level
+    NULL::VARCHAR(MAX) AS schema_name,
+    NULL::VARCHAR(MAX) AS table_name,
+    NULL::VARCHAR(MAX) AS column_name,
+    database_owner::BIGINT AS owner,
+    database_type AS type,
+    database_acl AS acl,
+    database_options AS options,
+    NULL::VARCHAR(MAX) AS source_database,
+    database_isolation_level AS isolation_level,
+    NULL::VARCHAR(MAX) AS remarks,
+    NULL::BIGINT AS ordinal_position,
+    NULL::VARCHAR(MAX) AS column_default,
+    NULL::VARCHAR(MAX) AS is_nullable,
+    NULL::VARCHAR(MAX) AS data_type,
+    NULL::BIGINT AS character_maximum_length,
+    NULL::BIGINT AS numeric_precision,
+    NULL::BIGINT AS numeric_scale
 FROM pg_catalog.svv_redshift_databases
-ORDER BY database_name;
-"""
-
-SVV_ALL_SCHEMAS_QUERY = """
+UNION ALL
 SELECT
+    'schema',
     database_name,
     schema_name,
+    NULL,
+    NULL,
     schema_owner,
     schema_type,
     schema_acl,
+    schema_option,
     source_database,
-    schema_option
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL
 FROM pg_catalog.svv_all_schemas
 WHERE database_name = :database_name
-ORDER BY schema_name;
-"""
-
-SVV_ALL_TABLES_QUERY = """
+UNION ALL
 SELECT
+    'table',
     database_name,
     schema_name,
     table_name,
-    table_acl,
+    NULL,
+    NULL,
     table_type,
-    remarks
+    table_acl,
+    NULL,
+    NULL,
+    NULL,
+    remarks,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL
 FROM pg_catalog.svv_all_tables
-WHERE database_name = :database_name AND schema_name = :schema_name
-ORDER BY table_name;
-"""
-
-SVV_ALL_COLUMNS_QUERY = """
+WHERE database_name = :database_name
+UNION ALL
 SELECT
+    'column',
     database_name,
     schema_name,
     table_name,
     column_name,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    remarks,
     ordinal_position,
     column_default,
     is_nullable,
     data_type,
     character_maximum_length,
     numeric_precision,
-    numeric_scale,
-    remarks
+    numeric_scale
 FROM pg_catalog.svv_all_columns
-WHERE database_name = :database_name AND schema_name = :schema_name AND table_name = :table_name
-ORDER BY ordinal_position;
+WHERE database_name = :database_name
+ORDER BY object_type, database_name, schema_name, table_name, ordinal_position;
 """
 
 # SQL guardrails
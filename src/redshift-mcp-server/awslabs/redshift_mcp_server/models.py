@@ -139,3 +139,6 @@ class QueryResult(BaseModel):
         None, description='Query execution time in milliseconds'
     )
     query_id: str = Field(..., description='Unique identifier for the query execution')
+    truncated: bool = Field(
+        False, description='Whether rows were left out because the row limit was reached'
+    )
@@ -16,23 +16,26 @@
 
 import asyncio
 import boto3
+import csv
+import io
 import os
 import regex
 import time
 from awslabs.redshift_mcp_server import __version__
 from awslabs.redshift_mcp_server.consts import (
+    CATALOG_CACHE_TTL,
     CLIENT_CONNECT_TIMEOUT,
     CLIENT_READ_TIMEOUT,
     CLIENT_RETRIES,
     CLIENT_USER_AGENT_NAME,
+    QUERY_MAX_ROWS,
+    QUERY_POLL_BACKOFF_FACTOR,
+    QUERY_POLL_INITIAL_INTERVAL,
     QUERY_POLL_INTERVAL,
     QUERY_TIMEOUT,
     SESSION_KEEPALIVE,
     SUSPICIOUS_QUERY_REGEXP,
-    SVV_ALL_COLUMNS_QUERY,
-    SVV_ALL_SCHEMAS_QUERY,
-    SVV_ALL_TABLES_QUERY,
-    SVV_REDSHIFT_DATABASES_QUERY,
+    SVV_CATALOG_QUERY,
 )
 from botocore.config import Config
 from loguru import logger
@@ -179,7 +182,7 @@ class RedshiftSessionManager:
 
         # Get session ID from the response
         data_client = client_manager.redshift_data_client()
-        status_response = data_client.describe_statement(Id=statement_id)
+        status_response = await asyncio.to_thread(data_client.describe_statement, Id=statement_id)
         session_id = status_response['SessionId']
 
         logger.debug(f'Created session with application name: {session_id}')
@@ -197,12 +200,187 @@ class RedshiftSessionManager:
         return (time.time() - session_info['created_at']) > self._session_keepalive
 
 
+class RedshiftCatalogCache:
+    """Caches the catalog metadata of Redshift clusters for the discovery functions."""
+
+    def __init__(self, ttl: float):
+        """Initialize the catalog cache.
+
+        Args:
+            ttl: Number of seconds a loaded catalog is used (0 disables the cache).
+        """
+        self._catalogs = {}  # {cluster -> {database -> catalog}}
+        self._locks = {}  # {(cluster, database) -> asyncio.Lock}
+        self._generation = 0
+        self._ttl = ttl
+
+    async def catalog(self, cluster_identifier: str, database_name: str) -> dict:
+        """Get the catalog of a database, loading it if it is not cached or has expired.
+
+        The databases of the cluster, and the schemas, tables and columns of the database are
+        loaded in one query. Concurrent calls for the same database wait for a single load.
+
+        Args:
+            cluster_identifier: The cluster identifier.
+            database_name: The database name to load the catalog of. Also used to connect to.
+
+        Returns:
+            Catalog dictionary with the databases and schemas lists, tables by schema name and
+            columns by (schema name, table name).
+        """
+        catalog = self._cached_catalog(cluster_identifier, database_name)
+        if catalog is not None:
+            return catalog
+
+        lock = self._locks.setdefault((cluster_identifier, database_name), asyncio.Lock())
+        async with lock:
+            catalog = self._cached_catalog(cluster_identifier, database_name)
+            if catalog is None:
+                generation = self._generation
+                catalog = await self._load_catalog(cluster_identifier, database_name)
+                # Do not cache catalogs loaded while the cache was being invalidated
+                if self._ttl > 0 and generation == self._generation:
+                    self._catalogs.setdefault(cluster_identifier, {})[database_name] = catalog
+
+        return catalog
+
+    def invalidate(
+        self, cluster_identifier: str | None = None, database_name: str | None = None
+    ) -> None:
+        """Remove cached catalogs.
+
+        Args:
+            cluster_identifier: Optional cluster identifier to remove the catalogs of. All
+                catalogs are removed if not provided.
+            database_name: Optional database name to remove the catalog of within the cluster.
+        """
+        self._generation += 1
+        if cluster_identifier is None:
+            self._catalogs.clear()
+        elif database_name is None:
+            self._catalogs.pop(cluster_identifier, None)
+        else:
+            self._catalogs.get(cluster_identifier, {}).pop(database_name, None)
+        logger.debug(
+            f'Invalidated catalog cache for cluster {cluster_identifier or "*"}, database {database_name or "*"}'
+        )
+
+    def _cached_catalog(self, cluster_identifier: str, database_name: str) -> dict | None:
+        """Get a cached catalog if it has not expired.
+
+        Args:
+            cluster_identifier: The cluster identifier.
+            database_name: The database name.
+
+        Returns:
+            Catalog dictionary, or None if it is not cached or has expired.
+        """
+        catalogs = self._catalogs.get(cluster_identifier, {})
+        catalog = catalogs.get(database_name)
+        if catalog is None:
+            return None
+        if time.monotonic() - catalog['loaded_at'] > self._ttl:
+            logger.debug(f'Catalog expired, removing: {cluster_identifier}:{database_name}')
+            del catalogs[database_name]
+            return None
+        return catalog
+
+    async def _load_catalog(self, cluster_identifier: str, database_name: str) -> dict:
+        """Load the catalog of a database with a single query.
+
+        Args:
+            cluster_identifier: The cluster identifier.
+            database_name: The database name.
+
+        Returns:
+            Catalog dictionary.
+        """
+        results_response, _ = await _execute_protected_statement(
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            sql=SVV_CATALOG_QUERY,
+            parameters=[{'name': 'database_name', 'value': database_name}],
+        )
+
+        catalog = {
+            'loaded_at': time.monotonic(),
+            'databases': [],
+            'schemas': [],
+            'tables': {},
+            'columns': {},
+        }
+        for record in results_response.get('Records', []):
+            # Extract values from the record based on the object type
+            object_type = record[0].get('stringValue')
+            if object_type == 'database':
+                catalog['databases'].append(
+                    {
+                        'database_name': record[1].get('stringValue'),
+                        'database_owner': record[5].get('longValue'),
+                        'database_type': record[6].get('stringValue'),
+                        'database_acl': record[7].get('stringValue'),
+                        'database_options': record[8].get('stringValue'),
+                        'database_isolation_level': record[10].get('stringValue'),
+                    }
+                )
+            elif object_type == 'schema':
+                catalog['schemas'].append(
+                    {
+                        'database_name': record[1].get('stringValue'),
+                        'schema_name': record[2].get('stringValue'),
+                        'schema_owner': record[5].get('longValue'),
+                        'schema_type': record[6].get('stringValue'),
+                        'schema_acl': record[7].get('stringValue'),
+                        'source_database': record[9].get('stringValue'),
+                        'schema_option': record[8].get('stringValue'),
+                    }
+                )
+            elif object_type == 'table':
+                table_info = {
+                    'database_name': record[1].get('stringValue'),
+                    'schema_name': record[2].get('stringValue'),
+                    'table_name': record[3].get('stringValue'),
+                    'table_acl': record[7].get('stringValue'),
+                    'table_type': record[6].get('stringValue'),
+                    'remarks': record[11].get('stringValue'),
+                }
+                catalog['tables'].setdefault(table_info['schema_name'], []).append(table_info)
+            elif object_type == 'column':
+                column_info = {
+                    'database_name': record[1].get('stringValue'),
+                    'schema_name': record[2].get('stringValue'),
+                    'table_name': record[3].get('stringValue'),
+                    'column_name': record[4].get('stringValue'),
+                    'ordinal_position': record[12].get('longValue'),
+                    'column_default': record[13].get('stringValue'),
+                    'is_nullable': record[14].get('stringValue'),
+                    'data_type': record[15].get('stringValue'),
+                    'character_maximum_length': record[16].get('longValue'),
+                    'numeric_precision': record[17].get('longValue'),
+                    'numeric_scale': record[18].get('longValue'),
+                    'remarks': record[11].get('stringValue'),
+                }
+                catalog['columns'].setdefault(
+                    (column_info['schema_name'], column_info['table_name']), []
+                ).append(column_info)
+
+        logger.info(
+            f'Loaded catalog of database {database_name} in cluster {cluster_identifier}: '
+            f'{len(catalog["schemas"])} schemas, '
+            f'{sum(len(tables) for tables in catalog["tables"].values())} tables, '
+            f'{sum(len(columns) for columns in catalog["columns"].values())} columns'
+        )
+        return catalog
+
+
 async def _execute_protected_statement(
     cluster_identifier: str,
     database_name: str,
     sql: str,
     parameters: list[dict] | None = None,
     allow_read_write: bool = False,
+    max_rows: int | None = None,
+    result_format: str = 'JSON',
 ) -> tuple[dict, str]:
     """Execute a SQL statement against a Redshift cluster in a protected fashion.
 
@@ -222,10 +400,12 @@ async def _execute_protected_statement(
         sql: The SQL statement to execute.
         parameters: Optional list of parameter dictionaries with 'name' and 'value' keys.
         allow_read_write: Indicates if read-write mode should be activated.
+        max_rows: Optional maximum number of result rows to fetch.
+        result_format: Result format of the user SQL ('JSON' or 'CSV').
 
     Returns:
         Tuple containing:
-        - Dictionary with the raw results_response from get_statement_result.
+        - Dictionary with the results from _get_statement_result.
         - String with the query_id.
 
     Raises:
@@ -275,6 +455,7 @@ async def _execute_protected_statement(
             sql=sql,
             parameters=parameters,
             session_id=session_id,
+            result_format=result_format if result_format != 'JSON' else None,
         )
     except Exception as e:
         user_sql_error = e
@@ -305,9 +486,10 @@ async def _execute_protected_statement(
         raise user_sql_error
 
     # Get results from user query
-    data_client = client_manager.redshift_data_client()
     assert user_query_id is not None, 'user_query_id should not be None at this point'
-    results_response = data_client.get_statement_result(Id=user_query_id)
+    results_response = await _get_statement_result(
+        user_query_id, max_rows=max_rows, result_format=result_format
+    )
     return results_response, user_query_id
 
 
@@ -321,9 +503,15 @@ async def _execute_statement(
     session_keepalive: int | None = None,
     query_poll_interval: float = QUERY_POLL_INTERVAL,
     query_timeout: float = QUERY_TIMEOUT,
+    result_format: str | None = None,
 ) -> str:
     """Execute a single statement with optional session support and parameters.
 
+    The Data API calls are made from a worker thread, so waiting on the service does not
+    block the event loop. The statement status is polled with an exponential backoff that
+    starts at QUERY_POLL_INITIAL_INTERVAL, so short statements finish without waiting for
+    a full poll interval.
+
     Args:
         cluster_info: Cluster information dictionary.
         cluster_identifier: The cluster identifier.
@@ -332,8 +520,9 @@ async def _execute_statement(
         parameters: Optional list of parameter dictionaries with 'name' and 'value' keys.
         session_id: Optional session ID to use.
         session_keepalive: Optional session keepalive seconds (only used when session_id is None).
-        query_poll_interval: Polling interval in seconds for checking query status.
+        query_poll_interval: Maximum polling interval in seconds for checking query status.
         query_timeout: Maximum time in seconds to wait for query completion.
+        result_format: Optional result format of the statement ('JSON' or 'CSV').
 
     Returns:
         Statement ID from the ExecuteStatement response.
@@ -363,17 +552,22 @@ async def _execute_statement(
     elif session_keepalive is not None:
         request_params['SessionKeepAliveSeconds'] = session_keepalive
 
-    response = data_client.execute_statement(**request_params)
+    # Add result format if provided
+    if result_format:
+        request_params['ResultFormat'] = result_format
+
+    response = await asyncio.to_thread(data_client.execute_statement, **request_params)
     statement_id = response['Id']
 
     logger.debug(
         f'Executed statement: {statement_id}' + (f' in session {session_id}' if session_id else '')
     )
 
-    # Wait for statement completion
-    wait_time = 0
-    while wait_time < query_timeout:
-        status_response = data_client.describe_statement(Id=statement_id)
+    # Wait for statement completion, backing off up to the poll interval
+    poll_interval = min(QUERY_POLL_INITIAL_INTERVAL, query_poll_interval)
+    start_time = time.monotonic()
+    while True:
+        status_response = await asyncio.to_thread(data_client.describe_statement, Id=statement_id)
         status = status_response['Status']
 
         if status == 'FINISHED':
@@ -384,16 +578,100 @@ async def _execute_statement(
             logger.error(f'Statement failed: {error_msg}')
             raise Exception(f'Statement failed: {error_msg}')
 
-        await asyncio.sleep(query_poll_interval)
-        wait_time += query_poll_interval
+        wait_time = time.monotonic() - start_time
+        if wait_time >= query_timeout:
+            logger.error(f'Statement timed out: {statement_id}')
+            raise Exception(f'Statement timed out after {wait_time:.1f} seconds')
 
-    if wait_time >= query_timeout:
-        logger.error(f'Statement timed out: {statement_id}')
-        raise Exception(f'Statement timed out after {wait_time} seconds')
+        await asyncio.sleep(min(poll_interval, query_timeout - wait_time))
+        poll_interval = min(poll_interval * QUERY_POLL_BACKOFF_FACTOR, query_poll_interval)
 
     return statement_id
 
 
+async def _get_statement_result(
+    statement_id: str, max_rows: int | None = None, result_format: str = 'JSON'
+) -> dict:
+    """Get the result of a finished statement, following result pages up to a row cap.
+
+    Pages are fetched from a worker thread one at a time, and no further pages are fetched
+    once max_rows rows have been collected. Results of statements executed with the CSV
+    result format are fetched with GetStatementResultV2, which transfers the rows as CSV
+    text; their values are returned as string fields.
+
+    Args:
+        statement_id: The statement ID to get the result of.
+        max_rows: Optional maximum number of rows to return.
+        result_format: Result format the statement was executed with ('JSON' or 'CSV').
+
+    Returns:
+        Dictionary with the ColumnMetadata, Records and TotalNumRows of the result, and a
+        Truncated flag set when rows were left out because of max_rows.
+    """
+    data_client = client_manager.redshift_data_client()
+    if result_format == 'CSV':
+        get_result_page = data_client.get_statement_result_v2
+    else:
+        get_result_page = data_client.get_statement_result
+
+    column_metadata = None
+    total_rows = None
+    records = []
+    next_token = None
+    while True:
+        request_params = {'Id': statement_id}
+        if next_token:
+            request_params['NextToken'] = next_token
+        page = await asyncio.to_thread(get_result_page, **request_params)
+
+        page_records = page.get('Records', [])
+        if result_format == 'CSV':
+            page_records = _parse_csv_records(
+                page_records, page.get('ColumnMetadata', []) if column_metadata is None else None
+            )
+        if column_metadata is None:
+            column_metadata = page.get('ColumnMetadata', [])
+            total_rows = page.get('TotalNumRows')
+        records.extend(page_records)
+
+        next_token = page.get('NextToken')
+        if not next_token or (max_rows is not None and len(records) >= max_rows):
+            break
+
+    truncated = max_rows is not None and (len(records) > max_rows or bool(next_token))
+    if truncated:
+        logger.debug(f'Result of statement {statement_id} truncated to {max_rows} rows')
+        records = records[:max_rows]
+
+    return {
+        'ColumnMetadata': column_metadata,
+        'Records': records,
+        'TotalNumRows': total_rows if total_rows is not None else len(records),
+        'Truncated': truncated,
+    }
+
+
+def _parse_csv_records(records: list[dict], column_metadata: list[dict] | None) -> list[list]:
+    """Parse the CSV records of a GetStatementResultV2 page into string fields.
+
+    Args:
+        records: Records of the page, each with a CSVRecords string.
+        column_metadata: Column metadata of the result when parsing its first page, which
+            starts with a header row of the column names.
+
+    Returns:
+        List of records, each a list of {'stringValue': ...} fields.
+    """
+    rows = []
+    for record in records:
+        rows.extend(csv.reader(io.StringIO(record.get('CSVRecords', ''), newline='')))
+
+    if column_metadata and rows and rows[0] == [column.get('name') for column in column_metadata]:
+        rows = rows[1:]
+
+    return [[{'stringValue': value} for value in row] for row in rows]
+
+
 async def discover_clusters() -> list[dict]:
     """Discover all Redshift clusters and serverless workgroups.
 
@@ -481,7 +759,7 @@ async def discover_clusters() -> list[dict]:
 
 
 async def discover_databases(cluster_identifier: str, database_name: str = 'dev') -> list[dict]:
-    """Discover databases in a Redshift cluster using the Data API.
+    """Discover databases in a Redshift cluster from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
@@ -493,27 +771,9 @@ async def discover_databases(cluster_identifier: str, database_name: str = 'dev'
     try:
         logger.info(f'Discovering databases in cluster {cluster_identifier}')
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=database_name,
-            sql=SVV_REDSHIFT_DATABASES_QUERY,
-        )
-
-        databases = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            database_info = {
-                'database_name': record[0].get('stringValue'),
-                'database_owner': record[1].get('longValue'),
-                'database_type': record[2].get('stringValue'),
-                'database_acl': record[3].get('stringValue'),
-                'database_options': record[4].get('stringValue'),
-                'database_isolation_level': record[5].get('stringValue'),
-            }
-            databases.append(database_info)
+        # Look up the databases in the cached catalog
+        catalog = await catalog_cache.catalog(cluster_identifier, database_name)
+        databases = [dict(database_info) for database_info in catalog['databases']]
 
         logger.info(f'Found {len(databases)} databases in cluster {cluster_identifier}')
         return databases
@@ -524,7 +784,7 @@ async def discover_databases(cluster_identifier: str, database_name: str = 'dev'
 
 
 async def discover_schemas(cluster_identifier: str, schema_database_name: str) -> list[dict]:
-    """Discover schemas in a Redshift database using the Data API.
+    """Discover schemas in a Redshift database from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
@@ -538,29 +798,9 @@ async def discover_schemas(cluster_identifier: str, schema_database_name: str) -
             f'Discovering schemas in database {schema_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=schema_database_name,
-            sql=SVV_ALL_SCHEMAS_QUERY,
-            parameters=[{'name': 'database_name', 'value': schema_database_name}],
-        )
-
-        schemas = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            schema_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'schema_owner': record[2].get('longValue'),
-                'schema_type': record[3].get('stringValue'),
-                'schema_acl': record[4].get('stringValue'),
-                'source_database': record[5].get('stringValue'),
-                'schema_option': record[6].get('stringValue'),
-            }
-            schemas.append(schema_info)
+        # Look up the schemas in the cached catalog
+        catalog = await catalog_cache.catalog(cluster_identifier, schema_database_name)
+        schemas = [dict(schema_info) for schema_info in catalog['schemas']]
 
         logger.info(
             f'Found {len(schemas)} schemas in database {schema_database_name} in cluster {cluster_identifier}'
@@ -577,7 +817,7 @@ async def discover_schemas(cluster_identifier: str, schema_database_name: str) -
 async def discover_tables(
     cluster_identifier: str, table_database_name: str, table_schema_name: str
 ) -> list[dict]:
-    """Discover tables in a Redshift schema using the Data API.
+    """Discover tables in a Redshift schema from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
@@ -592,31 +832,9 @@ async def discover_tables(
             f'Discovering tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=table_database_name,
-            sql=SVV_ALL_TABLES_QUERY,
-            parameters=[
-                {'name': 'database_name', 'value': table_database_name},
-                {'name': 'schema_name', 'value': table_schema_name},
-            ],
-        )
-
-        tables = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            table_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'table_name': record[2].get('stringValue'),
-                'table_acl': record[3].get('stringValue'),
-                'table_type': record[4].get('stringValue'),
-                'remarks': record[5].get('stringValue'),
-            }
-            tables.append(table_info)
+        # Look up the tables in the cached catalog
+        catalog = await catalog_cache.catalog(cluster_identifier, table_database_name)
+        tables = [dict(table_info) for table_info in catalog['tables'].get(table_schema_name, [])]
 
         logger.info(
             f'Found {len(tables)} tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
@@ -636,7 +854,7 @@ async def discover_columns(
     column_schema_name: str,
     column_table_name: str,
 ) -> list[dict]:
-    """Discover columns in a Redshift table using the Data API.
+    """Discover columns in a Redshift table from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
@@ -652,38 +870,12 @@ async def discover_columns(
             f'Discovering columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=column_database_name,
-            sql=SVV_ALL_COLUMNS_QUERY,
-            parameters=[
-                {'name': 'database_name', 'value': column_database_name},
-                {'name': 'schema_name', 'value': column_schema_name},
-                {'name': 'table_name', 'value': column_table_name},
-            ],
-        )
-
-        columns = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            column_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'table_name': record[2].get('stringValue'),
-                'column_name': record[3].get('stringValue'),
-                'ordinal_position': record[4].get('longValue'),
-                'column_default': record[5].get('stringValue'),
-                'is_nullable': record[6].get('stringValue'),
-                'data_type': record[7].get('stringValue'),
-                'character_maximum_length': record[8].get('longValue'),
-                'numeric_precision': record[9].get('longValue'),
-                'numeric_scale': record[10].get('longValue'),
-                'remarks': record[11].get('stringValue'),
-            }
-            columns.append(column_info)
+        # Look up the columns in the cached catalog
+        catalog = await catalog_cache.catalog(cluster_identifier, column_database_name)
+        columns = [
+            dict(column_info)
+            for column_info in catalog['columns'].get((column_schema_name, column_table_name), [])
+        ]
 
         logger.info(
             f'Found {len(columns)} columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
@@ -697,13 +889,22 @@ async def discover_columns(
         raise
 
 
-async def execute_query(cluster_identifier: str, database_name: str, sql: str) -> dict:
+async def execute_query(
+    cluster_identifier: str,
+    database_name: str,
+    sql: str,
+    max_rows: int | None = QUERY_MAX_ROWS,
+    result_format: str = 'JSON',
+) -> dict:
     """Execute a SQL query against a Redshift cluster using the Data API.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to execute the query against.
         sql: The SQL statement to execute.
+        max_rows: Maximum number of rows to return (None for all rows).
+        result_format: Result format to transfer the rows in ('JSON' or 'CSV'). CSV is more
+            compact, but returns all values as strings.
 
     Returns:
         Dictionary with query results including columns, rows, and metadata.
@@ -719,7 +920,11 @@ async def execute_query(cluster_identifier: str, database_name: str, sql: str) -
 
         # Execute the query using the common function
         results_response, query_id = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier, database_name=database_name, sql=sql
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            sql=sql,
+            max_rows=max_rows,
+            result_format=result_format,
         )
 
         # Calculate execution time
@@ -761,6 +966,7 @@ async def execute_query(cluster_identifier: str, database_name: str, sql: str) -
             'row_count': len(rows),
             'execution_time_ms': execution_time_ms,
             'query_id': query_id,
+            'truncated': results_response.get('Truncated', False),
         }
 
         logger.info(
@@ -789,3 +995,6 @@ client_manager = RedshiftClientManager(
 session_manager = RedshiftSessionManager(
     session_keepalive=SESSION_KEEPALIVE, app_name=f'{CLIENT_USER_AGENT_NAME}/{__version__}'
 )
+
+# Global catalog cache instance
+catalog_cache = RedshiftCatalogCache(ttl=CATALOG_CACHE_TTL)
@@ -19,6 +19,7 @@ import sys
 from awslabs.redshift_mcp_server.consts import (
     CLIENT_BEST_PRACTICES,
     DEFAULT_LOG_LEVEL,
+    QUERY_MAX_ROWS,
     REDSHIFT_BEST_PRACTICES,
 )
 from awslabs.redshift_mcp_server.models import (
@@ -30,6 +31,7 @@ from awslabs.redshift_mcp_server.models import (
     RedshiftTable,
 )
 from awslabs.redshift_mcp_server.redshift import (
+    catalog_cache,
     discover_clusters,
     discover_columns,
     discover_databases,
@@ -40,6 +42,7 @@ from awslabs.redshift_mcp_server.redshift import (
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
+from typing import Literal, Optional
 
 
 # Remove default handler and add custom configuration
@@ -531,6 +534,42 @@ async def list_columns_tool(
         raise
 
 
+@mcp.tool(name='refresh_catalog')
+async def refresh_catalog_tool(
+    ctx: Context,
+    cluster_identifier: str = Field(
+        ...,
+        description='The cluster identifier to refresh the catalog of. Must be a valid cluster identifier from the list_clusters tool.',
+    ),
+    database_name: Optional[str] = Field(
+        None,
+        description='The database name to refresh the catalog of. All databases of the cluster are refreshed if not provided.',
+    ),
+) -> str:
+    """Refresh the cached catalog metadata of a Redshift cluster.
+
+    The list_databases, list_schemas, list_tables and list_columns tools answer from a catalog
+    cache. The catalog of a database, with its schemas, tables and columns, is loaded in a single
+    query on first use and kept for 5 minutes. This tool discards the cached catalog, so that the
+    next discovery call loads it again.
+
+    ## Parameters
+
+    - cluster_identifier: The unique identifier of the Redshift cluster to refresh.
+    - database_name: Optional database name to refresh. All databases of the cluster are
+                     refreshed if not provided.
+
+    ## Usage Tips
+
+    1. Use this tool after databases, schemas, tables or columns were created, altered or dropped.
+    2. Discovery results are otherwise at most 5 minutes old.
+    """
+    logger.info(f'Refreshing catalog of cluster {cluster_identifier}')
+    catalog_cache.invalidate(cluster_identifier, database_name)
+    target = f'database {database_name}' if database_name else 'all databases'
+    return f'Catalog cache of {target} in cluster {cluster_identifier} cleared, it is reloaded on the next discovery call.'
+
+
 @mcp.tool(name='execute_query')
 async def execute_query_tool(
     ctx: Context,
@@ -545,6 +584,15 @@ async def execute_query_tool(
     sql: str = Field(
         ..., description='The SQL statement to execute. Should be a single SQL statement.'
     ),
+    max_rows: int = Field(
+        QUERY_MAX_ROWS,
+        ge=1,
+        description='Maximum number of rows to return. Further result pages are not fetched.',
+    ),
+    result_format: Literal['JSON', 'CSV'] = Field(
+        'JSON',
+        description='Format to transfer the rows in. CSV is more compact for large results, but returns all values as strings.',
+    ),
 ) -> QueryResult:
     """Execute a SQL query against a Redshift cluster or serverless workgroup.
 
@@ -556,7 +604,7 @@ async def execute_query_tool(
 
     - Ensure your AWS credentials are properly configured (via AWS_PROFILE or default credentials).
     - The cluster must be available and accessible.
-    - Required IAM permissions: redshift-data:ExecuteStatement, redshift-data:DescribeStatement, redshift-data:GetStatementResult.
+    - Required IAM permissions: redshift-data:ExecuteStatement, redshift-data:DescribeStatement, redshift-data:GetStatementResult (redshift-data:GetStatementResultV2 for the CSV result format).
     - The user must have appropriate permissions to execute queries in the specified database.
 
     ## Parameters
@@ -566,6 +614,10 @@ async def execute_query_tool(
     - database_name: The database name to execute the query against.
                     IMPORTANT: Use a valid database name from the list_databases tool.
     - sql: The SQL statement to execute. Should be a single SQL statement.
+    - max_rows: Maximum number of rows to return (default 10000). The result is marked as
+                truncated when the query returned more rows.
+    - result_format: 'JSON' (default) returns typed values. 'CSV' transfers the rows as CSV
+                     text, which is more compact for large results, and returns all values as strings.
 
     ## Response Structure
 
@@ -576,6 +628,7 @@ async def execute_query_tool(
     - row_count: Number of rows returned.
     - execution_time_ms: Query execution time in milliseconds.
     - query_id: Unique identifier for the query execution.
+    - truncated: Whether rows were left out because max_rows was reached.
 
     ## Usage Tips
 
@@ -604,7 +657,11 @@ async def execute_query_tool(
     try:
         logger.info(f'Executing query on cluster {cluster_identifier} in database {database_name}')
         query_result_data = await execute_query(
-            cluster_identifier=cluster_identifier, database_name=database_name, sql=sql
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            sql=sql,
+            max_rows=max_rows,
+            result_format=result_format,
         )
 
         # Convert to QueryResult model
@@ -14,13 +14,18 @@
 
 """Tests for the redshift module."""
 
+import asyncio
 import pytest
 import time
+from awslabs.redshift_mcp_server.consts import SVV_CATALOG_QUERY
 from awslabs.redshift_mcp_server.redshift import (
+    RedshiftCatalogCache,
     RedshiftClientManager,
     RedshiftSessionManager,
     _execute_protected_statement,
     _execute_statement,
+    _get_statement_result,
+    catalog_cache,
     discover_clusters,
     discover_columns,
     discover_databases,
@@ -31,6 +36,58 @@ from awslabs.redshift_mcp_server.redshift import (
 from botocore.config import Config
 
 
+CATALOG_FIELDS = [
+    'object_type',
+    'database_name',
+    'schema_name',
+    'table_name',
+    'column_name',
+    'owner',
+    'type',
+    'acl',
+    'options',
+    'source_database',
+    'isolation_level',
+    'remarks',
+    'ordinal_position',
+    'column_default',
+    'is_nullable',
+    'data_type',
+    'character_maximum_length',
+    'numeric_precision',
+    'numeric_scale',
+]
+CATALOG_LONG_FIELDS = {
+    'owner',
+    'ordinal_position',
+    'character_maximum_length',
+    'numeric_precision',
+    'numeric_scale',
+}
+
+
+def _catalog_record(**values):
+    """Create a record of the catalog query."""
+    record = []
+    for field in CATALOG_FIELDS:
+        value = values.get(field)
+        if value is None:
+            record.append({'isNull': True})
+        elif field in CATALOG_LONG_FIELDS:
+            record.append({'longValue': value})
+        else:
+            record.append({'stringValue': value})
+    return record
+
+
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    """Clear the global catalog cache between tests."""
+    catalog_cache.invalidate()
+    yield
+    catalog_cache.invalidate()
+
+
 class TestRedshiftClientManagerRedshiftClient:
     """Tests for RedshiftClientManager redshift_client() method."""
 
@@ -639,6 +696,134 @@ class TestExecuteStatement:
         assert 'Database' not in call_args
         assert 'ClusterIdentifier' not in call_args
 
+    @pytest.mark.asyncio
+    async def test_execute_statement_poll_backoff(self, mocker):
+        """Test that status polling backs off up to the poll interval."""
+        mock_client = mocker.Mock()
+        mock_client.execute_statement.return_value = {'Id': 'stmt-123'}
+        mock_client.describe_statement.side_effect = [{'Status': 'STARTED'}] * 7 + [
+            {'Status': 'FINISHED'}
+        ]
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_client
+        mock_sleep = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.asyncio.sleep', new_callable=mocker.AsyncMock
+        )
+
+        cluster_info = {'type': 'provisioned', 'identifier': 'test-cluster'}
+        statement_id = await _execute_statement(
+            cluster_info, 'test-cluster', 'dev', 'SELECT 1', query_poll_interval=0.5
+        )
+
+        assert statement_id == 'stmt-123'
+        intervals = [call.args[0] for call in mock_sleep.call_args_list]
+        assert intervals == pytest.approx([0.1, 0.15, 0.225, 0.3375, 0.5, 0.5, 0.5])
+
+    @pytest.mark.asyncio
+    async def test_execute_statement_with_result_format(self, mocker):
+        """Test _execute_statement requesting the CSV result format."""
+        mock_client = mocker.Mock()
+        mock_client.execute_statement.return_value = {'Id': 'stmt-123'}
+        mock_client.describe_statement.return_value = {'Status': 'FINISHED'}
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_client
+
+        cluster_info = {'type': 'provisioned', 'identifier': 'test-cluster'}
+        await _execute_statement(
+            cluster_info, 'test-cluster', 'dev', 'SELECT 1', result_format='CSV'
+        )
+
+        assert mock_client.execute_statement.call_args[1]['ResultFormat'] == 'CSV'
+
+
+class TestGetStatementResult:
+    """Tests for _get_statement_result function."""
+
+    @staticmethod
+    def _pages(mocker, method, pages):
+        mock_client = mocker.Mock()
+        getattr(mock_client, method).side_effect = pages
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_client
+        return getattr(mock_client, method)
+
+    @pytest.mark.asyncio
+    async def test_pages_merged(self, mocker):
+        """Test that all result pages are fetched and merged."""
+        get_page = self._pages(
+            mocker,
+            'get_statement_result',
+            [
+                {
+                    'ColumnMetadata': [{'name': 'id'}],
+                    'Records': [[{'longValue': 1}], [{'longValue': 2}]],
+                    'TotalNumRows': 3,
+                    'NextToken': 'token-1',
+                },
+                {'ColumnMetadata': [{'name': 'id'}], 'Records': [[{'longValue': 3}]]},
+            ],
+        )
+
+        result = await _get_statement_result('stmt-123')
+
+        assert result == {
+            'ColumnMetadata': [{'name': 'id'}],
+            'Records': [[{'longValue': 1}], [{'longValue': 2}], [{'longValue': 3}]],
+            'TotalNumRows': 3,
+            'Truncated': False,
+        }
+        assert get_page.call_args_list[0].kwargs == {'Id': 'stmt-123'}
+        assert get_page.call_args_list[1].kwargs == {'Id': 'stmt-123', 'NextToken': 'token-1'}
+
+    @pytest.mark.asyncio
+    async def test_row_cap(self, mocker):
+        """Test that no further pages are fetched once the row cap is reached."""
+        get_page = self._pages(
+            mocker,
+            'get_statement_result',
+            [
+                {
+                    'ColumnMetadata': [{'name': 'id'}],
+                    'Records': [[{'longValue': i}] for i in range(3)],
+                    'TotalNumRows': 6,
+                    'NextToken': 'token-1',
+                }
+            ],
+        )
+
+        result = await _get_statement_result('stmt-123', max_rows=2)
+
+        assert result['Records'] == [[{'longValue': 0}], [{'longValue': 1}]]
+        assert result['TotalNumRows'] == 6
+        assert result['Truncated'] is True
+        get_page.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_csv_result_format(self, mocker):
+        """Test that CSV pages are parsed into string fields without the header row."""
+        get_page = self._pages(
+            mocker,
+            'get_statement_result_v2',
+            [
+                {
+                    'ColumnMetadata': [{'name': 'id'}, {'name': 'name'}],
+                    'Records': [{'CSVRecords': 'id,name\n1,"Doe, Jane"\n'}],
+                    'TotalNumRows': 2,
+                    'NextToken': 'token-1',
+                },
+                {'Records': [{'CSVRecords': '2,"multi\nline"\n'}]},
+            ],
+        )
+
+        result = await _get_statement_result('stmt-123', result_format='CSV')
+
+        assert result['Records'] == [
+            [{'stringValue': '1'}, {'stringValue': 'Doe, Jane'}],
+            [{'stringValue': '2'}, {'stringValue': 'multi\nline'}],
+        ]
+        assert result['Truncated'] is False
+        assert get_page.call_count == 2
+
 
 class TestRedshiftSessionManager:
     """Tests for RedshiftSessionManager."""
@@ -946,21 +1131,24 @@ class TestDiscoverFunctions:
     @pytest.mark.asyncio
     async def test_discover_databases(self, mocker):
         """Test discover_databases function."""
-        # Mock _execute_protected_statement
         mock_execute_protected = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
         )
         mock_execute_protected.return_value = (
             {
                 'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'longValue': 100},
-                        {'stringValue': 'local'},
-                        {'stringValue': 'user=admin'},
-                        {'stringValue': 'encoding=utf8'},
-                        {'stringValue': 'Snapshot Isolation'},
-                    ]
+                    _catalog_record(
+                        object_type='database',
+                        database_name='dev',
+                        owner=100,
+                        type='local',
+                        acl='user=admin',
+                        options='encoding=utf8',
+                        isolation_level='Snapshot Isolation',
+                    ),
+                    _catalog_record(
+                        object_type='schema', database_name='dev', schema_name='public'
+                    ),
                 ]
             },
             'query-123',
@@ -968,10 +1156,21 @@ class TestDiscoverFunctions:
 
         result = await discover_databases('test-cluster', 'dev')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['database_owner'] == 100
-        assert result[0]['database_type'] == 'local'
+        assert result == [
+            {
+                'database_name': 'dev',
+                'database_owner': 100,
+                'database_type': 'local',
+                'database_acl': 'user=admin',
+                'database_options': 'encoding=utf8',
+                'database_isolation_level': 'Snapshot Isolation',
+            }
+        ]
+
+        # Verify the catalog was loaded from the connected database
+        call_args = mock_execute_protected.call_args
+        assert call_args[1]['sql'] == SVV_CATALOG_QUERY
+        assert call_args[1]['parameters'] == [{'name': 'database_name', 'value': 'dev'}]
 
     @pytest.mark.asyncio
     async def test_discover_databases_error(self, mocker):
@@ -987,22 +1186,21 @@ class TestDiscoverFunctions:
     @pytest.mark.asyncio
     async def test_discover_schemas(self, mocker):
         """Test discover_schemas function."""
-        # Mock _execute_protected_statement
         mock_execute_protected = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
         )
         mock_execute_protected.return_value = (
             {
                 'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'stringValue': 'public'},
-                        {'longValue': 100},
-                        {'stringValue': 'local'},
-                        {'stringValue': 'user=admin'},
-                        {'stringValue': None},
-                        {'stringValue': None},
-                    ]
+                    _catalog_record(object_type='database', database_name='dev'),
+                    _catalog_record(
+                        object_type='schema',
+                        database_name='dev',
+                        schema_name='public',
+                        owner=100,
+                        type='local',
+                        acl='user=admin',
+                    ),
                 ]
             },
             'query-456',
@@ -1010,10 +1208,17 @@ class TestDiscoverFunctions:
 
         result = await discover_schemas('test-cluster', 'dev')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['schema_name'] == 'public'
-        assert result[0]['schema_owner'] == 100
+        assert result == [
+            {
+                'database_name': 'dev',
+                'schema_name': 'public',
+                'schema_owner': 100,
+                'schema_type': 'local',
+                'schema_acl': 'user=admin',
+                'source_database': None,
+                'schema_option': None,
+            }
+        ]
 
         # Verify parameters were passed correctly
         mock_execute_protected.assert_called_once()
@@ -1034,21 +1239,28 @@ class TestDiscoverFunctions:
     @pytest.mark.asyncio
     async def test_discover_tables(self, mocker):
         """Test discover_tables function."""
-        # Mock _execute_protected_statement
         mock_execute_protected = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
         )
         mock_execute_protected.return_value = (
             {
                 'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'stringValue': 'public'},
-                        {'stringValue': 'users'},
-                        {'stringValue': 'user=admin'},
-                        {'stringValue': 'TABLE'},
-                        {'stringValue': 'User data table'},
-                    ]
+                    _catalog_record(
+                        object_type='table',
+                        database_name='dev',
+                        schema_name='public',
+                        table_name='users',
+                        acl='user=admin',
+                        type='TABLE',
+                        remarks='User data table',
+                    ),
+                    _catalog_record(
+                        object_type='table',
+                        database_name='dev',
+                        schema_name='sales',
+                        table_name='orders',
+                        type='TABLE',
+                    ),
                 ]
             },
             'query-789',
@@ -1056,20 +1268,20 @@ class TestDiscoverFunctions:
 
         result = await discover_tables('test-cluster', 'dev', 'public')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['schema_name'] == 'public'
-        assert result[0]['table_name'] == 'users'
-        assert result[0]['table_type'] == 'TABLE'
+        assert result == [
+            {
+                'database_name': 'dev',
+                'schema_name': 'public',
+                'table_name': 'users',
+                'table_acl': 'user=admin',
+                'table_type': 'TABLE',
+                'remarks': 'User data table',
+            }
+        ]
+        assert await discover_tables('test-cluster', 'dev', 'missing') == []
 
-        # Verify parameters were passed correctly
+        # Verify the catalog was loaded once
         mock_execute_protected.assert_called_once()
-        call_args = mock_execute_protected.call_args
-        expected_params = [
-            {'name': 'database_name', 'value': 'dev'},
-            {'name': 'schema_name', 'value': 'public'},
-        ]
-        assert call_args[1]['parameters'] == expected_params
 
     @pytest.mark.asyncio
     async def test_discover_tables_error(self, mocker):
@@ -1085,27 +1297,43 @@ class TestDiscoverFunctions:
     @pytest.mark.asyncio
     async def test_discover_columns(self, mocker):
         """Test discover_columns function."""
-        # Mock _execute_protected_statement
         mock_execute_protected = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
         )
         mock_execute_protected.return_value = (
             {
                 'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'stringValue': 'public'},
-                        {'stringValue': 'users'},
-                        {'stringValue': 'id'},
-                        {'longValue': 1},
-                        {'stringValue': None},
-                        {'stringValue': 'NO'},
-                        {'stringValue': 'integer'},
-                        {'longValue': None},
-                        {'longValue': 32},
-                        {'longValue': 0},
-                        {'stringValue': 'Primary key'},
-                    ]
+                    _catalog_record(
+                        object_type='column',
+                        database_name='dev',
+                        schema_name='public',
+                        table_name='users',
+                        column_name='id',
+                        ordinal_position=1,
+                        is_nullable='NO',
+                        data_type='integer',
+                        numeric_precision=32,
+                        numeric_scale=0,
+                        remarks='Primary key',
+                    ),
+                    _catalog_record(
+                        object_type='column',
+                        database_name='dev',
+                        schema_name='public',
+                        table_name='users',
+                        column_name='name',
+                        ordinal_position=2,
+                        data_type='character varying',
+                        character_maximum_length=256,
+                    ),
+                    _catalog_record(
+                        object_type='column',
+                        database_name='dev',
+                        schema_name='public',
+                        table_name='orders',
+                        column_name='id',
+                        ordinal_position=1,
+                    ),
                 ]
             },
             'query-101',
@@ -1113,23 +1341,27 @@ class TestDiscoverFunctions:
 
         result = await discover_columns('test-cluster', 'dev', 'public', 'users')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['schema_name'] == 'public'
-        assert result[0]['table_name'] == 'users'
-        assert result[0]['column_name'] == 'id'
-        assert result[0]['ordinal_position'] == 1
-        assert result[0]['data_type'] == 'integer'
+        assert [column['column_name'] for column in result] == ['id', 'name']
+        assert result[0] == {
+            'database_name': 'dev',
+            'schema_name': 'public',
+            'table_name': 'users',
+            'column_name': 'id',
+            'ordinal_position': 1,
+            'column_default': None,
+            'is_nullable': 'NO',
+            'data_type': 'integer',
+            'character_maximum_length': None,
+            'numeric_precision': 32,
+            'numeric_scale': 0,
+            'remarks': 'Primary key',
+        }
+        assert result[1]['character_maximum_length'] == 256
 
         # Verify parameters were passed correctly
         mock_execute_protected.assert_called_once()
         call_args = mock_execute_protected.call_args
-        expected_params = [
-            {'name': 'database_name', 'value': 'dev'},
-            {'name': 'schema_name', 'value': 'public'},
-            {'name': 'table_name', 'value': 'users'},
-        ]
-        assert call_args[1]['parameters'] == expected_params
+        assert call_args[1]['parameters'] == [{'name': 'database_name', 'value': 'dev'}]
 
     @pytest.mark.asyncio
     async def test_discover_columns_error(self, mocker):
@@ -1143,6 +1375,127 @@ class TestDiscoverFunctions:
             await discover_columns('test-cluster', 'dev', 'public', 'users')
 
 
+class TestRedshiftCatalogCache:
+    """Tests for RedshiftCatalogCache."""
+
+    @staticmethod
+    def _mock_catalog(mocker):
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
+        )
+        mock_execute_protected.return_value = (
+            {
+                'Records': [
+                    _catalog_record(object_type='database', database_name='dev'),
+                    _catalog_record(
+                        object_type='schema', database_name='dev', schema_name='public'
+                    ),
+                    _catalog_record(
+                        object_type='table',
+                        database_name='dev',
+                        schema_name='public',
+                        table_name='users',
+                    ),
+                    _catalog_record(
+                        object_type='column',
+                        database_name='dev',
+                        schema_name='public',
+                        table_name='users',
+                        column_name='id',
+                        ordinal_position=1,
+                    ),
+                ]
+            },
+            'query-123',
+        )
+        return mock_execute_protected
+
+    @pytest.mark.asyncio
+    async def test_lookups_served_from_cache(self, mocker):
+        """Test that all discovery functions share one catalog load per database."""
+        mock_execute_protected = self._mock_catalog(mocker)
+
+        await discover_databases('test-cluster', 'dev')
+        await discover_schemas('test-cluster', 'dev')
+        tables = await discover_tables('test-cluster', 'dev', 'public')
+        await discover_columns('test-cluster', 'dev', 'public', 'users')
+        tables[0]['table_name'] = 'changed'
+
+        assert mock_execute_protected.call_count == 1
+        assert (await discover_tables('test-cluster', 'dev', 'public'))[0]['table_name'] == 'users'
+
+        # Catalogs are cached per cluster and database
+        await discover_schemas('test-cluster', 'other')
+        await discover_schemas('other-cluster', 'dev')
+        assert mock_execute_protected.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_shared(self, mocker):
+        """Test that concurrent lookups wait for a single catalog load."""
+        mock_execute_protected = self._mock_catalog(mocker)
+
+        await asyncio.gather(
+            discover_schemas('test-cluster', 'dev'),
+            discover_tables('test-cluster', 'dev', 'public'),
+            discover_columns('test-cluster', 'dev', 'public', 'users'),
+        )
+
+        assert mock_execute_protected.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_catalog_reloaded(self, mocker):
+        """Test that a catalog older than the TTL is loaded again."""
+        mock_execute_protected = self._mock_catalog(mocker)
+        cache = RedshiftCatalogCache(ttl=300)
+
+        await cache.catalog('test-cluster', 'dev')
+        await cache.catalog('test-cluster', 'dev')
+        assert mock_execute_protected.call_count == 1
+
+        cache._catalogs['test-cluster']['dev']['loaded_at'] -= 301
+        catalog = await cache.catalog('test-cluster', 'dev')
+
+        assert mock_execute_protected.call_count == 2
+        assert catalog['columns'][('public', 'users')][0]['column_name'] == 'id'
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, mocker):
+        """Test that a TTL of 0 disables the cache."""
+        mock_execute_protected = self._mock_catalog(mocker)
+        cache = RedshiftCatalogCache(ttl=0)
+
+        await cache.catalog('test-cluster', 'dev')
+        await cache.catalog('test-cluster', 'dev')
+
+        assert mock_execute_protected.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, mocker):
+        """Test invalidating the catalogs of a database, a cluster and all clusters."""
+        mock_execute_protected = self._mock_catalog(mocker)
+        cache = RedshiftCatalogCache(ttl=300)
+
+        async def load_all():
+            for cluster_identifier in ('cluster-1', 'cluster-2'):
+                for database_name in ('dev', 'prod'):
+                    await cache.catalog(cluster_identifier, database_name)
+
+        await load_all()
+        assert mock_execute_protected.call_count == 4
+
+        cache.invalidate('cluster-1', 'dev')
+        await load_all()
+        assert mock_execute_protected.call_count == 5
+
+        cache.invalidate('cluster-2')
+        await load_all()
+        assert mock_execute_protected.call_count == 7
+
+        cache.invalidate()
+        await load_all()
+        assert mock_execute_protected.call_count == 11
+
+
 class TestExecuteQuery:
     """Tests for execute_query function."""
 
@@ -1195,6 +1548,29 @@ class TestExecuteQuery:
         assert result['execution_time_ms'] == 123
         assert result['query_id'] == 'query-123'
 
+    @pytest.mark.asyncio
+    async def test_execute_query_truncated(self, mocker):
+        """Test that execute_query passes the row cap and reports truncated results."""
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
+        )
+        mock_execute_protected.return_value = (
+            {
+                'ColumnMetadata': [{'name': 'id'}],
+                'Records': [[{'stringValue': '1'}]],
+                'TotalNumRows': 5,
+                'Truncated': True,
+            },
+            'query-123',
+        )
+
+        result = await execute_query('test-cluster', 'dev', 'SELECT id', 1, 'CSV')
+
+        assert result['rows'] == [['1']]
+        assert result['truncated'] is True
+        assert mock_execute_protected.call_args.kwargs['max_rows'] == 1
+        assert mock_execute_protected.call_args.kwargs['result_format'] == 'CSV'
+
     @pytest.mark.asyncio
     async def test_execute_query_error_handling(self, mocker):
         """Test error handling in execute_query."""
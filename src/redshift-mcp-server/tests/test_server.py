@@ -30,6 +30,7 @@ from awslabs.redshift_mcp_server.server import (
     list_databases_tool,
     list_schemas_tool,
     list_tables_tool,
+    refresh_catalog_tool,
 )
 from mcp.server.fastmcp import Context
 
@@ -528,3 +529,24 @@ class TestExecuteQueryTool:
         mock_ctx.error.assert_called_once_with(
             'Failed to execute query on cluster test-cluster in database test-db: Query error'
         )
+
+
+class TestRefreshCatalogTool:
+    """Tests for the refresh_catalog MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_catalog_tool(self, mocker):
+        """Test that the catalog cache of a cluster or database is invalidated."""
+        mock_catalog_cache = mocker.patch('awslabs.redshift_mcp_server.server.catalog_cache')
+
+        result = await refresh_catalog_tool(
+            Context(), cluster_identifier='test-cluster', database_name=None
+        )
+        assert 'all databases in cluster test-cluster' in result
+        mock_catalog_cache.invalidate.assert_called_with('test-cluster', None)
+
+        result = await refresh_catalog_tool(
+            Context(), cluster_identifier='test-cluster', database_name='dev'
+        )
+        assert 'database dev in cluster test-cluster' in result
+        mock_catalog_cache.invalidate.assert_called_with('test-cluster', 'dev')